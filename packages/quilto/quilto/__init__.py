@@ -15,10 +15,13 @@ from quilto.domain_selector import DomainSelector
 from quilto.flow import CorrectionResult, process_correction
 from quilto.llm import (
     AgentConfig,
+    CircuitBreakerConfig,
+    HedgingConfig,
     LLMClient,
     LLMConfig,
     ModelResolution,
     ProviderConfig,
+    ResponseCacheConfig,
     TierModels,
     load_llm_config,
     load_llm_config_from_dict,
@@ -37,18 +40,21 @@ from quilto.state import (
     route_after_planner,
     route_after_wait_user,
 )
-from quilto.storage import DateRange, Entry, StorageRepository
+from quilto.storage import AsyncStorageRepository, DateRange, Entry, StorageRepository
 
 __version__ = "0.1.0"
 
 __all__ = [
     "AgentConfig",
+    "AsyncStorageRepository",
+    "CircuitBreakerConfig",
     "CorrectionResult",
     "DateRange",
     "DomainInfo",
     "DomainModule",
     "DomainSelector",
     "Entry",
+    "HedgingConfig",
     "InputType",
     "LLMClient",
     "LLMConfig",
@@ -58,6 +64,7 @@ __all__ = [
     "ParserInput",
     "ParserOutput",
     "ProviderConfig",
+    "ResponseCacheConfig",
     "RouterAgent",
     "RouterInput",
     "RouterOutput",
@@ -15,6 +15,7 @@ from quilto.agents.models import (
     SufficiencyEvaluation,
 )
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class AnalyzerAgent:
@@ -299,6 +300,7 @@ Gap object structure:
 - outside_current_expertise: boolean (needs domain expansion)
 - suspected_domain: string or null (which domain might help)"""
 
+    @traced("AnalyzerAgent.analyze")
     async def analyze(self, analyzer_input: AnalyzerInput) -> AnalyzerOutput:
         """Analyze retrieved entries and assess sufficiency.
 
@@ -13,6 +13,7 @@ from quilto.agents.models import (
     RetrievalAttempt,
 )
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class ClarifierAgent:
@@ -275,6 +276,7 @@ Respond with a JSON object containing:
 
 IMPORTANT: Generate at most 3 questions. Prioritize critical gaps."""
 
+    @traced("ClarifierAgent.clarify")
     async def clarify(self, clarifier_input: ClarifierInput) -> ClarifierOutput:
         """Generate clarification questions for the user.
 
@@ -14,6 +14,7 @@ from quilto.agents.models import (
     Verdict,
 )
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class EvaluatorAgent:
@@ -274,6 +275,7 @@ Respond with a JSON object containing:
 
 For any INSUFFICIENT verdict, provide specific, actionable feedback that can guide a retry."""
 
+    @traced("EvaluatorAgent.evaluate")
     async def evaluate(self, evaluator_input: EvaluatorInput) -> EvaluatorOutput:
         """Evaluate a synthesized response for quality.
 
@@ -9,6 +9,7 @@ from quilto.agents.models import (
     ObserverOutput,
 )
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class ObserverAgent:
@@ -196,6 +197,7 @@ If nothing meaningful to update, return should_update=false with empty updates l
 
 IMPORTANT: Be conservative. It's better to miss an insight than to pollute the context with noise."""
 
+    @traced("ObserverAgent.observe")
     async def observe(self, observer_input: ObserverInput) -> ObserverOutput:
         """Observe user data and generate context updates.
 
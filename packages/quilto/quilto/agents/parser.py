@@ -12,6 +12,7 @@ from pydantic import BaseModel
 
 from quilto.agents.models import ParserInput, ParserOutput
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 __all__ = ["ParserAgent"]
 
@@ -216,6 +217,7 @@ Respond with a JSON object containing:
 - target_entry_id: string or null (ID of entry being corrected)
 - correction_delta: dict or null (only changed fields)"""
 
+    @traced("ParserAgent.parse")
     async def parse(self, parser_input: ParserInput) -> ParserOutput:
         """Parse raw input and extract structured data.
 
@@ -14,6 +14,7 @@ from quilto.agents.models import (
     PlannerOutput,
 )
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class PlannerAgent:
@@ -296,6 +297,7 @@ Respond with a JSON object matching this schema:
 - next_action: "retrieve" | "expand_domain" | "clarify" | "synthesize"
 - reasoning: string explaining the planning decisions"""
 
+    @traced("PlannerAgent.plan")
     async def plan(self, planner_input: PlannerInput) -> PlannerOutput:
         """Create retrieval plan for query.
 
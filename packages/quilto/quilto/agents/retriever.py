@@ -5,6 +5,7 @@ instructions from the Planner agent, fetching entries using StorageRepository
 methods and applying vocabulary expansion for better search coverage.
 """
 
+import asyncio
 from datetime import date, timedelta
 from typing import Any
 
@@ -13,8 +14,10 @@ from quilto.agents.models import (
     RetrieverInput,
     RetrieverOutput,
 )
+from quilto.storage.async_repository import AsyncStorageRepository
 from quilto.storage.models import DateRange, Entry
 from quilto.storage.repository import StorageRepository
+from quilto.tracing import traced
 
 
 def expand_terms(
@@ -94,14 +97,46 @@ class RetrieverAgent:
     AGENT_NAME = "retriever"
     EXPANSION_TIERS: list[int] = [7, 14, 30, 90]
 
-    def __init__(self, storage: StorageRepository) -> None:
+    def __init__(self, storage: StorageRepository | AsyncStorageRepository) -> None:
         """Initialize the Retriever agent.
 
         Args:
-            storage: StorageRepository instance for fetching entries.
+            storage: Repository for fetching entries. A synchronous
+                StorageRepository is called on a worker thread so scans never
+                block the event loop; pass an AsyncStorageRepository to share
+                its thread pool and read coalescing.
         """
         self.storage = storage
 
+    async def _get_entries_by_date_range(self, start: date, end: date) -> list[Entry]:
+        """Fetch entries in a date range without blocking the event loop.
+
+        Args:
+            start: Start date (inclusive).
+            end: End date (inclusive).
+
+        Returns:
+            Entries sorted by timestamp.
+        """
+        if isinstance(self.storage, AsyncStorageRepository):
+            return await self.storage.get_entries_by_date_range(start, end)
+        return await asyncio.to_thread(self.storage.get_entries_by_date_range, start, end)
+
+    async def _search_entries(self, keywords: list[str], date_range: DateRange | None) -> list[Entry]:
+        """Search entries by keywords without blocking the event loop.
+
+        Args:
+            keywords: Keywords to search for (case-insensitive).
+            date_range: Optional date range to limit the search.
+
+        Returns:
+            Matching entries sorted by timestamp.
+        """
+        if isinstance(self.storage, AsyncStorageRepository):
+            return await self.storage.search_entries(keywords, date_range=date_range)
+        return await asyncio.to_thread(self.storage.search_entries, keywords, date_range=date_range)
+
+    @traced("RetrieverAgent.retrieve")
     async def retrieve(self, retriever_input: RetrieverInput) -> RetrieverOutput:
         """Execute retrieval instructions and return entries.
 
@@ -135,7 +170,7 @@ class RetrieverAgent:
 
             # Execute strategy (with expansion for date_range if enabled)
             if enable_expansion:
-                entries, attempts, exhausted = self._execute_date_range_with_expansion(
+                entries, attempts, exhausted = await self._execute_date_range_with_expansion(
                     attempt_number=i,
                     params=params,
                     vocabulary=retriever_input.vocabulary,
@@ -145,7 +180,7 @@ class RetrieverAgent:
                 if exhausted:
                     expansion_exhausted = True
             else:
-                entries, attempt = self._execute_strategy(
+                entries, attempt = await self._execute_strategy(
                     attempt_number=i,
                     strategy=strategy,
                     params=params,
@@ -196,7 +231,7 @@ class RetrieverAgent:
             expansion_exhausted=expansion_exhausted,
         )
 
-    def _execute_strategy(
+    async def _execute_strategy(
         self,
         attempt_number: int,
         strategy: str,
@@ -221,20 +256,20 @@ class RetrieverAgent:
         strategy_lower = strategy.lower()
 
         if strategy_lower == "date_range":
-            return self._execute_date_range(
+            return await self._execute_date_range(
                 attempt_number=attempt_number,
                 params=params,
                 warnings=warnings,
             )
         elif strategy_lower == "keyword":
-            return self._execute_keyword(
+            return await self._execute_keyword(
                 attempt_number=attempt_number,
                 params=params,
                 vocabulary=vocabulary,
                 warnings=warnings,
             )
         elif strategy_lower == "topical":
-            return self._execute_topical(
+            return await self._execute_topical(
                 attempt_number=attempt_number,
                 params=params,
                 vocabulary=vocabulary,
@@ -245,7 +280,7 @@ class RetrieverAgent:
             warnings.append(f"Unknown strategy '{strategy}' in instruction {attempt_number}, skipping")
             return [], None
 
-    def _execute_date_range(
+    async def _execute_date_range(
         self,
         attempt_number: int,
         params: dict[str, Any],
@@ -279,7 +314,7 @@ class RetrieverAgent:
             warnings.append(f"Invalid date format in instruction {attempt_number}: {e}")
             return [], None
 
-        entries = self.storage.get_entries_by_date_range(start_date, end_date)
+        entries = await self._get_entries_by_date_range(start_date, end_date)
 
         attempt = RetrievalAttempt(
             attempt_number=attempt_number,
@@ -292,7 +327,7 @@ class RetrieverAgent:
 
         return entries, attempt
 
-    def _execute_keyword(
+    async def _execute_keyword(
         self,
         attempt_number: int,
         params: dict[str, Any],
@@ -323,7 +358,7 @@ class RetrieverAgent:
         # Parse optional date range
         date_range = self._parse_date_range(params)
 
-        entries = self.storage.search_entries(expanded, date_range=date_range)
+        entries = await self._search_entries(expanded, date_range)
 
         attempt = RetrievalAttempt(
             attempt_number=attempt_number,
@@ -336,7 +371,7 @@ class RetrieverAgent:
 
         return entries, attempt
 
-    def _execute_topical(
+    async def _execute_topical(
         self,
         attempt_number: int,
         params: dict[str, Any],
@@ -370,7 +405,7 @@ class RetrieverAgent:
         # Parse optional date range
         date_range = self._parse_date_range(params)
 
-        entries = self.storage.search_entries(expanded, date_range=date_range)
+        entries = await self._search_entries(expanded, date_range)
 
         attempt = RetrievalAttempt(
             attempt_number=attempt_number,
@@ -424,7 +459,7 @@ class RetrieverAgent:
         dates = [entry.date for entry in entries]
         return DateRange(start=min(dates), end=max(dates))
 
-    def _execute_date_range_with_expansion(
+    async def _execute_date_range_with_expansion(
         self,
         attempt_number: int,
         params: dict[str, Any],
@@ -449,7 +484,7 @@ class RetrieverAgent:
         attempts: list[RetrievalAttempt] = []
 
         # Tier 0: Original date range
-        entries, attempt = self._execute_date_range(
+        entries, attempt = await self._execute_date_range(
             attempt_number=attempt_number,
             params=params,
             warnings=warnings,
@@ -474,7 +509,7 @@ class RetrieverAgent:
                 "end_date": today.isoformat(),
             }
 
-            entries, tier_attempt = self._execute_date_range(
+            entries, tier_attempt = await self._execute_date_range(
                 attempt_number=attempt_number,
                 params=expanded_params,
                 warnings=[],  # Don't add warnings for expansion attempts
@@ -499,7 +534,7 @@ class RetrieverAgent:
 
         # If we have keywords, try term search fallback
         if keywords:
-            fallback_entries, fallback_attempt = self._execute_keyword(
+            fallback_entries, fallback_attempt = await self._execute_keyword(
                 attempt_number=attempt_number,
                 params={"keywords": keywords, "semantic_expansion": True},
                 vocabulary=vocabulary,
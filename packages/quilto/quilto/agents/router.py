@@ -7,6 +7,7 @@ input content matching against domain descriptions.
 
 from quilto.agents.models import RouterInput, RouterOutput
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class RouterAgent:
@@ -123,6 +124,7 @@ Respond with a JSON object matching this schema:
 - correction_target: string or null (required if CORRECTION)
 - reasoning: string explaining classification"""
 
+    @traced("RouterAgent.classify")
     async def classify(self, router_input: RouterInput) -> RouterOutput:
         """Classify input and select domains.
 
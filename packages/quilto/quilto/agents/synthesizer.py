@@ -5,6 +5,9 @@ responses based on analysis results, grounded in evidence and using domain-appro
 terminology.
 """
 
+from collections.abc import AsyncIterator
+from contextlib import aclosing
+
 from quilto.agents.models import (
     AnalyzerOutput,
     Gap,
@@ -13,6 +16,7 @@ from quilto.agents.models import (
     Verdict,
 )
 from quilto.llm import LLMClient
+from quilto.tracing import traced
 
 
 class SynthesizerAgent:
@@ -150,6 +154,32 @@ class SynthesizerAgent:
         Args:
             synthesizer_input: The SynthesizerInput containing query and analysis.
 
+        Returns:
+            The formatted system prompt string.
+        """
+        return self._build_prompt(synthesizer_input, stream=False)
+
+    def build_stream_prompt(self, synthesizer_input: SynthesizerInput) -> str:
+        """Build the system prompt for streamed response generation.
+
+        Same guidance as build_prompt, but asks for the answer as plain
+        text instead of a JSON object, so it can be shown as it arrives.
+
+        Args:
+            synthesizer_input: The SynthesizerInput containing query and analysis.
+
+        Returns:
+            The formatted system prompt string.
+        """
+        return self._build_prompt(synthesizer_input, stream=True)
+
+    def _build_prompt(self, synthesizer_input: SynthesizerInput, stream: bool) -> str:
+        """Build the system prompt for JSON or plain-text output.
+
+        Args:
+            synthesizer_input: The SynthesizerInput containing query and analysis.
+            stream: If True, ask for plain text instead of JSON.
+
         Returns:
             The formatted system prompt string.
         """
@@ -172,6 +202,38 @@ class SynthesizerAgent:
 - Nuanced interpretation of patterns
 - Include relevant trends and comparisons"""
 
+        # Get expected confidence
+        expected_confidence = self._get_confidence_from_verdict(synthesizer_input.analysis.verdict)
+
+        if stream:
+            gaps_instruction = "The closing part\nmust list what information is missing in user-friendly language."
+            output_section = f"""=== CONFIDENCE ===
+
+Based on analysis verdict ({synthesizer_input.analysis.verdict.value}),
+answer with {expected_confidence} confidence.
+
+=== OUTPUT (PLAIN TEXT) ===
+
+Respond with the user-facing answer only, as plain text (markdown allowed).
+Do not wrap it in JSON or code fences. Cite evidence inline."""
+        else:
+            gaps_instruction = (
+                "The gaps_disclosed field\nmust list what information is missing in user-friendly language."
+            )
+            output_section = f"""=== CONFIDENCE MAPPING ===
+
+Based on analysis verdict ({synthesizer_input.analysis.verdict.value}),
+set confidence to: {expected_confidence}
+
+=== OUTPUT (JSON) ===
+
+Respond with a JSON object containing:
+- response: string (the user-facing answer, required, non-empty)
+- key_points: list of strings (main takeaways, 2-5 points)
+- evidence_cited: list of strings (dates/entries referenced, e.g., "2026-01-10: bench 185x5")
+- gaps_disclosed: list of strings (empty if not partial, otherwise gaps in user-friendly language)
+- confidence: "{expected_confidence}" (based on analysis verdict)"""
+
         # Partial answer handling
         partial_instruction = ""
         if synthesizer_input.is_partial:
@@ -187,11 +249,7 @@ To provide a more complete answer, I would need: [list gaps]"
 UNANSWERED GAPS:
 {gaps_text}
 
-IMPORTANT: Be transparent about what you cannot answer. The gaps_disclosed field
-must list what information is missing in user-friendly language."""
-
-        # Get expected confidence
-        expected_confidence = self._get_confidence_from_verdict(synthesizer_input.analysis.verdict)
+IMPORTANT: Be transparent about what you cannot answer. {gaps_instruction}"""
 
         return f"""ROLE: You are a response generation agent that creates user-facing answers.
 
@@ -222,20 +280,9 @@ Is partial answer: {synthesizer_input.is_partial}
 4. Match requested response style (concise vs detailed)
 5. If partial: clearly state what you can answer and what remains unknown
 
-=== CONFIDENCE MAPPING ===
-
-Based on analysis verdict ({synthesizer_input.analysis.verdict.value}),
-set confidence to: {expected_confidence}
-
-=== OUTPUT (JSON) ===
-
-Respond with a JSON object containing:
-- response: string (the user-facing answer, required, non-empty)
-- key_points: list of strings (main takeaways, 2-5 points)
-- evidence_cited: list of strings (dates/entries referenced, e.g., "2026-01-10: bench 185x5")
-- gaps_disclosed: list of strings (empty if not partial, otherwise gaps in user-friendly language)
-- confidence: "{expected_confidence}" (based on analysis verdict)"""
+{output_section}"""
 
+    @traced("SynthesizerAgent.synthesize")
     async def synthesize(self, synthesizer_input: SynthesizerInput) -> SynthesizerOutput:
         """Generate a user-facing response from analysis results.
 
@@ -267,3 +314,32 @@ Respond with a JSON object containing:
         )
         assert isinstance(result, SynthesizerOutput), f"Expected SynthesizerOutput, got {type(result)}"
         return result
+
+    async def synthesize_stream(self, synthesizer_input: SynthesizerInput) -> AsyncIterator[str]:
+        """Generate a user-facing response, yielding text as it arrives.
+
+        Streaming counterpart of synthesize for lower time-to-first-token.
+        The model is asked for plain text (see build_stream_prompt), so
+        only the response text is produced; key points and evidence are
+        not. The confidence for the answer is the one synthesize would
+        report for the same verdict.
+
+        Args:
+            synthesizer_input: SynthesizerInput with query, analysis, and context.
+
+        Yields:
+            Pieces of the response text, in order.
+
+        Raises:
+            ValueError: If query is empty or whitespace-only.
+        """
+        if not synthesizer_input.query or not synthesizer_input.query.strip():
+            raise ValueError("query cannot be empty or whitespace-only")
+
+        messages = [
+            {"role": "system", "content": self.build_stream_prompt(synthesizer_input)},
+            {"role": "user", "content": synthesizer_input.query},
+        ]
+        async with aclosing(self.llm_client.stream(agent=self.AGENT_NAME, messages=messages)) as deltas:
+            async for delta in deltas:
+                yield delta
@@ -5,6 +5,7 @@ the correction flow: parsing correction input and saving with upsert
 semantics to storage.
 """
 
+import asyncio
 from datetime import UTC, datetime
 
 from pydantic import BaseModel
@@ -12,7 +13,7 @@ from pydantic import BaseModel
 from quilto.agents import ParserAgent
 from quilto.agents.models import InputType, ParserInput, RouterOutput
 from quilto.flow.models import CorrectionResult
-from quilto.storage import Entry, StorageRepository
+from quilto.storage import AsyncStorageRepository, Entry, StorageRepository
 
 __all__ = ["process_correction"]
 
@@ -20,7 +21,7 @@ __all__ = ["process_correction"]
 async def process_correction(
     router_output: RouterOutput,
     parser_agent: ParserAgent,
-    storage: StorageRepository,
+    storage: StorageRepository | AsyncStorageRepository,
     recent_entries: list[Entry],
     domain_schemas: dict[str, type[BaseModel]],
     vocabulary: dict[str, str],
@@ -37,7 +38,8 @@ async def process_correction(
     Args:
         router_output: RouterOutput with input_type=CORRECTION and correction_target.
         parser_agent: ParserAgent instance for extraction.
-        storage: StorageRepository for saving corrected entry.
+        storage: Storage repository for saving corrected entry; the write
+            runs off the event loop.
         recent_entries: Recent entries for target identification.
         domain_schemas: Domain schemas for parsing.
         vocabulary: Vocabulary for term normalization.
@@ -112,7 +114,10 @@ async def process_correction(
     )
 
     # 6. Save with correction (triggers append + upsert)
-    storage.save_entry(entry, correction=parser_output)
+    if isinstance(storage, AsyncStorageRepository):
+        await storage.save_entry(entry, correction=parser_output)
+    else:
+        await asyncio.to_thread(storage.save_entry, entry, correction=parser_output)
 
     # 7. Return success
     return CorrectionResult(
@@ -4,27 +4,47 @@ This module provides a unified interface for making LLM calls
 across different providers (Ollama, Anthropic, OpenAI, Azure, OpenRouter).
 """
 
+from quilto.llm.breaker import CircuitBreaker, CircuitBreakerStats, CircuitState
+from quilto.llm.cache import ResponseCache, ResponseCacheStats, make_cache_key
 from quilto.llm.client import LLMClient
 from quilto.llm.config import (
     AgentConfig,
+    CircuitBreakerConfig,
+    HedgingConfig,
     LLMConfig,
     ModelResolution,
     ProviderConfig,
+    ResponseCacheConfig,
     TierModels,
 )
 from quilto.llm.errors import ErrorType, PartialResult, classify_error
+from quilto.llm.hedging import HedgeStats, LatencyTracker
+from quilto.llm.limits import LimiterStats, RequestLimiter
 from quilto.llm.loader import load_llm_config, load_llm_config_from_dict
 
 __all__ = [
     "AgentConfig",
+    "CircuitBreaker",
+    "CircuitBreakerConfig",
+    "CircuitBreakerStats",
+    "CircuitState",
     "ErrorType",
+    "HedgeStats",
+    "HedgingConfig",
     "LLMClient",
     "LLMConfig",
+    "LatencyTracker",
+    "LimiterStats",
     "ModelResolution",
     "PartialResult",
     "ProviderConfig",
+    "RequestLimiter",
+    "ResponseCache",
+    "ResponseCacheConfig",
+    "ResponseCacheStats",
     "TierModels",
     "classify_error",
     "load_llm_config",
     "load_llm_config_from_dict",
+    "make_cache_key",
 ]
@@ -0,0 +1,131 @@
+"""Per-provider circuit breaker for the LLM error cascade.
+
+A breaker counts consecutive outage-type failures (transient or unknown
+errors) of one provider. After failure_threshold of them it opens, and
+the cascade skips the provider in favour of the fallback instead of paying
+the full retry-with-backoff cycle on every request. After
+recovery_timeout seconds it lets a limited number of trial requests
+through (half-open); a success closes it again, a failure re-opens it.
+"""
+
+from time import monotonic
+from typing import Literal
+
+from pydantic import BaseModel, ConfigDict
+
+CircuitState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerStats(BaseModel):
+    """Snapshot of a CircuitBreaker.
+
+    Attributes:
+        state: Current breaker state.
+        consecutive_failures: Outage-type failures since the last success.
+        times_opened: How often the breaker has opened.
+        rejected: Requests turned away while the breaker was open.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    state: CircuitState
+    consecutive_failures: int
+    times_opened: int
+    rejected: int
+
+
+class CircuitBreaker:
+    """Closed/open/half-open breaker for one provider.
+
+    Example:
+        >>> breaker = CircuitBreaker(failure_threshold=5, recovery_timeout=30.0)
+        >>> if breaker.allow_request():
+        ...     try:
+        ...         await call_provider()
+        ...         breaker.record_success()
+        ...     except Exception:
+        ...         breaker.record_failure()
+    """
+
+    def __init__(
+        self, failure_threshold: int = 5, recovery_timeout: float = 30.0, half_open_max_calls: int = 1
+    ) -> None:
+        """Initialize a closed breaker.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            recovery_timeout: Seconds the breaker stays open before trials.
+            half_open_max_calls: Trial requests allowed at once when half-open.
+        """
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._open = False
+        self._opened_at = 0.0
+        self._trials = 0
+        self._failures = 0
+        self._times_opened = 0
+        self._rejected = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state; an open breaker turns half-open once its timeout passes."""
+        if not self._open:
+            return "closed"
+        if monotonic() - self._opened_at >= self.recovery_timeout:
+            return "half_open"
+        return "open"
+
+    def allow_request(self) -> bool:
+        """Check whether a request may be sent to the provider.
+
+        In the half-open state this admits a trial request (counted until
+        its outcome is recorded).
+
+        Returns:
+            True if the request may be sent.
+        """
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "half_open" and self._trials < self.half_open_max_calls:
+            self._trials += 1
+            return True
+        self._rejected += 1
+        return False
+
+    def record_success(self) -> None:
+        """Record a successful request; closes the breaker."""
+        self._open = False
+        self._trials = 0
+        self._failures = 0
+
+    def record_failure(self) -> None:
+        """Record an outage-type failure; may open (or re-open) the breaker."""
+        self._failures += 1
+        if self._open:
+            # A failed trial (or a straggler) re-opens for another timeout
+            self._trials = max(self._trials - 1, 0)
+            self._opened_at = monotonic()
+        elif self._failures >= self.failure_threshold:
+            self._open = True
+            self._opened_at = monotonic()
+            self._times_opened += 1
+
+    def release_trial(self) -> None:
+        """Give back a half-open trial whose request was abandoned (cancelled)."""
+        if self._open:
+            self._trials = max(self._trials - 1, 0)
+
+    def stats(self) -> CircuitBreakerStats:
+        """Get a snapshot of the breaker.
+
+        Returns:
+            CircuitBreakerStats with state and counters.
+        """
+        return CircuitBreakerStats(
+            state=self.state,
+            consecutive_failures=self._failures,
+            times_opened=self._times_opened,
+            rejected=self._rejected,
+        )
@@ -0,0 +1,278 @@
+"""Response cache for LLMClient completions.
+
+Identical requests (same litellm model, messages, response format and
+other request arguments) are answered from the cache instead of calling
+the provider again. Lookups go through an in-memory LRU tier first and
+then an optional SQLite tier on disk, which survives restarts and is
+shared by processes using the same file. Entries expire after a TTL.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import Counter, OrderedDict
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+# Bump when the schema changes; older cache files are dropped
+_SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    expires_at REAL
+) WITHOUT ROWID;
+"""
+
+# Request arguments that do not change the response
+_IGNORED_KWARGS = frozenset({"api_key", "timeout", "num_retries", "metadata"})
+
+
+class ResponseCacheStats(BaseModel):
+    """Snapshot of ResponseCache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no entry or an expired one.
+        disk_hits: Hits answered by the SQLite tier.
+        stores: Responses written to the cache.
+        entries: Number of responses held in memory.
+        agent_hits: Hits per agent.
+        agent_misses: Misses per agent.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    hits: int
+    misses: int
+    disk_hits: int
+    stores: int
+    entries: int
+    agent_hits: dict[str, int]
+    agent_misses: dict[str, int]
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def make_cache_key(completion_kwargs: dict[str, Any]) -> str:
+    """Hash the arguments of a litellm completion request.
+
+    Credentials and transport options (api_key, timeout, ...) are left out
+    so they do not split the cache.
+
+    Args:
+        completion_kwargs: Arguments passed to litellm.acompletion.
+
+    Returns:
+        Hex SHA-256 digest of the canonical JSON of the request.
+    """
+    relevant = {k: v for k, v in completion_kwargs.items() if k not in _IGNORED_KWARGS}
+    canonical = json.dumps(relevant, sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+class ResponseCache:
+    """Two-tier (memory LRU over SQLite) cache of completion responses.
+
+    The memory tier is bounded by entry count. The SQLite tier is only
+    used when a path is given; its reads and writes run in a worker thread
+    so they never block the event loop.
+
+    Attributes:
+        db_path: Path to the SQLite database file, or None for memory only.
+        max_entries: Maximum number of responses kept in memory.
+
+    Example:
+        >>> cache = ResponseCache(Path("logs/llm-cache.sqlite"))
+        >>> key = make_cache_key(completion_kwargs)
+        >>> response = await cache.get(key, agent="router")
+        >>> if response is None:
+        ...     response = await call_provider()
+        ...     await cache.put(key, response, ttl=3600)
+    """
+
+    def __init__(self, db_path: Path | None = None, max_entries: int = 1024) -> None:
+        """Initialize the cache, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file, or None for memory only.
+            max_entries: Maximum number of responses kept in memory.
+
+        Raises:
+            ValueError: If max_entries is negative.
+        """
+        if max_entries < 0:
+            raise ValueError("max_entries must be >= 0")
+        self.db_path = db_path
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        # Guards the connection separately so disk I/O never holds up memory lookups
+        self._db_lock = threading.Lock()
+        self._items: OrderedDict[str, tuple[str, float | None]] = OrderedDict()
+        self._hits: Counter[str] = Counter()
+        self._misses: Counter[str] = Counter()
+        self._disk_hits = 0
+        self._stores = 0
+        self._conn: sqlite3.Connection | None = None
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            version = int(self._conn.execute("PRAGMA user_version").fetchone()[0])
+            if version != _SCHEMA_VERSION:
+                self._conn.execute("DROP TABLE IF EXISTS responses")
+                self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+            self._conn.executescript(_SCHEMA)
+            self._conn.execute("DELETE FROM responses WHERE expires_at IS NOT NULL AND expires_at <= ?", (time.time(),))
+            self._conn.commit()
+
+    async def get(self, key: str, agent: str = "") -> str | None:
+        """Look up a cached response.
+
+        Args:
+            key: Key from make_cache_key.
+            agent: Agent name the hit or miss is counted for.
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        now = time.time()
+        with self._lock:
+            item = self._items.get(key)
+            if item is not None and (item[1] is None or item[1] > now):
+                self._items.move_to_end(key)
+                self._hits[agent] += 1
+                return item[0]
+            if item is not None:
+                del self._items[key]
+
+        item = await asyncio.to_thread(self._disk_get, key, now) if self._conn is not None else None
+        with self._lock:
+            if item is None:
+                self._misses[agent] += 1
+                return None
+            self._hits[agent] += 1
+            self._disk_hits += 1
+            self._remember(key, item)
+        return item[0]
+
+    async def put(self, key: str, value: str, ttl: float | None = None) -> None:
+        """Store a response.
+
+        Args:
+            key: Key from make_cache_key.
+            value: Response content.
+            ttl: Seconds until the response expires, or None to keep it.
+        """
+        item = (value, None if ttl is None else time.time() + ttl)
+        with self._lock:
+            self._stores += 1
+            self._remember(key, item)
+        if self._conn is not None:
+            await asyncio.to_thread(self._disk_put, key, item)
+
+    async def delete(self, key: str) -> None:
+        """Drop a response from both tiers.
+
+        Args:
+            key: Key from make_cache_key.
+        """
+        with self._lock:
+            self._items.pop(key, None)
+        if self._conn is not None:
+            await asyncio.to_thread(self._disk_delete, key)
+
+    def stats(self) -> ResponseCacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            ResponseCacheStats with overall and per-agent counts.
+        """
+        with self._lock:
+            return ResponseCacheStats(
+                hits=sum(self._hits.values()),
+                misses=sum(self._misses.values()),
+                disk_hits=self._disk_hits,
+                stores=self._stores,
+                entries=len(self._items),
+                agent_hits=dict(self._hits),
+                agent_misses=dict(self._misses),
+            )
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._db_lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def _remember(self, key: str, item: tuple[str, float | None]) -> None:
+        """Insert into the memory tier; the caller holds the lock.
+
+        Args:
+            key: Cache key.
+            item: (value, expires_at) pair.
+        """
+        if self.max_entries == 0:
+            return
+        self._items[key] = item
+        self._items.move_to_end(key)
+        while len(self._items) > self.max_entries:
+            self._items.popitem(last=False)
+
+    def _disk_get(self, key: str, now: float) -> tuple[str, float | None] | None:
+        """Read a fresh response from the SQLite tier.
+
+        Args:
+            key: Cache key.
+            now: Current time for the expiry check.
+
+        Returns:
+            (value, expires_at) pair, or None if missing or expired.
+        """
+        with self._db_lock:
+            if self._conn is None:
+                return None
+            row = self._conn.execute("SELECT value, expires_at FROM responses WHERE key = ?", (key,)).fetchone()
+        if row is None or (row[1] is not None and row[1] <= now):
+            return None
+        return (row[0], row[1])
+
+    def _disk_put(self, key: str, item: tuple[str, float | None]) -> None:
+        """Write a response to the SQLite tier.
+
+        Args:
+            key: Cache key.
+            item: (value, expires_at) pair.
+        """
+        with self._db_lock:
+            if self._conn is None:
+                return
+            self._conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, item[0], item[1]),
+            )
+            self._conn.commit()
+
+    def _disk_delete(self, key: str) -> None:
+        """Delete a response from the SQLite tier.
+
+        Args:
+            key: Cache key.
+        """
+        with self._db_lock:
+            if self._conn is None:
+                return
+            self._conn.execute("DELETE FROM responses WHERE key = ?", (key,))
+            self._conn.commit()
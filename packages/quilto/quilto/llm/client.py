@@ -6,13 +6,21 @@ using litellm as the underlying API.
 """
 
 import asyncio
+import functools
 import logging
 import random
-from typing import Any
+from collections import Counter
+from collections.abc import AsyncGenerator, Callable, Coroutine
+from contextlib import AsyncExitStack
+from dataclasses import dataclass
+from time import monotonic
+from typing import Any, TypeVar
 
 import litellm
 from pydantic import BaseModel
 
+from quilto.llm.breaker import CircuitBreaker, CircuitBreakerStats
+from quilto.llm.cache import ResponseCache, ResponseCacheStats, make_cache_key
 from quilto.llm.config import (
     AgentConfig,
     LLMConfig,
@@ -20,9 +28,68 @@ from quilto.llm.config import (
     ProviderName,
 )
 from quilto.llm.errors import ErrorType, PartialResult, classify_error
+from quilto.llm.hedging import HedgeStats, LatencyTracker
+from quilto.llm.limits import LimiterStats, RequestLimiter
+from quilto.tracing import Span, current_span, get_tracer, traced
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# A retry cycle on one provider: (result, last_exception, attempts)
+_Attempt = Callable[[], Coroutine[Any, Any, tuple[T | None, Exception | None, int]]]
+
+
+@dataclass
+class _Flight:
+    """A litellm call shared by identical concurrent requests.
+
+    Attributes:
+        task: The running call.
+        waiters: Number of requests currently awaiting it.
+    """
+
+    task: asyncio.Future[str]
+    waiters: int = 0
+
+
+def _estimate_tokens(completion_kwargs: dict[str, Any]) -> int:
+    """Roughly estimate the tokens a request will use before sending it.
+
+    Counts about four characters per prompt token, plus max_tokens for the
+    completion when given. Budgets are corrected with the real usage once
+    the response arrives.
+
+    Args:
+        completion_kwargs: Arguments passed to litellm.acompletion.
+
+    Returns:
+        Estimated total tokens.
+    """
+    messages: list[dict[str, Any]] = completion_kwargs.get("messages", [])
+    prompt_chars = sum(len(str(message.get("content") or "")) for message in messages)
+    return prompt_chars // 4 + int(completion_kwargs.get("max_tokens") or 0)
+
+
+def _record_usage(usage: Any, limiters: list[RequestLimiter], estimated: int, span: Span | None) -> None:
+    """Apply the token usage a provider reported for a request.
+
+    Args:
+        usage: The response's usage object, if any.
+        limiters: Limiters the request was admitted by.
+        estimated: Tokens taken from their budgets on admission.
+        span: Span to record prompt/completion/total tokens on.
+    """
+    used = getattr(usage, "total_tokens", None)
+    if isinstance(used, int):
+        for limiter in limiters:
+            limiter.record_tokens(used, estimated)
+    if span is not None:
+        for key in ("prompt_tokens", "completion_tokens", "total_tokens"):
+            value = getattr(usage, key, None)
+            if isinstance(value, int):
+                span.set(key, value)
+
 
 class LLMClient:
     """Unified LLM client with provider abstraction.
@@ -33,6 +100,7 @@ class LLMClient:
 
     Attributes:
         config: The LLM configuration.
+        cache: Response cache, or None unless enabled in config.cache.
 
     Example:
         >>> from quilto.llm import LLMClient, load_llm_config
@@ -52,6 +120,40 @@ class LLMClient:
                 tiers, and agent settings.
         """
         self.config = config
+        self._inflight: dict[str, _Flight] = {}
+        self._coalesced = 0
+        self._limiters: dict[str, RequestLimiter] = {}
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._latencies: dict[str, LatencyTracker] = {}
+        self._hedge_requests: Counter[str] = Counter()
+        self._hedges: Counter[str] = Counter()
+        self._hedge_wins: Counter[str] = Counter()
+        for name, provider_config in config.providers.items():
+            if (
+                provider_config.max_concurrency
+                or provider_config.requests_per_minute
+                or provider_config.tokens_per_minute
+            ):
+                self._limiters[f"provider:{name}"] = RequestLimiter(
+                    provider_config.max_concurrency,
+                    provider_config.requests_per_minute,
+                    provider_config.tokens_per_minute,
+                )
+        for name, agent_config in config.agents.items():
+            if agent_config.max_concurrency:
+                self._limiters[f"agent:{name}"] = RequestLimiter(agent_config.max_concurrency)
+        self.cache: ResponseCache | None = None
+        if config.cache.enabled:
+            self.cache = ResponseCache(config.cache.path, max_entries=config.cache.max_memory_entries)
+
+    async def aclose(self) -> None:
+        """Release resources owned by the client.
+
+        Call once when a long-lived client is no longer needed (e.g. on
+        application shutdown). Safe to call more than once.
+        """
+        if self.cache is not None:
+            self.cache.close()
 
     def _get_litellm_model(self, provider: ProviderName, model: str) -> str:
         """Get the litellm-formatted model name.
@@ -150,7 +252,8 @@ class LLMClient:
         """Complete a chat request via litellm.
 
         Resolves the model for the agent and makes an async completion
-        request using litellm.
+        request using litellm. When the response cache is enabled, an
+        identical earlier request is answered from the cache.
 
         Args:
             agent: The agent name.
@@ -161,22 +264,7 @@ class LLMClient:
         Returns:
             The response content as a string.
         """
-        resolution = self.resolve_model(agent, force_cloud=force_cloud)
-
-        # Build kwargs for litellm
-        completion_kwargs: dict[str, Any] = {
-            "model": resolution.litellm_model,
-            "messages": messages,
-            **kwargs,
-        }
-
-        if resolution.api_base:
-            completion_kwargs["api_base"] = resolution.api_base
-        if resolution.api_key:
-            completion_kwargs["api_key"] = resolution.api_key
-
-        response = await litellm.acompletion(**completion_kwargs)  # type: ignore[reportUnknownMemberType]
-        return response.choices[0].message.content or ""  # type: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
+        return await self._complete(agent, messages, force_cloud, kwargs, lambda response: response)
 
     async def complete_structured(
         self,
@@ -190,6 +278,7 @@ class LLMClient:
 
         Makes a completion request with JSON response format and
         validates the response against the provided Pydantic model.
+        Only responses that validate are cached.
 
         Args:
             agent: The agent name.
@@ -205,23 +294,406 @@ class LLMClient:
             ValueError: If LLM returns invalid JSON or response doesn't
                 match the expected schema.
         """
-        response = await self.complete(
-            agent=agent,
-            messages=messages,
-            force_cloud=force_cloud,
-            response_format={"type": "json_object"},
+
+        def validate(response: str) -> BaseModel:
+            try:
+                return response_model.model_validate_json(response)
+            except Exception as e:
+                logger.error(
+                    "Failed to parse structured response for agent '%s'. Expected schema: %s. Raw response: %s",
+                    agent,
+                    response_model.__name__,
+                    response[:500] if len(response) > 500 else response,
+                )
+                raise ValueError(f"LLM response failed schema validation for {response_model.__name__}: {e}") from e
+
+        structured_kwargs = {"response_format": {"type": "json_object"}, **kwargs}
+        return await self._complete(agent, messages, force_cloud, structured_kwargs, validate)
+
+    async def _complete(
+        self,
+        agent: str,
+        messages: list[dict[str, Any]],
+        force_cloud: bool,
+        kwargs: dict[str, Any],
+        parse: Callable[[str], T],
+    ) -> T:
+        """Make one completion request, going through the response cache.
+
+        The response is parsed before it is cached, so responses that fail
+        parsing are never cached. A cached response that no longer parses
+        is dropped and requested again. The request is traced as an
+        "LLMClient.complete" span.
+
+        Args:
+            agent: The agent name.
+            messages: Chat messages in OpenAI format.
+            force_cloud: If True, use fallback_provider.
+            kwargs: Additional arguments passed to litellm.acompletion.
+            parse: Converts the response content to the return value.
+
+        Returns:
+            The parsed response.
+        """
+        with get_tracer().span("LLMClient.complete", "llm", agent=agent, fallback=force_cloud) as span:
+            resolution = self.resolve_model(agent, force_cloud=force_cloud)
+            completion_kwargs = self._completion_kwargs(resolution, messages, kwargs)
+            span.set("provider", resolution.provider)
+            span.set("model", resolution.litellm_model)
+
+            agent_config = self.config.agents.get(agent, AgentConfig())
+            cache = self.cache if agent_config.cache else None
+            request_key = make_cache_key(completion_kwargs)
+            if cache is not None:
+                cached = await cache.get(request_key, agent=agent)
+                if cached is not None:
+                    try:
+                        result = parse(cached)
+                        span.set("cache_hit", True)
+                        return result
+                    except ValueError:
+                        await cache.delete(request_key)
+            span.set("cache_hit", False)
+
+            if self.config.coalesce_requests:
+                content, started = await self._acompletion_shared(
+                    request_key, agent, resolution.provider, completion_kwargs
+                )
+            else:
+                content, started = await self._acompletion(agent, resolution.provider, completion_kwargs), True
+            span.set("coalesced", not started)
+            result = parse(content)
+            # Joined requests got the same response; the request that made the call stores it
+            if cache is not None and started:
+                ttl = agent_config.cache_ttl if agent_config.cache_ttl is not None else self.config.cache.ttl
+                await cache.put(request_key, content, ttl=ttl)
+            return result
+
+    @staticmethod
+    def _completion_kwargs(
+        resolution: ModelResolution, messages: list[dict[str, Any]], kwargs: dict[str, Any]
+    ) -> dict[str, Any]:
+        """Build the arguments for litellm.acompletion.
+
+        Args:
+            resolution: The resolved model and provider settings.
+            messages: Chat messages in OpenAI format.
+            kwargs: Additional arguments passed to litellm.acompletion.
+
+        Returns:
+            Keyword arguments for litellm.acompletion.
+        """
+        completion_kwargs: dict[str, Any] = {
+            "model": resolution.litellm_model,
+            "messages": messages,
             **kwargs,
-        )
+        }
+
+        if resolution.api_base:
+            completion_kwargs["api_base"] = resolution.api_base
+        if resolution.api_key:
+            completion_kwargs["api_key"] = resolution.api_key
+        return completion_kwargs
+
+    def _request_limiters(self, agent: str, provider: ProviderName) -> list[RequestLimiter]:
+        """Get the limiters a request has to pass, agent first.
+
+        Args:
+            agent: The agent name.
+            provider: The provider the request goes to.
+
+        Returns:
+            The configured agent and provider limiters.
+        """
+        return [
+            limiter
+            for limiter in (self._limiters.get(f"agent:{agent}"), self._limiters.get(f"provider:{provider}"))
+            if limiter is not None
+        ]
+
+    async def stream(
+        self,
+        agent: str,
+        messages: list[dict[str, Any]],
+        force_cloud: bool = False,
+        **kwargs: Any,
+    ) -> AsyncGenerator[str]:
+        """Stream a chat completion as it is generated.
+
+        Sends the request with stream=True within the agent and provider
+        limits (the slot is held until the stream ends) and yields the
+        content deltas. Streamed requests bypass the response cache and
+        request coalescing. Close the generator (aclose) when stopping
+        early so the slot is released right away.
+
+        Errors before the first delta go through the same cascade as
+        complete_with_cascade: transient errors are retried with backoff,
+        then the fallback provider is tried, and a primary whose circuit
+        breaker is open is skipped. Outcomes are recorded on the provider's
+        breaker. Once a delta has been yielded the response cannot be
+        replayed, so a later error raises from the iterator. Streams are
+        not hedged or degraded: if every attempt fails, the last error is
+        raised.
+
+        Args:
+            agent: The agent name.
+            messages: Chat messages in OpenAI format.
+            force_cloud: If True, use fallback_provider.
+            **kwargs: Additional arguments passed to litellm.acompletion.
+
+        Yields:
+            Non-empty pieces of the response content, in order.
+
+        Example:
+            >>> async for delta in client.stream("synthesizer", messages):
+            ...     print(delta, end="", flush=True)
+        """
+        primary = self.resolve_model(agent, force_cloud=force_cloud).provider
+        has_fallback = not force_cloud and self._has_fallback(agent, primary)
+        primary_breaker = self._get_breaker(primary)
+        half_open = primary_breaker is not None and primary_breaker.state == "half_open"
+        # Breaker whose half-open trial this stream holds until an outcome is recorded
+        trial: CircuitBreaker | None = None
+        cycles: list[bool] = []
+        if self._primary_allowed(primary, has_fallback):
+            cycles.append(force_cloud)
+            if has_fallback and half_open:
+                trial = primary_breaker
+        if has_fallback:
+            cycles.append(True)
+
+        # Not made current: the generator's caller runs between yields
+        tracer = get_tracer()
+        span = tracer.start_span("LLMClient.stream", "llm", agent=agent, fallback=force_cloud)
+        error: BaseException | None = None
+        attempts = 0
+        last_exception: Exception | None = None
         try:
-            return response_model.model_validate_json(response)
-        except Exception as e:
-            logger.error(
-                "Failed to parse structured response for agent '%s'. Expected schema: %s. Raw response: %s",
-                agent,
-                response_model.__name__,
-                response[:500] if len(response) > 500 else response,
-            )
-            raise ValueError(f"LLM response failed schema validation for {response_model.__name__}: {e}") from e
+            for use_fallback in cycles:
+                resolution = self.resolve_model(agent, force_cloud=use_fallback)
+                breaker = self._get_breaker(resolution.provider)
+                span.set("provider", resolution.provider)
+                span.set("model", resolution.litellm_model)
+                span.set("fallback_used", use_fallback and not force_cloud)
+                for attempt in range(self.config.max_retries):
+                    attempts += 1
+                    span.set("attempts", attempts)
+                    deltas = self._stream_attempt(agent, resolution, messages, kwargs, span)
+                    try:
+                        try:
+                            first = await anext(deltas, None)
+                        except asyncio.CancelledError:
+                            if trial is not None:
+                                trial.release_trial()
+                            raise
+                        except Exception as e:
+                            last_exception = e
+                            error_type = classify_error(e)
+                            self._record_breaker_failure(breaker, error_type)
+                            trial = None
+                            logger.warning(
+                                "LLM stream failed before the first token (attempt %d/%d, type=%s): %s",
+                                attempt + 1,
+                                self.config.max_retries,
+                                error_type.value,
+                                str(e),
+                            )
+                            if error_type == ErrorType.PERMANENT:
+                                break
+                            # The provider is considered down; fall back
+                            if has_fallback and not use_fallback and breaker is not None and breaker.state == "open":
+                                break
+                            if attempt < self.config.max_retries - 1:
+                                await asyncio.sleep(
+                                    self.config.base_retry_delay * (2**attempt) + random.uniform(0, 0.5)
+                                )
+                            continue
+
+                        # The provider answered: commit to it
+                        if breaker is not None:
+                            breaker.record_success()
+                        trial = None
+                        if first is None:
+                            return
+                        try:
+                            yield first
+                            async for delta in deltas:
+                                yield delta
+                        except Exception as e:
+                            self._record_breaker_failure(breaker, classify_error(e))
+                            raise
+                        return
+                    finally:
+                        await deltas.aclose()
+
+                if has_fallback and not use_fallback:
+                    logger.warning(
+                        "Primary provider %s failed to stream after %d attempts, trying fallback %s",
+                        resolution.provider,
+                        attempts,
+                        self.config.fallback_provider,
+                    )
+
+            raise last_exception or RuntimeError(f"No provider available to stream for agent '{agent}'")
+        except BaseException as e:
+            if not isinstance(e, GeneratorExit):
+                error = e
+            raise
+        finally:
+            tracer.end_span(span, error)
+
+    async def _stream_attempt(
+        self,
+        agent: str,
+        resolution: ModelResolution,
+        messages: list[dict[str, Any]],
+        kwargs: dict[str, Any],
+        span: Span,
+    ) -> AsyncGenerator[str]:
+        """Send one streamed request and yield its content deltas.
+
+        Args:
+            agent: The agent name.
+            resolution: The resolved model and provider settings.
+            messages: Chat messages in OpenAI format.
+            kwargs: Additional arguments passed to litellm.acompletion.
+            span: Span to record chunks and token usage on.
+
+        Yields:
+            Non-empty pieces of the response content, in order.
+        """
+        completion_kwargs = self._completion_kwargs(resolution, messages, {**kwargs, "stream": True})
+        limiters = self._request_limiters(agent, resolution.provider)
+        estimated = _estimate_tokens(completion_kwargs) if any(lim.limits_tokens for lim in limiters) else 0
+        async with AsyncExitStack() as stack:
+            for limiter in limiters:
+                await stack.enter_async_context(limiter.slot(estimated))
+            response = await litellm.acompletion(**completion_kwargs)  # type: ignore[reportUnknownMemberType]
+            async for chunk in response:  # type: ignore[reportUnknownVariableType]
+                # Providers that report usage do so on the last chunk
+                _record_usage(getattr(chunk, "usage", None), limiters, estimated, span)  # type: ignore[reportUnknownArgumentType]
+                choices = getattr(chunk, "choices", None)  # type: ignore[reportUnknownArgumentType]
+                delta = getattr(getattr(choices[0], "delta", None), "content", None) if choices else None
+                if delta:
+                    span.add("chunks")
+                    yield str(delta)
+
+    async def _acompletion(self, agent: str, provider: ProviderName, completion_kwargs: dict[str, Any]) -> str:
+        """Call litellm.acompletion within the agent and provider limits.
+
+        Waits for a slot in the agent's and then the provider's limiter
+        (see LLMConfig limits), sends the request, and corrects the token
+        budgets with the usage the provider reports. The latency of
+        successful calls, including the wait, is recorded for hedging (for
+        cancelled calls, the time they ran as a lower bound), and the token
+        usage on the current span.
+
+        Args:
+            agent: The agent name.
+            provider: The provider the request goes to.
+            completion_kwargs: Arguments passed to litellm.acompletion.
+
+        Returns:
+            The response content as a string.
+        """
+        limiters = self._request_limiters(agent, provider)
+        estimated = _estimate_tokens(completion_kwargs) if any(lim.limits_tokens for lim in limiters) else 0
+        tracker = self._latencies.setdefault(provider, LatencyTracker())
+        start = monotonic()
+        try:
+            async with AsyncExitStack() as stack:
+                for limiter in limiters:
+                    await stack.enter_async_context(limiter.slot(estimated))
+                response = await litellm.acompletion(**completion_kwargs)  # type: ignore[reportUnknownMemberType]
+        except asyncio.CancelledError:
+            # An out-hedged request took at least this long; dropping it would
+            # leave only the fast requests in the window and shrink the delay
+            tracker.record(monotonic() - start)
+            raise
+        tracker.record(monotonic() - start)
+
+        _record_usage(getattr(response, "usage", None), limiters, estimated, current_span())
+        return str(response.choices[0].message.content or "")  # type: ignore[reportUnknownMemberType,reportAttributeAccessIssue]
+
+    def limiter_stats(self) -> dict[str, LimiterStats]:
+        """Get queue depth and wait times of the configured limits.
+
+        Returns:
+            LimiterStats keyed by "provider:<name>" or "agent:<name>", for
+            providers and agents that have limits configured.
+        """
+        return {name: limiter.stats() for name, limiter in self._limiters.items()}
+
+    async def _acompletion_shared(
+        self,
+        key: str,
+        agent: str,
+        provider: ProviderName,
+        completion_kwargs: dict[str, Any],
+    ) -> tuple[str, bool]:
+        """Make a completion call, or join an identical call already in flight.
+
+        Every caller awaits the shared call through a shield, so a caller
+        being cancelled does not cancel it for the others. The call itself
+        is cancelled once no caller is waiting for it any more. Errors are
+        raised to every caller.
+
+        Args:
+            key: Identity of the request (see make_cache_key).
+            agent: The agent name.
+            provider: The provider the request goes to.
+            completion_kwargs: Arguments passed to litellm.acompletion.
+
+        Returns:
+            Tuple of the response content and whether this caller started
+            the call (False if it joined one).
+        """
+        flight = self._inflight.get(key)
+        started = flight is None or flight.task.get_loop() is not asyncio.get_running_loop()
+        if flight is None or started:
+            flight = _Flight(asyncio.ensure_future(self._acompletion(agent, provider, completion_kwargs)))
+            self._inflight[key] = flight
+            flight.task.add_done_callback(functools.partial(self._forget_flight, key, flight))
+        else:
+            self._coalesced += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task), started
+        finally:
+            flight.waiters -= 1
+            if flight.waiters == 0 and not flight.task.done():
+                flight.task.cancel()
+                # A later identical request must not join the call being cancelled
+                if self._inflight.get(key) is flight:
+                    del self._inflight[key]
+
+    def _forget_flight(self, key: str, flight: "_Flight", task: asyncio.Future[str]) -> None:
+        """Remove a finished call from the in-flight map.
+
+        Args:
+            key: Identity of the request.
+            flight: The finished call.
+            task: The call's task (passed by add_done_callback).
+        """
+        if self._inflight.get(key) is flight:
+            del self._inflight[key]
+        if not task.cancelled():
+            # Mark the exception as retrieved when every caller had gone away
+            task.exception()
+
+    @property
+    def coalesced_requests(self) -> int:
+        """Number of requests answered by joining an identical in-flight call."""
+        return self._coalesced
+
+    def cache_stats(self) -> ResponseCacheStats | None:
+        """Get the response cache counters.
+
+        Returns:
+            ResponseCacheStats, or None if the cache is disabled.
+        """
+        return self.cache.stats() if self.cache is not None else None
 
     async def complete_with_fallback(
         self,
@@ -253,23 +725,230 @@ class LLMClient:
         # Since allow_degradation=False, result is always str (raises on failure)
         return result  # type: ignore[return-value]
 
+    def _get_breaker(self, provider: str) -> CircuitBreaker | None:
+        """Get (creating on first use) the circuit breaker of a provider.
+
+        Args:
+            provider: The provider name.
+
+        Returns:
+            The provider's breaker, or None if breakers are disabled.
+        """
+        settings = self.config.circuit_breaker
+        if not settings.enabled:
+            return None
+        breaker = self._breakers.get(provider)
+        if breaker is None:
+            breaker = self._breakers[provider] = CircuitBreaker(
+                settings.failure_threshold, settings.recovery_timeout, settings.half_open_max_calls
+            )
+        return breaker
+
+    @staticmethod
+    def _record_breaker_failure(breaker: CircuitBreaker | None, error_type: ErrorType) -> None:
+        """Record a failed attempt on a provider's breaker.
+
+        Only outage-type errors count as failures. A permanent error (bad
+        request, schema mismatch, auth) means the provider answered, so it
+        counts as a success for availability.
+
+        Args:
+            breaker: The provider's breaker, if enabled.
+            error_type: Classification of the error.
+        """
+        if breaker is None:
+            return
+        if error_type == ErrorType.PERMANENT:
+            breaker.record_success()
+        else:
+            breaker.record_failure()
+
+    def _has_fallback(self, agent: str, primary: ProviderName) -> bool:
+        """Check whether the cascade can fall back to another provider.
+
+        Args:
+            agent: The agent name.
+            primary: The agent's primary provider.
+
+        Returns:
+            True if force_cloud resolves to a different provider.
+        """
+        agent_config = self.config.agents.get(agent, AgentConfig())
+        fallback = self.config.fallback_provider
+        return fallback is not None and agent_config.provider is None and fallback != primary
+
+    def _primary_allowed(self, primary: ProviderName, has_fallback: bool) -> bool:
+        """Check the primary's circuit breaker before the cascade tries it.
+
+        The primary is only skipped when there is a fallback to go to.
+
+        Args:
+            primary: The primary provider.
+            has_fallback: Whether a distinct fallback provider exists.
+
+        Returns:
+            True if the cascade should try the primary provider.
+        """
+        breaker = self._get_breaker(primary)
+        if not has_fallback or breaker is None or breaker.allow_request():
+            return True
+        logger.warning("Circuit breaker open for provider %s, going straight to fallback", primary)
+        return False
+
+    def circuit_breaker_stats(self) -> dict[str, CircuitBreakerStats]:
+        """Get the state of each provider's circuit breaker.
+
+        Returns:
+            CircuitBreakerStats keyed by provider, for providers the
+            cascade has used.
+        """
+        return {provider: breaker.stats() for provider, breaker in self._breakers.items()}
+
+    def _hedging_enabled(self, agent: str) -> bool:
+        """Check whether an agent's cascade requests are hedged.
+
+        Args:
+            agent: The agent name.
+
+        Returns:
+            True if hedging is enabled globally and for the agent.
+        """
+        return self.config.hedging.enabled and self.config.agents.get(agent, AgentConfig()).hedge
+
+    def _hedge_delay(self, provider: str) -> float:
+        """Get how long to wait for the primary before hedging.
+
+        Args:
+            provider: The primary provider.
+
+        Returns:
+            The configured percentile of the provider's recent latencies,
+            or initial_delay until enough latencies are known.
+        """
+        settings = self.config.hedging
+        tracker = self._latencies.get(provider)
+        if tracker is None or len(tracker) < settings.min_samples:
+            return settings.initial_delay
+        return tracker.percentile(settings.percentile) or settings.initial_delay
+
+    async def _hedged(
+        self,
+        agent: str,
+        provider: ProviderName,
+        primary: _Attempt[T],
+        fallback: _Attempt[T],
+    ) -> tuple[T | None, Exception | None, int, bool]:
+        """Run the primary retry cycle, hedging it on the fallback when slow.
+
+        If the primary has not finished within the hedge delay, the
+        fallback cycle is started too. The first successful result wins
+        and the other cycle is cancelled.
+
+        Args:
+            agent: The agent name.
+            provider: The primary provider.
+            primary: Starts the retry cycle on the primary provider.
+            fallback: Starts the retry cycle on the fallback provider.
+
+        Returns:
+            Tuple of (result, last_exception, attempts, fallback_started).
+            attempts counts the attempts of cycles that finished.
+        """
+        delay = self._hedge_delay(provider)
+        self._hedge_requests[agent] += 1
+        primary_task = asyncio.create_task(primary())
+        tasks: list[asyncio.Task[tuple[T | None, Exception | None, int]]] = [primary_task]
+        try:
+            await asyncio.wait(tasks, timeout=delay)
+            if primary_task.done():
+                return (*primary_task.result(), False)
+
+            logger.info("Primary provider %s slower than %.2fs, hedging on fallback", provider, delay)
+            self._hedges[agent] += 1
+            span = current_span()
+            if span is not None:
+                span.set("hedged", True)
+            fallback_task = asyncio.create_task(fallback())
+            tasks.append(fallback_task)
+
+            last_exception: Exception | None = None
+            attempts = 0
+            while tasks:
+                done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+                # Check the primary first when both finish together
+                for task in [task for task in tasks if task in done]:
+                    result, exception, task_attempts = task.result()
+                    if result is not None:
+                        if task is fallback_task:
+                            self._hedge_wins[agent] += 1
+                            if span is not None:
+                                span.set("hedge_won", True)
+                        return result, None, attempts + task_attempts, True
+                    attempts += task_attempts
+                    last_exception = exception
+                tasks = [task for task in tasks if task not in done]
+            return None, last_exception, attempts, True
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    @staticmethod
+    def _trace_cascade(
+        agent: str, providers_attempted: list[str], attempts: int, fallback_used: bool, degraded: bool = False
+    ) -> None:
+        """Record a cascade's progress on its span.
+
+        Args:
+            agent: The agent name.
+            providers_attempted: Providers tried so far.
+            attempts: Attempts made so far across providers.
+            fallback_used: Whether the fallback provider was tried.
+            degraded: Whether the cascade gave up with a PartialResult.
+        """
+        span = current_span()
+        if span is not None:
+            span.set("agent", agent)
+            span.set("providers", list(providers_attempted))
+            span.set("attempts", attempts)
+            span.set("retries", max(attempts - len(providers_attempted), 0))
+            span.set("fallback_used", fallback_used)
+            span.set("degraded", degraded)
+
+    def hedge_stats(self) -> HedgeStats:
+        """Get how often requests were hedged and how often the hedge won.
+
+        Returns:
+            HedgeStats with overall and per-agent counts.
+        """
+        return HedgeStats(
+            requests=sum(self._hedge_requests.values()),
+            hedged=sum(self._hedges.values()),
+            hedge_wins=sum(self._hedge_wins.values()),
+            agent_hedged=dict(self._hedges),
+            agent_hedge_wins=dict(self._hedge_wins),
+        )
+
     async def _retry_with_backoff(
         self,
         agent: str,
         messages: list[dict[str, Any]],
         force_cloud: bool = False,
+        stop_when_open: bool = False,
         **kwargs: Any,
     ) -> tuple[str | None, Exception | None, int]:
         """Retry completion with exponential backoff.
 
         Attempts the completion up to max_retries times, applying
         exponential backoff with jitter between attempts. Stops early
-        if a permanent error is encountered.
+        if a permanent error is encountered. Outcomes are recorded on the
+        provider's circuit breaker.
 
         Args:
             agent: The agent name.
             messages: Chat messages.
             force_cloud: If True, use fallback provider.
+            stop_when_open: If True, stop retrying once the provider's
+                circuit breaker opens.
             **kwargs: Additional litellm arguments.
 
         Returns:
@@ -280,15 +959,24 @@ class LLMClient:
         """
         last_exception: Exception | None = None
         actual_attempts = 0
+        breaker = self._get_breaker(self.resolve_model(agent, force_cloud=force_cloud).provider)
 
         for attempt in range(self.config.max_retries):
             actual_attempts = attempt + 1
             try:
                 result = await self.complete(agent, messages, force_cloud=force_cloud, **kwargs)
+                if breaker is not None:
+                    breaker.record_success()
                 return result, None, actual_attempts
+            except asyncio.CancelledError:
+                # An abandoned request (e.g. a hedge loser) gives back its trial
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
             except Exception as e:
                 last_exception = e
                 error_type = classify_error(e)
+                self._record_breaker_failure(breaker, error_type)
 
                 logger.warning(
                     "LLM call failed (attempt %d/%d, type=%s): %s",
@@ -302,6 +990,10 @@ class LLMClient:
                 if error_type == ErrorType.PERMANENT:
                     break
 
+                # The provider is considered down; let the caller fall back
+                if stop_when_open and breaker is not None and breaker.state == "open":
+                    break
+
                 # Apply backoff before next retry (except on last attempt)
                 if attempt < self.config.max_retries - 1:
                     delay = self.config.base_retry_delay * (2**attempt)
@@ -310,6 +1002,7 @@ class LLMClient:
 
         return None, last_exception, actual_attempts
 
+    @traced("LLMClient.complete_with_cascade", kind="llm")
     async def complete_with_cascade(
         self,
         agent: str,
@@ -323,7 +1016,9 @@ class LLMClient:
         transient errors. If all retries fail and a fallback provider
         is configured, tries the fallback with its own retry cycle.
         If all attempts fail and allow_degradation is True, returns
-        a PartialResult instead of raising.
+        a PartialResult instead of raising. While the primary provider's
+        circuit breaker is open, requests go straight to the fallback. With
+        hedging enabled, a slow primary is raced against the fallback.
 
         Args:
             agent: The agent name.
@@ -341,19 +1036,39 @@ class LLMClient:
         total_retries = 0
         last_exception: Exception | None = None
 
-        # Try primary provider
+        # Try primary provider, unless its circuit is open and there is a fallback
         resolution = self.resolve_model(agent, force_cloud=False)
-        providers_attempted.append(resolution.provider)
+        has_fallback = self._has_fallback(agent, resolution.provider)
 
-        result, exception, retries = await self._retry_with_backoff(agent, messages, force_cloud=False, **kwargs)
-        total_retries += retries
+        def primary() -> Coroutine[Any, Any, tuple[str | None, Exception | None, int]]:
+            return self._retry_with_backoff(agent, messages, force_cloud=False, stop_when_open=has_fallback, **kwargs)
 
-        if result is not None:
-            return result
-        last_exception = exception
+        def fallback() -> Coroutine[Any, Any, tuple[str | None, Exception | None, int]]:
+            return self._retry_with_backoff(agent, messages, force_cloud=True, **kwargs)
+
+        retries = 0
+        fallback_tried = False
+
+        if self._primary_allowed(resolution.provider, has_fallback):
+            providers_attempted.append(resolution.provider)
+
+            if has_fallback and self._hedging_enabled(agent):
+                result, exception, retries, fallback_tried = await self._hedged(
+                    agent, resolution.provider, primary, fallback
+                )
+                if fallback_tried and self.config.fallback_provider:
+                    providers_attempted.append(self.config.fallback_provider)
+            else:
+                result, exception, retries = await primary()
+            total_retries += retries
+            self._trace_cascade(agent, providers_attempted, total_retries, fallback_tried)
 
-        # Try fallback provider if configured
-        if self.config.fallback_provider:
+            if result is not None:
+                return result
+            last_exception = exception
+
+        # Try fallback provider if configured (and not already hedged on)
+        if self.config.fallback_provider and not fallback_tried:
             logger.warning(
                 "Primary provider %s failed after %d retries, trying fallback %s",
                 resolution.provider,
@@ -363,8 +1078,9 @@ class LLMClient:
 
             providers_attempted.append(self.config.fallback_provider)
 
-            result, exception, retries = await self._retry_with_backoff(agent, messages, force_cloud=True, **kwargs)
+            result, exception, retries = await fallback()
             total_retries += retries
+            self._trace_cascade(agent, providers_attempted, total_retries, True)
 
             if result is not None:
                 return result
@@ -379,6 +1095,9 @@ class LLMClient:
                 providers_attempted,
                 total_retries,
             )
+            self._trace_cascade(
+                agent, providers_attempted, total_retries, bool(self.config.fallback_provider), degraded=True
+            )
             return PartialResult(
                 success=False,
                 content=None,
@@ -391,6 +1110,7 @@ class LLMClient:
         logger.error("LLM cascade failed, raising exception. Providers: %s", providers_attempted)
         raise last_exception or Exception(error_msg)
 
+    @traced("LLMClient.complete_structured_with_cascade", kind="llm")
     async def complete_structured_with_cascade(
         self,
         agent: str,
@@ -404,6 +1124,9 @@ class LLMClient:
         Attempts structured completion with retry and fallback support.
         Schema validation errors (JSONDecodeError, ValidationError) are
         treated as permanent errors and immediately trigger fallback.
+        While the primary provider's circuit breaker is open, requests go
+        straight to the fallback. With hedging enabled, a slow primary is
+        raced against the fallback.
 
         Args:
             agent: The agent name.
@@ -422,21 +1145,41 @@ class LLMClient:
         total_retries = 0
         last_exception: Exception | None = None
 
-        # Try primary provider
+        # Try primary provider, unless its circuit is open and there is a fallback
         resolution = self.resolve_model(agent, force_cloud=False)
-        providers_attempted.append(resolution.provider)
+        has_fallback = self._has_fallback(agent, resolution.provider)
 
-        result, exception, retries = await self._retry_structured_with_backoff(
-            agent, messages, response_model, force_cloud=False, **kwargs
-        )
-        total_retries += retries
+        def primary() -> Coroutine[Any, Any, tuple[BaseModel | None, Exception | None, int]]:
+            return self._retry_structured_with_backoff(
+                agent, messages, response_model, force_cloud=False, stop_when_open=has_fallback, **kwargs
+            )
 
-        if result is not None:
-            return result
-        last_exception = exception
+        def fallback() -> Coroutine[Any, Any, tuple[BaseModel | None, Exception | None, int]]:
+            return self._retry_structured_with_backoff(agent, messages, response_model, force_cloud=True, **kwargs)
+
+        retries = 0
+        fallback_tried = False
+
+        if self._primary_allowed(resolution.provider, has_fallback):
+            providers_attempted.append(resolution.provider)
+
+            if has_fallback and self._hedging_enabled(agent):
+                result, exception, retries, fallback_tried = await self._hedged(
+                    agent, resolution.provider, primary, fallback
+                )
+                if fallback_tried and self.config.fallback_provider:
+                    providers_attempted.append(self.config.fallback_provider)
+            else:
+                result, exception, retries = await primary()
+            total_retries += retries
+            self._trace_cascade(agent, providers_attempted, total_retries, fallback_tried)
+
+            if result is not None:
+                return result
+            last_exception = exception
 
-        # Try fallback provider if configured
-        if self.config.fallback_provider:
+        # Try fallback provider if configured (and not already hedged on)
+        if self.config.fallback_provider and not fallback_tried:
             logger.warning(
                 "Primary provider %s failed after %d retries for structured response, trying fallback %s",
                 resolution.provider,
@@ -446,10 +1189,9 @@ class LLMClient:
 
             providers_attempted.append(self.config.fallback_provider)
 
-            result, exception, retries = await self._retry_structured_with_backoff(
-                agent, messages, response_model, force_cloud=True, **kwargs
-            )
+            result, exception, retries = await fallback()
             total_retries += retries
+            self._trace_cascade(agent, providers_attempted, total_retries, True)
 
             if result is not None:
                 return result
@@ -465,6 +1207,9 @@ class LLMClient:
                 providers_attempted,
                 total_retries,
             )
+            self._trace_cascade(
+                agent, providers_attempted, total_retries, bool(self.config.fallback_provider), degraded=True
+            )
             return PartialResult(
                 success=False,
                 content=None,
@@ -487,6 +1232,7 @@ class LLMClient:
         messages: list[dict[str, Any]],
         response_model: type[BaseModel],
         force_cloud: bool = False,
+        stop_when_open: bool = False,
         **kwargs: Any,
     ) -> tuple[BaseModel | None, Exception | None, int]:
         """Retry structured completion with exponential backoff.
@@ -499,6 +1245,8 @@ class LLMClient:
             messages: Chat messages.
             response_model: Pydantic model class for response validation.
             force_cloud: If True, use fallback provider.
+            stop_when_open: If True, stop retrying once the provider's
+                circuit breaker opens.
             **kwargs: Additional litellm arguments.
 
         Returns:
@@ -507,6 +1255,7 @@ class LLMClient:
         """
         last_exception: Exception | None = None
         actual_attempts = 0
+        breaker = self._get_breaker(self.resolve_model(agent, force_cloud=force_cloud).provider)
 
         for attempt in range(self.config.max_retries):
             actual_attempts = attempt + 1
@@ -514,10 +1263,18 @@ class LLMClient:
                 result = await self.complete_structured(
                     agent, messages, response_model, force_cloud=force_cloud, **kwargs
                 )
+                if breaker is not None:
+                    breaker.record_success()
                 return result, None, actual_attempts
+            except asyncio.CancelledError:
+                # An abandoned request (e.g. a hedge loser) gives back its trial
+                if breaker is not None:
+                    breaker.release_trial()
+                raise
             except Exception as e:
                 last_exception = e
                 error_type = classify_error(e)
+                self._record_breaker_failure(breaker, error_type)
 
                 logger.warning(
                     "LLM structured call failed (attempt %d/%d, type=%s, schema=%s): %s",
@@ -532,6 +1289,10 @@ class LLMClient:
                 if error_type == ErrorType.PERMANENT:
                     break
 
+                # The provider is considered down; let the caller fall back
+                if stop_when_open and breaker is not None and breaker.state == "open":
+                    break
+
                 # Apply backoff before next retry (except on last attempt)
                 if attempt < self.config.max_retries - 1:
                     delay = self.config.base_retry_delay * (2**attempt)
@@ -7,6 +7,7 @@ tier-based model selection, and per-agent settings.
 import os
 import re
 from dataclasses import dataclass
+from pathlib import Path
 from typing import Literal
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
@@ -48,6 +49,11 @@ class ProviderConfig(BaseModel):
         api_key: API key for the provider. Supports ${ENV_VAR} interpolation.
         api_base: Base URL for API calls. Required for Ollama and Azure.
         api_version: API version. Required for Azure.
+        max_concurrency: Maximum concurrent requests to the provider.
+            None means unlimited.
+        requests_per_minute: Request budget per minute. None means unlimited.
+        tokens_per_minute: Token budget per minute (prompt and completion).
+            None means unlimited.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -55,6 +61,45 @@ class ProviderConfig(BaseModel):
     api_key: str | None = None
     api_base: str | None = None
     api_version: str | None = None
+    max_concurrency: int | None = None
+    requests_per_minute: float | None = None
+    tokens_per_minute: float | None = None
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def validate_max_concurrency(cls, v: int | None) -> int | None:
+        """Validate max_concurrency is at least 1.
+
+        Args:
+            v: The max_concurrency value.
+
+        Returns:
+            The validated max_concurrency value.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if v is not None and v < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        return v
+
+    @field_validator("requests_per_minute", "tokens_per_minute")
+    @classmethod
+    def validate_rate(cls, v: float | None) -> float | None:
+        """Validate per-minute budgets are positive.
+
+        Args:
+            v: The budget value.
+
+        Returns:
+            The validated budget value.
+
+        Raises:
+            ValueError: If the budget is not positive.
+        """
+        if v is not None and v <= 0:
+            raise ValueError("per-minute budgets must be > 0")
+        return v
 
     @field_validator("api_key", mode="after")
     @classmethod
@@ -104,12 +149,250 @@ class AgentConfig(BaseModel):
         tier: Model tier to use for this agent.
         provider: Optional provider override. If set, uses this provider
             instead of the default.
+        cache: Whether responses for this agent may be cached when the
+            response cache is enabled. Turn off for agents whose answers
+            must reflect data that changes between identical prompts.
+        cache_ttl: Seconds cached responses stay valid for this agent.
+            None uses the response cache's default TTL.
+        max_concurrency: Maximum concurrent requests for this agent, on top
+            of the provider's limits. None means unlimited.
+        hedge: Whether this agent's cascade requests may be hedged when
+            hedging is enabled.
     """
 
     model_config = ConfigDict(extra="forbid")
 
     tier: TierName = "medium"
     provider: ProviderName | None = None
+    cache: bool = True
+    cache_ttl: float | None = None
+    max_concurrency: int | None = None
+    hedge: bool = True
+
+    @field_validator("max_concurrency")
+    @classmethod
+    def validate_max_concurrency(cls, v: int | None) -> int | None:
+        """Validate max_concurrency is at least 1.
+
+        Args:
+            v: The max_concurrency value.
+
+        Returns:
+            The validated max_concurrency value.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if v is not None and v < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        return v
+
+    @field_validator("cache_ttl")
+    @classmethod
+    def validate_cache_ttl(cls, v: float | None) -> float | None:
+        """Validate cache_ttl is positive.
+
+        Args:
+            v: The cache_ttl value.
+
+        Returns:
+            The validated cache_ttl value.
+
+        Raises:
+            ValueError: If cache_ttl is not positive.
+        """
+        if v is not None and v <= 0:
+            raise ValueError("cache_ttl must be > 0")
+        return v
+
+
+class ResponseCacheConfig(BaseModel):
+    """Settings for the opt-in LLM response cache.
+
+    Attributes:
+        enabled: If True, LLMClient answers identical requests from the cache.
+        path: SQLite file for the on-disk tier. None keeps responses in
+            memory only.
+        max_memory_entries: Maximum number of responses in the memory tier.
+        ttl: Default seconds a cached response stays valid. None never
+            expires responses.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = False
+    path: Path | None = None
+    max_memory_entries: int = 1024
+    ttl: float | None = 24 * 60 * 60
+
+    @field_validator("max_memory_entries")
+    @classmethod
+    def validate_max_memory_entries(cls, v: int) -> int:
+        """Validate max_memory_entries is non-negative.
+
+        Args:
+            v: The max_memory_entries value.
+
+        Returns:
+            The validated max_memory_entries value.
+
+        Raises:
+            ValueError: If max_memory_entries is negative.
+        """
+        if v < 0:
+            raise ValueError("max_memory_entries must be >= 0")
+        return v
+
+    @field_validator("ttl")
+    @classmethod
+    def validate_ttl(cls, v: float | None) -> float | None:
+        """Validate ttl is positive.
+
+        Args:
+            v: The ttl value.
+
+        Returns:
+            The validated ttl value.
+
+        Raises:
+            ValueError: If ttl is not positive.
+        """
+        if v is not None and v <= 0:
+            raise ValueError("ttl must be > 0")
+        return v
+
+
+class CircuitBreakerConfig(BaseModel):
+    """Settings for the per-provider circuit breakers of the error cascade.
+
+    Attributes:
+        enabled: If True, providers that keep failing are skipped in favour
+            of fallback_provider until they recover.
+        failure_threshold: Consecutive transient failures that open a
+            provider's breaker.
+        recovery_timeout: Seconds an open breaker waits before letting
+            trial requests through (half-open).
+        half_open_max_calls: Trial requests allowed at once while half-open.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = True
+    failure_threshold: int = 5
+    recovery_timeout: float = 30.0
+    half_open_max_calls: int = 1
+
+    @field_validator("failure_threshold", "half_open_max_calls")
+    @classmethod
+    def validate_positive_count(cls, v: int) -> int:
+        """Validate counts are at least 1.
+
+        Args:
+            v: The count value.
+
+        Returns:
+            The validated count value.
+
+        Raises:
+            ValueError: If the count is less than 1.
+        """
+        if v < 1:
+            raise ValueError("circuit breaker counts must be >= 1")
+        return v
+
+    @field_validator("recovery_timeout")
+    @classmethod
+    def validate_recovery_timeout(cls, v: float) -> float:
+        """Validate recovery_timeout is positive.
+
+        Args:
+            v: The recovery_timeout value.
+
+        Returns:
+            The validated recovery_timeout value.
+
+        Raises:
+            ValueError: If recovery_timeout is not positive.
+        """
+        if v <= 0:
+            raise ValueError("recovery_timeout must be > 0")
+        return v
+
+
+class HedgingConfig(BaseModel):
+    """Settings for hedging cascade requests on the fallback provider.
+
+    Attributes:
+        enabled: If True, cascade requests whose primary has not answered
+            within the hedge delay are also sent to fallback_provider, and
+            the first answer wins.
+        percentile: Percentile of the primary's recent latencies used as
+            the hedge delay.
+        min_samples: Latencies the primary needs before the percentile is
+            used; until then initial_delay applies.
+        initial_delay: Hedge delay in seconds before enough latencies are known.
+    """
+
+    model_config = ConfigDict(extra="forbid")
+
+    enabled: bool = False
+    percentile: float = 95.0
+    min_samples: int = 20
+    initial_delay: float = 5.0
+
+    @field_validator("percentile")
+    @classmethod
+    def validate_percentile(cls, v: float) -> float:
+        """Validate percentile is in (0, 100].
+
+        Args:
+            v: The percentile value.
+
+        Returns:
+            The validated percentile value.
+
+        Raises:
+            ValueError: If percentile is outside (0, 100].
+        """
+        if not 0 < v <= 100:
+            raise ValueError("percentile must be > 0 and <= 100")
+        return v
+
+    @field_validator("min_samples")
+    @classmethod
+    def validate_min_samples(cls, v: int) -> int:
+        """Validate min_samples is at least 1.
+
+        Args:
+            v: The min_samples value.
+
+        Returns:
+            The validated min_samples value.
+
+        Raises:
+            ValueError: If min_samples is less than 1.
+        """
+        if v < 1:
+            raise ValueError("min_samples must be >= 1")
+        return v
+
+    @field_validator("initial_delay")
+    @classmethod
+    def validate_initial_delay(cls, v: float) -> float:
+        """Validate initial_delay is not negative.
+
+        Args:
+            v: The initial_delay value.
+
+        Returns:
+            The validated initial_delay value.
+
+        Raises:
+            ValueError: If initial_delay is negative.
+        """
+        if v < 0:
+            raise ValueError("initial_delay must be >= 0")
+        return v
 
 
 @dataclass
@@ -186,6 +469,12 @@ class LLMConfig(BaseModel):
         base_retry_delay: Base delay in seconds for exponential backoff.
         enable_graceful_degradation: If True, return PartialResult instead of
             raising when all providers fail.
+        cache: Response cache settings (disabled by default).
+        coalesce_requests: If True, identical requests made while one is
+            in flight share its response instead of calling the provider
+            again.
+        circuit_breaker: Per-provider circuit breaker settings.
+        hedging: Settings for hedging slow primary requests on the fallback.
     """
 
     model_config = ConfigDict(extra="forbid")
@@ -198,6 +487,10 @@ class LLMConfig(BaseModel):
     max_retries: int = 3
     base_retry_delay: float = 1.0
     enable_graceful_degradation: bool = True
+    cache: ResponseCacheConfig = ResponseCacheConfig()
+    coalesce_requests: bool = True
+    circuit_breaker: CircuitBreakerConfig = CircuitBreakerConfig()
+    hedging: HedgingConfig = HedgingConfig()
 
     @field_validator("max_retries")
     @classmethod
@@ -0,0 +1,92 @@
+"""Latency tracking and counters for hedged cascade requests.
+
+With hedging enabled, the cascade starts the same request on the fallback
+provider when the primary has not answered within a percentile of its
+recent latencies, takes whichever answer arrives first and cancels the
+other. LatencyTracker keeps the recent latencies that delay is derived
+from, including those of cancelled requests.
+"""
+
+from collections import deque
+
+from pydantic import BaseModel, ConfigDict
+
+
+class HedgeStats(BaseModel):
+    """Snapshot of hedging counters.
+
+    Attributes:
+        requests: Cascade requests that were eligible for hedging.
+        hedged: Requests where the fallback was started alongside the primary.
+        hedge_wins: Hedged requests answered by the fallback first.
+        agent_hedged: Hedged requests per agent.
+        agent_hedge_wins: Hedge wins per agent.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    requests: int
+    hedged: int
+    hedge_wins: int
+    agent_hedged: dict[str, int]
+    agent_hedge_wins: dict[str, int]
+
+    @property
+    def win_ratio(self) -> float:
+        """Fraction of hedged requests the fallback won (0.0 when unused)."""
+        return self.hedge_wins / self.hedged if self.hedged else 0.0
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies for one provider.
+
+    Example:
+        >>> tracker = LatencyTracker(window=200)
+        >>> tracker.record(1.7)
+        >>> tracker.percentile(95.0)
+        1.7
+    """
+
+    def __init__(self, window: int = 200) -> None:
+        """Initialize an empty tracker.
+
+        Args:
+            window: Number of most recent latencies kept.
+
+        Raises:
+            ValueError: If window is less than 1.
+        """
+        if window < 1:
+            raise ValueError("window must be >= 1")
+        self._samples: deque[float] = deque(maxlen=window)
+
+    def __len__(self) -> int:
+        """Number of latencies currently in the window."""
+        return len(self._samples)
+
+    def record(self, seconds: float) -> None:
+        """Add the latency of a request.
+
+        Requests cancelled before answering (e.g. the losing side of a
+        hedge) are recorded with the time they ran, a lower bound of their
+        latency, so slow requests are not dropped from the window.
+
+        Args:
+            seconds: Time the request took, or ran before it was cancelled.
+        """
+        self._samples.append(seconds)
+
+    def percentile(self, percentile: float) -> float | None:
+        """Get a percentile of the recorded latencies (nearest rank).
+
+        Args:
+            percentile: Percentile between 0 and 100.
+
+        Returns:
+            The latency in seconds, or None if nothing was recorded.
+        """
+        if not self._samples:
+            return None
+        ordered = sorted(self._samples)
+        rank = max(int(len(ordered) * percentile / 100 + 0.5), 1)
+        return ordered[min(rank, len(ordered)) - 1]
@@ -0,0 +1,233 @@
+"""Client-side concurrency and rate limits for LLMClient.
+
+Each provider (and optionally each agent) can be given a maximum number of
+concurrent requests and request/token-per-minute budgets. Requests over
+the limits wait in FIFO order before they are sent instead of being sent
+and rejected by the provider.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from time import monotonic
+
+from pydantic import BaseModel, ConfigDict
+
+
+class LimiterStats(BaseModel):
+    """Snapshot of a RequestLimiter's counters.
+
+    Attributes:
+        in_flight: Requests currently holding a slot.
+        queued: Requests currently waiting for a slot or budget.
+        requests: Requests that have been admitted.
+        total_wait: Seconds admitted requests spent waiting, summed.
+        max_wait: Longest wait of any admitted request in seconds.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    in_flight: int
+    queued: int
+    requests: int
+    total_wait: float
+    max_wait: float
+
+    @property
+    def avg_wait(self) -> float:
+        """Mean wait per admitted request in seconds (0.0 when unused)."""
+        return self.total_wait / self.requests if self.requests else 0.0
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a per-minute rate.
+
+    The bucket holds at most one minute of budget. Takes larger than the
+    capacity are capped to it so they wait for a full bucket rather than
+    forever. The balance may go negative through debit(), which delays
+    later takes.
+
+    Attributes:
+        rate_per_minute: Budget added per minute.
+    """
+
+    def __init__(self, rate_per_minute: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate_per_minute: Budget added per minute.
+
+        Raises:
+            ValueError: If rate_per_minute is not positive.
+        """
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be > 0")
+        self.rate_per_minute = rate_per_minute
+        self._level = rate_per_minute
+        self._updated = monotonic()
+
+    def _refill(self) -> None:
+        """Add the budget accumulated since the last update."""
+        now = monotonic()
+        self._level = min(self.rate_per_minute, self._level + (now - self._updated) * self.rate_per_minute / 60)
+        self._updated = now
+
+    def delay(self, amount: float) -> float:
+        """Get how long until amount can be taken.
+
+        Args:
+            amount: Budget to take.
+
+        Returns:
+            Seconds to wait, 0.0 if it can be taken now.
+        """
+        self._refill()
+        missing = min(amount, self.rate_per_minute) - self._level
+        return max(missing, 0.0) * 60 / self.rate_per_minute
+
+    def take(self, amount: float) -> None:
+        """Take budget without waiting (call after delay() returned 0).
+
+        Args:
+            amount: Budget to take.
+        """
+        self._refill()
+        self._level -= min(amount, self.rate_per_minute)
+
+    def debit(self, amount: float) -> None:
+        """Correct the balance after the fact (negative amounts refund).
+
+        Args:
+            amount: Budget to remove from the bucket.
+        """
+        self._refill()
+        self._level = min(self.rate_per_minute, self._level - amount)
+
+
+class RequestLimiter:
+    """Concurrency semaphore plus request and token buckets for one key.
+
+    Requests are admitted one at a time in arrival order: the head of the
+    queue waits for a free slot and then for enough request and token
+    budget, and later requests wait behind it.
+
+    Example:
+        >>> limiter = RequestLimiter(max_concurrency=2, requests_per_minute=60)
+        >>> async with limiter.slot(tokens=500):
+        ...     response = await call_provider()
+        >>> limiter.record_tokens(used=response_tokens, estimated=500)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int | None = None,
+        requests_per_minute: float | None = None,
+        tokens_per_minute: float | None = None,
+    ) -> None:
+        """Initialize the limiter; None disables a limit.
+
+        Args:
+            max_concurrency: Maximum requests in flight at once.
+            requests_per_minute: Request budget per minute.
+            tokens_per_minute: Token budget per minute.
+
+        Raises:
+            ValueError: If max_concurrency is less than 1.
+        """
+        if max_concurrency is not None and max_concurrency < 1:
+            raise ValueError("max_concurrency must be >= 1")
+        self._semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._admission = asyncio.Lock()
+        self._in_flight = 0
+        self._queued = 0
+        self._admitted = 0
+        self._total_wait = 0.0
+        self._max_wait = 0.0
+
+    @asynccontextmanager
+    async def slot(self, tokens: float = 0.0) -> AsyncGenerator[None]:
+        """Wait until a request may be sent and hold its slot.
+
+        Args:
+            tokens: Estimated tokens the request will use.
+
+        Yields:
+            Nothing; the request is sent inside the block.
+        """
+        start = monotonic()
+        self._queued += 1
+        acquired = False
+        try:
+            async with self._admission:
+                if self._semaphore is not None:
+                    await self._semaphore.acquire()
+                    acquired = True
+                await self._wait_for_budget(tokens)
+        except BaseException:
+            if acquired and self._semaphore is not None:
+                self._semaphore.release()
+            raise
+        finally:
+            self._queued -= 1
+
+        wait = monotonic() - start
+        self._admitted += 1
+        self._total_wait += wait
+        self._max_wait = max(self._max_wait, wait)
+        self._in_flight += 1
+        try:
+            yield
+        finally:
+            self._in_flight -= 1
+            if self._semaphore is not None:
+                self._semaphore.release()
+
+    async def _wait_for_budget(self, tokens: float) -> None:
+        """Sleep until both buckets can cover the request, then take it.
+
+        Args:
+            tokens: Estimated tokens the request will use.
+        """
+        while True:
+            delay = max(
+                self._requests.delay(1) if self._requests is not None else 0.0,
+                self._tokens.delay(tokens) if self._tokens is not None else 0.0,
+            )
+            if delay <= 0:
+                break
+            await asyncio.sleep(delay)
+        if self._requests is not None:
+            self._requests.take(1)
+        if self._tokens is not None:
+            self._tokens.take(tokens)
+
+    @property
+    def limits_tokens(self) -> bool:
+        """Whether the limiter has a token budget."""
+        return self._tokens is not None
+
+    def record_tokens(self, used: float, estimated: float) -> None:
+        """Correct the token budget once a request's real usage is known.
+
+        Args:
+            used: Tokens the request actually used.
+            estimated: Tokens taken for it when it was admitted.
+        """
+        if self._tokens is not None:
+            self._tokens.debit(used - estimated)
+
+    def stats(self) -> LimiterStats:
+        """Get a snapshot of the limiter counters.
+
+        Returns:
+            LimiterStats with queue depth and wait times.
+        """
+        return LimiterStats(
+            in_flight=self._in_flight,
+            queued=self._queued,
+            requests=self._admitted,
+            total_wait=self._total_wait,
+            max_wait=self._max_wait,
+        )
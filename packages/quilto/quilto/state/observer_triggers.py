@@ -11,8 +11,10 @@ Trigger types:
 - periodic: Scheduled batch updates (optional)
 """
 
+import asyncio
 import re
-from datetime import datetime, timedelta
+from collections.abc import AsyncIterator
+from datetime import date, datetime, timedelta
 from typing import Any, Literal, Protocol
 
 from pydantic import BaseModel, ConfigDict, field_validator, model_validator
@@ -26,6 +28,7 @@ from quilto.agents.models import (
 )
 from quilto.state.session import SessionState
 from quilto.storage import (
+    AsyncStorageRepository,
     DateRange,
     Entry,
     GlobalContext,
@@ -422,26 +425,55 @@ async def trigger_significant_log(
     return output
 
 
+async def _stream_entries(
+    storage: StorageRepository | AsyncStorageRepository,
+    start: date,
+    end: date,
+) -> AsyncIterator[Entry]:
+    """Stream entries in a date range without blocking the event loop.
+
+    Args:
+        storage: Sync or async storage repository.
+        start: Start date (inclusive).
+        end: End date (inclusive).
+
+    Yields:
+        Entries in timestamp order.
+    """
+    if isinstance(storage, AsyncStorageRepository):
+        async for entry in storage.iter_entries(start, end):
+            yield entry
+        return
+
+    iterator = storage.iter_entries(start, end)
+    while (entry := await asyncio.to_thread(next, iterator, None)) is not None:
+        yield entry
+
+
 async def trigger_periodic(
     observer: ObserverAgent,
     context_manager: GlobalContextManager,
-    storage: StorageRepository,
+    storage: StorageRepository | AsyncStorageRepository,
     config: ObserverTriggerConfig,
     active_domain_context: ActiveDomainContext,
     since_datetime: datetime | None = None,
+    max_entries: int | None = None,
 ) -> list[ObserverOutput]:
     """Trigger Observer for periodic batch processing of recent logs.
 
-    Fetches entries since the specified datetime (or last 24 hours)
-    and processes each through trigger_significant_log.
+    Streams entries since the specified datetime (or last 24 hours)
+    and processes each through trigger_significant_log. Entries are read
+    lazily, so when max_entries is reached no further day files are read.
 
     Args:
         observer: The ObserverAgent instance.
         context_manager: GlobalContextManager for context operations.
-        storage: StorageRepository for fetching entries.
+        storage: Storage repository for fetching entries; reads run off the
+            event loop.
         config: Trigger configuration.
         active_domain_context: Active domain context with guidance.
         since_datetime: Start datetime for fetching entries (default: 24 hours ago).
+        max_entries: Maximum number of entries to process (default: no limit).
 
     Returns:
         List of ObserverOutput from processing significant entries.
@@ -456,12 +488,13 @@ async def trigger_periodic(
     # Build DateRange for query
     date_range = DateRange(start=since_datetime.date(), end=datetime.now().date())
 
-    # Fetch entries
-    entries = storage.get_entries_by_date_range(date_range.start, date_range.end)
-
-    # Process each entry through significant_log trigger
+    # Stream entries and process each through significant_log trigger
     results: list[ObserverOutput] = []
-    for entry in entries:
+    if max_entries is not None and max_entries <= 0:
+        return results
+
+    processed = 0
+    async for entry in _stream_entries(storage, date_range.start, date_range.end):
         # Use empty parsed_data as we're doing batch processing
         output = await trigger_significant_log(
             observer=observer,
@@ -474,6 +507,10 @@ async def trigger_periodic(
         if output is not None:
             results.append(output)
 
+        processed += 1
+        if max_entries is not None and processed >= max_entries:
+            break
+
     return results
 
 
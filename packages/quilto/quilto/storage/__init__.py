@@ -3,24 +3,41 @@
 This module provides:
 - Entry and DateRange models for log data
 - StorageRepository for raw/parsed file operations
+- AsyncStorageRepository, its async facade for event-loop callers
+- EntryIndex, the optional SQLite sidecar index used by StorageRepository
+- FileCache and CacheStats for StorageRepository's in-process read cache
+- ParsedJournal, the append-only journal behind parsed JSON writes
+- ParsedLog, the append-only JSONL parsed store (parsed_format="jsonl")
 - GlobalContextManager for context persistence and size management
 """
 
+from quilto.storage.async_repository import AsyncStorageRepository
+from quilto.storage.cache import CacheStats, FileCache
 from quilto.storage.context import (
     ContextEntry,
     GlobalContext,
     GlobalContextFrontmatter,
     GlobalContextManager,
 )
+from quilto.storage.index import EntryIndex
+from quilto.storage.journal import ParsedJournal
 from quilto.storage.models import DateRange, Entry
+from quilto.storage.parsed_log import ParsedFormat, ParsedLog
 from quilto.storage.repository import StorageRepository
 
 __all__ = [
+    "AsyncStorageRepository",
+    "CacheStats",
     "ContextEntry",
     "DateRange",
     "Entry",
+    "EntryIndex",
+    "FileCache",
     "GlobalContext",
     "GlobalContextFrontmatter",
     "GlobalContextManager",
+    "ParsedFormat",
+    "ParsedJournal",
+    "ParsedLog",
     "StorageRepository",
 ]
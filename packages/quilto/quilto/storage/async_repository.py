@@ -0,0 +1,373 @@
+"""Async facade over StorageRepository for use from event loops."""
+
+import asyncio
+import functools
+from collections.abc import AsyncIterator, Callable, Hashable, Iterator, Sequence
+from concurrent.futures import Executor, ThreadPoolExecutor
+from datetime import date
+from pathlib import Path
+from typing import Any, TypeVar
+
+from quilto.agents.models import ParserOutput
+from quilto.storage.cache import CacheStats
+from quilto.storage.models import DateRange, Entry
+from quilto.storage.parsed_log import ParsedFormat
+from quilto.storage.repository import StorageRepository
+
+T = TypeVar("T")
+
+
+def _copy_entries(entries: list[Entry]) -> list[Entry]:
+    """Deep-copy entries handed to a coalesced waiter.
+
+    Args:
+        entries: Entries returned to the first caller.
+
+    Returns:
+        Independent copies.
+    """
+    return [entry.model_copy(deep=True) for entry in entries]
+
+
+def _next_chunk(iterator: Iterator[Entry], size: int) -> list[Entry]:
+    """Pull up to size entries from a storage iterator.
+
+    Args:
+        iterator: Iterator returned by iter_entries or iter_search.
+        size: Maximum number of entries to pull.
+
+    Returns:
+        The next entries, empty when the iterator is exhausted.
+    """
+    chunk: list[Entry] = []
+    for entry in iterator:
+        chunk.append(entry)
+        if len(chunk) >= size:
+            break
+    return chunk
+
+
+class AsyncStorageRepository:
+    """Async mirror of StorageRepository that keeps file I/O off the event loop.
+
+    Every call runs the wrapped repository's synchronous method on a
+    bounded thread pool. Concurrent reads of the same raw day file (and
+    identical concurrent pattern or keyword searches) share one read: the
+    first caller starts it and later callers await the same result and
+    receive their own copies of the entries. Range reads are split per day
+    file, so overlapping ranges requested at the same time read each
+    shared file once and different files in parallel. Reads started after
+    a write through this facade never join a read started before it.
+
+    Attributes:
+        storage: The wrapped synchronous repository.
+
+    Example:
+        >>> storage = AsyncStorageRepository(StorageRepository(Path("/data")))
+        >>> entries = await storage.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 31))
+        >>> await storage.save_entry(entry)
+        >>> await storage.aclose()
+    """
+
+    def __init__(
+        self,
+        storage: StorageRepository,
+        max_workers: int = 4,
+        executor: Executor | None = None,
+        chunk_size: int = 64,
+    ) -> None:
+        """Initialize the facade.
+
+        Args:
+            storage: Repository to wrap.
+            max_workers: Size of the thread pool created when no executor is given.
+            executor: Executor to run file work on; owned by the caller.
+            chunk_size: Entries pulled per thread hop by iter_entries/iter_search.
+
+        Raises:
+            ValueError: If max_workers or chunk_size is less than 1.
+        """
+        if max_workers < 1 or chunk_size < 1:
+            raise ValueError("max_workers and chunk_size must be >= 1")
+        self.storage = storage
+        self._chunk_size = chunk_size
+        self._owns_executor = executor is None
+        self._executor = executor or ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="quilto-storage")
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._coalesced = 0
+
+    @property
+    def base_path(self) -> Path:
+        """Root directory of the wrapped repository."""
+        return self.storage.base_path
+
+    @property
+    def parsed_format(self) -> ParsedFormat:
+        """Parsed format new data is written in."""
+        return self.storage.parsed_format
+
+    @property
+    def index_enabled(self) -> bool:
+        """Whether the SQLite entry index is enabled."""
+        return self.storage.index_enabled
+
+    @property
+    def coalesced_reads(self) -> int:
+        """Number of reads answered by joining an in-flight read."""
+        return self._coalesced
+
+    def cache_stats(self) -> CacheStats:
+        """Get the wrapped repository's read cache counters.
+
+        Returns:
+            CacheStats with hits, misses, evictions and current usage.
+        """
+        return self.storage.cache_stats()
+
+    async def aclose(self) -> None:
+        """Close the wrapped repository and shut down the owned thread pool."""
+        await self._run(self.storage.close)
+        if self._owns_executor:
+            self._executor.shutdown(wait=False)
+
+    async def _run(self, func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Run a blocking call on the thread pool.
+
+        Args:
+            func: Function to call.
+            *args: Positional arguments.
+            **kwargs: Keyword arguments.
+
+        Returns:
+            The function's return value.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    async def _coalesce(self, key: Hashable, func: Callable[..., list[Entry]], *args: Any) -> list[Entry]:
+        """Run a read, or join an identical read that is already in flight.
+
+        Cancelling one waiter does not cancel the shared read.
+
+        Args:
+            key: Identity of the read.
+            func: Blocking read function.
+            *args: Arguments for func.
+
+        Returns:
+            The entries; joiners receive deep copies.
+        """
+        future = self._inflight.get(key)
+        if future is not None and future.get_loop() is asyncio.get_running_loop():
+            self._coalesced += 1
+            return _copy_entries(await asyncio.shield(future))
+
+        future = asyncio.ensure_future(self._run(func, *args))
+        self._inflight[key] = future
+
+        def _forget(done: asyncio.Future[Any]) -> None:
+            if self._inflight.get(key) is done:
+                del self._inflight[key]
+
+        future.add_done_callback(_forget)
+        return await asyncio.shield(future)
+
+    async def read_day_file(self, file_path: Path) -> list[Entry]:
+        """Read the entries of one raw day file with their parsed data.
+
+        Args:
+            file_path: Raw markdown file, as returned by list_day_files.
+
+        Returns:
+            Entries in file order.
+        """
+        return await self._coalesce(("file", file_path), self.storage.read_day_file, file_path)
+
+    async def list_day_files(self, start: date, end: date) -> list[Path]:
+        """Get the raw day files between start and end dates (inclusive).
+
+        Args:
+            start: Start date (inclusive).
+            end: End date (inclusive).
+
+        Returns:
+            Paths of existing raw files in date order.
+        """
+        return await self._run(self.storage.list_day_files, start, end)
+
+    async def get_entries_by_date_range(self, start: date, end: date) -> list[Entry]:
+        """Get all entries between start and end dates (inclusive).
+
+        Args:
+            start: Start date (inclusive).
+            end: End date (inclusive).
+
+        Returns:
+            List of Entry objects in the date range, sorted by timestamp.
+        """
+        paths = await self.list_day_files(start, end)
+        per_file = await asyncio.gather(*(self.read_day_file(path) for path in paths))
+        entries = [entry for file_entries in per_file for entry in file_entries]
+        return sorted(entries, key=lambda e: e.timestamp)
+
+    async def get_entries_by_pattern(self, pattern: str) -> list[Entry]:
+        """Get entries from raw files matching a glob pattern.
+
+        Args:
+            pattern: Glob pattern relative to logs/raw/.
+
+        Returns:
+            List of Entry objects from matching files, sorted by timestamp.
+        """
+        return await self._coalesce(("pattern", pattern), self.storage.get_entries_by_pattern, pattern)
+
+    async def search_entries(
+        self,
+        keywords: list[str],
+        date_range: DateRange | None = None,
+        match_all: bool = False,
+    ) -> list[Entry]:
+        """Search entries by keywords.
+
+        Args:
+            keywords: Keywords to search for (case-insensitive).
+            date_range: Optional date range to limit the search.
+            match_all: If True, entries must contain all keywords.
+
+        Returns:
+            Matching entries sorted by timestamp.
+        """
+        range_key = None if date_range is None else (date_range.start, date_range.end)
+        key = ("search", tuple(keywords), range_key, match_all)
+        return await self._coalesce(key, self.storage.search_entries, keywords, date_range, match_all)
+
+    async def iter_entries(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        newest_first: bool = False,
+    ) -> AsyncIterator[Entry]:
+        """Lazily yield entries between start and end dates (inclusive).
+
+        Entries are pulled from StorageRepository.iter_entries in chunks on
+        the thread pool, so stopping early still avoids reading later files.
+
+        Args:
+            start: Start date (inclusive), or None for no lower bound.
+            end: End date (inclusive), or None for no upper bound.
+            newest_first: If True, yield from the latest day backwards.
+
+        Yields:
+            Entry objects in timestamp order.
+        """
+        async for entry in self._iterate(self.storage.iter_entries(start, end, newest_first)):
+            yield entry
+
+    async def iter_search(
+        self,
+        keywords: list[str],
+        date_range: DateRange | None = None,
+        match_all: bool = False,
+        newest_first: bool = False,
+    ) -> AsyncIterator[Entry]:
+        """Lazily yield entries matching keywords.
+
+        Args:
+            keywords: Keywords to search for (case-insensitive).
+            date_range: Optional date range to limit the search.
+            match_all: If True, entries must contain all keywords.
+            newest_first: If True, yield from the latest day backwards.
+
+        Yields:
+            Matching Entry objects in timestamp order.
+
+        Raises:
+            ValueError: If keywords is empty.
+        """
+        iterator = self.storage.iter_search(keywords, date_range, match_all, newest_first)
+        async for entry in self._iterate(iterator):
+            yield entry
+
+    async def _iterate(self, iterator: Iterator[Entry]) -> AsyncIterator[Entry]:
+        """Drain a blocking iterator in chunks on the thread pool.
+
+        Args:
+            iterator: Storage iterator to drain.
+
+        Yields:
+            Entries in iterator order.
+        """
+        while True:
+            chunk = await self._run(_next_chunk, iterator, self._chunk_size)
+            if not chunk:
+                return
+            for entry in chunk:
+                yield entry
+
+    async def save_entry(self, entry: Entry, correction: ParserOutput | None = None) -> None:
+        """Save an entry to storage.
+
+        Args:
+            entry: The Entry to save.
+            correction: Optional ParserOutput for correction flow.
+        """
+        await self._run(self.storage.save_entry, entry, correction)
+        # Reads started from now on must see this write
+        self._inflight.clear()
+
+    async def save_entries(
+        self,
+        entries: Sequence[Entry],
+        corrections: Sequence[ParserOutput | None] | None = None,
+    ) -> None:
+        """Save several entries with one raw append and one parsed write per day.
+
+        Args:
+            entries: Entries to save, in order.
+            corrections: Optional ParserOutput per entry for correction flow.
+
+        Raises:
+            ValueError: If corrections is not aligned with entries.
+        """
+        await self._run(self.storage.save_entries, entries, corrections)
+        self._inflight.clear()
+
+    async def rebuild_index(self) -> int:
+        """Rebuild the entry index from every raw markdown file.
+
+        Returns:
+            Number of entries indexed.
+
+        Raises:
+            RuntimeError: If the repository was created without use_index.
+        """
+        return await self._run(self.storage.rebuild_index)
+
+    async def migrate_parsed_format(self, parsed_format: ParsedFormat) -> int:
+        """Convert every parsed day file to the given format.
+
+        Args:
+            parsed_format: Target format, "json" or "jsonl".
+
+        Returns:
+            Number of day files converted.
+        """
+        converted = await self._run(self.storage.migrate_parsed_format, parsed_format)
+        self._inflight.clear()
+        return converted
+
+    async def get_global_context(self) -> str:
+        """Get the global context content.
+
+        Returns:
+            Content of logs/context/global.md, or empty string if not found.
+        """
+        return await self._run(self.storage.get_global_context)
+
+    async def update_global_context(self, content: str) -> None:
+        """Update the global context content.
+
+        Args:
+            content: New content to write to logs/context/global.md.
+        """
+        await self._run(self.storage.update_global_context, content)
@@ -0,0 +1,187 @@
+"""In-process LRU cache for values derived from storage files.
+
+StorageRepository uses this to remember the parsed contents of raw
+markdown and parsed JSON day files. Every entry is validated against the
+file's (mtime_ns, size) on lookup, so a warm read costs a single stat and
+files changed by other processes are re-read.
+"""
+
+import os
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+# (st_mtime_ns, st_size) of a file
+FileSignature = tuple[int, int]
+
+
+class CacheStats(BaseModel):
+    """Snapshot of FileCache counters.
+
+    Attributes:
+        hits: Lookups answered from the cache.
+        misses: Lookups that found no entry or a stale one.
+        evictions: Entries dropped to stay within the budgets.
+        entries: Number of cached files.
+        bytes: Total size of the cached files on disk.
+    """
+
+    model_config = ConfigDict(strict=True)
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    bytes: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups answered from the cache (0.0 when unused)."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+def file_signature(path: Path) -> FileSignature | None:
+    """Get the (mtime_ns, size) signature of a file.
+
+    Args:
+        path: File to stat.
+
+    Returns:
+        Signature tuple, or None if the file does not exist.
+    """
+    try:
+        st = os.stat(path)
+    except FileNotFoundError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+class FileCache:
+    """Bounded, thread-safe LRU cache keyed by file path.
+
+    Values are stored with the signature of the file they were derived
+    from. A lookup with a different signature counts as a miss and drops
+    the stale value. The byte budget is measured by on-disk file size,
+    which is a cheap proxy for the memory held by the derived value.
+
+    Attributes:
+        max_entries: Maximum number of cached files (0 disables caching).
+        max_bytes: Maximum total size of cached files in bytes.
+
+    Example:
+        >>> cache = FileCache(max_entries=128, max_bytes=16 * 1024 * 1024)
+        >>> sig = file_signature(path)
+        >>> value = cache.get(path, sig)
+        >>> if value is None:
+        ...     value = load(path)
+        ...     cache.put(path, sig, value)
+    """
+
+    def __init__(self, max_entries: int = 256, max_bytes: int = 32 * 1024 * 1024) -> None:
+        """Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached files (0 disables caching).
+            max_bytes: Maximum total size of cached files in bytes.
+
+        Raises:
+            ValueError: If either budget is negative.
+        """
+        if max_entries < 0 or max_bytes < 0:
+            raise ValueError("cache budgets must be >= 0")
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        self._items: OrderedDict[Path, tuple[FileSignature, Any]] = OrderedDict()
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(self, path: Path, signature: FileSignature) -> Any | None:
+        """Get the cached value for a file if it is still fresh.
+
+        Args:
+            path: File the value was derived from.
+            signature: Current (mtime_ns, size) of the file.
+
+        Returns:
+            The cached value, or None on a miss.
+        """
+        with self._lock:
+            item = self._items.get(path)
+            if item is None or item[0] != signature:
+                if item is not None:
+                    self._drop(path)
+                self._misses += 1
+                return None
+            self._items.move_to_end(path)
+            self._hits += 1
+            return item[1]
+
+    def put(self, path: Path, signature: FileSignature, value: Any) -> None:
+        """Cache a value derived from a file, evicting least recently used entries.
+
+        Files larger than the byte budget are not cached.
+
+        Args:
+            path: File the value was derived from.
+            signature: (mtime_ns, size) of the file when it was read.
+            value: Derived value; callers must treat it as immutable.
+        """
+        size = signature[1]
+        if self.max_entries == 0 or size > self.max_bytes:
+            return
+        with self._lock:
+            if path in self._items:
+                self._drop(path)
+            self._items[path] = (signature, value)
+            self._bytes += size
+            while len(self._items) > self.max_entries or self._bytes > self.max_bytes:
+                oldest = next(iter(self._items))
+                self._drop(oldest)
+                self._evictions += 1
+
+    def invalidate(self, path: Path) -> None:
+        """Drop the cached value for a file.
+
+        Args:
+            path: File whose value should be dropped.
+        """
+        with self._lock:
+            if path in self._items:
+                self._drop(path)
+
+    def clear(self) -> None:
+        """Drop every cached value (counters are kept)."""
+        with self._lock:
+            self._items.clear()
+            self._bytes = 0
+
+    def stats(self) -> CacheStats:
+        """Get a snapshot of the cache counters.
+
+        Returns:
+            CacheStats with hit/miss/eviction counts and current usage.
+        """
+        with self._lock:
+            return CacheStats(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._items),
+                bytes=self._bytes,
+            )
+
+    def _drop(self, path: Path) -> None:
+        """Remove an entry; the caller holds the lock.
+
+        Args:
+            path: File whose entry to remove.
+        """
+        signature, _ = self._items.pop(path)
+        self._bytes -= signature[1]
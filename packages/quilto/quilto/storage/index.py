@@ -0,0 +1,502 @@
+"""SQLite sidecar index for StorageRepository entries.
+
+The index caches what StorageRepository parses out of the raw markdown
+files so that repeated reads do not have to re-read and re-split them.
+The markdown files remain the source of truth: every indexed file is
+stored together with a signature of the files it was built from, and a
+lookup with a different signature is treated as a miss.
+
+It also keeps an inverted index (term -> entries) over entry content so
+keyword searches only touch the entries whose terms can match. Vocabulary
+terms are themselves indexed by trigram, so finding the terms that contain
+a keyword term as a substring does not scan the whole vocabulary.
+"""
+
+import json
+import re
+import sqlite3
+import threading
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any
+
+from quilto.storage.models import Entry
+
+# Bump when the schema changes; older index files are dropped and rebuilt lazily
+_SCHEMA_VERSION = 3
+
+# SQLite limits the number of bound parameters per statement
+_MAX_PARAMS = 500
+
+_TOKEN_PATTERN = re.compile(r"\w+")
+
+# Vocabulary terms are split into trigrams; shorter tails are padded with a non-word character
+_GRAM_SIZE = 3
+_GRAM_PAD = "$" * (_GRAM_SIZE - 1)
+
+# Sorts after any character that can follow a prefix, for prefix range scans
+_MAX_CHAR = "\U0010ffff"
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    date TEXT NOT NULL,
+    signature TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS entries (
+    path TEXT NOT NULL,
+    position INTEGER NOT NULL,
+    id TEXT NOT NULL,
+    date TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    byte_start INTEGER NOT NULL,
+    byte_end INTEGER NOT NULL,
+    raw_content TEXT NOT NULL,
+    parsed_data TEXT,
+    PRIMARY KEY (path, position)
+);
+CREATE INDEX IF NOT EXISTS entries_by_date ON entries (date, timestamp);
+CREATE TABLE IF NOT EXISTS terms (
+    term TEXT PRIMARY KEY
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS grams (
+    gram TEXT NOT NULL,
+    term TEXT NOT NULL,
+    PRIMARY KEY (gram, term)
+) WITHOUT ROWID;
+CREATE TABLE IF NOT EXISTS postings (
+    term TEXT NOT NULL,
+    entry_rowid INTEGER NOT NULL,
+    path TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_by_term ON postings (term);
+CREATE INDEX IF NOT EXISTS postings_by_path ON postings (path);
+"""
+
+_DROP_SCHEMA = """
+DROP TABLE IF EXISTS files;
+DROP TABLE IF EXISTS entries;
+DROP TABLE IF EXISTS terms;
+DROP TABLE IF EXISTS grams;
+DROP TABLE IF EXISTS postings;
+"""
+
+_ENTRY_COLUMNS = "id, date, timestamp, byte_start, byte_end, raw_content, parsed_data"
+
+
+def tokenize(text: str) -> set[str]:
+    """Split text into the lowercase terms used by the inverted index.
+
+    Args:
+        text: Text to tokenize.
+
+    Returns:
+        Set of lowercase word terms.
+    """
+    return set(_TOKEN_PATTERN.findall(text.lower()))
+
+
+def _term_grams(term: str) -> set[str]:
+    """Split a vocabulary term into the trigrams stored in the grams table.
+
+    Every position of the term starts a gram, padding the tail, so a term
+    shorter than a trigram is still reachable by a prefix lookup.
+
+    Args:
+        term: Vocabulary term.
+
+    Returns:
+        Set of padded trigrams.
+    """
+    padded = term + _GRAM_PAD
+    return {padded[i : i + _GRAM_SIZE] for i in range(len(term))}
+
+
+@dataclass(frozen=True)
+class IndexedEntry:
+    """An entry together with its location in the raw markdown file.
+
+    Attributes:
+        entry: The parsed Entry.
+        byte_start: Byte offset of the entry content in the raw file.
+        byte_end: Byte offset just past the entry content in the raw file.
+    """
+
+    entry: Entry
+    byte_start: int
+    byte_end: int
+
+
+class EntryIndex:
+    """SQLite-backed index of entries keyed by raw file.
+
+    Each raw markdown file is indexed as a unit: its rows are replaced
+    whenever the file (or its parsed JSON) changes. Lookups are validated
+    against a caller-supplied signature so stale rows are never returned.
+
+    Attributes:
+        db_path: Path to the SQLite database file.
+
+    Example:
+        >>> index = EntryIndex(Path("/data/logs/index.sqlite"))
+        >>> index.get_file("2026/01/2026-01-01.md", signature)
+        None
+    """
+
+    def __init__(self, db_path: Path) -> None:
+        """Initialize the index, creating the database if needed.
+
+        Args:
+            db_path: Path to the SQLite database file.
+        """
+        self.db_path = db_path
+        db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(db_path, timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        version = int(self._conn.execute("PRAGMA user_version").fetchone()[0])
+        if version != _SCHEMA_VERSION:
+            self._conn.executescript(_DROP_SCHEMA)
+            self._conn.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+        self._conn.executescript(_SCHEMA)
+        self._conn.commit()
+
+    def get_file(self, path: str, signature: str) -> list[IndexedEntry] | None:
+        """Get the indexed entries of a raw file if the index is fresh.
+
+        Args:
+            path: Raw file path relative to logs/raw/.
+            signature: Current signature of the raw and parsed files.
+
+        Returns:
+            Indexed entries in file order, or None if the file is not
+            indexed or was indexed with a different signature.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT signature FROM files WHERE path = ?", (path,)).fetchone()
+            if row is None or row[0] != signature:
+                return None
+            rows = self._conn.execute(
+                f"SELECT {_ENTRY_COLUMNS} FROM entries WHERE path = ? ORDER BY position",
+                (path,),
+            ).fetchall()
+        return [_row_to_indexed(r) for r in rows]
+
+    def get_signatures(self, start: date | None = None, end: date | None = None) -> dict[str, str]:
+        """Get the stored signature of every indexed file in a date range.
+
+        Args:
+            start: First date to include, or None for no lower bound.
+            end: Last date to include, or None for no upper bound.
+
+        Returns:
+            Mapping of raw file path to its indexed signature.
+        """
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT path, signature FROM files WHERE date >= ? AND date <= ?",
+                (_lower_bound(start), _upper_bound(end)),
+            ).fetchall()
+        return {path: signature for path, signature in rows}
+
+    def put_file(self, path: str, entry_date: date, signature: str, entries: list[IndexedEntry]) -> None:
+        """Replace the indexed entries of a raw file.
+
+        Args:
+            path: Raw file path relative to logs/raw/.
+            entry_date: Date the raw file belongs to.
+            signature: Signature of the raw and parsed files the entries were read from.
+            entries: Entries in file order.
+        """
+        with self._lock, self._conn:
+            old_terms = self._file_terms(path)
+            self._delete_file_rows(path)
+            self._conn.execute(
+                "INSERT INTO files (path, date, signature) VALUES (?, ?, ?)",
+                (path, entry_date.isoformat(), signature),
+            )
+            for position, item in enumerate(entries):
+                cursor = self._conn.execute(
+                    "INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    (
+                        path,
+                        position,
+                        item.entry.id,
+                        item.entry.date.isoformat(),
+                        item.entry.timestamp.isoformat(),
+                        item.byte_start,
+                        item.byte_end,
+                        item.entry.raw_content,
+                        None
+                        if item.entry.parsed_data is None
+                        else json.dumps(item.entry.parsed_data, ensure_ascii=False, default=str),
+                    ),
+                )
+                terms = sorted(tokenize(item.entry.raw_content))
+                for term in terms:
+                    added = self._conn.execute("INSERT OR IGNORE INTO terms VALUES (?)", (term,))
+                    if added.rowcount:
+                        self._conn.executemany(
+                            "INSERT INTO grams (gram, term) VALUES (?, ?)",
+                            [(g, term) for g in sorted(_term_grams(term))],
+                        )
+                self._conn.executemany(
+                    "INSERT INTO postings (term, entry_rowid, path) VALUES (?, ?, ?)",
+                    [(t, cursor.lastrowid, path) for t in terms],
+                )
+            self._prune_terms(old_terms)
+
+    def remove_file(self, path: str) -> None:
+        """Remove a raw file and its entries from the index.
+
+        Args:
+            path: Raw file path relative to logs/raw/.
+        """
+        with self._lock, self._conn:
+            old_terms = self._file_terms(path)
+            self._delete_file_rows(path)
+            self._prune_terms(old_terms)
+
+    def _file_terms(self, path: str) -> list[str]:
+        """Get the terms posted by a file; the caller holds the lock.
+
+        Args:
+            path: Raw file path relative to logs/raw/.
+
+        Returns:
+            Distinct terms of the file's entries.
+        """
+        rows = self._conn.execute("SELECT DISTINCT term FROM postings WHERE path = ?", (path,)).fetchall()
+        return [str(r[0]) for r in rows]
+
+    def _delete_file_rows(self, path: str) -> None:
+        """Delete a file's rows; the caller holds the lock and transaction.
+
+        Args:
+            path: Raw file path relative to logs/raw/.
+        """
+        self._conn.execute("DELETE FROM postings WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM entries WHERE path = ?", (path,))
+        self._conn.execute("DELETE FROM files WHERE path = ?", (path,))
+
+    def _prune_terms(self, terms: list[str]) -> None:
+        """Drop vocabulary terms that no posting refers to any more.
+
+        The caller holds the lock and transaction.
+
+        Args:
+            terms: Terms whose postings may have been removed.
+        """
+        for term in terms:
+            if self._conn.execute("SELECT 1 FROM postings WHERE term = ? LIMIT 1", (term,)).fetchone():
+                continue
+            self._conn.execute("DELETE FROM terms WHERE term = ?", (term,))
+            self._conn.executemany(
+                "DELETE FROM grams WHERE gram = ? AND term = ?",
+                [(g, term) for g in _term_grams(term)],
+            )
+
+    def clear(self) -> None:
+        """Remove every file and entry from the index."""
+        with self._lock, self._conn:
+            self._conn.execute("DELETE FROM postings")
+            self._conn.execute("DELETE FROM terms")
+            self._conn.execute("DELETE FROM grams")
+            self._conn.execute("DELETE FROM entries")
+            self._conn.execute("DELETE FROM files")
+
+    def search_candidates(
+        self,
+        keyword_terms: list[list[str]],
+        match_all: bool,
+        start: date | None = None,
+        end: date | None = None,
+    ) -> list[Entry]:
+        """Find entries that may contain the given keywords.
+
+        Each keyword is given as its list of terms (see tokenize). An entry
+        can only contain a keyword as a substring if every term of the
+        keyword is a substring of one of the entry's terms, so candidates
+        are collected from the posting lists of the matching vocabulary
+        terms. The result is a superset of the true matches; callers verify
+        each candidate against its content.
+
+        Args:
+            keyword_terms: Terms of each keyword. A keyword without terms
+                (e.g. pure punctuation) cannot be narrowed by the index.
+            match_all: If True, intersect keyword candidates (AND logic),
+                otherwise union them (OR logic).
+            start: First date to include, or None for no lower bound.
+            end: Last date to include, or None for no upper bound.
+
+        Returns:
+            Candidate entries sorted by timestamp, then file order.
+        """
+        with self._lock:
+            constrained = [terms for terms in keyword_terms if terms]
+            # Unconstrained keywords match everything under OR and add nothing under AND
+            if not constrained or (not match_all and len(constrained) < len(keyword_terms)):
+                return self._entries_in_range(start, end)
+
+            candidates: set[int] | None = None
+            for terms in constrained:
+                rowids = self._keyword_rowids(terms)
+                if candidates is None:
+                    candidates = rowids
+                elif match_all:
+                    candidates &= rowids
+                else:
+                    candidates |= rowids
+
+            rows: list[tuple[Any, ...]] = []
+            ids = sorted(candidates) if candidates else []
+            for i in range(0, len(ids), _MAX_PARAMS):
+                chunk = ids[i : i + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows.extend(
+                    self._conn.execute(
+                        f"SELECT {_ENTRY_COLUMNS}, path, position FROM entries "
+                        f"WHERE rowid IN ({placeholders}) AND date >= ? AND date <= ?",
+                        (*chunk, _lower_bound(start), _upper_bound(end)),
+                    ).fetchall()
+                )
+
+        rows.sort(key=lambda r: (r[2], r[7], r[8]))
+        return [_row_to_indexed(r[:7]).entry for r in rows]
+
+    def _keyword_rowids(self, terms: list[str]) -> set[int]:
+        """Collect entries whose terms contain every term of a keyword.
+
+        Args:
+            terms: Terms of a single keyword.
+
+        Returns:
+            Set of entry rowids; the caller holds the lock.
+        """
+        result: set[int] | None = None
+        for term in terms:
+            rowids: set[int] = set()
+            vocabulary = self._matching_terms(term)
+            for i in range(0, len(vocabulary), _MAX_PARAMS):
+                chunk = vocabulary[i : i + _MAX_PARAMS]
+                placeholders = ",".join("?" * len(chunk))
+                rows = self._conn.execute(
+                    f"SELECT DISTINCT entry_rowid FROM postings WHERE term IN ({placeholders})",
+                    chunk,
+                ).fetchall()
+                rowids.update(int(r[0]) for r in rows)
+            result = rowids if result is None else result & rowids
+            if not result:
+                break
+        return result or set()
+
+    def _matching_terms(self, term: str) -> list[str]:
+        """Find the vocabulary terms that contain a term as a substring.
+
+        A term of at least trigram length is looked up by its trigrams: a
+        vocabulary term containing it has all of them. Shorter terms are a
+        prefix of some gram of every term containing them.
+
+        Args:
+            term: A keyword term.
+
+        Returns:
+            Matching vocabulary terms; the caller holds the lock.
+        """
+        if len(term) < _GRAM_SIZE:
+            rows = self._conn.execute(
+                "SELECT DISTINCT term FROM grams WHERE gram >= ? AND gram < ?",
+                (term, term + _MAX_CHAR),
+            ).fetchall()
+            return [str(r[0]) for r in rows]
+
+        # Any subset of the grams still narrows correctly; cap it to fit one statement
+        grams = sorted({term[i : i + _GRAM_SIZE] for i in range(len(term) - _GRAM_SIZE + 1)})[: _MAX_PARAMS - 1]
+        placeholders = ",".join("?" * len(grams))
+        rows = self._conn.execute(
+            f"SELECT term FROM grams WHERE gram IN ({placeholders}) GROUP BY term HAVING COUNT(*) = ?",
+            (*grams, len(grams)),
+        ).fetchall()
+        # Sharing every trigram does not imply containment (e.g. "abcab" vs "cabca")
+        return [str(r[0]) for r in rows if term in r[0]]
+
+    def _entries_in_range(self, start: date | None, end: date | None) -> list[Entry]:
+        """Get every indexed entry in a date range; the caller holds the lock.
+
+        Args:
+            start: First date to include, or None for no lower bound.
+            end: Last date to include, or None for no upper bound.
+
+        Returns:
+            Entries sorted by timestamp, then file order.
+        """
+        rows = self._conn.execute(
+            f"SELECT {_ENTRY_COLUMNS} FROM entries WHERE date >= ? AND date <= ? ORDER BY timestamp, path, position",
+            (_lower_bound(start), _upper_bound(end)),
+        ).fetchall()
+        return [_row_to_indexed(r).entry for r in rows]
+
+    def count_entries(self) -> int:
+        """Count the indexed entries.
+
+        Returns:
+            Number of entries in the index.
+        """
+        with self._lock:
+            row = self._conn.execute("SELECT COUNT(*) FROM entries").fetchone()
+        return int(row[0])
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._conn.close()
+
+
+def _lower_bound(start: date | None) -> str:
+    """Format an optional start date for an ISO-string comparison.
+
+    Args:
+        start: Start date, or None for no lower bound.
+
+    Returns:
+        ISO date string, or an empty string that sorts before every date.
+    """
+    return "" if start is None else start.isoformat()
+
+
+def _upper_bound(end: date | None) -> str:
+    """Format an optional end date for an ISO-string comparison.
+
+    Args:
+        end: End date, or None for no upper bound.
+
+    Returns:
+        ISO date string, or a string that sorts after every date.
+    """
+    return "9999-99-99" if end is None else end.isoformat()
+
+
+def _row_to_indexed(row: tuple[Any, ...]) -> IndexedEntry:
+    """Convert an entries row into an IndexedEntry.
+
+    Args:
+        row: Tuple of (id, date, timestamp, byte_start, byte_end, raw_content, parsed_data).
+
+    Returns:
+        The reconstructed IndexedEntry.
+    """
+    entry_id, entry_date, timestamp, byte_start, byte_end, raw_content, parsed_json = row
+    parsed_data: dict[str, Any] | None = None if parsed_json is None else json.loads(parsed_json)
+    return IndexedEntry(
+        entry=Entry(
+            id=entry_id,
+            date=date.fromisoformat(entry_date),
+            timestamp=datetime.fromisoformat(timestamp),
+            raw_content=raw_content,
+            parsed_data=parsed_data,
+        ),
+        byte_start=byte_start,
+        byte_end=byte_end,
+    )
@@ -0,0 +1,238 @@
+"""Append-only journal for parsed JSON day files.
+
+Writers never rewrite a parsed day file directly. Each change is appended
+as one JSON line to ``{DATE}.json.journal`` under a short exclusive lock,
+and a later compaction (StorageRepository runs it in a background thread)
+folds the journal into ``{DATE}.json`` with a write-to-temp-and-rename.
+Concurrent writers therefore only serialize on the append, and a single
+rewrite can absorb many writers' changes.
+
+Compaction first renames the journal to ``{DATE}.json.journal.pending`` so
+new appends go to a fresh journal while the fold runs. Readers fold
+base + pending + journal under a shared lock. Replaying records is
+idempotent, so a compaction interrupted between the rename of the new base
+and the removal of the pending file loses nothing.
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, cast
+
+from quilto.storage.cache import FileSignature, file_signature
+from quilto.storage.locking import append_text, file_lock, write_temp_file
+
+logger = logging.getLogger(__name__)
+
+
+def apply_records(state: dict[str, Any], records: list[dict[str, Any]]) -> dict[str, Any]:
+    """Fold journal records into a parsed-data mapping, in order.
+
+    ``set`` replaces an entry's parsed data; ``update`` merges a correction
+    delta into it (upsert, last writer wins per field).
+
+    Args:
+        state: Mapping of entry ID to parsed data; modified in place.
+        records: Journal records in append order.
+
+    Returns:
+        The updated state.
+    """
+    for record in records:
+        entry_id = record.get("id")
+        if not isinstance(entry_id, str):
+            continue
+        op = record.get("op")
+        if op == "set":
+            state[entry_id] = record.get("data")
+        elif op == "update":
+            current = state.get(entry_id)
+            merged = dict(cast(dict[str, Any], current)) if isinstance(current, dict) else {}
+            merged.update(cast(dict[str, Any], record.get("delta") or {}))
+            state[entry_id] = merged
+    return state
+
+
+def read_records(path: Path) -> list[dict[str, Any]]:
+    """Read the records of a journal file.
+
+    Lines that are not valid JSON objects (e.g. a torn write after a crash)
+    are skipped.
+
+    Args:
+        path: Journal file.
+
+    Returns:
+        Records in append order, empty if the file is missing.
+    """
+    try:
+        text = path.read_text(encoding="utf-8")
+    except FileNotFoundError:
+        return []
+
+    records: list[dict[str, Any]] = []
+    for line in text.splitlines():
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            logger.warning("Skipping unreadable journal record in %s", path)
+            continue
+        if isinstance(record, dict):
+            records.append(cast(dict[str, Any], record))
+    return records
+
+
+class ParsedJournal:
+    """Journaled writer and reader for one parsed JSON day file.
+
+    Attributes:
+        path: The parsed JSON file.
+        journal_path: Journal receiving new records.
+        pending_path: Journal being folded by an in-progress compaction.
+
+    Example:
+        >>> journal = ParsedJournal(Path("logs/parsed/2026/01/2026-01-01.json"))
+        >>> journal.set("2026-01-01_08-30-00", {"exercise": "squat"})
+        >>> journal.read()["2026-01-01_08-30-00"]
+        {'exercise': 'squat'}
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the journal for a parsed JSON file.
+
+        Args:
+            path: The parsed JSON file.
+        """
+        self.path = path
+        self.journal_path = path.with_name(f"{path.name}.journal")
+        self.pending_path = path.with_name(f"{path.name}.journal.pending")
+
+    def signature(self) -> tuple[FileSignature | None, FileSignature | None, FileSignature | None]:
+        """Get the signatures of the journal, pending journal and base file.
+
+        Files are stat-ed in the order data flows through them (journal,
+        then pending, then base), so a record moved by a concurrent
+        compaction is always seen in at least one of them.
+
+        Returns:
+            Tuple of (journal, pending, base) signatures, None for missing files.
+        """
+        journal_sig = file_signature(self.journal_path)
+        pending_sig = file_signature(self.pending_path)
+        return journal_sig, pending_sig, file_signature(self.path)
+
+    def has_records(self) -> bool:
+        """Check whether any journaled changes are not yet folded into the base.
+
+        Returns:
+            True if a journal or pending journal exists.
+        """
+        return file_signature(self.journal_path) is not None or file_signature(self.pending_path) is not None
+
+    def set(self, entry_id: str, parsed_data: dict[str, Any]) -> None:
+        """Record the parsed data of an entry in the journal.
+
+        Args:
+            entry_id: ID of the entry.
+            parsed_data: Data to save.
+        """
+        self.append_records([{"op": "set", "id": entry_id, "data": parsed_data}])
+
+    def update(self, entry_id: str, correction_delta: dict[str, Any]) -> None:
+        """Record a correction delta (upsert) in the journal.
+
+        Args:
+            entry_id: ID of the entry to update.
+            correction_delta: Fields to update.
+        """
+        self.append_records([{"op": "update", "id": entry_id, "delta": correction_delta}])
+
+    def read(self) -> dict[str, Any]:
+        """Read the base file with all journaled changes applied.
+
+        Returns:
+            Mapping of entry ID to parsed data.
+        """
+        with file_lock(self.path, shared=True):
+            state = self._load_base()
+            apply_records(state, read_records(self.pending_path))
+            return apply_records(state, read_records(self.journal_path))
+
+    def compact(self, blocking: bool = False) -> bool:
+        """Fold journaled changes into the base file.
+
+        Only one compaction runs at a time. With blocking=False a writer that
+        finds another compaction in progress returns immediately; the running
+        compaction keeps draining until the journal is empty, and re-checks
+        after releasing its lock so no record is left behind.
+
+        Args:
+            blocking: Wait for a running compaction instead of leaving the
+                work to it.
+
+        Returns:
+            True if this call ran a compaction.
+        """
+        ran = False
+        while True:
+            with file_lock(self.journal_path, blocking=blocking) as acquired:
+                if not acquired:
+                    return ran
+                ran = True
+                while self._compact_once():
+                    pass
+            if not self.journal_path.exists():
+                return ran
+
+    def append_records(self, records: list[dict[str, Any]]) -> None:
+        """Append records to the journal in one write.
+
+        The base file is not rewritten; call compact to fold the journal.
+
+        Args:
+            records: ``set``/``update`` records in the order they apply.
+        """
+        if not records:
+            return
+        lines = "".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records)
+        with file_lock(self.path):
+            append_text(self.journal_path, lines)
+
+    def _compact_once(self) -> bool:
+        """Fold one batch of journal records; the caller holds the compaction lock.
+
+        Returns:
+            True if records were folded.
+        """
+        if not self.pending_path.exists():
+            with file_lock(self.path):
+                if not self.journal_path.exists():
+                    return False
+                self.journal_path.replace(self.pending_path)
+
+        state = apply_records(self._load_base(), read_records(self.pending_path))
+        tmp_path = write_temp_file(self.path, json.dumps(state, indent=2, ensure_ascii=False, default=str))
+
+        with file_lock(self.path):
+            tmp_path.replace(self.path)
+            self.pending_path.unlink(missing_ok=True)
+        return True
+
+    def _load_base(self) -> dict[str, Any]:
+        """Load the base JSON file without journaled changes.
+
+        Returns:
+            Mapping of entry ID to parsed data, empty if the file is missing
+            or unreadable.
+        """
+        try:
+            with self.path.open(encoding="utf-8") as f:
+                data = json.load(f)
+        except FileNotFoundError:
+            return {}
+        except (json.JSONDecodeError, OSError) as e:
+            logger.error("Failed to load parsed data from %s: %s", self.path, e)
+            return {}
+        return cast(dict[str, Any], data) if isinstance(data, dict) else {}
@@ -0,0 +1,148 @@
+"""Cross-process file locking and atomic file replacement.
+
+Locks are advisory fcntl.flock locks taken on a ``{name}.lock`` file in a
+hidden ``.locks/`` directory beside the protected file, so they serialize
+writers across threads, processes and uvicorn workers sharing the same
+storage directory without leaving lock files among the user's data. On
+platforms without fcntl the locks degrade to in-process locks.
+"""
+
+import os
+import sys
+import tempfile
+import threading
+from collections.abc import Generator
+from contextlib import contextmanager
+from pathlib import Path
+
+if sys.platform != "win32":
+    import fcntl
+
+# Hidden directory, beside each protected file, that holds its lock file
+LOCK_DIR = ".locks"
+
+_fallback_locks: dict[Path, threading.Lock] = {}
+_fallback_guard = threading.Lock()
+
+
+def lock_path_for(path: Path) -> Path:
+    """Get the lock file path for a file.
+
+    Args:
+        path: File to protect.
+
+    Returns:
+        Path of the file's ``.lock`` file in the hidden lock directory.
+    """
+    return path.parent / LOCK_DIR / f"{path.name}.lock"
+
+
+@contextmanager
+def file_lock(path: Path, shared: bool = False, blocking: bool = True) -> Generator[bool]:
+    """Hold an advisory lock protecting a file.
+
+    Args:
+        path: File to protect (the lock is taken on its lock_path_for file).
+        shared: If True, take a shared (reader) lock instead of an exclusive one.
+        blocking: If False, do not wait for the lock.
+
+    Yields:
+        True if the lock is held, False if blocking=False and it was busy.
+    """
+    lock_path = lock_path_for(path)
+    lock_path.parent.mkdir(parents=True, exist_ok=True)
+
+    if sys.platform == "win32":
+        with _fallback_guard:
+            lock = _fallback_locks.setdefault(lock_path, threading.Lock())
+        acquired = lock.acquire(blocking=blocking)
+        try:
+            yield acquired
+        finally:
+            if acquired:
+                lock.release()
+        return
+
+    fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+    try:
+        flags = fcntl.LOCK_SH if shared else fcntl.LOCK_EX
+        if not blocking:
+            flags |= fcntl.LOCK_NB
+        try:
+            fcntl.flock(fd, flags)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(fd, fcntl.LOCK_UN)
+    finally:
+        os.close(fd)
+
+
+def write_temp_file(path: Path, content: str) -> Path:
+    """Write content to a durable temporary file next to a target file.
+
+    Pair with os.replace to swap it in, which lets callers do the write
+    outside a lock and hold the lock only for the rename.
+
+    Args:
+        path: File the temporary file will replace.
+        content: Text content (written as UTF-8).
+
+    Returns:
+        Path of the temporary file, flushed to disk.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+    except BaseException:
+        Path(tmp_name).unlink(missing_ok=True)
+        raise
+    return Path(tmp_name)
+
+
+def atomic_write_text(path: Path, content: str) -> None:
+    """Write a file so readers see either the old or the new content.
+
+    The content is written to a temporary file in the same directory,
+    flushed to disk and renamed over the target.
+
+    Args:
+        path: File to write.
+        content: Text content (written as UTF-8).
+    """
+    tmp_path = write_temp_file(path, content)
+    try:
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def append_text(path: Path, content: str) -> int:
+    """Append text to a file with a single write call.
+
+    Callers that need ordering across processes hold file_lock(path).
+
+    Args:
+        path: File to append to (created if missing).
+        content: Text content (written as UTF-8).
+
+    Returns:
+        Size of the file before the append.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    data = content.encode("utf-8")
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+    try:
+        size_before = os.fstat(fd).st_size
+        os.write(fd, data)
+    finally:
+        os.close(fd)
+    return size_before
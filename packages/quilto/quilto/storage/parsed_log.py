@@ -0,0 +1,146 @@
+"""Append-only JSONL store for parsed day files.
+
+In the ``jsonl`` parsed format each day's parsed data lives in
+``parsed/{YYYY}/{MM}/{YYYY-MM-DD}.jsonl``. Saving an entry or a correction
+appends one record line (the same ``set``/``update`` records used by the
+parsed JSON journal), so a write costs O(1) regardless of how many entries
+the day already has. Reads fold the records in order, and compaction
+rewrites a file as one ``set`` record per entry once superseded records
+dominate it.
+"""
+
+import json
+from pathlib import Path
+from typing import Any, Literal
+
+from quilto.storage.journal import apply_records, read_records
+from quilto.storage.locking import append_text, file_lock, write_temp_file
+
+ParsedFormat = Literal["json", "jsonl"]
+
+# Records the parsed format of a storage tree, under logs/parsed/
+PARSED_FORMAT_MARKER = ".format"
+
+# Never compact files with fewer superseded records than this
+COMPACT_MIN_SUPERSEDED = 16
+
+
+class ParsedLog:
+    """Append-only JSONL parsed store for one day.
+
+    Attributes:
+        path: The ``.jsonl`` file.
+
+    Example:
+        >>> log = ParsedLog(Path("logs/parsed/2026/01/2026-01-01.jsonl"))
+        >>> log.set("2026-01-01_08-30-00", {"weight": 100})
+        >>> log.update("2026-01-01_08-30-00", {"weight": 185})
+        >>> log.read()
+        {'2026-01-01_08-30-00': {'weight': 185}}
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Initialize the store for a day file.
+
+        Args:
+            path: The ``.jsonl`` file.
+        """
+        self.path = path
+
+    def set(self, entry_id: str, parsed_data: dict[str, Any]) -> int:
+        """Append a record replacing an entry's parsed data.
+
+        Args:
+            entry_id: ID of the entry.
+            parsed_data: Data to save.
+
+        Returns:
+            Size of the file after the append.
+        """
+        return self.append_records([{"op": "set", "id": entry_id, "data": parsed_data}])
+
+    def update(self, entry_id: str, correction_delta: dict[str, Any]) -> int:
+        """Append a correction delta (upsert, last writer wins per field).
+
+        Args:
+            entry_id: ID of the entry to update.
+            correction_delta: Fields to update.
+
+        Returns:
+            Size of the file after the append.
+        """
+        return self.append_records([{"op": "update", "id": entry_id, "delta": correction_delta}])
+
+    def append_records(self, records: list[dict[str, Any]]) -> int:
+        """Append records in one write under the file's lock.
+
+        Args:
+            records: ``set``/``update`` records in the order they apply.
+
+        Returns:
+            Size of the file after the append.
+        """
+        lines = "".join(json.dumps(record, ensure_ascii=False, default=str) + "\n" for record in records)
+        with file_lock(self.path):
+            return append_text(self.path, lines) + len(lines.encode("utf-8"))
+
+    def read_records(self) -> list[dict[str, Any]]:
+        """Read the records in append order.
+
+        Returns:
+            Records, empty if the file is missing.
+        """
+        with file_lock(self.path, shared=True):
+            return read_records(self.path)
+
+    def read(self) -> dict[str, Any]:
+        """Read the day's parsed data with all records folded.
+
+        Returns:
+            Mapping of entry ID to parsed data.
+        """
+        return apply_records({}, self.read_records())
+
+    def write(self, parsed: dict[str, Any]) -> None:
+        """Replace the file with one ``set`` record per entry.
+
+        Args:
+            parsed: Mapping of entry ID to parsed data.
+        """
+        with file_lock(self.path):
+            self._replace(parsed)
+
+    def compact(self, min_superseded: int = COMPACT_MIN_SUPERSEDED) -> bool:
+        """Rewrite the file without superseded records if it is worth it.
+
+        The file is compacted when superseded records (replaced ``set``
+        records and folded ``update`` records) are at least as many as the
+        live entries and at least min_superseded. Appends wait while the
+        rewrite runs.
+
+        Args:
+            min_superseded: Minimum number of superseded records to compact.
+
+        Returns:
+            True if the file was rewritten.
+        """
+        with file_lock(self.path):
+            records = read_records(self.path)
+            parsed = apply_records({}, records)
+            superseded = len(records) - len(parsed)
+            if superseded < max(min_superseded, len(parsed)):
+                return False
+            self._replace(parsed)
+        return True
+
+    def _replace(self, parsed: dict[str, Any]) -> None:
+        """Atomically replace the file; the caller holds the lock.
+
+        Args:
+            parsed: Mapping of entry ID to parsed data.
+        """
+        lines = [
+            json.dumps({"op": "set", "id": entry_id, "data": data}, ensure_ascii=False, default=str) + "\n"
+            for entry_id, data in parsed.items()
+        ]
+        write_temp_file(self.path, "".join(lines)).replace(self.path)
@@ -1,17 +1,40 @@
 """StorageRepository implementation for entry persistence and retrieval."""
 
+import copy
 import json
 import logging
+import os
 import re
-from datetime import date, datetime, timedelta
+import threading
+from collections.abc import Callable, Iterator, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, datetime
 from pathlib import Path
-from typing import Any, cast
+from typing import Any, NamedTuple, cast
 
 from quilto.agents.models import ParserOutput
+from quilto.storage.cache import CacheStats, FileCache, file_signature
+from quilto.storage.index import EntryIndex, IndexedEntry, tokenize
+from quilto.storage.journal import ParsedJournal, apply_records
+from quilto.storage.locking import append_text, atomic_write_text, file_lock
 from quilto.storage.models import DateRange, Entry
+from quilto.storage.parsed_log import PARSED_FORMAT_MARKER, ParsedFormat, ParsedLog
 
 logger = logging.getLogger(__name__)
 
+# Section headers: ## HH:MM or ## HH:MM [correction]
+_SECTION_PATTERN = re.compile(r"^## (\d{2}):(\d{2})(?:\s*\[correction\])?\s*$", re.MULTILINE)
+
+
+class _Section(NamedTuple):
+    """A ## HH:MM section of a raw markdown file, before parsed data is joined."""
+
+    entry_id: str
+    timestamp: datetime
+    content: str
+    byte_start: int
+    byte_end: int
+
 
 class StorageRepository:
     """Repository for storing and retrieving log entries.
@@ -23,25 +46,129 @@ class StorageRepository:
         {base_path}/logs/
         ├── raw/{YYYY}/{MM}/{YYYY-MM-DD}.md      # Human + agent readable
         ├── parsed/{YYYY}/{MM}/{YYYY-MM-DD}.json  # App consumption
-        └── context/global.md                     # Observer's global context
+        ├── parsed/{YYYY}/{MM}/{YYYY-MM-DD}.jsonl # App consumption (jsonl format)
+        ├── context/global.md                     # Observer's global context
+        ├── index.sqlite                          # Optional entry index
+        └── index.dirty                           # Days written without the index
+
+    When the index is enabled, entries parsed from each raw file are kept in
+    a SQLite sidecar and reads are answered from it for as long as the raw
+    and parsed files are unchanged. The markdown files stay the source of
+    truth: a file whose size or mtime differs from the indexed signature is
+    re-parsed and re-indexed on the next read. The index also holds an
+    inverted keyword index that search_entries uses to avoid scanning
+    every entry. Searches do not stat every file: writes re-index their
+    day (repositories without the index record it in index.dirty for the
+    next indexed search), the files of candidate entries are validated,
+    and the whole tree is checked once, on a repository's first search.
+    Files added or edited outside StorageRepository after that are picked
+    up by a new repository or by rebuild_index.
+
+    Independently of the index, the split sections of raw files and the
+    contents of parsed files are kept in an in-process LRU cache validated
+    by each file's (mtime_ns, size), so warm reads cost a stat per file.
+
+    Writes are safe across threads and processes sharing the directory:
+    raw appends happen under a per-day fcntl lock, and parsed data is
+    written through an append-only journal that a background thread folds
+    into the day's JSON file with write-to-temp-and-rename (see
+    quilto.storage.journal).
+
+    With parsed_format="jsonl", parsed records and correction deltas are
+    instead appended to a per-day JSONL file, so a write no longer rewrites
+    the day. Superseded records are compacted away in a background thread.
+    Reads fold a day's JSON file first and its JSONL records on top, so a
+    tree can be switched between formats; migrate_parsed_format converts
+    the existing files and records the format for later repositories.
 
     Attributes:
         base_path: Root directory for all storage operations.
     """
 
-    def __init__(self, base_path: Path) -> None:
+    def __init__(
+        self,
+        base_path: Path,
+        use_index: bool = False,
+        cache_max_entries: int = 256,
+        cache_max_bytes: int = 32 * 1024 * 1024,
+        parsed_format: ParsedFormat | None = None,
+        compact_min_bytes: int = 64 * 1024,
+    ) -> None:
         """Initialize the StorageRepository.
 
         Args:
             base_path: Root directory for storage. Will be created if it doesn't exist.
+            use_index: If True, maintain and read from logs/index.sqlite.
+            cache_max_entries: Maximum number of files held in the read cache
+                (0 disables the cache).
+            cache_max_bytes: Maximum total on-disk size of cached files.
+            parsed_format: How new parsed data is written: "json" (one JSON
+                object per day) or "jsonl" (append-only records per day).
+                Defaults to the format recorded by migrate_parsed_format, or
+                "json" for trees that were never migrated.
+            compact_min_bytes: Size a JSONL day file must reach before it is
+                considered for background compaction.
 
         Raises:
             NotADirectoryError: If base_path exists but is not a directory.
+            ValueError: If a cache budget is negative or parsed_format is unknown.
         """
         if base_path.exists() and not base_path.is_dir():
             raise NotADirectoryError(f"base_path must be a directory, got file: {base_path}")
         self.base_path = base_path
         self._ensure_directories()
+        self._cache = FileCache(max_entries=cache_max_entries, max_bytes=cache_max_bytes)
+        self._index_path = self.base_path / "logs" / "index.sqlite"
+        self._index = EntryIndex(self._index_path) if use_index else None
+        self._index_synced = False
+        self.parsed_format: ParsedFormat = parsed_format or self._detect_parsed_format()
+        if self.parsed_format not in ("json", "jsonl"):
+            raise ValueError(f"Unknown parsed format: {self.parsed_format}")
+        self._compact_min_bytes = compact_min_bytes
+        self._compact_lock = threading.Lock()
+        self._compacted_sizes: dict[Path, int] = {}
+        self._compacting: set[Path] = set()
+        self._compact_again: set[Path] = set()
+        self._compactor: ThreadPoolExecutor | None = None
+
+    @property
+    def index_enabled(self) -> bool:
+        """Whether the SQLite entry index is enabled."""
+        return self._index is not None
+
+    def cache_stats(self) -> CacheStats:
+        """Get the read cache counters.
+
+        Returns:
+            CacheStats with hits, misses, evictions and current usage.
+        """
+        return self._cache.stats()
+
+    def close(self) -> None:
+        """Release resources held by the repository.
+
+        Waits for background compactions to finish and closes the index
+        connection.
+        """
+        with self._compact_lock:
+            compactor, self._compactor = self._compactor, None
+        if compactor is not None:
+            compactor.shutdown(wait=True)
+        if self._index is not None:
+            self._index.close()
+
+    def _detect_parsed_format(self) -> ParsedFormat:
+        """Read the parsed format recorded by migrate_parsed_format.
+
+        Returns:
+            The recorded format, or "json" if none is recorded.
+        """
+        marker = self.base_path / "logs" / "parsed" / PARSED_FORMAT_MARKER
+        try:
+            recorded = marker.read_text(encoding="utf-8").strip()
+        except FileNotFoundError:
+            return "json"
+        return "jsonl" if recorded == "jsonl" else "json"
 
     def _ensure_directories(self) -> None:
         """Create required directory structure if it doesn't exist."""
@@ -85,6 +212,17 @@ class StorageRepository:
             / f"{entry_date.isoformat()}.json"
         )
 
+    def _get_parsed_log_path(self, entry_date: date) -> Path:
+        """Get the path for a parsed JSONL file for a given date.
+
+        Args:
+            entry_date: The date to get the path for.
+
+        Returns:
+            Path to the parsed JSONL file.
+        """
+        return self._get_parsed_path(entry_date).with_suffix(".jsonl")
+
     def _parse_raw_file(self, file_path: Path) -> list[Entry]:
         """Parse a raw markdown file into Entry objects.
 
@@ -95,86 +233,293 @@ class StorageRepository:
             ## HH:MM [correction]
             Correction content
 
+        When the index is enabled and fresh for this file, entries are read
+        from the index instead of the file.
+
         Args:
             file_path: Path to the raw markdown file.
 
         Returns:
             List of Entry objects parsed from the file.
         """
-        if not file_path.exists():
-            return []
+        if self._index is None:
+            return [item.entry for item in self._scan_raw_file(file_path)]
 
-        content = file_path.read_text(encoding="utf-8")
-        entries: list[Entry] = []
+        return [item.entry for item in self._read_indexed(self._index, file_path)]
 
+    def _scan_raw_file(self, file_path: Path) -> list[IndexedEntry]:
+        """Read a raw markdown file and join it with the day's parsed data.
+
+        Args:
+            file_path: Path to an existing raw markdown file.
+
+        Returns:
+            Entries in file order with the byte span of their content.
+        """
         # Extract date from filename (YYYY-MM-DD.md)
         entry_date = date.fromisoformat(file_path.stem)
-
-        # Parse sections: ## HH:MM or ## HH:MM [correction]
-        section_pattern = r"^## (\d{2}):(\d{2})(?:\s*\[correction\])?\s*$"
-        sections = re.split(section_pattern, content, flags=re.MULTILINE)
-
-        # sections[0] is any content before the first ##
-        # Then groups of 3: (hour, minute, content)
-        i = 1
-        while i < len(sections) - 2:
-            hour = int(sections[i])
-            minute = int(sections[i + 1])
-            section_content = sections[i + 2].strip()
-
-            if section_content:
-                timestamp = datetime(
-                    entry_date.year,
-                    entry_date.month,
-                    entry_date.day,
-                    hour,
-                    minute,
+        sections = self._read_sections(file_path)
+
+        # Load the day's parsed data once and join it to sections by ID. The
+        # mapping is shared with the read cache, so each entry gets a deep copy.
+        all_parsed = self._load_parsed_file(entry_date) if sections else {}
+
+        entries: list[IndexedEntry] = []
+        for section in sections:
+            parsed = all_parsed.get(section.entry_id)
+            entries.append(
+                IndexedEntry(
+                    entry=Entry(
+                        id=section.entry_id,
+                        date=entry_date,
+                        timestamp=section.timestamp,
+                        raw_content=section.content,
+                        parsed_data=copy.deepcopy(cast(dict[str, Any], parsed)) if isinstance(parsed, dict) else None,
+                    ),
+                    byte_start=section.byte_start,
+                    byte_end=section.byte_end,
                 )
-                entry_id = f"{entry_date.isoformat()}_{hour:02d}-{minute:02d}-00"
+            )
+
+        return entries
 
-                # Load parsed data if available
-                parsed_data = self._load_parsed_data(entry_date, entry_id)
+    def _read_sections(self, file_path: Path) -> list[_Section]:
+        """Split a raw markdown file into sections, using the read cache.
 
-                entries.append(
-                    Entry(
-                        id=entry_id,
-                        date=entry_date,
-                        timestamp=timestamp,
-                        raw_content=section_content,
-                        parsed_data=parsed_data,
-                    )
+        Args:
+            file_path: Path to the raw markdown file.
+
+        Returns:
+            Non-empty sections in file order (empty if the file is missing).
+        """
+        signature = file_signature(file_path)
+        if signature is None:
+            return []
+
+        cached: list[_Section] | None = self._cache.get(file_path, signature)
+        if cached is not None:
+            return cached
+
+        sections = self._split_sections(file_path.read_text(encoding="utf-8"), date.fromisoformat(file_path.stem))
+        self._cache.put(file_path, signature, sections)
+        return sections
+
+    @staticmethod
+    def _split_sections(content: str, entry_date: date) -> list[_Section]:
+        """Split raw markdown content into sections, recording byte offsets.
+
+        Args:
+            content: Full content of a raw markdown file.
+            entry_date: Date the file belongs to.
+
+        Returns:
+            Non-empty sections in file order.
+        """
+        sections: list[_Section] = []
+
+        # Track byte offsets incrementally so multi-byte content stays O(n)
+        char_pos = 0
+        byte_pos = 0
+
+        matches = list(_SECTION_PATTERN.finditer(content))
+        for i, match in enumerate(matches):
+            body_start = match.end()
+            body_end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+            body = content[body_start:body_end]
+            section_content = body.strip()
+
+            if not section_content:
+                continue
+
+            hour = int(match.group(1))
+            minute = int(match.group(2))
+            timestamp = datetime(
+                entry_date.year,
+                entry_date.month,
+                entry_date.day,
+                hour,
+                minute,
+            )
+            entry_id = f"{entry_date.isoformat()}_{hour:02d}-{minute:02d}-00"
+
+            char_start = body_start + len(body) - len(body.lstrip())
+            byte_pos += len(content[char_pos:char_start].encode("utf-8"))
+            char_pos = char_start
+
+            sections.append(
+                _Section(
+                    entry_id=entry_id,
+                    timestamp=timestamp,
+                    content=section_content,
+                    byte_start=byte_pos,
+                    byte_end=byte_pos + len(section_content.encode("utf-8")),
                 )
+            )
 
-            i += 3
+        return sections
 
+    def _relative_raw_path(self, file_path: Path) -> str:
+        """Get the index key of a raw file (its path relative to logs/raw/).
+
+        Args:
+            file_path: Path to the raw markdown file.
+
+        Returns:
+            POSIX-style path relative to logs/raw/.
+        """
+        return file_path.relative_to(self.base_path / "logs" / "raw").as_posix()
+
+    def _file_signature(self, file_path: Path) -> str | None:
+        """Compute the freshness signature of a raw file and its parsed data.
+
+        Args:
+            file_path: Path to the raw markdown file.
+
+        Returns:
+            Signature string built from (mtime_ns, size) of the raw file and
+            of the parsed JSON file, its journals and the parsed JSONL file,
+            or None if the raw file does not exist.
+        """
+        raw_sig = file_signature(file_path)
+        if raw_sig is None:
+            return None
+        entry_date = date.fromisoformat(file_path.stem)
+        journal = ParsedJournal(self._get_parsed_path(entry_date))
+        sigs = [raw_sig, *journal.signature(), file_signature(self._get_parsed_log_path(entry_date))]
+        return "|".join("-" if sig is None else f"{sig[0]}:{sig[1]}" for sig in sigs)
+
+    def _read_indexed(self, index: EntryIndex, file_path: Path) -> list[IndexedEntry]:
+        """Read a raw file through the index, re-indexing it if stale.
+
+        Args:
+            index: The entry index to read from.
+            file_path: Path to the raw markdown file.
+
+        Returns:
+            Entries in file order.
+        """
+        rel_path = self._relative_raw_path(file_path)
+        signature = self._file_signature(file_path)
+        if signature is None:
+            index.remove_file(rel_path)
+            return []
+
+        cached = index.get_file(rel_path, signature)
+        if cached is not None:
+            return cached
+
+        return self._reindex_file(index, file_path)
+
+    def _reindex_file(self, index: EntryIndex, file_path: Path) -> list[IndexedEntry]:
+        """Re-parse a raw file and replace its rows in the index.
+
+        Args:
+            index: The entry index to update.
+            file_path: Path to the raw markdown file.
+
+        Returns:
+            Entries in file order (empty if the file does not exist).
+        """
+        rel_path = self._relative_raw_path(file_path)
+        signature = self._file_signature(file_path)
+        if signature is None:
+            index.remove_file(rel_path)
+            return []
+
+        entries = self._scan_raw_file(file_path)
+        index.put_file(rel_path, date.fromisoformat(file_path.stem), signature, entries)
         return entries
 
-    def _load_parsed_data(self, entry_date: date, entry_id: str) -> dict[str, Any] | None:
-        """Load parsed data for a specific entry from the JSON file.
+    def rebuild_index(self) -> int:
+        """Rebuild the entry index from every raw markdown file.
+
+        Use this to build the index for an existing storage tree or to
+        recover from an index that was deleted or corrupted.
+
+        Returns:
+            Number of entries indexed.
+
+        Raises:
+            RuntimeError: If the repository was created without use_index.
+        """
+        if self._index is None:
+            raise RuntimeError("Entry index is not enabled for this repository")
+
+        self._take_dirty_paths()
+        self._index.clear()
+        total = 0
+        for file_path in sorted((self.base_path / "logs" / "raw").glob("**/*.md")):
+            if file_path.is_file():
+                total += len(self._reindex_file(self._index, file_path))
+        self._index_synced = True
+        return total
+
+    def _load_parsed_file(self, entry_date: date) -> dict[str, Any]:
+        """Load all parsed data for a date, using the read cache.
+
+        The day's JSON file is loaded first and its JSONL records are folded
+        on top, so days written in either format (or migrated between
+        reads) are read consistently. The returned mapping may be shared
+        with the cache and must not be mutated.
 
         Args:
-            entry_date: Date of the entry.
-            entry_id: ID of the entry to load.
+            entry_date: Date whose parsed data to load.
 
         Returns:
-            Parsed data dictionary if available, None otherwise.
+            Mapping of entry ID to parsed data, empty if there is none.
+        """
+        legacy = self._load_parsed_json(entry_date)
+        log_path = self._get_parsed_log_path(entry_date)
+        signature = file_signature(log_path)
+        if signature is None:
+            return legacy
+        if legacy:
+            return apply_records(dict(legacy), ParsedLog(log_path).read_records())
+
+        cached: dict[str, Any] | None = self._cache.get(log_path, signature)
+        if cached is not None:
+            return cached
+        result = ParsedLog(log_path).read()
+        self._cache.put(log_path, signature, result)
+        return result
+
+    def _load_parsed_json(self, entry_date: date) -> dict[str, Any]:
+        """Load all parsed data for a date from its JSON file, using the read cache.
+
+        The returned mapping may be shared with the cache and must not be
+        mutated. While journaled writes are waiting to be folded into the
+        file, the journal is applied on every read and nothing is cached.
+
+        Args:
+            entry_date: Date whose parsed file to load.
+
+        Returns:
+            Mapping of entry ID to parsed data, empty if the file is missing
+            or unreadable.
         """
         parsed_path = self._get_parsed_path(entry_date)
-        if not parsed_path.exists():
-            return None
+        journal = ParsedJournal(parsed_path)
+        if journal.has_records():
+            return journal.read()
+
+        signature = file_signature(parsed_path)
+        if signature is None:
+            return {}
+
+        cached: dict[str, Any] | None = self._cache.get(parsed_path, signature)
+        if cached is not None:
+            return cached
 
         try:
             with parsed_path.open(encoding="utf-8") as f:
-                all_parsed: dict[str, Any] = json.load(f)
-
-            if entry_id in all_parsed:
-                result = all_parsed[entry_id]
-                if isinstance(result, dict):
-                    return cast(dict[str, Any], result)
-            return None
+                all_parsed = json.load(f)
         except (json.JSONDecodeError, OSError) as e:
             logger.error("Failed to load parsed data from %s: %s", parsed_path, e)
-            return None
+            return {}
+
+        result = cast(dict[str, Any], all_parsed) if isinstance(all_parsed, dict) else {}
+        self._cache.put(parsed_path, signature, result)
+        return result
 
     def get_entries_by_date_range(self, start: date, end: date) -> list[Entry]:
         """Get all entries between start and end dates (inclusive).
@@ -187,15 +532,174 @@ class StorageRepository:
             List of Entry objects in the date range, sorted by timestamp.
         """
         entries: list[Entry] = []
-        current = start
-
-        while current <= end:
-            raw_path = self._get_raw_path(current)
+        for raw_path in self._raw_paths_in_range(start, end):
             entries.extend(self._parse_raw_file(raw_path))
-            current += timedelta(days=1)
 
         return sorted(entries, key=lambda e: e.timestamp)
 
+    def list_day_files(self, start: date, end: date) -> list[Path]:
+        """Get the raw day files between start and end dates (inclusive).
+
+        Together with read_day_file this is the per-file form of
+        get_entries_by_date_range, for callers that schedule file reads
+        themselves (see AsyncStorageRepository).
+
+        Args:
+            start: Start date (inclusive).
+            end: End date (inclusive).
+
+        Returns:
+            Paths of existing raw files in date order.
+        """
+        return self._raw_paths_in_range(start, end)
+
+    def read_day_file(self, file_path: Path) -> list[Entry]:
+        """Read the entries of one raw day file with their parsed data.
+
+        Args:
+            file_path: Raw markdown file, as returned by list_day_files.
+
+        Returns:
+            Entries in file order; fresh objects the caller may mutate.
+        """
+        return self._parse_raw_file(file_path)
+
+    def _raw_paths_in_range(self, start: date, end: date) -> list[Path]:
+        """Get the existing raw files between start and end dates (inclusive).
+
+        Lists the raw/{YYYY}/{MM} directories overlapping the range once
+        instead of probing every calendar day, so the cost scales with the
+        number of days actually logged rather than the length of the range.
+
+        Args:
+            start: Start date (inclusive).
+            end: End date (inclusive).
+
+        Returns:
+            Paths of existing raw files in date order.
+        """
+        return list(self._iter_raw_paths(start, end))
+
+    def iter_entries(
+        self,
+        start: date | None = None,
+        end: date | None = None,
+        newest_first: bool = False,
+    ) -> Iterator[Entry]:
+        """Lazily yield entries between start and end dates (inclusive).
+
+        Walks the existing raw/{YYYY}/{MM} directories in date order and
+        reads one day file at a time, so callers that stop iterating early
+        never read the remaining files.
+
+        Args:
+            start: First date to include, or None for the earliest entry.
+            end: Last date to include, or None for the latest entry.
+            newest_first: If True, yield the most recent entries first.
+
+        Yields:
+            Entries in timestamp order (reversed if newest_first).
+        """
+        for raw_path in self._iter_raw_paths(start, end, newest_first):
+            entries = sorted(self._parse_raw_file(raw_path), key=lambda e: e.timestamp)
+            if newest_first:
+                entries.reverse()
+            yield from entries
+
+    def iter_search(
+        self,
+        keywords: list[str],
+        date_range: DateRange | None = None,
+        match_all: bool = False,
+        newest_first: bool = False,
+    ) -> Iterator[Entry]:
+        """Lazily yield entries matching keywords.
+
+        Streaming counterpart of search_entries: entries are read and
+        matched one day file at a time, in date order.
+
+        Args:
+            keywords: List of keywords to search for (case-insensitive).
+                Must contain at least one keyword.
+            date_range: DateRange to restrict the search, or None for all entries.
+            match_all: If True, all keywords must match (AND logic).
+                If False, any keyword match (OR logic).
+            newest_first: If True, yield the most recent matches first.
+
+        Returns:
+            Iterator over matching entries in timestamp order (reversed if
+            newest_first).
+
+        Raises:
+            ValueError: If keywords list is empty.
+        """
+        if not keywords:
+            raise ValueError("keywords list must not be empty")
+
+        keywords_lower = [kw.lower() for kw in keywords]
+        entries = self.iter_entries(
+            date_range.start if date_range else None,
+            date_range.end if date_range else None,
+            newest_first=newest_first,
+        )
+        return (e for e in entries if self._matches_keywords(e, keywords_lower, match_all))
+
+    def _iter_raw_paths(self, start: date | None, end: date | None, newest_first: bool = False) -> Iterator[Path]:
+        """Yield existing raw files in a date range by walking year/month directories.
+
+        Args:
+            start: First date to include, or None for no lower bound.
+            end: Last date to include, or None for no upper bound.
+            newest_first: If True, yield the most recent files first.
+
+        Yields:
+            Paths of raw markdown files in date order.
+        """
+        raw_base = self.base_path / "logs" / "raw"
+        for year, year_dir in self._numeric_subdirs(raw_base, newest_first):
+            if (start and year < start.year) or (end and year > end.year):
+                continue
+            for month, month_dir in self._numeric_subdirs(year_dir, newest_first):
+                if (start and (year, month) < (start.year, start.month)) or (
+                    end and (year, month) > (end.year, end.month)
+                ):
+                    continue
+
+                day_files: list[tuple[date, Path]] = []
+                with os.scandir(month_dir) as it:
+                    for dir_entry in it:
+                        if not dir_entry.name.endswith(".md") or not dir_entry.is_file():
+                            continue
+                        try:
+                            file_date = date.fromisoformat(dir_entry.name[:-3])
+                        except ValueError:
+                            continue
+                        if (start and file_date < start) or (end and file_date > end):
+                            continue
+                        day_files.append((file_date, Path(dir_entry.path)))
+
+                day_files.sort(reverse=newest_first)
+                for _, path in day_files:
+                    yield path
+
+    @staticmethod
+    def _numeric_subdirs(parent: Path, reverse: bool) -> list[tuple[int, Path]]:
+        """List subdirectories with numeric names (years or months), sorted.
+
+        Args:
+            parent: Directory to list.
+            reverse: If True, sort in descending order.
+
+        Returns:
+            (number, path) pairs sorted by number.
+        """
+        try:
+            with os.scandir(parent) as it:
+                dirs = [(int(e.name), Path(e.path)) for e in it if e.name.isdigit() and e.is_dir()]
+        except FileNotFoundError:
+            return []
+        return sorted(dirs, reverse=reverse)
+
     def get_entries_by_pattern(self, pattern: str) -> list[Entry]:
         """Get entries matching a glob pattern.
 
@@ -241,6 +745,9 @@ class StorageRepository:
         if not keywords:
             raise ValueError("keywords list must not be empty")
 
+        if self._index is not None:
+            return self._search_indexed(self._index, keywords, date_range, match_all)
+
         # Get entries to search
         if date_range:
             candidates = self.get_entries_by_date_range(date_range.start, date_range.end)
@@ -251,20 +758,139 @@ class StorageRepository:
         # Normalize keywords for case-insensitive search
         keywords_lower = [kw.lower() for kw in keywords]
 
-        matching: list[Entry] = []
-        for entry in candidates:
-            content_lower = entry.raw_content.lower()
+        return [e for e in candidates if self._matches_keywords(e, keywords_lower, match_all)]
+
+    @staticmethod
+    def _matches_keywords(entry: Entry, keywords_lower: list[str], match_all: bool) -> bool:
+        """Check whether an entry's content contains the keywords.
+
+        Args:
+            entry: Entry to check.
+            keywords_lower: Lowercased keywords.
+            match_all: If True, all keywords must be present (AND logic),
+                otherwise any keyword suffices (OR logic).
+
+        Returns:
+            True if the entry matches.
+        """
+        content_lower = entry.raw_content.lower()
+        if match_all:
+            return all(kw in content_lower for kw in keywords_lower)
+        return any(kw in content_lower for kw in keywords_lower)
+
+    def _search_indexed(
+        self,
+        index: EntryIndex,
+        keywords: list[str],
+        date_range: DateRange | None,
+        match_all: bool,
+    ) -> list[Entry]:
+        """Search entries through the inverted index.
+
+        Applies the writes recorded since the last search (checking every
+        file only on this repository's first search), re-indexes the files
+        of stale candidates, then verifies only the candidates from the
+        matching posting lists against their content.
+
+        Args:
+            index: The entry index to search.
+            keywords: Non-empty list of keywords.
+            date_range: DateRange to filter entries, or None for all entries.
+            match_all: AND logic if True, OR logic otherwise.
+
+        Returns:
+            Matching entries sorted by timestamp.
+        """
+        start = date_range.start if date_range else None
+        end = date_range.end if date_range else None
+        self._sync_index(index)
+
+        keywords_lower = [kw.lower() for kw in keywords]
+        keyword_terms = [sorted(tokenize(kw)) for kw in keywords_lower]
+        candidates = index.search_candidates(keyword_terms, match_all, start, end)
+        if self._refresh_candidate_files(index, candidates, start, end):
+            candidates = index.search_candidates(keyword_terms, match_all, start, end)
+        return [e for e in candidates if self._matches_keywords(e, keywords_lower, match_all)]
+
+    def _sync_index(self, index: EntryIndex) -> None:
+        """Apply recorded writes to the index, checking every file once.
 
-            if match_all:
-                # AND logic: all keywords must be present
-                if all(kw in content_lower for kw in keywords_lower):
-                    matching.append(entry)
-            else:
-                # OR logic: any keyword present
-                if any(kw in content_lower for kw in keywords_lower):
-                    matching.append(entry)
+        Args:
+            index: The entry index to update.
+        """
+        raw_root = self.base_path / "logs" / "raw"
+        for rel_path in self._take_dirty_paths():
+            self._reindex_file(index, raw_root / rel_path)
+        if self._index_synced:
+            return
+
+        known = index.get_signatures()
+        seen: set[str] = set()
+        for file_path in raw_root.glob("**/*.md"):
+            if not file_path.is_file():
+                continue
+            rel_path = self._relative_raw_path(file_path)
+            seen.add(rel_path)
+            if known.get(rel_path) != self._file_signature(file_path):
+                self._reindex_file(index, file_path)
+
+        for rel_path in known.keys() - seen:
+            index.remove_file(rel_path)
+        self._index_synced = True
+
+    def _refresh_candidate_files(
+        self,
+        index: EntryIndex,
+        candidates: list[Entry],
+        start: date | None,
+        end: date | None,
+    ) -> bool:
+        """Re-index the files of candidate entries that changed on disk.
+
+        Args:
+            index: The entry index to update.
+            candidates: Candidate entries returned by the index.
+            start: First date of the search, or None for no lower bound.
+            end: Last date of the search, or None for no upper bound.
 
-        return matching
+        Returns:
+            True if any file was re-indexed or removed.
+        """
+        known = index.get_signatures(start, end)
+        refreshed = False
+        for entry_date in sorted({e.date for e in candidates}):
+            raw_path = self._get_raw_path(entry_date)
+            if known.get(self._relative_raw_path(raw_path)) != self._file_signature(raw_path):
+                self._reindex_file(index, raw_path)
+                refreshed = True
+        return refreshed
+
+    def _mark_index_dirty(self, raw_path: Path) -> None:
+        """Record a raw file written without the index for the next indexed search.
+
+        Args:
+            raw_path: Path to the raw markdown file that changed.
+        """
+        dirty_path = self._index_path.with_suffix(".dirty")
+        with file_lock(dirty_path):
+            append_text(dirty_path, self._relative_raw_path(raw_path) + "\n")
+
+    def _take_dirty_paths(self) -> list[str]:
+        """Read and clear the raw files recorded by _mark_index_dirty.
+
+        Returns:
+            Distinct raw file paths relative to logs/raw/.
+        """
+        dirty_path = self._index_path.with_suffix(".dirty")
+        if not dirty_path.exists():
+            return []
+        with file_lock(dirty_path):
+            try:
+                lines = dirty_path.read_text(encoding="utf-8").splitlines()
+            except FileNotFoundError:
+                return []
+            dirty_path.unlink()
+        return sorted({line for line in lines if line})
 
     def save_entry(self, entry: Entry, correction: ParserOutput | None = None) -> None:
         """Save an entry to storage.
@@ -279,88 +905,231 @@ class StorageRepository:
             entry: The Entry to save.
             correction: Optional ParserOutput for correction flow.
         """
-        raw_path = self._get_raw_path(entry.date)
-        parsed_path = self._get_parsed_path(entry.date)
+        self.save_entries([entry], [correction])
 
-        # Ensure directories exist
+    def save_entries(
+        self,
+        entries: Sequence[Entry],
+        corrections: Sequence[ParserOutput | None] | None = None,
+    ) -> None:
+        """Save many entries with one raw append and one parsed write per day.
+
+        Equivalent to calling save_entry for each entry in order: entries
+        are grouped by date, each day's raw sections and parsed records are
+        written in input order, so later entries and corrections still win
+        over earlier ones.
+
+        Args:
+            entries: Entries to save.
+            corrections: Optional ParserOutput per entry (same length as
+                entries) for the correction flow; None items save normally.
+
+        Raises:
+            ValueError: If corrections and entries differ in length.
+        """
+        if corrections is None:
+            corrections = [None] * len(entries)
+        if len(corrections) != len(entries):
+            raise ValueError("corrections must have one item per entry")
+
+        by_day: dict[date, list[tuple[Entry, ParserOutput | None]]] = {}
+        for entry, correction in zip(entries, corrections, strict=True):
+            by_day.setdefault(entry.date, []).append((entry, correction))
+
+        for entry_date, items in by_day.items():
+            self._save_day(entry_date, items)
+
+    def _save_day(self, entry_date: date, items: list[tuple[Entry, ParserOutput | None]]) -> None:
+        """Append one day's entries to its raw and parsed files.
+
+        Args:
+            entry_date: Date shared by the entries.
+            items: (entry, correction) pairs in save order.
+        """
+        raw_path = self._get_raw_path(entry_date)
         raw_path.parent.mkdir(parents=True, exist_ok=True)
-        parsed_path.parent.mkdir(parents=True, exist_ok=True)
+
+        records: list[dict[str, Any]] = []
+        for entry, correction in items:
+            if correction and correction.is_correction and correction.correction_delta:
+                # Update existing parsed data with correction delta
+                target_id = correction.target_entry_id or entry.id
+                records.append({"op": "update", "id": target_id, "delta": correction.correction_delta})
+            elif entry.parsed_data:
+                records.append({"op": "set", "id": entry.id, "data": entry.parsed_data})
 
         # Handle raw markdown
-        time_str = entry.timestamp.strftime("%H:%M")
+        with file_lock(raw_path):
+            has_content = raw_path.exists() and raw_path.stat().st_size > 0
+            chunks: list[str] = []
+            for entry, correction in items:
+                time_str = entry.timestamp.strftime("%H:%M")
+                if correction and correction.is_correction:
+                    # Correction flow: append correction note
+                    chunks.append(f"\n\n## {time_str} [correction]\n{entry.raw_content}")
+                else:
+                    # New entry: create or append
+                    separator = "\n" if has_content else ""
+                    chunks.append(f"{separator}## {time_str}\n{entry.raw_content}\n")
+                has_content = True
+            append_text(raw_path, "".join(chunks))
+
+        self._cache.invalidate(raw_path)
+
+        # Handle parsed data
+        if records:
+            self._write_parsed_records(entry_date, records)
+
+        if self._index is not None:
+            self._reindex_file(self._index, raw_path)
+        elif self._index_path.exists():
+            self._mark_index_dirty(raw_path)
+
+    def _write_parsed_records(self, entry_date: date, records: list[dict[str, Any]]) -> None:
+        """Write a day's parsed set/update records in one append.
 
-        if correction and correction.is_correction:
-            # Correction flow: append correction note
-            correction_content = f"\n\n## {time_str} [correction]\n{entry.raw_content}"
-            with raw_path.open("a", encoding="utf-8") as f:
-                f.write(correction_content)
-        else:
-            # New entry: create or append
-            entry_content = f"## {time_str}\n{entry.raw_content}\n"
-
-            if raw_path.exists():
-                with raw_path.open("a", encoding="utf-8") as f:
-                    f.write(f"\n{entry_content}")
-            else:
-                raw_path.write_text(entry_content, encoding="utf-8")
-
-        # Handle parsed JSON
-        if correction and correction.is_correction and correction.correction_delta:
-            # Update existing parsed data with correction delta
-            self._update_parsed_json(
-                parsed_path,
-                correction.target_entry_id or entry.id,
-                correction.correction_delta,
-            )
-        elif entry.parsed_data:
-            # Save new parsed data
-            self._save_parsed_json(parsed_path, entry.id, entry.parsed_data)
+        Args:
+            entry_date: Date of the records.
+            records: Records in the order they apply.
+        """
+        log_path = self._get_parsed_log_path(entry_date)
+        # Days that already have JSONL records keep using them in either format
+        if self.parsed_format == "jsonl" or file_signature(log_path) is not None:
+            self._after_log_append(log_path, ParsedLog(log_path).append_records(records))
+            return
 
-    def _save_parsed_json(self, parsed_path: Path, entry_id: str, parsed_data: dict[str, Any]) -> None:
-        """Save parsed data for an entry.
+        parsed_path = self._get_parsed_path(entry_date)
+        ParsedJournal(parsed_path).append_records(records)
+        self._after_journal_append(parsed_path)
+
+    def _after_log_append(self, log_path: Path, size: int) -> None:
+        """Invalidate a JSONL day file and schedule compaction if it grew enough.
+
+        A file is considered again once it is twice the size it had after
+        its last compaction check, which keeps compaction cost amortized
+        O(1) per write.
 
         Args:
-            parsed_path: Path to the parsed JSON file.
-            entry_id: ID of the entry.
-            parsed_data: Data to save.
+            log_path: The JSONL day file that was appended to.
+            size: Size of the file after the append.
         """
-        existing: dict[str, Any] = {}
-        if parsed_path.exists():
-            try:
-                with parsed_path.open(encoding="utf-8") as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                existing = {}
+        self._cache.invalidate(log_path)
+        with self._compact_lock:
+            threshold = max(self._compact_min_bytes, 2 * self._compacted_sizes.get(log_path, 0))
+            if size < threshold or log_path in self._compacting:
+                return
+            self._compacting.add(log_path)
+            self._submit_compaction(self._compact_log, log_path)
 
-        existing[entry_id] = parsed_data
+    def _after_journal_append(self, parsed_path: Path) -> None:
+        """Invalidate a JSON day file and fold its journal in the background.
 
-        with parsed_path.open("w", encoding="utf-8") as f:
-            json.dump(existing, f, indent=2, ensure_ascii=False, default=str)
+        Args:
+            parsed_path: The parsed JSON day file whose journal was appended to.
+        """
+        self._cache.invalidate(parsed_path)
+        with self._compact_lock:
+            if parsed_path in self._compacting:
+                # The running compaction may have checked the journal before this append
+                self._compact_again.add(parsed_path)
+                return
+            self._compacting.add(parsed_path)
+            self._submit_compaction(self._compact_journal, parsed_path)
+
+    def _submit_compaction(self, task: Callable[[Path], None], path: Path) -> None:
+        """Run a compaction on the background compactor; the caller holds _compact_lock.
+
+        Args:
+            task: Compaction to run.
+            path: File to compact.
+        """
+        if self._compactor is None:
+            self._compactor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="quilto-compact")
+        self._compactor.submit(task, path)
 
-    def _update_parsed_json(self, parsed_path: Path, entry_id: str, correction_delta: dict[str, Any]) -> None:
-        """Update parsed data with a correction delta (upsert semantics).
+    def _compact_log(self, log_path: Path) -> None:
+        """Compact a JSONL day file (runs on the background compactor).
 
         Args:
-            parsed_path: Path to the parsed JSON file.
-            entry_id: ID of the entry to update.
-            correction_delta: Fields to update.
+            log_path: The JSONL day file.
         """
-        existing: dict[str, Any] = {}
-        if parsed_path.exists():
+        try:
+            ParsedLog(log_path).compact()
+        except OSError as e:
+            logger.warning("Failed to compact %s: %s", log_path, e)
+        finally:
+            signature = file_signature(log_path)
+            with self._compact_lock:
+                self._compacting.discard(log_path)
+                self._compacted_sizes[log_path] = signature[1] if signature else 0
+
+    def _compact_journal(self, parsed_path: Path) -> None:
+        """Fold a JSON day file's journal (runs on the background compactor).
+
+        Args:
+            parsed_path: The parsed JSON day file.
+        """
+        while True:
             try:
-                with parsed_path.open(encoding="utf-8") as f:
-                    existing = json.load(f)
-            except (json.JSONDecodeError, OSError):
-                existing = {}
+                ParsedJournal(parsed_path).compact()
+            except OSError as e:
+                logger.warning("Failed to compact %s: %s", parsed_path, e)
+            with self._compact_lock:
+                if parsed_path not in self._compact_again:
+                    self._compacting.discard(parsed_path)
+                    return
+                self._compact_again.discard(parsed_path)
+
+    def migrate_parsed_format(self, parsed_format: ParsedFormat) -> int:
+        """Convert every parsed day file to the given format.
+
+        Each day's JSON file (with its journal) and JSONL records are folded
+        and written back in the target format, the other format's files are
+        removed, and the format is recorded so repositories created later
+        without an explicit parsed_format use it. Run this while no other
+        process is writing to the storage tree.
 
-        if entry_id not in existing:
-            existing[entry_id] = {}
+        Args:
+            parsed_format: Target format, "json" or "jsonl".
 
-        # Upsert: update existing with correction delta
-        existing[entry_id].update(correction_delta)
+        Returns:
+            Number of day files converted.
 
-        with parsed_path.open("w", encoding="utf-8") as f:
-            json.dump(existing, f, indent=2, ensure_ascii=False, default=str)
+        Raises:
+            ValueError: If parsed_format is unknown.
+        """
+        if parsed_format not in ("json", "jsonl"):
+            raise ValueError(f"Unknown parsed format: {parsed_format}")
+
+        parsed_root = self.base_path / "logs" / "parsed"
+        days: set[date] = set()
+        for path in parsed_root.glob("*/*/*.json*"):
+            try:
+                days.add(date.fromisoformat(path.name[:10]))
+            except ValueError:
+                continue
+
+        converted = 0
+        for entry_date in sorted(days):
+            json_path = self._get_parsed_path(entry_date)
+            log_path = self._get_parsed_log_path(entry_date)
+            journal = ParsedJournal(json_path)
+            journal.compact(blocking=True)
+            parsed = dict(self._load_parsed_file(entry_date))
+
+            if parsed_format == "jsonl" and json_path.exists():
+                ParsedLog(log_path).write(parsed)
+                json_path.unlink()
+                converted += 1
+            elif parsed_format == "json" and log_path.exists():
+                atomic_write_text(json_path, json.dumps(parsed, indent=2, ensure_ascii=False, default=str))
+                log_path.unlink()
+                converted += 1
+
+        (parsed_root / PARSED_FORMAT_MARKER).write_text(f"{parsed_format}\n", encoding="utf-8")
+        self.parsed_format = parsed_format
+        self._cache.clear()
+        return converted
 
     def get_global_context(self) -> str:
         """Get the global context content.
@@ -0,0 +1,25 @@
+"""Tracing for Quilto agents and LLM requests.
+
+This module provides:
+- Span, one timed operation with attributes (model, tokens, retries, ...)
+- Tracer, which records spans and passes finished ones to exporters
+- get_tracer/set_tracer for the process-wide tracer agents and LLMClient use
+- traced, a decorator recording every call of an async function as a span
+- RingBufferExporter (recent spans in memory) and JsonLinesExporter (file)
+"""
+
+from quilto.tracing.exporters import JsonLinesExporter, RingBufferExporter, SpanExporter
+from quilto.tracing.spans import Span, SpanKind, Tracer, current_span, get_tracer, set_tracer, traced
+
+__all__ = [
+    "JsonLinesExporter",
+    "RingBufferExporter",
+    "Span",
+    "SpanExporter",
+    "SpanKind",
+    "Tracer",
+    "current_span",
+    "get_tracer",
+    "set_tracer",
+    "traced",
+]
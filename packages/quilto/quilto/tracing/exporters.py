@@ -0,0 +1,125 @@
+"""Destinations for finished spans."""
+
+import json
+import threading
+from collections import deque
+from pathlib import Path
+from typing import Protocol
+
+from quilto.tracing.spans import Span
+
+
+class SpanExporter(Protocol):
+    """Receives every span when it finishes.
+
+    export is called synchronously on the thread that finished the span,
+    so implementations must be quick and thread-safe.
+    """
+
+    def export(self, span: Span) -> None:
+        """Handle a finished span.
+
+        Args:
+            span: The finished span.
+        """
+        ...
+
+
+class RingBufferExporter:
+    """Keeps the most recent spans in memory.
+
+    Attributes:
+        capacity: Maximum number of spans kept; older ones are dropped.
+
+    Example:
+        >>> buffer = RingBufferExporter(capacity=1000)
+        >>> set_tracer(Tracer([buffer]))
+        >>> slow = [s for s in buffer.spans() if (s.duration_ms or 0) > 5000]
+    """
+
+    def __init__(self, capacity: int = 1000) -> None:
+        """Initialize an empty buffer.
+
+        Args:
+            capacity: Maximum number of spans kept.
+
+        Raises:
+            ValueError: If capacity is less than 1.
+        """
+        if capacity < 1:
+            raise ValueError("capacity must be >= 1")
+        self.capacity = capacity
+        self._lock = threading.Lock()
+        self._spans: deque[Span] = deque(maxlen=capacity)
+
+    def export(self, span: Span) -> None:
+        """Add a finished span, dropping the oldest when full.
+
+        Args:
+            span: The finished span.
+        """
+        with self._lock:
+            self._spans.append(span)
+
+    def spans(self, trace_id: str | None = None) -> list[Span]:
+        """Get the buffered spans in the order they finished.
+
+        Args:
+            trace_id: If given, only spans of this trace.
+
+        Returns:
+            The spans.
+        """
+        with self._lock:
+            return [span for span in self._spans if trace_id is None or span.trace_id == trace_id]
+
+    def clear(self) -> None:
+        """Drop all buffered spans."""
+        with self._lock:
+            self._spans.clear()
+
+
+class JsonLinesExporter:
+    """Appends each finished span to a file as one JSON object per line.
+
+    Lines are small and written without fsync, so exporting does not
+    noticeably block the event loop.
+
+    Attributes:
+        path: Path of the JSON lines file.
+
+    Example:
+        >>> exporter = JsonLinesExporter(Path("logs/traces.jsonl"))
+        >>> set_tracer(Tracer([exporter]))
+        >>> ...
+        >>> exporter.close()
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Open the file for appending, creating parent directories.
+
+        Args:
+            path: Path of the JSON lines file.
+        """
+        self.path = path
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._file = path.open("a", encoding="utf-8")
+
+    def export(self, span: Span) -> None:
+        """Append a finished span.
+
+        Args:
+            span: The finished span.
+        """
+        line = json.dumps(span.to_dict(), ensure_ascii=False, default=str)
+        with self._lock:
+            if self._file.closed:
+                return
+            self._file.write(line + "\n")
+            self._file.flush()
+
+    def close(self) -> None:
+        """Close the file; later spans are dropped."""
+        with self._lock:
+            self._file.close()
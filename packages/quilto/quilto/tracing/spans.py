@@ -0,0 +1,243 @@
+"""Spans and the tracer that records them.
+
+A span covers one timed operation: an agent call, an LLMClient request or
+a cascade. Spans opened while another one is current become its children
+and share its trace ID, so one query's agent calls and LLM requests can be
+put back together. The current span lives in a context variable, which
+asyncio copies into tasks, so spans nest across awaits and gathers.
+"""
+
+import functools
+import logging
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Generator, Sequence
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal, ParamSpec, TypeVar
+
+if TYPE_CHECKING:
+    from quilto.tracing.exporters import SpanExporter
+
+logger = logging.getLogger(__name__)
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+SpanKind = Literal["agent", "llm", "internal"]
+
+_current_span: ContextVar["Span | None"] = ContextVar("quilto_current_span", default=None)
+
+
+@dataclass
+class Span:
+    """One timed operation.
+
+    Attributes:
+        name: Operation name, e.g. "PlannerAgent.plan".
+        kind: What the span covers: an agent call, an LLM request, or other work.
+        trace_id: ID shared by all spans of one top-level operation.
+        span_id: ID of this span.
+        parent_id: span_id of the enclosing span, or None for a root span.
+        start_time: Wall-clock start as a Unix timestamp.
+        attributes: Details such as model, tokens, retries or cache hits.
+        duration_ms: Duration in milliseconds, None while the span is open.
+        status: "error" if the operation raised.
+        error: Exception type and message when status is "error".
+    """
+
+    name: str
+    kind: SpanKind
+    trace_id: str
+    span_id: str
+    parent_id: str | None
+    start_time: float
+    attributes: dict[str, Any] = field(default_factory=dict[str, Any])
+    duration_ms: float | None = None
+    status: Literal["ok", "error"] = "ok"
+    error: str | None = None
+    _started: float = field(default_factory=time.perf_counter, repr=False, compare=False)
+
+    def set(self, key: str, value: Any) -> None:
+        """Set an attribute.
+
+        Args:
+            key: Attribute name.
+            value: JSON-serializable value.
+        """
+        self.attributes[key] = value
+
+    def add(self, key: str, amount: int | float = 1) -> None:
+        """Add to a numeric attribute, starting from 0.
+
+        Args:
+            key: Attribute name.
+            amount: Amount to add.
+        """
+        self.attributes[key] = self.attributes.get(key, 0) + amount
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to a JSON-serializable dict.
+
+        Returns:
+            The public fields of the span.
+        """
+        return {
+            "name": self.name,
+            "kind": self.kind,
+            "trace_id": self.trace_id,
+            "span_id": self.span_id,
+            "parent_id": self.parent_id,
+            "start_time": self.start_time,
+            "duration_ms": self.duration_ms,
+            "status": self.status,
+            "error": self.error,
+            "attributes": self.attributes,
+        }
+
+
+def current_span() -> Span | None:
+    """Get the span the caller is running in.
+
+    Returns:
+        The innermost open span of the current context, or None.
+    """
+    return _current_span.get()
+
+
+class Tracer:
+    """Creates spans and hands finished ones to exporters.
+
+    Without exporters spans are still created (so code can annotate them
+    unconditionally) but go nowhere.
+
+    Attributes:
+        exporters: Exporters every finished span is passed to.
+
+    Example:
+        >>> buffer = RingBufferExporter(capacity=500)
+        >>> set_tracer(Tracer([buffer]))
+        >>> with get_tracer().span("import", "internal", files=3) as span:
+        ...     span.add("entries", 120)
+    """
+
+    def __init__(self, exporters: Sequence["SpanExporter"] = ()) -> None:
+        """Initialize the tracer.
+
+        Args:
+            exporters: Exporters every finished span is passed to.
+        """
+        self.exporters = list(exporters)
+
+    def start_span(self, name: str, kind: SpanKind = "internal", **attributes: Any) -> Span:
+        """Open a span without making it current.
+
+        Use for work that outlives a single block, such as a stream that is
+        consumed by the caller; finish it with end_span.
+
+        Args:
+            name: Operation name.
+            kind: What the span covers.
+            **attributes: Initial attributes.
+
+        Returns:
+            The open span, a child of the current span if there is one.
+        """
+        parent = _current_span.get()
+        return Span(
+            name=name,
+            kind=kind,
+            trace_id=parent.trace_id if parent is not None else uuid.uuid4().hex,
+            span_id=uuid.uuid4().hex[:16],
+            parent_id=parent.span_id if parent is not None else None,
+            start_time=time.time(),
+            attributes=attributes,
+        )
+
+    def end_span(self, span: Span, error: BaseException | None = None) -> None:
+        """Finish a span and export it.
+
+        Exporter failures are logged and never propagate to the traced code.
+
+        Args:
+            span: Span returned by start_span.
+            error: Exception the operation raised, if any.
+        """
+        span.duration_ms = (time.perf_counter() - span._started) * 1000  # pyright: ignore[reportPrivateUsage]
+        if error is not None:
+            span.status = "error"
+            span.error = f"{type(error).__name__}: {error}"
+        for exporter in self.exporters:
+            try:
+                exporter.export(span)
+            except Exception:
+                logger.exception("Span exporter %s failed", type(exporter).__name__)
+
+    @contextmanager
+    def span(self, name: str, kind: SpanKind = "internal", **attributes: Any) -> Generator[Span]:
+        """Open a span that is current for the duration of the block.
+
+        Args:
+            name: Operation name.
+            kind: What the span covers.
+            **attributes: Initial attributes.
+
+        Yields:
+            The open span, to add attributes to.
+        """
+        span = self.start_span(name, kind, **attributes)
+        token = _current_span.set(span)
+        try:
+            yield span
+        except BaseException as e:
+            self.end_span(span, e)
+            raise
+        else:
+            self.end_span(span)
+        finally:
+            _current_span.reset(token)
+
+
+_tracer = Tracer()
+
+
+def get_tracer() -> Tracer:
+    """Get the process-wide tracer used by agents and LLMClient.
+
+    Returns:
+        The tracer set with set_tracer, or one without exporters.
+    """
+    return _tracer
+
+
+def set_tracer(tracer: Tracer) -> None:
+    """Replace the process-wide tracer.
+
+    Args:
+        tracer: Tracer to use from now on.
+    """
+    global _tracer
+    _tracer = tracer
+
+
+def traced(name: str, kind: SpanKind = "agent") -> Callable[[Callable[P, Awaitable[R]]], Callable[P, Awaitable[R]]]:
+    """Decorate an async function so every call is recorded as a span.
+
+    Args:
+        name: Span name, e.g. "RouterAgent.classify".
+        kind: What the span covers.
+
+    Returns:
+        The decorator.
+    """
+
+    def decorator(func: Callable[P, Awaitable[R]]) -> Callable[P, Awaitable[R]]:
+        @functools.wraps(func)
+        async def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            with get_tracer().span(name, kind):
+                return await func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
@@ -662,6 +662,7 @@ class TestStorageRepositoryCorrectionIntegration:
             correction_delta={"weight_kg": 84.0},  # Only update weight
         )
         storage.save_entry(correction_entry, correction=correction)
+        storage.close()
 
         # Verify parsed JSON has upsert semantics
         parsed_path = tmp_path / "logs" / "parsed" / "2026" / "01" / "2026-01-14.json"
@@ -1,14 +1,24 @@
 """Unit tests for LLM error cascade functionality."""
 
+import asyncio
 import json
+import math
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import litellm.exceptions
 import pytest
 from pydantic import BaseModel, ValidationError
-from quilto.llm import LLMClient, PartialResult, load_llm_config_from_dict
-from quilto.llm.config import LLMConfig, ProviderConfig
+from quilto.llm import (
+    CircuitBreaker,
+    CircuitBreakerStats,
+    HedgeStats,
+    LatencyTracker,
+    LLMClient,
+    PartialResult,
+    load_llm_config_from_dict,
+)
+from quilto.llm.config import AgentConfig, LLMConfig, ProviderConfig
 from quilto.llm.errors import ErrorType, classify_error
 
 
@@ -727,3 +737,369 @@ class TestCompleteWithFallbackBackwardCompatibility:
 
         assert result == "Fallback success!"
         assert call_count == 2
+
+
+def timeout_error() -> litellm.exceptions.Timeout:
+    """Create a transient provider error."""
+    return litellm.exceptions.Timeout(message="timeout", model="test", llm_provider="ollama")
+
+
+class TestCircuitBreaker:
+    """Tests for the per-provider circuit breaker."""
+
+    def test_opens_after_threshold_and_recovers(self) -> None:
+        """The breaker opens, turns half-open after the timeout, and closes on success."""
+        breaker = CircuitBreaker(failure_threshold=2, recovery_timeout=10.0)
+
+        with patch("quilto.llm.breaker.monotonic", return_value=100.0):
+            breaker.record_failure()
+            assert breaker.state == "closed"
+            breaker.record_failure()
+            assert breaker.state == "open"
+            assert breaker.allow_request() is False
+
+        with patch("quilto.llm.breaker.monotonic", return_value=110.0):
+            assert breaker.state == "half_open"
+            assert breaker.allow_request() is True
+            assert breaker.allow_request() is False  # only one trial at a time
+            breaker.record_success()
+            assert breaker.state == "closed"
+
+        assert breaker.stats() == CircuitBreakerStats(
+            state="closed", consecutive_failures=0, times_opened=1, rejected=2
+        )
+
+    def test_failed_trial_reopens(self) -> None:
+        """A failed half-open trial re-opens the breaker for another timeout."""
+        breaker = CircuitBreaker(failure_threshold=1, recovery_timeout=10.0)
+
+        with patch("quilto.llm.breaker.monotonic", return_value=100.0):
+            breaker.record_failure()
+        with patch("quilto.llm.breaker.monotonic", return_value=110.0):
+            assert breaker.allow_request() is True
+            breaker.record_failure()
+            assert breaker.state == "open"
+        with patch("quilto.llm.breaker.monotonic", return_value=120.0):
+            assert breaker.allow_request() is True
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_goes_straight_to_fallback(self) -> None:
+        """Once the primary's breaker is open, the cascade skips it."""
+        config = create_test_config(max_retries=3, fallback_provider="anthropic")
+        config.circuit_breaker.failure_threshold = 2
+        client = LLMClient(config)
+        primary_calls = 0
+
+        async def mock_complete(*args: Any, force_cloud: bool = False, **kwargs: Any) -> str:
+            nonlocal primary_calls
+            if not force_cloud:
+                primary_calls += 1
+                raise timeout_error()
+            return "Fallback success!"
+
+        with (
+            patch.object(client, "complete", side_effect=mock_complete),
+            patch("quilto.llm.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            first = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+            second = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert first == second == "Fallback success!"
+        # Retries stop once the breaker opens, and the second request skips ollama
+        assert primary_calls == 2
+        stats = client.circuit_breaker_stats()
+        assert stats["ollama"].state == "open"
+        assert stats["ollama"].rejected == 1
+        assert stats["anthropic"].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_skips_primary_for_structured(self) -> None:
+        """complete_structured_with_cascade also skips an open primary."""
+
+        class ExpectedSchema(BaseModel):
+            field: str
+
+        config = create_test_config(fallback_provider="anthropic")
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+        client._get_breaker("ollama").record_failure()  # pyright: ignore[reportPrivateUsage, reportOptionalMemberAccess]
+
+        with patch.object(client, "complete_structured", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = ExpectedSchema(field="value")
+            result = await client.complete_structured_with_cascade(
+                "router", [{"role": "user", "content": "test"}], response_model=ExpectedSchema
+            )
+
+        assert result == ExpectedSchema(field="value")
+        assert mock_complete.call_count == 1
+        assert mock_complete.call_args.kwargs["force_cloud"] is True
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_without_fallback_still_tries_primary(self) -> None:
+        """With nowhere to fall back to, the primary is still tried."""
+        config = create_test_config(max_retries=1)
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+        client._get_breaker("ollama").record_failure()  # pyright: ignore[reportPrivateUsage, reportOptionalMemberAccess]
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = "Recovered"
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert result == "Recovered"
+        assert client.circuit_breaker_stats()["ollama"].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_permanent_errors_do_not_trip_breaker(self) -> None:
+        """Permanent errors show the provider is reachable and reset the count."""
+        config = create_test_config(max_retries=3, fallback_provider="anthropic")
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.side_effect = ValueError("schema validation failed")
+            await client._retry_with_backoff(  # pyright: ignore[reportPrivateUsage]
+                "router", [{"role": "user", "content": "test"}], stop_when_open=True
+            )
+
+        assert client.circuit_breaker_stats()["ollama"].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_disabled_breaker(self) -> None:
+        """With breakers disabled the cascade keeps retrying the primary."""
+        config = create_test_config(max_retries=3, fallback_provider="anthropic", enable_graceful_degradation=True)
+        config.circuit_breaker.enabled = False
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+
+        with (
+            patch.object(client, "complete", new_callable=AsyncMock) as mock_complete,
+            patch("quilto.llm.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_complete.side_effect = timeout_error()
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert isinstance(result, PartialResult)
+        assert result.retry_count == 6
+        assert client.circuit_breaker_stats() == {}
+
+
+def create_hedging_client(initial_delay: float = 0.01, **hedging: Any) -> LLMClient:
+    """Create a client with a fallback provider and hedging enabled."""
+    config = create_test_config(max_retries=1, fallback_provider="anthropic")
+    config.hedging = config.hedging.model_copy(update={"enabled": True, "initial_delay": initial_delay, **hedging})
+    return LLMClient(config)
+
+
+class TestLatencyTracker:
+    """Tests for the latency window hedge delays are derived from."""
+
+    def test_percentile(self) -> None:
+        """Percentiles use the nearest rank over the window."""
+        tracker = LatencyTracker(window=100)
+        assert tracker.percentile(95) is None
+        for latency in range(1, 101):
+            tracker.record(float(latency))
+        assert tracker.percentile(50) == 50.0
+        assert tracker.percentile(95) == 95.0
+        assert tracker.percentile(100) == 100.0
+
+    def test_window_keeps_recent_latencies(self) -> None:
+        """Only the most recent latencies are kept."""
+        tracker = LatencyTracker(window=2)
+        for latency in (10.0, 1.0, 2.0):
+            tracker.record(latency)
+        assert len(tracker) == 2
+        assert tracker.percentile(100) == 2.0
+
+
+class TestHedging:
+    """Tests for hedging slow primary requests on the fallback provider."""
+
+    @pytest.mark.asyncio
+    async def test_slow_primary_is_hedged_and_cancelled(self) -> None:
+        """The fallback answer wins and the hung primary is cancelled."""
+        client = create_hedging_client()
+        primary_cancelled = False
+
+        async def mock_complete(*args: Any, force_cloud: bool = False, **kwargs: Any) -> str:
+            nonlocal primary_cancelled
+            if force_cloud:
+                return "Fallback"
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                primary_cancelled = True
+                raise
+            return "Primary"
+
+        with patch.object(client, "complete", side_effect=mock_complete):
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+            await asyncio.sleep(0)
+
+        assert result == "Fallback"
+        assert primary_cancelled
+        assert client.hedge_stats() == HedgeStats(
+            requests=1, hedged=1, hedge_wins=1, agent_hedged={"router": 1}, agent_hedge_wins={"router": 1}
+        )
+
+    @pytest.mark.asyncio
+    async def test_fast_primary_is_not_hedged(self) -> None:
+        """A primary answering within the delay never starts the fallback."""
+        client = create_hedging_client(initial_delay=5.0)
+
+        with patch.object(client, "complete", new_callable=AsyncMock) as mock_complete:
+            mock_complete.return_value = "Primary"
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert result == "Primary"
+        assert mock_complete.call_count == 1
+        stats = client.hedge_stats()
+        assert (stats.requests, stats.hedged, stats.win_ratio) == (1, 0, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_primary_can_still_win_after_hedging(self) -> None:
+        """If the primary answers before the hedge, the fallback is cancelled."""
+        client = create_hedging_client()
+        fallback_cancelled = False
+
+        async def mock_complete(*args: Any, force_cloud: bool = False, **kwargs: Any) -> str:
+            nonlocal fallback_cancelled
+            if not force_cloud:
+                await asyncio.sleep(0.05)
+                return "Primary"
+            try:
+                await asyncio.Event().wait()
+            except asyncio.CancelledError:
+                fallback_cancelled = True
+                raise
+            return "Fallback"
+
+        with patch.object(client, "complete", side_effect=mock_complete):
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+            await asyncio.sleep(0)
+
+        assert result == "Primary"
+        assert fallback_cancelled
+        assert client.hedge_stats().hedged == 1
+        assert client.hedge_stats().hedge_wins == 0
+
+    @pytest.mark.asyncio
+    async def test_hedged_failures_do_not_retry_fallback(self) -> None:
+        """When both hedged cycles fail, the fallback is not run a second time."""
+        client = create_hedging_client()
+
+        async def mock_complete(*args: Any, force_cloud: bool = False, **kwargs: Any) -> str:
+            if not force_cloud:
+                await asyncio.sleep(0.05)
+            raise RuntimeError("failure")
+
+        with patch.object(client, "complete", side_effect=mock_complete) as mock:
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert isinstance(result, PartialResult)
+        assert result.providers_attempted == ["ollama", "anthropic"]
+        assert result.retry_count == 2
+        assert mock.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_agent_can_opt_out(self) -> None:
+        """Agents with hedge disabled wait for the primary."""
+        client = create_hedging_client()
+        client.config.agents = {**client.config.agents, "router": AgentConfig(tier="low", hedge=False)}
+
+        async def mock_complete(*args: Any, force_cloud: bool = False, **kwargs: Any) -> str:
+            await asyncio.sleep(0.05)
+            return "Fallback" if force_cloud else "Primary"
+
+        with patch.object(client, "complete", side_effect=mock_complete) as mock:
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert result == "Primary"
+        assert mock.call_count == 1
+        assert client.hedge_stats().requests == 0
+
+    @pytest.mark.asyncio
+    async def test_structured_cascade_is_hedged(self) -> None:
+        """complete_structured_with_cascade hedges a slow primary too."""
+
+        class ExpectedSchema(BaseModel):
+            field: str
+
+        client = create_hedging_client()
+
+        async def mock_complete_structured(*args: Any, force_cloud: bool = False, **kwargs: Any) -> BaseModel:
+            if not force_cloud:
+                await asyncio.Event().wait()
+            return ExpectedSchema(field="fallback")
+
+        with patch.object(client, "complete_structured", side_effect=mock_complete_structured):
+            result = await client.complete_structured_with_cascade(
+                "router", [{"role": "user", "content": "test"}], response_model=ExpectedSchema
+            )
+
+        assert result == ExpectedSchema(field="fallback")
+        assert client.hedge_stats().hedge_wins == 1
+
+    def test_delay_follows_primary_latency_percentile(self) -> None:
+        """The hedge delay switches from initial_delay to the percentile."""
+        client = create_hedging_client(initial_delay=3.0, min_samples=10, percentile=90.0)
+        assert client._hedge_delay("ollama") == 3.0  # pyright: ignore[reportPrivateUsage]
+
+        tracker = client._latencies.setdefault("ollama", LatencyTracker())  # pyright: ignore[reportPrivateUsage]
+        for latency in range(1, 11):
+            tracker.record(latency / 10)
+
+        assert math.isclose(client._hedge_delay("ollama"), 0.9)  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_delay_stable_under_slow_primaries(self) -> None:
+        """Out-hedged primaries count towards the delay, so it does not collapse.
+
+        Every other primary request hangs and loses to the fallback. If only
+        the fast requests that completed were recorded, the delay would drop
+        to their latency and every request would be hedged.
+        """
+        client = create_hedging_client(initial_delay=0.05, min_samples=2, percentile=90.0)
+        requests = 0
+
+        async def mock_acompletion(**kwargs: Any) -> MagicMock:
+            nonlocal requests
+            if str(kwargs["model"]).startswith("ollama"):
+                requests += 1
+                await asyncio.sleep(0.001 if requests % 2 else 10.0)
+            else:
+                await asyncio.sleep(0.02)
+            response = MagicMock()
+            response.choices = [MagicMock(message=MagicMock(content=kwargs["model"]))]
+            return response
+
+        with patch("quilto.llm.client.litellm.acompletion", side_effect=mock_acompletion):
+            for _ in range(10):
+                await client.complete_with_cascade("router", [{"role": "user", "content": "test"}])
+
+        assert client.hedge_stats().hedged == 5
+        assert client._hedge_delay("ollama") >= 0.05  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_trial_is_released(self) -> None:
+        """A half-open trial abandoned by cancellation does not wedge the breaker."""
+        client = create_hedging_client()
+        client.config.circuit_breaker.failure_threshold = 1
+        breaker = client._get_breaker("ollama")  # pyright: ignore[reportPrivateUsage]
+        assert breaker is not None
+        with patch("quilto.llm.breaker.monotonic", return_value=0.0):
+            breaker.record_failure()
+
+        async def mock_complete(*args: Any, force_cloud: bool = False, **kwargs: Any) -> str:
+            if not force_cloud:
+                await asyncio.Event().wait()
+            return "Fallback"
+
+        with (
+            patch("quilto.llm.breaker.monotonic", return_value=100.0),
+            patch.object(client, "complete", side_effect=mock_complete),
+        ):
+            assert await client.complete_with_cascade("router", [{"role": "user", "content": "test"}]) == "Fallback"
+            await asyncio.sleep(0)
+            assert breaker.allow_request() is True
@@ -1,16 +1,25 @@
 """Unit tests for LLMClient."""
 
+import asyncio
+import math
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+import litellm
 import pytest
-from pydantic import BaseModel
+from pydantic import BaseModel, ValidationError
+from quilto.llm.cache import ResponseCache, make_cache_key
 from quilto.llm.client import LLMClient
 from quilto.llm.config import (
     AgentConfig,
     LLMConfig,
     ProviderConfig,
+    ResponseCacheConfig,
     TierModels,
 )
+from quilto.llm.limits import TokenBucket
 
 
 class SampleResponse(BaseModel):
@@ -513,3 +522,760 @@ class TestCompleteWithFallback:
                     "router",
                     [{"role": "user", "content": "Hi"}],
                 )
+
+
+def mock_completion(content: str) -> MagicMock:
+    """Build a litellm completion response with the given content."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    return response
+
+
+def create_cached_client(tmp_path: Path, **cache: Any) -> LLMClient:
+    """Create a client with the response cache enabled on disk."""
+    config = create_test_config(default_provider="anthropic")
+    config.cache = ResponseCacheConfig(enabled=True, path=tmp_path / "llm-cache.sqlite", **cache)
+    return LLMClient(config)
+
+
+class TestResponseCache:
+    """Test ResponseCache tiers and expiry."""
+
+    @pytest.mark.asyncio
+    async def test_memory_and_disk_tiers(self, tmp_path: Path) -> None:
+        """Responses survive a new cache instance through the SQLite tier."""
+        first = ResponseCache(tmp_path / "cache.sqlite")
+        await first.put("key", "value")
+        assert await first.get("key", agent="router") == "value"
+        first.close()
+
+        second = ResponseCache(tmp_path / "cache.sqlite")
+        assert await second.get("key", agent="router") == "value"
+        assert await second.get("key", agent="router") == "value"
+        assert await second.get("other", agent="parser") is None
+
+        stats = second.stats()
+        assert (stats.hits, stats.disk_hits, stats.misses) == (2, 1, 1)
+        assert stats.agent_hits == {"router": 2}
+        assert stats.agent_misses == {"parser": 1}
+        second.close()
+
+    @pytest.mark.asyncio
+    async def test_expired_entries_miss(self, tmp_path: Path) -> None:
+        """Entries past their TTL are not returned from either tier."""
+        cache = ResponseCache(tmp_path / "cache.sqlite")
+        with patch("quilto.llm.cache.time.time", return_value=1000.0):
+            await cache.put("key", "value", ttl=10)
+        with patch("quilto.llm.cache.time.time", return_value=1011.0):
+            assert await cache.get("key") is None
+        assert cache.stats().entries == 0
+        cache.close()
+
+    @pytest.mark.asyncio
+    async def test_memory_tier_is_lru_bounded(self) -> None:
+        """The memory tier evicts the least recently used response."""
+        cache = ResponseCache(max_entries=2)
+        await cache.put("a", "1")
+        await cache.put("b", "2")
+        assert await cache.get("a") == "1"
+        await cache.put("c", "3")
+
+        assert await cache.get("b") is None
+        assert await cache.get("a") == "1"
+        assert await cache.get("c") == "3"
+
+    def test_key_ignores_credentials(self) -> None:
+        """Keys depend on the request, not on credentials or timeouts."""
+        request = {"model": "m", "messages": [{"role": "user", "content": "hi"}]}
+        assert make_cache_key({**request, "api_key": "a", "timeout": 5}) == make_cache_key(request)
+        assert make_cache_key({**request, "response_format": {"type": "json_object"}}) != make_cache_key(request)
+        assert make_cache_key({**request, "model": "other"}) != make_cache_key(request)
+
+
+class TestClientResponseCache:
+    """Test LLMClient integration with the response cache."""
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self) -> None:
+        """Without cache config every call reaches the provider."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hello!")
+            await client.complete("router", messages)
+            await client.complete("router", messages)
+
+        assert mock_acompletion.call_count == 2
+        assert client.cache_stats() is None
+
+    @pytest.mark.asyncio
+    async def test_identical_requests_hit_cache(self, tmp_path: Path) -> None:
+        """A repeated request is answered from the cache."""
+        client = create_cached_client(tmp_path)
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hello!")
+            assert await client.complete("router", messages) == "Hello!"
+            assert await client.complete("router", messages) == "Hello!"
+            await client.complete("router", [{"role": "user", "content": "Bye"}])
+
+        assert mock_acompletion.call_count == 2
+        stats = client.cache_stats()
+        assert stats is not None
+        assert (stats.hits, stats.misses) == (1, 2)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_persists_across_clients(self, tmp_path: Path) -> None:
+        """A new client reuses responses stored on disk by an earlier one."""
+        messages = [{"role": "user", "content": "Hi"}]
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hello!")
+            first = create_cached_client(tmp_path)
+            await first.complete("router", messages)
+            await first.aclose()
+
+            second = create_cached_client(tmp_path)
+            assert await second.complete("router", messages) == "Hello!"
+            await second.aclose()
+
+        assert mock_acompletion.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_agent_opt_out(self, tmp_path: Path) -> None:
+        """Agents with cache disabled always reach the provider."""
+        client = create_cached_client(tmp_path)
+        client.config.agents["parser"] = AgentConfig(tier="medium", cache=False)
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hello!")
+            await client.complete("parser", messages)
+            await client.complete("parser", messages)
+
+        assert mock_acompletion.call_count == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_agent_ttl_overrides_default(self, tmp_path: Path) -> None:
+        """Per-agent cache_ttl is used instead of the cache default."""
+        client = create_cached_client(tmp_path, ttl=3600)
+        client.config.agents["router"] = AgentConfig(tier="low", cache_ttl=5)
+        assert client.cache is not None
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion,
+            patch.object(client.cache, "put", wraps=client.cache.put) as mock_put,
+        ):
+            mock_acompletion.return_value = mock_completion("Hello!")
+            await client.complete("router", [{"role": "user", "content": "Hi"}])
+            await client.complete("parser", [{"role": "user", "content": "Hi"}])
+
+        assert [c.kwargs["ttl"] for c in mock_put.call_args_list] == [5, 3600]
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_structured_caches_only_valid_responses(self, tmp_path: Path) -> None:
+        """Responses failing schema validation are not cached."""
+        client = create_cached_client(tmp_path)
+        messages = [{"role": "user", "content": "Rate this"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = [
+                mock_completion("not json"),
+                mock_completion('{"message": "ok", "score": 3}'),
+            ]
+            with pytest.raises(ValueError, match="schema validation"):
+                await client.complete_structured("router", messages, SampleResponse)
+            first = await client.complete_structured("router", messages, SampleResponse)
+            second = await client.complete_structured("router", messages, SampleResponse)
+
+        assert first == second == SampleResponse(message="ok", score=3)
+        assert mock_acompletion.call_count == 2
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_structured_and_plain_keys_differ(self, tmp_path: Path) -> None:
+        """The JSON response format is part of the cache key."""
+        client = create_cached_client(tmp_path)
+        messages = [{"role": "user", "content": "Rate this"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion('{"message": "ok", "score": 3}')
+            await client.complete("router", messages)
+            await client.complete_structured("router", messages, SampleResponse)
+
+        assert mock_acompletion.call_count == 2
+        await client.aclose()
+
+
+class FakeProvider:
+    """Local stand-in for litellm.acompletion that blocks until released."""
+
+    def __init__(self, content: str = "Hello!") -> None:
+        """Initialize the provider with the content it answers."""
+        self.content = content
+        self.calls = 0
+        self.cancelled = 0
+        self.release = asyncio.Event()
+        self.error: Exception | None = None
+
+    async def acompletion(self, **kwargs: Any) -> MagicMock:
+        """Count the call and answer once released."""
+        self.calls += 1
+        try:
+            await self.release.wait()
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.error is not None:
+            raise self.error
+        return mock_completion(self.content)
+
+
+class TestSingleFlight:
+    """Test coalescing of identical in-flight requests."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_identical_calls_share_one_upstream_call(self) -> None:
+        """N identical concurrent calls produce one provider call."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        provider = FakeProvider()
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            calls = [asyncio.create_task(client.complete("router", messages)) for _ in range(10)]
+            await asyncio.sleep(0)
+            provider.release.set()
+            results = await asyncio.gather(*calls)
+
+        assert results == ["Hello!"] * 10
+        assert provider.calls == 1
+        assert client.coalesced_requests == 9
+
+    @pytest.mark.asyncio
+    async def test_different_requests_are_not_coalesced(self) -> None:
+        """Requests that differ in messages or format each reach the provider."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        provider = FakeProvider('{"message": "ok", "score": 1}')
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            calls: list[asyncio.Task[Any]] = [
+                asyncio.create_task(client.complete("router", [{"role": "user", "content": "a"}])),
+                asyncio.create_task(client.complete("router", [{"role": "user", "content": "b"}])),
+                asyncio.create_task(
+                    client.complete_structured("router", [{"role": "user", "content": "a"}], SampleResponse)
+                ),
+            ]
+            await asyncio.sleep(0)
+            provider.release.set()
+            await asyncio.gather(*calls)
+
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_others(self) -> None:
+        """Cancelling one waiter leaves the shared call running for the rest."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        provider = FakeProvider()
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            first = asyncio.create_task(client.complete("router", messages))
+            second = asyncio.create_task(client.complete("router", messages))
+            await asyncio.sleep(0)
+            first.cancel()
+            await asyncio.sleep(0)
+            provider.release.set()
+
+            assert await second == "Hello!"
+            with pytest.raises(asyncio.CancelledError):
+                await first
+
+        assert provider.calls == 1
+        assert provider.cancelled == 0
+
+    @pytest.mark.asyncio
+    async def test_call_cancelled_when_all_waiters_leave(self) -> None:
+        """The upstream call is cancelled once nobody waits for it."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        provider = FakeProvider()
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            waiters = [asyncio.create_task(client.complete("router", messages)) for _ in range(3)]
+            await asyncio.sleep(0)
+            for waiter in waiters:
+                waiter.cancel()
+            await asyncio.gather(*waiters, return_exceptions=True)
+            await asyncio.sleep(0)
+
+            # A later identical request starts a fresh call
+            provider.release.set()
+            assert await client.complete("router", messages) == "Hello!"
+
+        assert provider.cancelled == 1
+
+    @pytest.mark.asyncio
+    async def test_request_does_not_join_call_being_cancelled(self) -> None:
+        """An identical request right after the last waiter left starts a fresh call."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        provider = FakeProvider()
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            waiter = asyncio.create_task(client.complete("router", messages))
+            await asyncio.sleep(0)
+            waiter.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await waiter
+
+            provider.release.set()
+            assert await client.complete("router", messages) == "Hello!"
+
+        assert provider.calls == 2
+        assert provider.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_errors_reach_every_waiter(self) -> None:
+        """A failed shared call raises in every waiter."""
+        client = LLMClient(create_test_config(default_provider="anthropic"))
+        provider = FakeProvider()
+        provider.error = ConnectionError("provider down")
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            calls = [asyncio.create_task(client.complete("router", messages)) for _ in range(3)]
+            await asyncio.sleep(0)
+            provider.release.set()
+            results = await asyncio.gather(*calls, return_exceptions=True)
+
+        assert all(isinstance(r, ConnectionError) for r in results)
+        assert provider.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_coalescing_can_be_disabled(self) -> None:
+        """With coalesce_requests off every call reaches the provider."""
+        config = create_test_config(default_provider="anthropic")
+        config.coalesce_requests = False
+        client = LLMClient(config)
+        provider = FakeProvider()
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            calls = [asyncio.create_task(client.complete("router", messages)) for _ in range(3)]
+            await asyncio.sleep(0)
+            provider.release.set()
+            await asyncio.gather(*calls)
+
+        assert provider.calls == 3
+
+    @pytest.mark.asyncio
+    async def test_only_the_caller_that_made_the_call_stores_it(self, tmp_path: Path) -> None:
+        """Coalesced waiters do not write the response to the cache again."""
+        client = create_cached_client(tmp_path)
+        assert client.cache is not None
+        provider = FakeProvider()
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", provider.acompletion),
+            patch.object(client.cache, "put", wraps=client.cache.put) as mock_put,
+        ):
+            calls = [asyncio.create_task(client.complete("router", messages)) for _ in range(5)]
+            await asyncio.sleep(0.05)
+            provider.release.set()
+            await asyncio.gather(*calls)
+
+        assert provider.calls == 1
+        assert mock_put.call_count == 1
+        await client.aclose()
+
+
+class ConcurrencyProbe:
+    """Fake provider that records how many calls run at once."""
+
+    def __init__(self, delay: float = 0.01) -> None:
+        """Initialize the probe with the latency of each call."""
+        self.delay = delay
+        self.current = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def acompletion(self, **kwargs: Any) -> MagicMock:
+        """Track concurrency around a short sleep."""
+        self.calls += 1
+        self.current += 1
+        self.peak = max(self.peak, self.current)
+        try:
+            await asyncio.sleep(self.delay)
+        finally:
+            self.current -= 1
+        response = mock_completion("ok")
+        response.usage = MagicMock(total_tokens=100)
+        return response
+
+
+class TestTokenBucket:
+    """Test TokenBucket refill and delay math."""
+
+    def test_delay_after_budget_is_spent(self) -> None:
+        """An empty bucket waits for the missing budget at the refill rate."""
+        with patch("quilto.llm.limits.monotonic", return_value=100.0):
+            bucket = TokenBucket(rate_per_minute=60)
+            assert bucket.delay(60) == 0.0
+            bucket.take(60)
+            assert math.isclose(bucket.delay(1), 1.0)
+        with patch("quilto.llm.limits.monotonic", return_value=101.0):
+            assert bucket.delay(1) == 0.0
+
+    def test_oversized_takes_are_capped(self) -> None:
+        """Takes above one minute of budget wait for a full bucket only."""
+        with patch("quilto.llm.limits.monotonic", return_value=0.0):
+            bucket = TokenBucket(rate_per_minute=10)
+            bucket.take(5)
+            assert math.isclose(bucket.delay(1000), 30.0)
+
+    def test_debit_delays_later_takes(self) -> None:
+        """Usage above the estimate pushes the balance negative."""
+        with patch("quilto.llm.limits.monotonic", return_value=0.0):
+            bucket = TokenBucket(rate_per_minute=600)
+            bucket.take(600)
+            bucket.debit(300)
+            assert math.isclose(bucket.delay(1), 30.1)
+
+
+class TestRequestLimits:
+    """Test LLMClient concurrency and rate limits."""
+
+    @pytest.mark.asyncio
+    async def test_provider_concurrency_limit(self) -> None:
+        """No more than max_concurrency requests reach a provider at once."""
+        config = create_test_config(default_provider="anthropic")
+        config.providers["anthropic"].max_concurrency = 2
+        client = LLMClient(config)
+        probe = ConcurrencyProbe()
+
+        with patch("quilto.llm.client.litellm.acompletion", probe.acompletion):
+            await asyncio.gather(*(client.complete("router", [{"role": "user", "content": str(i)}]) for i in range(6)))
+
+        assert probe.calls == 6
+        assert probe.peak == 2
+        stats = client.limiter_stats()["provider:anthropic"]
+        assert (stats.requests, stats.in_flight, stats.queued) == (6, 0, 0)
+        assert stats.max_wait > 0
+
+    @pytest.mark.asyncio
+    async def test_queue_depth_is_visible_while_waiting(self) -> None:
+        """Requests waiting for a slot are counted as queued."""
+        config = create_test_config(default_provider="anthropic")
+        config.providers["anthropic"].max_concurrency = 1
+        client = LLMClient(config)
+        provider = FakeProvider()
+
+        with patch("quilto.llm.client.litellm.acompletion", provider.acompletion):
+            calls = [
+                asyncio.create_task(client.complete("router", [{"role": "user", "content": str(i)}])) for i in range(3)
+            ]
+            await asyncio.sleep(0.01)
+            stats = client.limiter_stats()["provider:anthropic"]
+            assert (stats.in_flight, stats.queued) == (1, 2)
+            provider.release.set()
+            await asyncio.gather(*calls)
+
+    @pytest.mark.asyncio
+    async def test_agent_concurrency_limit(self) -> None:
+        """Per-agent limits apply on top of provider limits."""
+        config = create_test_config(default_provider="anthropic")
+        config.agents["router"] = AgentConfig(tier="low", max_concurrency=1)
+        client = LLMClient(config)
+        probe = ConcurrencyProbe()
+
+        with patch("quilto.llm.client.litellm.acompletion", probe.acompletion):
+            await asyncio.gather(
+                *(client.complete("router", [{"role": "user", "content": str(i)}]) for i in range(3)),
+                *(client.complete("parser", [{"role": "user", "content": str(i)}]) for i in range(3)),
+            )
+
+        assert probe.peak == 4
+        assert set(client.limiter_stats()) == {"agent:router"}
+
+    @pytest.mark.asyncio
+    async def test_requests_per_minute_waits_for_budget(self) -> None:
+        """Requests over the per-minute budget sleep until it refills."""
+        config = create_test_config(default_provider="anthropic")
+        config.providers["anthropic"].requests_per_minute = 2
+        probe = ConcurrencyProbe(delay=0)
+
+        now = [0.0]
+
+        def advance(delay: float) -> None:
+            now[0] += delay
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", probe.acompletion),
+            patch("quilto.llm.limits.asyncio.sleep", new_callable=AsyncMock, side_effect=advance) as mock_sleep,
+            patch("quilto.llm.limits.monotonic", lambda: now[0]),
+        ):
+            client = LLMClient(config)
+            for i in range(3):
+                await client.complete("router", [{"role": "user", "content": str(i)}])
+
+        waits = [c.args[0] for c in mock_sleep.await_args_list if c.args[0] > 0]
+        assert len(waits) == 1
+        assert math.isclose(waits[0], 30.0)
+
+    @pytest.mark.asyncio
+    async def test_cascade_goes_through_limits(self) -> None:
+        """Cascade calls are admitted by the provider limiter too."""
+        config = create_test_config(default_provider="anthropic")
+        config.providers["anthropic"].max_concurrency = 1
+        client = LLMClient(config)
+        probe = ConcurrencyProbe(delay=0)
+
+        with patch("quilto.llm.client.litellm.acompletion", probe.acompletion):
+            await client.complete_with_cascade("router", [{"role": "user", "content": "Hi"}])
+            await client.complete_structured_with_cascade(
+                "router", [{"role": "user", "content": "Hi"}], SampleResponse, allow_degradation=True
+            )
+
+        assert client.limiter_stats()["provider:anthropic"].requests == 2
+
+    def test_limit_config_validation(self) -> None:
+        """Limits must be positive."""
+        with pytest.raises(ValidationError, match="max_concurrency must be >= 1"):
+            ProviderConfig(max_concurrency=0)
+        with pytest.raises(ValidationError, match="per-minute budgets must be > 0"):
+            ProviderConfig(tokens_per_minute=0)
+        with pytest.raises(ValidationError, match="max_concurrency must be >= 1"):
+            AgentConfig(max_concurrency=0)
+
+
+def stream_chunk(content: str | None, total_tokens: int | None = None) -> MagicMock:
+    """Build a litellm streaming chunk with the given delta."""
+    chunk = MagicMock()
+    chunk.choices = [MagicMock(delta=MagicMock(content=content))]
+    chunk.usage = MagicMock(total_tokens=total_tokens) if total_tokens is not None else None
+    return chunk
+
+
+async def fake_stream(chunks: list[MagicMock], error: Exception | None = None) -> AsyncIterator[MagicMock]:
+    """Yield streaming chunks like litellm's stream wrapper, then raise error if given."""
+    for chunk in chunks:
+        await asyncio.sleep(0)
+        yield chunk
+    if error is not None:
+        raise error
+
+
+def stream_timeout() -> litellm.exceptions.Timeout:
+    """Create a transient provider error."""
+    return litellm.exceptions.Timeout(message="timeout", model="test", llm_provider="ollama")
+
+
+async def hang(**kwargs: Any) -> AsyncIterator[MagicMock]:
+    """Stand in for a provider that never answers."""
+    await asyncio.Event().wait()
+    raise AssertionError("unreachable")
+
+
+class TestStream:
+    """Test LLMClient.stream."""
+
+    @pytest.mark.asyncio
+    async def test_yields_deltas(self) -> None:
+        """Non-empty content deltas are yielded in order."""
+        client = LLMClient(create_test_config())
+        chunks = [stream_chunk("Hel"), stream_chunk(None), stream_chunk("lo"), stream_chunk("")]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = fake_stream(chunks)
+            deltas = [delta async for delta in client.stream("router", [{"role": "user", "content": "Hi"}])]
+
+        assert deltas == ["Hel", "lo"]
+        kwargs = mock_acompletion.call_args.kwargs
+        assert kwargs["stream"] is True
+        assert kwargs["model"] == "ollama/qwen2.5:7b"
+        assert kwargs["api_base"] == "http://localhost:11434"
+
+    @pytest.mark.asyncio
+    async def test_bypasses_cache(self, tmp_path: Path) -> None:
+        """Streamed responses are neither read from nor written to the cache."""
+        client = create_cached_client(tmp_path)
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            for _ in range(2):
+                mock_acompletion.return_value = fake_stream([stream_chunk("Hi")])
+                assert [d async for d in client.stream("router", [{"role": "user", "content": "Hi"}])] == ["Hi"]
+
+        assert mock_acompletion.call_count == 2
+        stats = client.cache_stats()
+        assert stats is not None
+        assert (stats.hits, stats.stores) == (0, 0)
+        await client.aclose()
+
+    @pytest.mark.asyncio
+    async def test_holds_limiter_slot_until_stream_ends(self) -> None:
+        """The provider slot is held while the stream is consumed."""
+        config = create_test_config(default_provider="anthropic")
+        config.providers["anthropic"].max_concurrency = 1
+        config.providers["anthropic"].tokens_per_minute = 100_000
+        client = LLMClient(config)
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = fake_stream([stream_chunk("a"), stream_chunk("b", total_tokens=40)])
+            stream = client.stream("router", [{"role": "user", "content": "Hi"}])
+            assert await anext(stream) == "a"
+            assert client.limiter_stats()["provider:anthropic"].in_flight == 1
+            assert [d async for d in stream] == ["b"]
+
+        assert client.limiter_stats()["provider:anthropic"].in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_closing_early_releases_slot(self) -> None:
+        """Stopping the iterator early frees the limiter slot."""
+        config = create_test_config(default_provider="anthropic")
+        config.providers["anthropic"].max_concurrency = 1
+        client = LLMClient(config)
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = fake_stream([stream_chunk("a"), stream_chunk("b")])
+            stream = client.stream("router", [{"role": "user", "content": "Hi"}])
+            assert await anext(stream) == "a"
+            await stream.aclose()
+
+        assert client.limiter_stats()["provider:anthropic"].in_flight == 0
+
+    @pytest.mark.asyncio
+    async def test_retries_transient_error_before_first_token(self) -> None:
+        """A transient error before any delta is retried with backoff."""
+        client = LLMClient(create_test_config())
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion,
+            patch("quilto.llm.client.asyncio.sleep", new_callable=AsyncMock) as mock_sleep,
+        ):
+            mock_acompletion.side_effect = [stream_timeout(), fake_stream([stream_chunk("Hi")])]
+            deltas = [d async for d in client.stream("router", [{"role": "user", "content": "Hi"}])]
+
+        assert deltas == ["Hi"]
+        assert mock_acompletion.call_count == 2
+        assert len([c for c in mock_sleep.await_args_list if c.args[0] > 0]) == 1
+        assert client.circuit_breaker_stats()["ollama"].consecutive_failures == 0
+
+    @pytest.mark.asyncio
+    async def test_falls_back_before_first_token(self) -> None:
+        """When the primary keeps failing, the fallback provider streams the response."""
+        config = create_test_config(fallback_provider="anthropic")
+        config.max_retries = 2
+        client = LLMClient(config)
+
+        async def acompletion(**kwargs: Any) -> AsyncIterator[MagicMock]:
+            if kwargs["model"].startswith("ollama/"):
+                raise stream_timeout()
+            return fake_stream([stream_chunk("From fallback")])
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", side_effect=acompletion) as mock_acompletion,
+            patch("quilto.llm.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            deltas = [d async for d in client.stream("router", [{"role": "user", "content": "Hi"}])]
+
+        assert deltas == ["From fallback"]
+        models = [call.kwargs["model"] for call in mock_acompletion.call_args_list]
+        assert models == ["ollama/qwen2.5:7b", "ollama/qwen2.5:7b", "claude-3-haiku-20240307"]
+        stats = client.circuit_breaker_stats()
+        assert stats["ollama"].consecutive_failures == 2
+        assert stats["anthropic"].state == "closed"
+
+    @pytest.mark.asyncio
+    async def test_open_breaker_goes_straight_to_fallback(self) -> None:
+        """A primary whose circuit breaker is open is not streamed from."""
+        config = create_test_config(fallback_provider="anthropic")
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+        client._get_breaker("ollama").record_failure()  # pyright: ignore[reportPrivateUsage, reportOptionalMemberAccess]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = fake_stream([stream_chunk("Hi")])
+            deltas = [d async for d in client.stream("router", [{"role": "user", "content": "Hi"}])]
+
+        assert deltas == ["Hi"]
+        assert mock_acompletion.call_args.kwargs["model"] == "claude-3-haiku-20240307"
+        assert client.circuit_breaker_stats()["ollama"].rejected == 1
+
+    @pytest.mark.asyncio
+    async def test_cancel_releases_own_half_open_trial(self) -> None:
+        """Cancelling a stream that holds the primary's half-open trial gives the trial back."""
+        config = create_test_config(fallback_provider="anthropic")
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+        breaker = client._get_breaker("ollama")  # pyright: ignore[reportPrivateUsage]
+        assert breaker is not None
+        breaker.record_failure()
+        breaker.recovery_timeout = 0.0
+
+        with patch("quilto.llm.client.litellm.acompletion", side_effect=hang):
+            task = asyncio.create_task(anext(client.stream("router", [{"role": "user", "content": "Hi"}])))
+            await asyncio.sleep(0.01)
+            assert breaker._trials == 1  # pyright: ignore[reportPrivateUsage]
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert breaker._trials == 0  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_cancel_on_fallback_keeps_other_trials(self) -> None:
+        """Cancelling a fallback stream does not give back a half-open trial it never took."""
+        config = create_test_config(fallback_provider="anthropic")
+        config.circuit_breaker.failure_threshold = 1
+        client = LLMClient(config)
+        client._get_breaker("ollama").record_failure()  # pyright: ignore[reportPrivateUsage, reportOptionalMemberAccess]
+        fallback = client._get_breaker("anthropic")  # pyright: ignore[reportPrivateUsage]
+        assert fallback is not None
+        fallback.record_failure()
+        fallback.recovery_timeout = 0.0
+        # Another request is the fallback's half-open trial
+        assert fallback.allow_request()
+
+        with patch("quilto.llm.client.litellm.acompletion", side_effect=hang):
+            task = asyncio.create_task(anext(client.stream("router", [{"role": "user", "content": "Hi"}])))
+            await asyncio.sleep(0.01)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        assert fallback._trials == 1  # pyright: ignore[reportPrivateUsage]
+
+    @pytest.mark.asyncio
+    async def test_error_after_first_token_raises(self) -> None:
+        """Once a delta was yielded the stream is not retried, but the failure is recorded."""
+        client = LLMClient(create_test_config(fallback_provider="anthropic"))
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = fake_stream([stream_chunk("Hel")], error=stream_timeout())
+            stream = client.stream("router", [{"role": "user", "content": "Hi"}])
+            assert await anext(stream) == "Hel"
+            with pytest.raises(litellm.exceptions.Timeout):
+                await anext(stream)
+
+        assert mock_acompletion.call_count == 1
+        assert client.circuit_breaker_stats()["ollama"].consecutive_failures == 1
+
+    @pytest.mark.asyncio
+    async def test_permanent_error_raises_without_retry(self) -> None:
+        """Permanent errors are not retried on the same provider."""
+        client = LLMClient(create_test_config())
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = litellm.exceptions.BadRequestError(
+                message="bad request", model="test", llm_provider="ollama"
+            )
+            stream = client.stream("router", [{"role": "user", "content": "Hi"}])
+            with pytest.raises(litellm.exceptions.BadRequestError):
+                await anext(stream)
+
+        assert mock_acompletion.call_count == 1
@@ -8,9 +8,12 @@ from quilto.llm.config import (
     DEFAULT_AGENT_CONFIGS,
     DEFAULT_TIER_MODELS,
     AgentConfig,
+    CircuitBreakerConfig,
+    HedgingConfig,
     LLMConfig,
     ModelResolution,
     ProviderConfig,
+    ResponseCacheConfig,
     TierModels,
     interpolate_env_vars,
 )
@@ -136,6 +139,104 @@ class TestAgentConfig:
         with pytest.raises(ValidationError):
             AgentConfig(provider="invalid")  # type: ignore[arg-type]
 
+    def test_cache_defaults(self) -> None:
+        """AgentConfig allows caching with the default TTL."""
+        config = AgentConfig()
+        assert config.cache is True
+        assert config.cache_ttl is None
+
+    def test_rejects_non_positive_cache_ttl(self) -> None:
+        """AgentConfig rejects cache_ttl <= 0."""
+        with pytest.raises(ValidationError, match="cache_ttl must be > 0"):
+            AgentConfig(cache_ttl=0)
+
+
+class TestResponseCacheConfig:
+    """Test ResponseCacheConfig model."""
+
+    def test_disabled_by_default(self) -> None:
+        """The response cache is opt-in."""
+        config = LLMConfig()
+        assert config.cache.enabled is False
+        assert config.cache.path is None
+
+    def test_loads_from_dict(self) -> None:
+        """Cache settings and per-agent overrides load from config dicts."""
+        config = load_llm_config_from_dict(
+            {
+                "cache": {"enabled": True, "path": "logs/llm-cache.sqlite", "ttl": 600},
+                "agents": {"observer": {"tier": "medium", "cache": False}, "router": {"cache_ttl": 60}},
+            }
+        )
+        assert config.cache == ResponseCacheConfig(enabled=True, path=Path("logs/llm-cache.sqlite"), ttl=600)
+        assert config.agents["observer"].cache is False
+        assert config.agents["router"].cache_ttl == 60
+
+    def test_rejects_invalid_values(self) -> None:
+        """ResponseCacheConfig rejects negative sizes and non-positive TTLs."""
+        with pytest.raises(ValidationError, match="max_memory_entries must be >= 0"):
+            ResponseCacheConfig(max_memory_entries=-1)
+        with pytest.raises(ValidationError, match="ttl must be > 0"):
+            ResponseCacheConfig(ttl=0)
+
+
+class TestCircuitBreakerConfig:
+    """Test CircuitBreakerConfig model."""
+
+    def test_enabled_by_default(self) -> None:
+        """Circuit breakers are on with the documented defaults."""
+        config = LLMConfig()
+        assert config.circuit_breaker == CircuitBreakerConfig(
+            enabled=True, failure_threshold=5, recovery_timeout=30.0, half_open_max_calls=1
+        )
+
+    def test_loads_from_dict(self) -> None:
+        """Breaker settings load from config dicts."""
+        config = load_llm_config_from_dict({"circuit_breaker": {"failure_threshold": 3, "recovery_timeout": 10}})
+        assert config.circuit_breaker.failure_threshold == 3
+        assert config.circuit_breaker.recovery_timeout == 10.0
+
+    def test_rejects_invalid_values(self) -> None:
+        """CircuitBreakerConfig rejects zero counts and non-positive timeouts."""
+        with pytest.raises(ValidationError, match="circuit breaker counts must be >= 1"):
+            CircuitBreakerConfig(failure_threshold=0)
+        with pytest.raises(ValidationError, match="circuit breaker counts must be >= 1"):
+            CircuitBreakerConfig(half_open_max_calls=0)
+        with pytest.raises(ValidationError, match="recovery_timeout must be > 0"):
+            CircuitBreakerConfig(recovery_timeout=0)
+
+
+class TestHedgingConfig:
+    """Test HedgingConfig model."""
+
+    def test_disabled_by_default(self) -> None:
+        """Hedging is opt-in; agents may be hedged once it is enabled."""
+        config = LLMConfig()
+        assert config.hedging.enabled is False
+        assert AgentConfig().hedge is True
+
+    def test_loads_from_dict(self) -> None:
+        """Hedging settings and per-agent opt-outs load from config dicts."""
+        config = load_llm_config_from_dict(
+            {
+                "hedging": {"enabled": True, "percentile": 90, "initial_delay": 2},
+                "agents": {"observer": {"hedge": False}},
+            }
+        )
+        assert config.hedging == HedgingConfig(enabled=True, percentile=90.0, initial_delay=2.0)
+        assert config.agents["observer"].hedge is False
+
+    def test_rejects_invalid_values(self) -> None:
+        """HedgingConfig rejects out-of-range percentiles and delays."""
+        with pytest.raises(ValidationError, match="percentile must be > 0 and <= 100"):
+            HedgingConfig(percentile=0)
+        with pytest.raises(ValidationError, match="percentile must be > 0 and <= 100"):
+            HedgingConfig(percentile=101)
+        with pytest.raises(ValidationError, match="min_samples must be >= 1"):
+            HedgingConfig(min_samples=0)
+        with pytest.raises(ValidationError, match="initial_delay must be >= 0"):
+            HedgingConfig(initial_delay=-1)
+
 
 class TestModelResolution:
     """Test ModelResolution dataclass."""
@@ -4,10 +4,10 @@ Tests cover configuration validation, significant entry detection,
 helper functions, trigger functions, and LangGraph node.
 """
 
-from datetime import date, datetime
+from datetime import date, datetime, timedelta
 from pathlib import Path
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from pydantic import ValidationError
@@ -822,6 +822,45 @@ class TestTriggerPeriodic:
 
         assert result == []
 
+    @pytest.mark.asyncio
+    async def test_max_entries_stops_reading(
+        self,
+        context_manager: GlobalContextManager,
+        storage: StorageRepository,
+        active_domain_context: ActiveDomainContext,
+    ) -> None:
+        """Stops after max_entries without reading later day files."""
+        today = datetime.now()
+        yesterday = today - timedelta(days=1)
+        for ts in (yesterday.replace(hour=8, minute=0), today.replace(hour=0, minute=1)):
+            storage.save_entry(
+                Entry(
+                    id=ts.strftime("%Y-%m-%d_%H-%M-00"),
+                    date=ts.date(),
+                    timestamp=ts.replace(second=0, microsecond=0),
+                    raw_content="New personal record on bench press!",
+                )
+            )
+
+        mock_observer = MagicMock()
+        mock_observer.observe = AsyncMock(return_value=ObserverOutput(should_update=False, updates=[]))
+        config = ObserverTriggerConfig(enable_periodic=True, periodic_interval_minutes=60)
+
+        with patch.object(storage, "_parse_raw_file", wraps=storage._parse_raw_file) as parse:  # pyright: ignore[reportPrivateUsage]
+            result = await trigger_periodic(
+                observer=mock_observer,
+                context_manager=context_manager,
+                storage=storage,
+                config=config,
+                active_domain_context=active_domain_context,
+                since_datetime=yesterday,
+                max_entries=1,
+            )
+
+        assert len(result) == 1
+        assert mock_observer.observe.call_count == 1
+        assert parse.call_count == 1
+
 
 # =============================================================================
 # Test observe_node
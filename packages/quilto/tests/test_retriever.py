@@ -17,6 +17,7 @@ from quilto.agents import (
     RetrieverOutput,
 )
 from quilto.agents.retriever import RetrieverAgent, expand_terms
+from quilto.storage.async_repository import AsyncStorageRepository
 from quilto.storage.models import DateRange, Entry
 from quilto.storage.repository import StorageRepository
 
@@ -1484,6 +1485,33 @@ class TestRetrieverIntegration:
         entry_ids = [e.id for e in dedup_result.entries]
         assert len(entry_ids) == len(set(entry_ids))  # No duplicates
 
+    @pytest.mark.asyncio
+    async def test_real_async_storage(self, storage_with_entries: StorageRepository) -> None:
+        """Integration test: retrieval through AsyncStorageRepository."""
+        storage = AsyncStorageRepository(storage_with_entries)
+        retriever = RetrieverAgent(storage)
+
+        result = await retriever.retrieve(
+            RetrieverInput(
+                instructions=[
+                    {
+                        "strategy": "date_range",
+                        "params": {"start_date": "2026-01-01", "end_date": "2026-01-02"},
+                        "sub_query_id": 1,
+                    },
+                    {
+                        "strategy": "keyword",
+                        "params": {"keywords": ["squat"]},
+                        "sub_query_id": 2,
+                    },
+                ],
+            )
+        )
+        await storage.aclose()
+
+        assert len(result.entries) == 3
+        assert [a.entries_found for a in result.retrieval_summary] == [3, 1]
+
 
 # =============================================================================
 # Test Progressive Expansion (Task 8: Story 3-5)
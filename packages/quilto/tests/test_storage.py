@@ -1,13 +1,29 @@
 """Comprehensive tests for the storage module."""
 
+import asyncio
 import json
+import multiprocessing
+import sys
+import threading
 from datetime import date, datetime
 from pathlib import Path
 from typing import Any
+from unittest.mock import patch
 
 import pytest
 from quilto.agents.models import ParserOutput
-from quilto.storage import DateRange, Entry, StorageRepository
+from quilto.storage import (
+    AsyncStorageRepository,
+    DateRange,
+    Entry,
+    EntryIndex,
+    FileCache,
+    ParsedJournal,
+    ParsedLog,
+    StorageRepository,
+)
+from quilto.storage.index import IndexedEntry
+from quilto.storage.locking import append_text
 
 
 def create_parser_output(
@@ -191,6 +207,117 @@ class TestGetEntriesByDateRange:
         assert entries[0].parsed_data == {"exercise": "bench press", "weight": 185}
 
 
+class TestDateRangeScan:
+    """Tests that range reads enumerate month directories instead of probing days."""
+
+    def test_long_range_only_touches_logged_days(self, tmp_path: Path) -> None:
+        """Test a year-long range does not stat every calendar day."""
+        repo = StorageRepository(tmp_path)
+        raw_base = tmp_path / "logs" / "raw"
+        (raw_base / "2025" / "03").mkdir(parents=True)
+        (raw_base / "2025" / "11").mkdir(parents=True)
+        (raw_base / "2025" / "03" / "2025-03-14.md").write_text("## 10:00\nBench 185\n")
+        (raw_base / "2025" / "11" / "2025-11-02.md").write_text("## 07:00\nRun 10k\n")
+
+        with (
+            patch.object(Path, "exists", side_effect=AssertionError("per-day probe")),
+            patch.object(repo, "_parse_raw_file", wraps=repo._parse_raw_file) as parse,  # pyright: ignore[reportPrivateUsage]
+        ):
+            entries = repo.get_entries_by_date_range(date(2025, 1, 1), date(2025, 12, 31))
+
+        assert [e.raw_content for e in entries] == ["Bench 185", "Run 10k"]
+        assert parse.call_count == 2
+
+    def test_range_bounds_within_month(self, tmp_path: Path) -> None:
+        """Test files outside the range in an overlapping month are skipped."""
+        repo = StorageRepository(tmp_path)
+        raw_dir = tmp_path / "logs" / "raw" / "2026" / "01"
+        raw_dir.mkdir(parents=True)
+        for day in (1, 15, 31):
+            (raw_dir / f"2026-01-{day:02d}.md").write_text(f"## 10:00\nDay {day}\n")
+
+        entries = repo.get_entries_by_date_range(date(2026, 1, 2), date(2026, 1, 31))
+
+        assert [e.raw_content for e in entries] == ["Day 15", "Day 31"]
+
+    def test_inverted_range_is_empty(self, tmp_path: Path) -> None:
+        """Test that start after end returns no entries, as before."""
+        repo = StorageRepository(tmp_path)
+        raw_dir = tmp_path / "logs" / "raw" / "2026" / "01"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "2026-01-05.md").write_text("## 10:00\nEntry\n")
+
+        assert repo.get_entries_by_date_range(date(2026, 1, 10), date(2026, 1, 1)) == []
+
+
+class TestIterEntries:
+    """Tests for the streaming iter_entries / iter_search API."""
+
+    def _write_days(self, tmp_path: Path) -> None:
+        raw_base = tmp_path / "logs" / "raw"
+        (raw_base / "2025" / "12").mkdir(parents=True)
+        (raw_base / "2026" / "01").mkdir(parents=True)
+        (raw_base / "2026" / "02").mkdir(parents=True)
+        (raw_base / "2025" / "12" / "2025-12-31.md").write_text("## 22:00\nNew year eve run\n")
+        (raw_base / "2026" / "01" / "2026-01-02.md").write_text("## 18:00\nSquat 225\n\n## 07:00\nMorning run\n")
+        (raw_base / "2026" / "01" / "2026-01-10.md").write_text("## 10:00\nBench 185\n")
+        (raw_base / "2026" / "02" / "2026-02-01.md").write_text("## 09:00\nEasy run\n")
+        (raw_base / "2026" / "01" / "notes.md").write_text("## 09:00\nNot a day file\n")
+
+    def test_yields_in_timestamp_order(self, tmp_path: Path) -> None:
+        """Test entries are yielded oldest first across years and months."""
+        self._write_days(tmp_path)
+        repo = StorageRepository(tmp_path)
+
+        contents = [e.raw_content for e in repo.iter_entries()]
+
+        assert contents == ["New year eve run", "Morning run", "Squat 225", "Bench 185", "Easy run"]
+
+    def test_newest_first(self, tmp_path: Path) -> None:
+        """Test newest_first reverses the order."""
+        self._write_days(tmp_path)
+        repo = StorageRepository(tmp_path)
+
+        contents = [e.raw_content for e in repo.iter_entries(newest_first=True)]
+
+        assert contents == ["Easy run", "Bench 185", "Squat 225", "Morning run", "New year eve run"]
+
+    def test_matches_get_entries_by_date_range(self, tmp_path: Path) -> None:
+        """Test a bounded iteration returns the same entries as the list API."""
+        self._write_days(tmp_path)
+        repo = StorageRepository(tmp_path)
+        start, end = date(2025, 12, 31), date(2026, 1, 10)
+
+        assert list(repo.iter_entries(start, end)) == repo.get_entries_by_date_range(start, end)
+
+    def test_early_termination_reads_fewer_files(self, tmp_path: Path) -> None:
+        """Test that stopping early does not read the remaining day files."""
+        self._write_days(tmp_path)
+        repo = StorageRepository(tmp_path)
+
+        with patch.object(repo, "_parse_raw_file", wraps=repo._parse_raw_file) as parse:  # pyright: ignore[reportPrivateUsage]
+            first = next(repo.iter_entries(newest_first=True))
+
+        assert first.raw_content == "Easy run"
+        assert parse.call_count == 1
+
+    def test_iter_search(self, tmp_path: Path) -> None:
+        """Test iter_search yields only matching entries lazily."""
+        self._write_days(tmp_path)
+        repo = StorageRepository(tmp_path)
+
+        matches = repo.iter_search(["run"], date_range=DateRange(start=date(2026, 1, 1), end=date(2026, 12, 31)))
+
+        assert [e.raw_content for e in matches] == ["Morning run", "Easy run"]
+
+    def test_iter_search_empty_keywords_raises(self, tmp_path: Path) -> None:
+        """Test iter_search validates keywords eagerly."""
+        repo = StorageRepository(tmp_path)
+
+        with pytest.raises(ValueError, match="keywords list must not be empty"):
+            repo.iter_search([])
+
+
 class TestGetEntriesByPattern:
     """Tests for pattern-based retrieval."""
 
@@ -334,6 +461,7 @@ class TestSaveEntry:
         )
 
         repo.save_entry(entry)
+        repo.close()
 
         # Check raw file
         raw_path = tmp_path / "logs" / "raw" / "2026" / "01" / "2026-01-01.md"
@@ -424,6 +552,7 @@ class TestCorrections:
             correction_delta={"weight": 185},
         )
         repo.save_entry(correction_entry, correction=correction)
+        repo.close()
 
         # Check raw file has correction marker
         raw_path = tmp_path / "logs" / "raw" / "2026" / "01" / "2026-01-01.md"
@@ -457,6 +586,7 @@ class TestCorrections:
             correction_delta={"weight": 185},
         )
         repo.save_entry(correction_entry, correction=correction)
+        repo.close()
 
         parsed_path = tmp_path / "logs" / "parsed" / "2026" / "01" / "2026-01-01.json"
         parsed = json.loads(parsed_path.read_text())
@@ -607,6 +737,27 @@ class TestEdgeCases:
         assert len(entries) == 1
         assert entries[0].parsed_data is None
 
+    def test_parsed_json_loaded_once_per_day(self, tmp_path: Path) -> None:
+        """Test that a day's parsed JSON is parsed once, not once per entry."""
+        repo = StorageRepository(tmp_path)
+        for hour in range(8, 14):
+            repo.save_entry(
+                Entry(
+                    id=f"2026-01-01_{hour:02d}-00-00",
+                    date=date(2026, 1, 1),
+                    timestamp=datetime(2026, 1, 1, hour, 0),
+                    raw_content=f"Set at {hour}",
+                    parsed_data={"hour": hour},
+                )
+            )
+        repo.close()
+
+        with patch("quilto.storage.repository.json.load", wraps=json.load) as load:
+            entries = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+
+        assert load.call_count == 1
+        assert [e.parsed_data for e in entries] == [{"hour": h} for h in range(8, 14)]
+
     def test_entry_id_format(self, tmp_path: Path) -> None:
         """Test entry IDs are generated correctly."""
         repo = StorageRepository(tmp_path)
@@ -636,3 +787,928 @@ class TestEdgeCases:
 
         assert len(entries) == 1
         assert "운동 메모" in entries[0].raw_content
+
+
+class TestEntryIndex:
+    """Tests for the optional SQLite entry index."""
+
+    def _entry(self, hour: int, content: str, parsed: dict[str, Any] | None = None) -> Entry:
+        return Entry(
+            id=f"2026-01-01_{hour:02d}-00-00",
+            date=date(2026, 1, 1),
+            timestamp=datetime(2026, 1, 1, hour, 0),
+            raw_content=content,
+            parsed_data=parsed,
+        )
+
+    def test_index_disabled_by_default(self, tmp_path: Path) -> None:
+        """Test that no index file is created unless requested."""
+        repo = StorageRepository(tmp_path)
+
+        assert repo.index_enabled is False
+        assert not (tmp_path / "logs" / "index.sqlite").exists()
+        with pytest.raises(RuntimeError, match="not enabled"):
+            repo.rebuild_index()
+
+    def test_save_entry_updates_index(self, tmp_path: Path) -> None:
+        """Test that save_entry keeps the index in sync."""
+        repo = StorageRepository(tmp_path, use_index=True)
+        repo.save_entry(self._entry(10, "Bench press 185", {"exercise": "bench press"}))
+
+        assert (tmp_path / "logs" / "index.sqlite").exists()
+        assert repo._index is not None  # pyright: ignore[reportPrivateUsage]
+        assert repo._index.count_entries() == 1  # pyright: ignore[reportPrivateUsage]
+
+        entries = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        assert len(entries) == 1
+        assert entries[0].parsed_data == {"exercise": "bench press"}
+        repo.close()
+
+    def test_reads_answered_from_index(self, tmp_path: Path) -> None:
+        """Test that fresh files are read from the index, not re-parsed."""
+        repo = StorageRepository(tmp_path, use_index=True)
+        repo.save_entry(self._entry(10, "Squat 225"))
+
+        calls = 0
+        original_scan = repo._scan_raw_file  # pyright: ignore[reportPrivateUsage]
+
+        def counting_scan(file_path: Path) -> Any:
+            nonlocal calls
+            calls += 1
+            return original_scan(file_path)
+
+        repo._scan_raw_file = counting_scan  # type: ignore[method-assign]
+        repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        repo.get_entries_by_pattern("**/*.md")
+
+        assert calls == 0
+        repo.close()
+
+    def test_external_edit_invalidates_index(self, tmp_path: Path) -> None:
+        """Test that the markdown file stays the source of truth."""
+        repo = StorageRepository(tmp_path, use_index=True)
+        repo.save_entry(self._entry(10, "Squat 225"))
+
+        raw_file = tmp_path / "logs" / "raw" / "2026" / "01" / "2026-01-01.md"
+        raw_file.write_text("## 10:00\nSquat 225\n\n## 18:00\nEvening run 5k\n", encoding="utf-8")
+
+        entries = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        assert [e.raw_content for e in entries] == ["Squat 225", "Evening run 5k"]
+
+        raw_file.unlink()
+        assert repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1)) == []
+        repo.close()
+
+    def test_correction_upsert_updates_index(self, tmp_path: Path) -> None:
+        """Test that correction deltas are reflected in indexed parsed data."""
+        repo = StorageRepository(tmp_path, use_index=True)
+        repo.save_entry(self._entry(10, "Bench 185", {"weight": 185}))
+        repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+
+        correction = create_parser_output(
+            is_correction=True,
+            target_entry_id="2026-01-01_10-00-00",
+            correction_delta={"weight": 195},
+        )
+        repo.save_entry(self._entry(10, "Actually 195"), correction=correction)
+
+        entries = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        assert entries[0].parsed_data == {"weight": 195}
+        repo.close()
+
+    def test_byte_offsets_locate_content(self, tmp_path: Path) -> None:
+        """Test that recorded byte offsets point at the entry content."""
+        repo = StorageRepository(tmp_path, use_index=True)
+        repo.save_entry(self._entry(9, "운동 메모"))
+        repo.save_entry(self._entry(10, "Deadlift 315"))
+
+        raw_file = tmp_path / "logs" / "raw" / "2026" / "01" / "2026-01-01.md"
+        data = raw_file.read_bytes()
+        indexed = repo._scan_raw_file(raw_file)  # pyright: ignore[reportPrivateUsage]
+
+        for item in indexed:
+            assert data[item.byte_start : item.byte_end].decode("utf-8") == item.entry.raw_content
+        repo.close()
+
+    def test_rebuild_index_for_existing_tree(self, tmp_path: Path) -> None:
+        """Test that rebuild_index indexes files written without the index."""
+        raw_dir = tmp_path / "logs" / "raw" / "2026" / "01"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "2026-01-01.md").write_text("## 10:30\nFirst\n\n## 14:00\nSecond\n")
+        (raw_dir / "2026-01-02.md").write_text("## 09:00\nThird\n")
+
+        repo = StorageRepository(tmp_path, use_index=True)
+        assert repo.rebuild_index() == 3
+
+        entries = repo.get_entries_by_pattern("2026/01/*.md")
+        assert [e.raw_content for e in entries] == ["First", "Second", "Third"]
+        repo.close()
+
+    def test_orphaned_terms_pruned(self, tmp_path: Path) -> None:
+        """Test that terms no entry uses any more leave the vocabulary."""
+        index = EntryIndex(tmp_path / "index.sqlite")
+        index.put_file("a.md", date(2026, 1, 1), "s1", [IndexedEntry(self._entry(10, "Bench press"), 0, 11)])
+        index.put_file("b.md", date(2026, 1, 1), "s1", [IndexedEntry(self._entry(11, "Bench dips"), 0, 10)])
+        index.put_file("a.md", date(2026, 1, 1), "s2", [IndexedEntry(self._entry(10, "Squat"), 0, 5)])
+
+        conn = index._conn  # pyright: ignore[reportPrivateUsage]
+        assert {r[0] for r in conn.execute("SELECT term FROM terms")} == {"bench", "dips", "squat"}
+        assert {r[0] for r in conn.execute("SELECT DISTINCT term FROM grams")} == {"bench", "dips", "squat"}
+
+        index.remove_file("b.md")
+        assert {r[0] for r in conn.execute("SELECT term FROM terms")} == {"squat"}
+        assert {r[0] for r in conn.execute("SELECT DISTINCT term FROM grams")} == {"squat"}
+        index.close()
+
+    @pytest.mark.parametrize(
+        ("term", "expected"),
+        [
+            ("e", ["bench"]),
+            ("ab", ["abcab", "cabca"]),
+            ("abc", ["abcab", "cabca"]),
+            ("abcab", ["abcab"]),
+            ("ench", ["bench"]),
+            ("xyz", []),
+        ],
+    )
+    def test_gram_lookup_finds_substring_terms(self, tmp_path: Path, term: str, expected: list[str]) -> None:
+        """Test that trigram and prefix lookups return exactly the containing terms."""
+        index = EntryIndex(tmp_path / "index.sqlite")
+        index.put_file("a.md", date(2026, 1, 1), "s", [IndexedEntry(self._entry(10, "bench abcab cabca"), 0, 17)])
+
+        assert sorted(index._matching_terms(term)) == expected  # pyright: ignore[reportPrivateUsage]
+        index.close()
+
+
+class TestIndexedSearch:
+    """Tests for keyword search through the inverted index."""
+
+    def _write_corpus(self, tmp_path: Path) -> None:
+        raw_dir = tmp_path / "logs" / "raw" / "2026" / "01"
+        raw_dir.mkdir(parents=True)
+        (raw_dir / "2026-01-01.md").write_text("## 10:00\nBench press 185x5\n\n## 18:00\nEasy run 5k\n")
+        (raw_dir / "2026-01-02.md").write_text("## 09:00\nSquat 225, bench-press accessory\n")
+        (raw_dir / "2026-01-03.md").write_text("## 07:30\nMorning RUN, felt great!\n\n## 12:00\n운동 메모: 스쿼트\n")
+
+    @pytest.mark.parametrize(
+        ("keywords", "match_all", "date_range"),
+        [
+            (["bench"], False, None),
+            (["BENCH", "run"], False, None),
+            (["bench", "press"], True, None),
+            (["bench press"], False, None),
+            (["ench"], False, None),
+            (["h-p"], False, None),
+            (["!"], False, None),
+            (["squat", "!"], True, None),
+            (["스쿼트"], False, None),
+            (["run"], False, DateRange(start=date(2026, 1, 2), end=date(2026, 1, 3))),
+            (["nothing"], False, None),
+        ],
+    )
+    def test_matches_full_scan(
+        self,
+        tmp_path: Path,
+        keywords: list[str],
+        match_all: bool,
+        date_range: DateRange | None,
+    ) -> None:
+        """Test that indexed search returns exactly what a full scan returns."""
+        self._write_corpus(tmp_path)
+        plain = StorageRepository(tmp_path)
+        indexed = StorageRepository(tmp_path, use_index=True)
+
+        expected = plain.search_entries(keywords, date_range=date_range, match_all=match_all)
+        actual = indexed.search_entries(keywords, date_range=date_range, match_all=match_all)
+
+        assert [e.id for e in actual] == [e.id for e in expected]
+        assert [e.raw_content for e in actual] == [e.raw_content for e in expected]
+        indexed.close()
+
+    def test_candidates_limited_to_posting_lists(self, tmp_path: Path) -> None:
+        """Test that only entries from matching posting lists are candidates."""
+        self._write_corpus(tmp_path)
+        repo = StorageRepository(tmp_path, use_index=True)
+        repo.rebuild_index()
+
+        assert repo._index is not None  # pyright: ignore[reportPrivateUsage]
+        candidates = repo._index.search_candidates([["squat"]], match_all=False)  # pyright: ignore[reportPrivateUsage]
+
+        assert [e.id for e in candidates] == ["2026-01-02_09-00-00"]
+        repo.close()
+
+    def test_save_entry_updates_postings(self, tmp_path: Path) -> None:
+        """Test that newly saved entries are searchable immediately."""
+        repo = StorageRepository(tmp_path, use_index=True)
+        assert repo.search_entries(["deadlift"]) == []
+
+        repo.save_entry(
+            Entry(
+                id="2026-01-05_08-00-00",
+                date=date(2026, 1, 5),
+                timestamp=datetime(2026, 1, 5, 8, 0),
+                raw_content="Deadlift 315x3",
+            )
+        )
+
+        results = repo.search_entries(["deadlift"])
+        assert [e.id for e in results] == ["2026-01-05_08-00-00"]
+        repo.close()
+
+    def test_deleted_file_removed_from_search(self, tmp_path: Path) -> None:
+        """Test that entries of deleted raw files are no longer returned."""
+        self._write_corpus(tmp_path)
+        repo = StorageRepository(tmp_path, use_index=True)
+        assert len(repo.search_entries(["squat"])) == 1
+
+        (tmp_path / "logs" / "raw" / "2026" / "01" / "2026-01-02.md").unlink()
+
+        assert repo.search_entries(["squat"]) == []
+        repo.close()
+
+    def test_later_searches_do_not_stat_every_file(self, tmp_path: Path) -> None:
+        """Test that only the first search checks every file of the tree."""
+        self._write_corpus(tmp_path)
+        repo = StorageRepository(tmp_path, use_index=True)
+        checked: list[Path] = []
+        original_signature = repo._file_signature  # pyright: ignore[reportPrivateUsage]
+
+        def counting_signature(file_path: Path) -> str | None:
+            checked.append(file_path)
+            return original_signature(file_path)
+
+        repo._file_signature = counting_signature  # type: ignore[method-assign]
+        repo.search_entries(["squat"])
+        assert len(checked) > 3
+
+        checked.clear()
+        assert [e.id for e in repo.search_entries(["squat"])] == ["2026-01-02_09-00-00"]
+        assert [p.name for p in checked] == ["2026-01-02.md"]
+        repo.close()
+
+    def test_writes_without_index_reach_indexed_search(self, tmp_path: Path) -> None:
+        """Test that days saved by a repository without the index are re-indexed."""
+        self._write_corpus(tmp_path)
+        indexed = StorageRepository(tmp_path, use_index=True)
+        assert indexed.search_entries(["deadlift"]) == []
+
+        StorageRepository(tmp_path).save_entry(
+            Entry(
+                id="2026-01-02_19-00-00",
+                date=date(2026, 1, 2),
+                timestamp=datetime(2026, 1, 2, 19, 0),
+                raw_content="Deadlift 315x3",
+            )
+        )
+
+        assert [e.id for e in indexed.search_entries(["deadlift"])] == ["2026-01-02_19-00-00"]
+        assert not (tmp_path / "logs" / "index.dirty").exists()
+        indexed.close()
+
+
+class TestFileCache:
+    """Tests for the mtime/size validated LRU file cache."""
+
+    def test_hit_and_miss_counters(self, tmp_path: Path) -> None:
+        """Test that lookups are counted as hits or misses."""
+        cache = FileCache(max_entries=4, max_bytes=1000)
+        path = tmp_path / "a.md"
+
+        assert cache.get(path, (1, 10)) is None
+        cache.put(path, (1, 10), "value")
+        assert cache.get(path, (1, 10)) == "value"
+
+        stats = cache.stats()
+        assert (stats.hits, stats.misses, stats.entries, stats.bytes) == (1, 1, 1, 10)
+        assert stats.hit_ratio == 0.5
+
+    def test_stale_signature_is_miss(self, tmp_path: Path) -> None:
+        """Test that a changed (mtime_ns, size) invalidates the entry."""
+        cache = FileCache()
+        path = tmp_path / "a.md"
+        cache.put(path, (1, 10), "old")
+
+        assert cache.get(path, (2, 10)) is None
+        assert cache.stats().entries == 0
+
+    def test_evicts_least_recently_used_by_count(self, tmp_path: Path) -> None:
+        """Test LRU eviction when the entry budget is exceeded."""
+        cache = FileCache(max_entries=2, max_bytes=1000)
+        a, b, c = tmp_path / "a", tmp_path / "b", tmp_path / "c"
+        cache.put(a, (1, 1), "a")
+        cache.put(b, (1, 1), "b")
+        cache.get(a, (1, 1))
+        cache.put(c, (1, 1), "c")
+
+        assert cache.get(b, (1, 1)) is None
+        assert cache.get(a, (1, 1)) == "a"
+        assert cache.stats().evictions == 1
+
+    def test_evicts_by_bytes(self, tmp_path: Path) -> None:
+        """Test eviction when the byte budget is exceeded."""
+        cache = FileCache(max_entries=10, max_bytes=100)
+        cache.put(tmp_path / "a", (1, 60), "a")
+        cache.put(tmp_path / "b", (1, 60), "b")
+        cache.put(tmp_path / "big", (1, 500), "big")
+
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.bytes == 60
+        assert cache.get(tmp_path / "b", (1, 60)) == "b"
+
+    def test_negative_budget_raises(self) -> None:
+        """Test that negative budgets are rejected."""
+        with pytest.raises(ValueError, match="budgets"):
+            FileCache(max_entries=-1)
+
+    def test_warm_reads_do_not_read_files(self, tmp_path: Path) -> None:
+        """Test that repeated reads over a warm window only stat files."""
+        repo = StorageRepository(tmp_path)
+        repo.save_entry(
+            Entry(
+                id="2026-01-01_10-00-00",
+                date=date(2026, 1, 1),
+                timestamp=datetime(2026, 1, 1, 10, 0),
+                raw_content="Bench 185",
+                parsed_data={"weight": 185},
+            )
+        )
+        repo.close()
+        first = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 7))
+
+        with (
+            patch.object(Path, "read_text", side_effect=AssertionError("read_text called")),
+            patch.object(Path, "open", side_effect=AssertionError("open called")),
+        ):
+            second = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 7))
+
+        assert second == first
+        assert repo.cache_stats().hits == 2
+
+    def test_save_entry_invalidates_cache(self, tmp_path: Path) -> None:
+        """Test that writes through the repository are visible immediately."""
+        repo = StorageRepository(tmp_path)
+        day = date(2026, 1, 1)
+        repo.save_entry(
+            Entry(id="2026-01-01_10-00-00", date=day, timestamp=datetime(2026, 1, 1, 10, 0), raw_content="First")
+        )
+        assert len(repo.get_entries_by_date_range(day, day)) == 1
+
+        repo.save_entry(
+            Entry(
+                id="2026-01-01_11-00-00",
+                date=day,
+                timestamp=datetime(2026, 1, 1, 11, 0),
+                raw_content="Second",
+                parsed_data={"n": 2},
+            )
+        )
+
+        entries = repo.get_entries_by_date_range(day, day)
+        assert [e.raw_content for e in entries] == ["First", "Second"]
+        assert entries[1].parsed_data == {"n": 2}
+
+    def test_cached_entries_are_independent_copies(self, tmp_path: Path) -> None:
+        """Test that mutating a returned entry does not leak into the cache."""
+        repo = StorageRepository(tmp_path)
+        day = date(2026, 1, 1)
+        repo.save_entry(
+            Entry(
+                id="2026-01-01_10-00-00",
+                date=day,
+                timestamp=datetime(2026, 1, 1, 10, 0),
+                raw_content="Bench",
+                parsed_data={"weight": 185},
+            )
+        )
+
+        first = repo.get_entries_by_date_range(day, day)
+        assert first[0].parsed_data is not None
+        first[0].parsed_data["weight"] = 0
+
+        assert repo.get_entries_by_date_range(day, day)[0].parsed_data == {"weight": 185}
+
+    def test_nested_parsed_data_not_shared_with_cache(self, tmp_path: Path) -> None:
+        """Test that mutating nested parsed data of a returned entry does not leak into later reads."""
+        repo = StorageRepository(tmp_path)
+        day = date(2026, 1, 1)
+        repo.save_entry(
+            Entry(
+                id="2026-01-01_10-00-00",
+                date=day,
+                timestamp=datetime(2026, 1, 1, 10, 0),
+                raw_content="Bench",
+                parsed_data={"strength": {"exercises": [{"name": "bench", "weight": 185}]}},
+            )
+        )
+
+        first = repo.get_entries_by_date_range(day, day)
+        assert first[0].parsed_data is not None
+        first[0].parsed_data["strength"]["exercises"][0]["weight"] = 0
+        first[0].parsed_data["strength"]["exercises"].append({"name": "squat"})
+
+        again = repo.read_day_file(repo.list_day_files(day, day)[0])
+        assert again[0].parsed_data == {"strength": {"exercises": [{"name": "bench", "weight": 185}]}}
+        assert repo.cache_stats().hits >= 1
+
+    def test_cache_can_be_disabled(self, tmp_path: Path) -> None:
+        """Test that a zero entry budget disables caching."""
+        repo = StorageRepository(tmp_path, cache_max_entries=0)
+        (tmp_path / "logs" / "raw" / "2026" / "01").mkdir(parents=True)
+        (tmp_path / "logs" / "raw" / "2026" / "01" / "2026-01-01.md").write_text("## 10:00\nEntry\n")
+
+        repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+
+        stats = repo.cache_stats()
+        assert stats.hits == 0
+        assert stats.entries == 0
+
+
+class TestParsedJournal:
+    """Tests for the append-only parsed JSON journal."""
+
+    def test_sequential_writes_fold_into_json(self, tmp_path: Path) -> None:
+        """Test that compaction leaves only the folded JSON file."""
+        path = tmp_path / "2026-01-01.json"
+        journal = ParsedJournal(path)
+
+        journal.set("a", {"weight": 185})
+        journal.update("a", {"reps": 5})
+        assert not path.exists()
+        assert journal.read() == {"a": {"weight": 185, "reps": 5}}
+
+        assert journal.compact()
+        assert json.loads(path.read_text()) == {"a": {"weight": 185, "reps": 5}}
+        assert not journal.journal_path.exists()
+        assert not journal.pending_path.exists()
+
+    def test_read_applies_pending_and_journal(self, tmp_path: Path) -> None:
+        """Test that unfolded records are visible to readers in order."""
+        path = tmp_path / "2026-01-01.json"
+        path.write_text(json.dumps({"a": {"weight": 100}}))
+        journal = ParsedJournal(path)
+        journal.pending_path.write_text(json.dumps({"op": "update", "id": "a", "delta": {"weight": 185}}) + "\n")
+        journal.journal_path.write_text(json.dumps({"op": "set", "id": "b", "data": {"reps": 5}}) + "\n")
+
+        assert journal.has_records()
+        assert journal.read() == {"a": {"weight": 185}, "b": {"reps": 5}}
+
+    def test_replaying_folded_records_is_idempotent(self, tmp_path: Path) -> None:
+        """Test recovery when a compaction stopped before removing the pending journal."""
+        path = tmp_path / "2026-01-01.json"
+        path.write_text(json.dumps({"a": {"weight": 185, "reps": 5}}))
+        journal = ParsedJournal(path)
+        journal.pending_path.write_text(
+            json.dumps({"op": "set", "id": "a", "data": {"weight": 185}})
+            + "\n"
+            + json.dumps({"op": "update", "id": "a", "delta": {"reps": 5}})
+            + "\n"
+        )
+
+        assert journal.compact(blocking=True)
+
+        assert json.loads(path.read_text()) == {"a": {"weight": 185, "reps": 5}}
+        assert not journal.pending_path.exists()
+
+    def test_torn_record_is_skipped(self, tmp_path: Path) -> None:
+        """Test that a partially written last line does not break reads."""
+        path = tmp_path / "2026-01-01.json"
+        journal = ParsedJournal(path)
+        journal.journal_path.write_text(json.dumps({"op": "set", "id": "a", "data": {"n": 1}}) + '\n{"op": "se')
+
+        assert journal.read() == {"a": {"n": 1}}
+
+    def test_repository_compacts_off_the_write_path(self, tmp_path: Path) -> None:
+        """Test that saves leave the fold to the background compactor."""
+        repo = StorageRepository(tmp_path)
+        threads: list[str] = []
+
+        def record_thread(journal: ParsedJournal, blocking: bool = False) -> bool:
+            threads.append(threading.current_thread().name)
+            return False
+
+        with patch.object(ParsedJournal, "compact", autospec=True, side_effect=record_thread):
+            repo.save_entry(_bench_entry(630, {"weight": 185}))
+            repo.close()
+        assert len(threads) == 1
+        assert threads[0].startswith("quilto-compact")
+
+        repo.save_entry(_bench_entry(1080, {"distance": 5}))
+        repo.close()
+        parsed_path = tmp_path / "logs" / "parsed" / "2026" / "01" / "2026-01-01.json"
+        assert json.loads(parsed_path.read_text()) == {
+            "2026-01-01_10-30-00": {"weight": 185},
+            "2026-01-01_18-00-00": {"distance": 5},
+        }
+        assert not ParsedJournal(parsed_path).has_records()
+
+    def test_lock_files_kept_out_of_data_directories(self, tmp_path: Path) -> None:
+        """Test that lock files live in a hidden directory beside the data."""
+        repo = StorageRepository(tmp_path)
+        repo.save_entry(_bench_entry(630, {"weight": 185}))
+        repo.close()
+
+        for directory in (tmp_path / "logs" / "raw" / "2026" / "01", tmp_path / "logs" / "parsed" / "2026" / "01"):
+            assert not list(directory.glob("*.lock"))
+            assert list((directory / ".locks").glob("*.lock"))
+
+    def test_repository_reads_unfolded_records(self, tmp_path: Path) -> None:
+        """Test that StorageRepository sees records still waiting in the journal."""
+        repo = StorageRepository(tmp_path)
+        day = date(2026, 1, 1)
+        repo.save_entry(
+            Entry(
+                id="2026-01-01_10-00-00",
+                date=day,
+                timestamp=datetime(2026, 1, 1, 10, 0),
+                raw_content="Bench",
+                parsed_data={"weight": 100},
+            )
+        )
+        assert repo.get_entries_by_date_range(day, day)[0].parsed_data == {"weight": 100}
+
+        journal = ParsedJournal(repo._get_parsed_path(day))  # pyright: ignore[reportPrivateUsage]
+        journal.journal_path.write_text(
+            json.dumps({"op": "update", "id": "2026-01-01_10-00-00", "delta": {"weight": 185}}) + "\n"
+        )
+
+        assert repo.get_entries_by_date_range(day, day)[0].parsed_data == {"weight": 185}
+
+
+def _bench_entry(minute: int, parsed_data: dict[str, Any] | None = None) -> Entry:
+    """Create an entry on 2026-01-01 at the given minute of the day."""
+    timestamp = datetime(2026, 1, 1, minute // 60, minute % 60)
+    return Entry(
+        id=timestamp.strftime("%Y-%m-%d_%H-%M-%S"),
+        date=timestamp.date(),
+        timestamp=timestamp,
+        raw_content=f"Entry {minute}",
+        parsed_data=parsed_data,
+    )
+
+
+class TestParsedLog:
+    """Tests for the append-only JSONL parsed store."""
+
+    def test_records_fold_last_writer_wins(self, tmp_path: Path) -> None:
+        """Test set/update records fold with last-writer-wins upsert."""
+        log = ParsedLog(tmp_path / "2026-01-01.jsonl")
+
+        log.set("a", {"weight": 100, "reps": 5})
+        log.update("a", {"weight": 185})
+        log.update("b", {"reps": 3})
+
+        assert log.read() == {"a": {"weight": 185, "reps": 5}, "b": {"reps": 3}}
+        assert len(log.path.read_text().splitlines()) == 3
+
+    def test_compact_drops_superseded_records(self, tmp_path: Path) -> None:
+        """Test compaction rewrites one set record per entry."""
+        log = ParsedLog(tmp_path / "2026-01-01.jsonl")
+        for i in range(20):
+            log.update("a", {"set": i})
+
+        assert log.compact()
+
+        assert log.read() == {"a": {"set": 19}}
+        assert len(log.path.read_text().splitlines()) == 1
+
+    def test_compact_skips_mostly_live_files(self, tmp_path: Path) -> None:
+        """Test compaction leaves files without enough superseded records alone."""
+        log = ParsedLog(tmp_path / "2026-01-01.jsonl")
+        for i in range(20):
+            log.set(f"e{i}", {"n": i})
+        log.update("e0", {"n": 100})
+
+        assert not log.compact()
+        assert len(log.path.read_text().splitlines()) == 21
+
+
+class TestJsonlParsedFormat:
+    """Tests for StorageRepository with parsed_format="jsonl"."""
+
+    def test_writes_append_records(self, tmp_path: Path) -> None:
+        """Test that entries and corrections append to the day's JSONL file."""
+        repo = StorageRepository(tmp_path, parsed_format="jsonl")
+        repo.save_entry(_bench_entry(630, {"weight": 100, "reps": 5}))
+        repo.save_entry(
+            _bench_entry(635),
+            correction=create_parser_output(
+                is_correction=True,
+                target_entry_id="2026-01-01_10-30-00",
+                correction_delta={"weight": 185},
+            ),
+        )
+
+        parsed_dir = tmp_path / "logs" / "parsed" / "2026" / "01"
+        assert not (parsed_dir / "2026-01-01.json").exists()
+        assert len((parsed_dir / "2026-01-01.jsonl").read_text().splitlines()) == 2
+
+        entries = repo.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        assert entries[0].parsed_data == {"weight": 185, "reps": 5}
+
+    def test_jsonl_records_fold_over_legacy_json(self, tmp_path: Path) -> None:
+        """Test that a day with legacy JSON and new JSONL records reads both."""
+        StorageRepository(tmp_path).save_entry(_bench_entry(630, {"weight": 100, "reps": 5}))
+        repo = StorageRepository(tmp_path, parsed_format="jsonl")
+        repo.save_entry(
+            _bench_entry(635),
+            correction=create_parser_output(
+                is_correction=True,
+                target_entry_id="2026-01-01_10-30-00",
+                correction_delta={"weight": 185},
+            ),
+        )
+
+        for reader in (repo, StorageRepository(tmp_path, parsed_format="json")):
+            entries = reader.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+            assert entries[0].parsed_data == {"weight": 185, "reps": 5}
+
+    def test_background_compaction(self, tmp_path: Path) -> None:
+        """Test that a growing JSONL file is compacted off the write path."""
+        repo = StorageRepository(tmp_path, parsed_format="jsonl", compact_min_bytes=1500)
+        repo.save_entry(_bench_entry(630, {"set": 0}))
+        for i in range(1, 40):
+            repo.save_entry(
+                _bench_entry(630),
+                correction=create_parser_output(
+                    is_correction=True,
+                    target_entry_id="2026-01-01_10-30-00",
+                    correction_delta={"set": i},
+                ),
+            )
+        repo.close()
+
+        log_path = tmp_path / "logs" / "parsed" / "2026" / "01" / "2026-01-01.jsonl"
+        assert len(log_path.read_text().splitlines()) < 40
+        assert ParsedLog(log_path).read() == {"2026-01-01_10-30-00": {"set": 39}}
+
+    def test_migrate_to_jsonl_and_back(self, tmp_path: Path) -> None:
+        """Test migrating a JSON tree to JSONL and back preserves parsed data."""
+        repo = StorageRepository(tmp_path)
+        repo.save_entry(_bench_entry(630, {"weight": 185}))
+        repo.save_entry(_bench_entry(1080, {"distance": 5}))
+        repo.close()
+        parsed_dir = tmp_path / "logs" / "parsed" / "2026" / "01"
+        expected = json.loads((parsed_dir / "2026-01-01.json").read_text())
+
+        assert repo.migrate_parsed_format("jsonl") == 1
+        assert not (parsed_dir / "2026-01-01.json").exists()
+        assert ParsedLog(parsed_dir / "2026-01-01.jsonl").read() == expected
+
+        reopened = StorageRepository(tmp_path)
+        assert reopened.parsed_format == "jsonl"
+        entries = reopened.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        assert [e.parsed_data for e in entries] == [{"weight": 185}, {"distance": 5}]
+
+        assert reopened.migrate_parsed_format("json") == 1
+        assert not (parsed_dir / "2026-01-01.jsonl").exists()
+        assert json.loads((parsed_dir / "2026-01-01.json").read_text()) == expected
+        assert StorageRepository(tmp_path).parsed_format == "json"
+
+    def test_unknown_format_rejected(self, tmp_path: Path) -> None:
+        """Test that an unknown parsed format raises ValueError."""
+        with pytest.raises(ValueError, match="Unknown parsed format"):
+            StorageRepository(tmp_path, parsed_format="xml")  # pyright: ignore[reportArgumentType]
+
+
+def _write_entries(base_path: Path, worker: int, count: int) -> None:
+    """Save `count` entries with distinct minutes on the same day.
+
+    Args:
+        base_path: Storage root shared by all writers.
+        worker: Writer number, used to give each writer its own minutes.
+        count: Number of entries to save.
+    """
+    repo = StorageRepository(base_path)
+    for i in range(count):
+        minute = worker * count + i
+        timestamp = datetime(2026, 1, 1, minute // 60, minute % 60)
+        repo.save_entry(
+            Entry(
+                id=timestamp.strftime("%Y-%m-%d_%H-%M-%S"),
+                date=timestamp.date(),
+                timestamp=timestamp,
+                raw_content=f"Writer {worker} entry {i}",
+                parsed_data={"worker": worker, "i": i},
+            )
+        )
+    repo.close()
+
+
+@pytest.mark.skipif(sys.platform == "win32", reason="fcntl locks are POSIX-only")
+class TestConcurrentWrites:
+    """Stress tests for concurrent writers on the same day file."""
+
+    def _assert_complete(self, base_path: Path, writers: int, count: int) -> None:
+        """Assert every written entry survived in both raw and parsed files."""
+        day = date(2026, 1, 1)
+        entries = StorageRepository(base_path).get_entries_by_date_range(day, day)
+        assert len(entries) == writers * count
+        assert sorted((e.parsed_data or {}).get("worker", -1) for e in entries) == sorted(
+            w for w in range(writers) for _ in range(count)
+        )
+
+        parsed_path = base_path / "logs" / "parsed" / "2026" / "01" / "2026-01-01.json"
+        assert len(json.loads(parsed_path.read_text())) == writers * count
+        assert not ParsedJournal(parsed_path).has_records()
+
+    def test_processes_lose_no_updates(self, tmp_path: Path) -> None:
+        """Test many writer processes appending to the same day."""
+        writers, count = 8, 20
+        ctx = multiprocessing.get_context("fork")
+        processes = [ctx.Process(target=_write_entries, args=(tmp_path, w, count)) for w in range(writers)]
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join(timeout=60)
+            assert process.exitcode == 0
+
+        self._assert_complete(tmp_path, writers, count)
+
+    def test_threads_lose_no_updates(self, tmp_path: Path) -> None:
+        """Test many writer threads appending to the same day."""
+        writers, count = 8, 20
+        threads = [threading.Thread(target=_write_entries, args=(tmp_path, w, count)) for w in range(writers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join(timeout=60)
+
+        self._assert_complete(tmp_path, writers, count)
+
+
+class TestAsyncStorageRepository:
+    """Tests for the async storage facade."""
+
+    @pytest.mark.asyncio
+    async def test_mirrors_sync_api(self, tmp_path: Path) -> None:
+        """Test reads and writes through the facade match the sync repository."""
+        storage = AsyncStorageRepository(StorageRepository(tmp_path))
+        await storage.save_entry(_bench_entry(630, {"exercise": "bench"}))
+        await storage.save_entry(_bench_entry(1080, {"exercise": "run"}))
+        await storage.update_global_context("# Context")
+
+        day = date(2026, 1, 1)
+        by_range = await storage.get_entries_by_date_range(day, day)
+        assert [e.parsed_data for e in by_range] == [{"exercise": "bench"}, {"exercise": "run"}]
+        assert [e.id for e in await storage.search_entries(["1080"])] == ["2026-01-01_18-00-00"]
+        assert len(await storage.get_entries_by_pattern("**/*.md")) == 2
+        assert [e.id async for e in storage.iter_entries(newest_first=True)] == [
+            "2026-01-01_18-00-00",
+            "2026-01-01_10-30-00",
+        ]
+        assert [e.id async for e in storage.iter_search(["630"])] == ["2026-01-01_10-30-00"]
+        assert await storage.get_global_context() == "# Context"
+        await storage.aclose()
+
+    @pytest.mark.asyncio
+    async def test_concurrent_reads_of_same_file_coalesce(self, tmp_path: Path) -> None:
+        """Test overlapping range reads share one read per day file."""
+        repo = StorageRepository(tmp_path)
+        repo.save_entry(_bench_entry(630, {"weight": 185}))
+        storage = AsyncStorageRepository(repo)
+        release = threading.Event()
+        calls: list[Path] = []
+        real_read = repo.read_day_file
+
+        def slow_read(file_path: Path) -> list[Entry]:
+            calls.append(file_path)
+            release.wait(timeout=5)
+            return real_read(file_path)
+
+        day = date(2026, 1, 1)
+        with patch.object(repo, "read_day_file", side_effect=slow_read):
+            tasks = [asyncio.ensure_future(storage.get_entries_by_date_range(day, day)) for _ in range(5)]
+            while not calls:
+                await asyncio.sleep(0.01)
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*tasks)
+
+        assert len(calls) == 1
+        assert storage.coalesced_reads == 4
+        assert all(r[0].parsed_data == {"weight": 185} for r in results)
+        results[0][0].parsed_data = {"weight": 0}
+        assert results[1][0].parsed_data == {"weight": 185}
+        await storage.aclose()
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_does_not_cancel_shared_read(self, tmp_path: Path) -> None:
+        """Test cancelling the first reader leaves joined readers intact."""
+        repo = StorageRepository(tmp_path)
+        repo.save_entry(_bench_entry(630))
+        storage = AsyncStorageRepository(repo)
+        release = threading.Event()
+        real_read = repo.read_day_file
+
+        def slow_read(file_path: Path) -> list[Entry]:
+            release.wait(timeout=5)
+            return real_read(file_path)
+
+        day = date(2026, 1, 1)
+        with patch.object(repo, "read_day_file", side_effect=slow_read):
+            first = asyncio.ensure_future(storage.get_entries_by_date_range(day, day))
+            await asyncio.sleep(0.05)
+            second = asyncio.ensure_future(storage.get_entries_by_date_range(day, day))
+            await asyncio.sleep(0.05)
+            first.cancel()
+            release.set()
+            entries = await second
+
+        assert [e.raw_content for e in entries] == ["Entry 630"]
+        await storage.aclose()
+
+    @pytest.mark.asyncio
+    async def test_read_after_write_sees_write(self, tmp_path: Path) -> None:
+        """Test a read started after save_entry never joins an older read."""
+        storage = AsyncStorageRepository(StorageRepository(tmp_path))
+        day = date(2026, 1, 1)
+        await storage.save_entry(_bench_entry(630))
+        stale = asyncio.ensure_future(storage.get_entries_by_date_range(day, day))
+        await storage.save_entry(_bench_entry(640))
+
+        fresh = await storage.get_entries_by_date_range(day, day)
+
+        assert len(fresh) == 2
+        await stale
+        await storage.aclose()
+
+
+class TestSaveEntries:
+    """Tests for bulk save_entries."""
+
+    @staticmethod
+    def _batch() -> tuple[list[Entry], list[ParserOutput | None]]:
+        """Entries over two days with a correction of an earlier entry."""
+        day2 = Entry(
+            id="2026-01-02_07-00-00",
+            date=date(2026, 1, 2),
+            timestamp=datetime(2026, 1, 2, 7, 0),
+            raw_content="Run 5k",
+            parsed_data={"distance": 5},
+        )
+        correction = create_parser_output(
+            is_correction=True,
+            target_entry_id="2026-01-01_10-30-00",
+            correction_delta={"weight": 185},
+        )
+        entries = [
+            _bench_entry(630, {"weight": 135, "reps": 5}),
+            day2,
+            _bench_entry(700, {"weight": 95}),
+            _bench_entry(705),
+        ]
+        return entries, [None, None, None, correction]
+
+    def test_matches_sequential_saves(self, tmp_path: Path) -> None:
+        """Test files are identical to saving the entries one by one."""
+        entries, corrections = self._batch()
+        sequential = StorageRepository(tmp_path / "sequential")
+        for entry, correction in zip(entries, corrections, strict=True):
+            sequential.save_entry(entry, correction=correction)
+        sequential.close()
+        bulk = StorageRepository(tmp_path / "bulk")
+
+        bulk.save_entries(entries, corrections)
+        bulk.close()
+
+        for day in ("2026-01-01", "2026-01-02"):
+            for kind, suffix in (("raw", ".md"), ("parsed", ".json")):
+                rel = Path("logs") / kind / "2026" / "01" / f"{day}{suffix}"
+                assert (tmp_path / "bulk" / rel).read_text() == (tmp_path / "sequential" / rel).read_text()
+
+        entries_day1 = bulk.get_entries_by_date_range(date(2026, 1, 1), date(2026, 1, 1))
+        assert entries_day1[0].parsed_data == {"weight": 185, "reps": 5}
+
+    def test_one_write_per_day(self, tmp_path: Path) -> None:
+        """Test each day gets one raw append and one parsed write."""
+        entries, corrections = self._batch()
+        repo = StorageRepository(tmp_path)
+
+        with (
+            patch("quilto.storage.repository.append_text", wraps=append_text) as raw_appends,
+            patch.object(
+                ParsedJournal, "append_records", autospec=True, side_effect=ParsedJournal.append_records
+            ) as journal_appends,
+        ):
+            repo.save_entries(entries, corrections)
+
+        assert raw_appends.call_count == 2
+        assert journal_appends.call_count == 2
+
+    def test_jsonl_format(self, tmp_path: Path) -> None:
+        """Test bulk saves append one JSONL write per day."""
+        entries, corrections = self._batch()
+        repo = StorageRepository(tmp_path, parsed_format="jsonl")
+
+        repo.save_entries(entries, corrections)
+
+        log = ParsedLog(tmp_path / "logs" / "parsed" / "2026" / "01" / "2026-01-01.jsonl")
+        assert [r["op"] for r in log.read_records()] == ["set", "set", "update"]
+        assert log.read()["2026-01-01_10-30-00"] == {"weight": 185, "reps": 5}
+
+    def test_length_mismatch(self, tmp_path: Path) -> None:
+        """Test that misaligned corrections are rejected."""
+        with pytest.raises(ValueError, match="one item per entry"):
+            StorageRepository(tmp_path).save_entries([_bench_entry(630)], [])
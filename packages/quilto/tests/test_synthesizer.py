@@ -5,6 +5,7 @@ helper methods, and exports.
 """
 
 import json
+from collections.abc import AsyncIterator
 from pathlib import Path
 from typing import Any
 from unittest.mock import AsyncMock
@@ -1125,3 +1126,63 @@ class TestSynthesizerIntegration:
         # Detailed style should produce longer response
         assert result.response is not None
         assert len(result.response) > 50  # Should be more than a short answer
+
+
+class TestSynthesizeStream:
+    """Tests for streamed synthesis."""
+
+    def _create_input(self, query: str = "How has my bench press progressed?") -> SynthesizerInput:
+        return SynthesizerInput(
+            query=query,
+            query_type=QueryType.INSIGHT,
+            analysis=create_sample_analyzer_output_sufficient(),
+            vocabulary={"pr": "personal record"},
+        )
+
+    @pytest.mark.asyncio
+    async def test_yields_response_text(self) -> None:
+        """Deltas from LLMClient.stream are yielded as they arrive."""
+        client = LLMClient(create_test_config())
+        calls: list[dict[str, Any]] = []
+
+        async def mock_stream(agent: str, messages: list[dict[str, Any]], **kwargs: Any) -> AsyncIterator[str]:
+            calls.append({"agent": agent, "messages": messages})
+            for delta in ("Your bench ", "went up ", "10lb."):
+                yield delta
+
+        client.stream = mock_stream  # type: ignore[method-assign]
+        synthesizer = SynthesizerAgent(client)
+
+        deltas = [delta async for delta in synthesizer.synthesize_stream(self._create_input())]
+
+        assert "".join(deltas) == "Your bench went up 10lb."
+        assert calls[0]["agent"] == "synthesizer"
+        system_prompt = calls[0]["messages"][0]["content"]
+        assert "OUTPUT (PLAIN TEXT)" in system_prompt
+        assert "JSON object" not in system_prompt
+        assert calls[0]["messages"][1] == {"role": "user", "content": "How has my bench press progressed?"}
+
+    def test_stream_prompt_keeps_guidance(self) -> None:
+        """The streaming prompt shares the analysis, style and partial guidance."""
+        synthesizer = SynthesizerAgent(LLMClient(create_test_config()))
+        synthesizer_input = self._create_input().model_copy(update={"is_partial": True})
+
+        prompt = synthesizer.build_stream_prompt(synthesizer_input)
+
+        assert "FINDINGS:" in prompt
+        assert "CONCISE STYLE" in prompt
+        assert "PARTIAL ANSWER REQUIRED" in prompt
+        assert "answer with high confidence" in prompt
+        assert "gaps_disclosed" not in prompt
+
+    @pytest.mark.asyncio
+    async def test_whitespace_only_query_raises_value_error(self) -> None:
+        """Whitespace-only queries are rejected before streaming."""
+        client = LLMClient(create_test_config())
+        client.stream = AsyncMock()  # type: ignore[method-assign]
+        synthesizer = SynthesizerAgent(client)
+
+        with pytest.raises(ValueError, match="query cannot be empty"):
+            async for _ in synthesizer.synthesize_stream(self._create_input(query="   ")):
+                pass
+        client.stream.assert_not_called()
@@ -0,0 +1,372 @@
+"""Unit tests for span tracing of agent calls and LLM requests."""
+
+import asyncio
+import json
+from collections.abc import AsyncIterator, Iterator
+from pathlib import Path
+from typing import Any
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import litellm
+import pytest
+from pydantic import BaseModel
+from quilto.agents import DomainInfo, RouterAgent, RouterInput
+from quilto.llm.client import LLMClient
+from quilto.llm.config import AgentConfig, LLMConfig, ProviderConfig, ResponseCacheConfig, TierModels
+from quilto.tracing import (
+    JsonLinesExporter,
+    RingBufferExporter,
+    Span,
+    Tracer,
+    current_span,
+    get_tracer,
+    set_tracer,
+    traced,
+)
+
+
+def create_test_config(fallback_provider: str | None = None) -> LLMConfig:
+    """Create a test LLMConfig.
+
+    Args:
+        fallback_provider: Optional fallback provider name.
+
+    Returns:
+        Configured LLMConfig for testing.
+    """
+    return LLMConfig(
+        default_provider="ollama",
+        fallback_provider=fallback_provider,  # type: ignore[arg-type]
+        providers={
+            "ollama": ProviderConfig(api_base="http://localhost:11434"),
+            "anthropic": ProviderConfig(api_key="test-key"),
+        },
+        tiers={
+            "low": TierModels(ollama="qwen2.5:7b", anthropic="claude-3-haiku-20240307"),
+            "medium": TierModels(ollama="qwen2.5:14b", anthropic="claude-3-5-haiku-20241022"),
+        },
+        agents={"router": AgentConfig(tier="low")},
+        max_retries=1,
+        base_retry_delay=0.01,
+    )
+
+
+def mock_completion(content: str, prompt_tokens: int = 12, completion_tokens: int = 5) -> MagicMock:
+    """Build a litellm completion response with content and usage."""
+    response = MagicMock()
+    response.choices = [MagicMock(message=MagicMock(content=content))]
+    response.usage = MagicMock(
+        prompt_tokens=prompt_tokens,
+        completion_tokens=completion_tokens,
+        total_tokens=prompt_tokens + completion_tokens,
+    )
+    return response
+
+
+@pytest.fixture
+def buffer() -> Iterator[RingBufferExporter]:
+    """Install a tracer exporting to a ring buffer for the test."""
+    original = get_tracer()
+    exporter = RingBufferExporter()
+    set_tracer(Tracer([exporter]))
+    yield exporter
+    set_tracer(original)
+
+
+def spans_named(buffer: RingBufferExporter, name: str) -> list[Span]:
+    """Get the buffered spans with the given name."""
+    return [span for span in buffer.spans() if span.name == name]
+
+
+class TestTracer:
+    """Test span creation, nesting and errors."""
+
+    def test_nested_spans_share_trace(self, buffer: RingBufferExporter) -> None:
+        """A span opened inside another is its child in the same trace."""
+        tracer = get_tracer()
+        with tracer.span("outer") as outer:
+            with tracer.span("inner", "llm", model="m") as inner:
+                assert current_span() is inner
+            assert current_span() is outer
+        assert current_span() is None
+
+        finished = buffer.spans()
+        assert [span.name for span in finished] == ["inner", "outer"]
+        assert inner.trace_id == outer.trace_id
+        assert inner.parent_id == outer.span_id
+        assert outer.parent_id is None
+        assert inner.kind == "llm"
+        assert inner.attributes == {"model": "m"}
+        assert outer.duration_ms is not None and outer.duration_ms >= 0
+
+    def test_separate_roots_get_separate_traces(self, buffer: RingBufferExporter) -> None:
+        """Spans opened outside any span start new traces."""
+        with get_tracer().span("a") as a:
+            pass
+        with get_tracer().span("b") as b:
+            pass
+        assert a.trace_id != b.trace_id
+        assert buffer.spans(trace_id=a.trace_id) == [a]
+
+    def test_error_recorded_and_reraised(self, buffer: RingBufferExporter) -> None:
+        """An exception marks the span as failed and still propagates."""
+        with pytest.raises(RuntimeError), get_tracer().span("failing"):
+            raise RuntimeError("boom")
+
+        (span,) = buffer.spans()
+        assert span.status == "error"
+        assert span.error == "RuntimeError: boom"
+
+    def test_failing_exporter_does_not_break_traced_code(self, buffer: RingBufferExporter) -> None:
+        """Exporter errors are logged, not raised."""
+        broken = MagicMock()
+        broken.export.side_effect = OSError("disk full")
+        get_tracer().exporters.insert(0, broken)
+
+        with get_tracer().span("work"):
+            pass
+
+        assert len(buffer.spans()) == 1
+
+    def test_add_accumulates(self) -> None:
+        """Span.add starts from 0 and accumulates."""
+        span = Tracer().start_span("s")
+        span.add("chunks")
+        span.add("chunks", 2)
+        assert span.attributes["chunks"] == 3
+
+    @pytest.mark.asyncio
+    async def test_traced_decorator_nests_across_gather(self, buffer: RingBufferExporter) -> None:
+        """Spans of concurrent tasks are children of the span that started them."""
+
+        @traced("child")
+        async def child() -> int:
+            await asyncio.sleep(0)
+            return 1
+
+        @traced("parent")
+        async def parent() -> list[int]:
+            return list(await asyncio.gather(child(), child()))
+
+        assert await parent() == [1, 1]
+
+        (root,) = spans_named(buffer, "parent")
+        children = spans_named(buffer, "child")
+        assert len(children) == 2
+        assert all(span.parent_id == root.span_id for span in children)
+        assert root.kind == "agent"
+
+
+class TestExporters:
+    """Test the ring buffer and JSON lines exporters."""
+
+    def test_ring_buffer_drops_oldest(self) -> None:
+        """Only the most recent spans are kept."""
+        exporter = RingBufferExporter(capacity=2)
+        tracer = Tracer([exporter])
+        for name in ("a", "b", "c"):
+            with tracer.span(name):
+                pass
+        assert [span.name for span in exporter.spans()] == ["b", "c"]
+
+        exporter.clear()
+        assert exporter.spans() == []
+
+    def test_ring_buffer_rejects_zero_capacity(self) -> None:
+        """Capacity must be at least 1."""
+        with pytest.raises(ValueError, match="capacity must be >= 1"):
+            RingBufferExporter(capacity=0)
+
+    def test_json_lines_written(self, tmp_path: Path) -> None:
+        """Each span is appended as one JSON object per line."""
+        path = tmp_path / "traces" / "spans.jsonl"
+        exporter = JsonLinesExporter(path)
+        tracer = Tracer([exporter])
+        with tracer.span("outer"), tracer.span("inner", "llm", prompt_tokens=3):
+            pass
+        exporter.close()
+        with tracer.span("after close"):
+            pass
+
+        records = [json.loads(line) for line in path.read_text().splitlines()]
+        assert [record["name"] for record in records] == ["inner", "outer"]
+        assert records[0]["attributes"] == {"prompt_tokens": 3}
+        assert records[0]["parent_id"] == records[1]["span_id"]
+        assert records[0]["status"] == "ok"
+
+
+class TestAgentSpans:
+    """Test that agent calls are traced."""
+
+    @pytest.mark.asyncio
+    async def test_router_classify_traced(self, buffer: RingBufferExporter) -> None:
+        """RouterAgent.classify records an agent span."""
+        client = LLMClient(create_test_config())
+        response = {
+            "input_type": "LOG",
+            "confidence": 0.9,
+            "selected_domains": ["strength"],
+            "domain_selection_reasoning": "bench press",
+            "reasoning": "declarative",
+        }
+
+        async def mock_complete_structured(
+            agent: str, messages: list[dict[str, Any]], response_model: type[BaseModel], **kwargs: Any
+        ) -> BaseModel:
+            return response_model.model_validate_json(json.dumps(response))
+
+        client.complete_structured = AsyncMock(side_effect=mock_complete_structured)  # type: ignore[method-assign]
+        domains = [DomainInfo(name="strength", description="Strength training")]
+
+        await RouterAgent(client).classify(RouterInput(raw_input="Bench 185x5", available_domains=domains))
+
+        (span,) = spans_named(buffer, "RouterAgent.classify")
+        assert span.kind == "agent"
+        assert span.status == "ok"
+
+
+class TestLLMClientSpans:
+    """Test that LLMClient requests are traced."""
+
+    @pytest.mark.asyncio
+    async def test_complete_records_model_and_tokens(self, buffer: RingBufferExporter) -> None:
+        """A request span carries the model and the reported token usage."""
+        client = LLMClient(create_test_config())
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hello!", prompt_tokens=12, completion_tokens=5)
+            await client.complete("router", [{"role": "user", "content": "Hi"}])
+
+        (span,) = spans_named(buffer, "LLMClient.complete")
+        assert span.kind == "llm"
+        attributes = span.attributes
+        assert attributes["agent"] == "router"
+        assert attributes["provider"] == "ollama"
+        assert attributes["model"] == "ollama/qwen2.5:7b"
+        assert attributes["prompt_tokens"] == 12
+        assert attributes["completion_tokens"] == 5
+        assert attributes["total_tokens"] == 17
+        assert attributes["cache_hit"] is False
+        assert attributes["fallback"] is False
+
+    @pytest.mark.asyncio
+    async def test_cache_hit_recorded(self, buffer: RingBufferExporter, tmp_path: Path) -> None:
+        """A request answered from the cache is marked as a cache hit."""
+        config = create_test_config()
+        config.cache = ResponseCacheConfig(enabled=True, path=tmp_path / "llm-cache.sqlite")
+        client = LLMClient(config)
+        messages = [{"role": "user", "content": "Hi"}]
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hello!")
+            await client.complete("router", messages)
+            await client.complete("router", messages)
+
+        first, second = spans_named(buffer, "LLMClient.complete")
+        assert first.attributes["cache_hit"] is False
+        assert second.attributes["cache_hit"] is True
+        assert "total_tokens" not in second.attributes
+
+    @pytest.mark.asyncio
+    async def test_failed_request_recorded_as_error(self, buffer: RingBufferExporter) -> None:
+        """A request that raises produces an error span."""
+        client = LLMClient(create_test_config())
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.side_effect = litellm.exceptions.Timeout(
+                message="timeout", model="test", llm_provider="ollama"
+            )
+            with pytest.raises(litellm.exceptions.Timeout):
+                await client.complete("router", [{"role": "user", "content": "Hi"}])
+
+        (span,) = spans_named(buffer, "LLMClient.complete")
+        assert span.status == "error"
+        assert span.error is not None and span.error.startswith("Timeout")
+
+    @pytest.mark.asyncio
+    async def test_cascade_records_retries_and_fallback(self, buffer: RingBufferExporter) -> None:
+        """The cascade span records providers, retries and fallback use."""
+        client = LLMClient(create_test_config(fallback_provider="anthropic"))
+
+        async def mock_acompletion(**kwargs: Any) -> MagicMock:
+            if kwargs["model"].startswith("ollama/"):
+                raise litellm.exceptions.Timeout(message="timeout", model="test", llm_provider="ollama")
+            return mock_completion("Fallback!")
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", side_effect=mock_acompletion),
+            patch("quilto.llm.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "Hi"}])
+
+        assert result == "Fallback!"
+        (cascade,) = spans_named(buffer, "LLMClient.complete_with_cascade")
+        assert cascade.kind == "llm"
+        assert cascade.attributes["providers"] == ["ollama", "anthropic"]
+        assert cascade.attributes["fallback_used"] is True
+        assert cascade.attributes["attempts"] == 2
+        assert cascade.attributes["retries"] == 0
+        assert cascade.attributes["agent"] == "router"
+        assert cascade.attributes["degraded"] is False
+
+        requests = spans_named(buffer, "LLMClient.complete")
+        assert [span.attributes["provider"] for span in requests] == ["ollama", "anthropic"]
+        assert [span.status for span in requests] == ["error", "ok"]
+        assert all(span.parent_id == cascade.span_id for span in requests)
+        assert requests[1].attributes["fallback"] is True
+
+    @pytest.mark.asyncio
+    async def test_cascade_without_fallback_use(self, buffer: RingBufferExporter) -> None:
+        """A cascade answered by the primary does not report fallback use."""
+        client = LLMClient(create_test_config(fallback_provider="anthropic"))
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = mock_completion("Hi!")
+            await client.complete_with_cascade("router", [{"role": "user", "content": "Hi"}])
+
+        (cascade,) = spans_named(buffer, "LLMClient.complete_with_cascade")
+        assert cascade.attributes["providers"] == ["ollama"]
+        assert cascade.attributes["fallback_used"] is False
+
+    @pytest.mark.asyncio
+    async def test_cascade_records_degradation(self, buffer: RingBufferExporter) -> None:
+        """A cascade returning a PartialResult is marked as degraded."""
+        client = LLMClient(create_test_config(fallback_provider="anthropic"))
+
+        with (
+            patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion,
+            patch("quilto.llm.client.asyncio.sleep", new_callable=AsyncMock),
+        ):
+            mock_acompletion.side_effect = litellm.exceptions.Timeout(
+                message="timeout", model="test", llm_provider="ollama"
+            )
+            result = await client.complete_with_cascade("router", [{"role": "user", "content": "Hi"}])
+
+        assert not isinstance(result, str)
+        (cascade,) = spans_named(buffer, "LLMClient.complete_with_cascade")
+        assert cascade.status == "ok"
+        assert cascade.attributes["degraded"] is True
+        assert cascade.attributes["fallback_used"] is True
+
+    @pytest.mark.asyncio
+    async def test_stream_span(self, buffer: RingBufferExporter) -> None:
+        """A stream is recorded as one span ending when the stream does."""
+        client = LLMClient(create_test_config())
+
+        def chunk(content: str | None, usage: MagicMock | None = None) -> MagicMock:
+            return MagicMock(choices=[MagicMock(delta=MagicMock(content=content))], usage=usage)
+
+        async def fake_stream() -> AsyncIterator[MagicMock]:
+            yield chunk("Hel")
+            yield chunk("lo", MagicMock(prompt_tokens=4, completion_tokens=2, total_tokens=6))
+
+        with patch("quilto.llm.client.litellm.acompletion", new_callable=AsyncMock) as mock_acompletion:
+            mock_acompletion.return_value = fake_stream()
+            deltas = [delta async for delta in client.stream("router", [{"role": "user", "content": "Hi"}])]
+
+        assert deltas == ["Hel", "lo"]
+        (span,) = spans_named(buffer, "LLMClient.stream")
+        assert span.status == "ok"
+        assert span.attributes["model"] == "ollama/qwen2.5:7b"
+        assert span.attributes["chunks"] == 2
+        assert span.attributes["total_tokens"] == 6
@@ -2,17 +2,27 @@
 
 from swealog.api.app import app
 from swealog.api.models import (
+    BatchInputItem,
+    BatchInputItemResponse,
+    BatchInputRequest,
+    BatchInputResponse,
     ErrorResponse,
     InputRequest,
     InputResponse,
+    InputStatusResponse,
     QueryRequest,
     QueryResponse,
 )
 
 __all__ = [
+    "BatchInputItem",
+    "BatchInputItemResponse",
+    "BatchInputRequest",
+    "BatchInputResponse",
     "ErrorResponse",
     "InputRequest",
     "InputResponse",
+    "InputStatusResponse",
     "QueryRequest",
     "QueryResponse",
     "app",
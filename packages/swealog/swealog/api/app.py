@@ -1,34 +1,90 @@
-"""FastAPI application with middleware and health endpoint."""
+"""FastAPI application with middleware, health and metrics endpoints."""
 
 import logging
-from collections.abc import AsyncIterator
+import time
+from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 
-from fastapi import FastAPI, Request
+from fastapi import FastAPI, Request, Response
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 from pydantic import ValidationError
-
-from swealog.api.dependencies import ConfigNotFoundError
+from quilto import AsyncStorageRepository, LLMClient
+from quilto.tracing import get_tracer
+
+from swealog.api.dependencies import (
+    ConfigNotFoundError,
+    create_llm_client,
+    create_parse_queue,
+    create_storage,
+    get_domains,
+    get_metrics,
+)
+from swealog.api.metrics import CONTENT_TYPE, ApiMetrics
 from swealog.api.models import ErrorResponse
+from swealog.api.parse_queue import ParseJob, ParseQueue
 from swealog.api.routes import input_router, query_router
+from swealog.api.routes.input import parse_log_entries
 
 logger = logging.getLogger(__name__)
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+async def lifespan(app: FastAPI) -> AsyncGenerator[None]:
     """Application lifespan manager for startup/shutdown.
 
+    Creates the storage repository, its async facade, the LLM client and
+    the parse queue once per process and keeps them on app.state, so
+    caches and pooled connections survive across requests, and starts the
+    parse workers. A missing LLM config does not block startup; requests
+    needing the client (and parse jobs, which are retried) fail with a
+    configuration error until it exists. The app's metrics are registered
+    as a span exporter so LLM requests show up on /metrics. Everything is
+    closed on shutdown.
+
     Args:
         app: FastAPI application instance.
 
     Yields:
         Nothing. Context manager for startup/shutdown lifecycle.
     """
-    # Startup: resources can be initialized here
-    yield
-    # Shutdown: cleanup can be done here
+    storage = create_storage()
+    app.state.storage = storage
+    app.state.async_storage = AsyncStorageRepository(storage)
+    try:
+        app.state.llm_client = create_llm_client()
+    except ConfigNotFoundError as e:
+        logger.warning("LLM client not created at startup: %s", e)
+        app.state.llm_client = None
+    tracer = get_tracer()
+    metrics: ApiMetrics = app.state.metrics
+    tracer.exporters.append(metrics)
+
+    async def parse_jobs(jobs: list[ParseJob]) -> list[Exception | None]:
+        llm_client: LLMClient | None = app.state.llm_client
+        if llm_client is None:
+            llm_client = app.state.llm_client = create_llm_client()
+        return await parse_log_entries(jobs, llm_client, app.state.async_storage, get_domains())
+
+    parse_queue = create_parse_queue()
+    app.state.parse_queue = parse_queue
+    parse_queue.start(parse_jobs)
+
+    try:
+        yield
+    finally:
+        await parse_queue.stop()
+        parse_queue.close()
+        app.state.parse_queue = None
+        if metrics in tracer.exporters:
+            tracer.exporters.remove(metrics)
+        llm_client: LLMClient | None = app.state.llm_client
+        if llm_client is not None:
+            await llm_client.aclose()
+        await app.state.async_storage.aclose()
+        app.state.llm_client = None
+        app.state.async_storage = None
+        app.state.storage = None
 
 
 app = FastAPI(
@@ -37,6 +93,7 @@ app = FastAPI(
     version="0.1.0",
     lifespan=lifespan,
 )
+app.state.metrics = ApiMetrics()
 
 # CORS middleware for development
 app.add_middleware(
@@ -48,6 +105,32 @@ app.add_middleware(
 )
 
 
+@app.middleware("http")
+async def record_request_metrics(request: Request, call_next: Callable[[Request], Awaitable[Response]]) -> Response:
+    """Record the count and latency of every request by route template.
+
+    Latency is measured until the response starts, so streaming
+    responses are not held open by the measurement.
+
+    Args:
+        request: The incoming request.
+        call_next: The rest of the middleware stack.
+
+    Returns:
+        The response.
+    """
+    start = time.perf_counter()
+    status = 500
+    try:
+        response = await call_next(request)
+        status = response.status_code
+        return response
+    finally:
+        route = getattr(request.scope.get("route"), "path", None) or "unmatched"
+        metrics: ApiMetrics = request.app.state.metrics
+        metrics.observe_request(request.method, route, status, time.perf_counter() - start)
+
+
 @app.exception_handler(ValueError)
 async def value_error_handler(request: Request, exc: ValueError) -> JSONResponse:
     """Handle ValueError exceptions.
@@ -122,6 +205,27 @@ async def health_check() -> dict[str, str]:
     return {"status": "ok"}
 
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics_endpoint(request: Request) -> Response:
+    """Prometheus metrics endpoint.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        Metrics in the Prometheus text exposition format.
+    """
+    state = request.app.state
+    metrics = await get_metrics(request)
+    parse_queue: ParseQueue | None = getattr(state, "parse_queue", None)
+    text = metrics.render(
+        llm_client=getattr(state, "llm_client", None),
+        storage=getattr(state, "async_storage", None),
+        parse_jobs=await parse_queue.counts() if parse_queue is not None else None,
+    )
+    return Response(content=text, media_type=CONTENT_TYPE)
+
+
 # Include routers - endpoints define their own paths (/input, /query)
 app.include_router(input_router, tags=["input"])
 app.include_router(query_router, tags=["query"])
@@ -1,10 +1,15 @@
 """FastAPI dependency injection for LLM client, storage, and domains."""
 
+from concurrent.futures import ThreadPoolExecutor
 from functools import lru_cache
 from pathlib import Path
+from typing import Annotated
 
-from quilto import DomainModule, LLMClient, LLMConfig, StorageRepository, load_llm_config
+from fastapi import Depends, Request
+from quilto import AsyncStorageRepository, DomainModule, LLMClient, LLMConfig, StorageRepository, load_llm_config
 
+from swealog.api.metrics import ApiMetrics
+from swealog.api.parse_queue import ParseQueue
 from swealog.domains import (
     general_fitness,
     nutrition,
@@ -34,18 +39,21 @@ def get_llm_config() -> LLMConfig:
     return load_llm_config(config_path)
 
 
-def get_llm_client() -> LLMClient:
-    """Get LLM client instance.
+def create_llm_client() -> LLMClient:
+    """Create an LLM client from the configuration file.
 
     Returns:
         Configured LLMClient.
+
+    Raises:
+        ConfigNotFoundError: If config file does not exist.
     """
     config = get_llm_config()
     return LLMClient(config)
 
 
-def get_storage() -> StorageRepository:
-    """Get storage repository instance.
+def create_storage() -> StorageRepository:
+    """Create the storage repository, creating ./logs if needed.
 
     Returns:
         StorageRepository configured with ./logs path.
@@ -55,6 +63,132 @@ def get_storage() -> StorageRepository:
     return StorageRepository(base_path=storage_path)
 
 
+def create_parse_queue() -> ParseQueue:
+    """Create the parse queue stored in ./logs, creating it if needed.
+
+    Returns:
+        ParseQueue backed by logs/parse-queue.sqlite.
+    """
+    return ParseQueue(Path("logs") / "parse-queue.sqlite")
+
+
+async def get_llm_client(request: Request) -> LLMClient:
+    """Get the process-wide LLM client.
+
+    The client is created by the app lifespan and kept on app.state. If
+    the lifespan did not run (or the config was missing at startup) it is
+    created on first use and kept for later requests.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The shared LLMClient.
+
+    Raises:
+        ConfigNotFoundError: If config file does not exist.
+    """
+    state = request.app.state
+    llm_client: LLMClient | None = getattr(state, "llm_client", None)
+    if llm_client is None:
+        llm_client = state.llm_client = create_llm_client()
+    return llm_client
+
+
+async def get_storage(request: Request) -> StorageRepository:
+    """Get the process-wide storage repository.
+
+    The repository is created by the app lifespan and kept on app.state,
+    so its caches and index connection survive across requests. If the
+    lifespan did not run it is created on first use.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The shared StorageRepository.
+    """
+    state = request.app.state
+    storage: StorageRepository | None = getattr(state, "storage", None)
+    if storage is None:
+        storage = state.storage = create_storage()
+    return storage
+
+
+@lru_cache
+def get_storage_executor() -> ThreadPoolExecutor:
+    """Get the thread pool for storage facades created outside the lifespan (cached).
+
+    Returns:
+        Bounded ThreadPoolExecutor shared by those facades.
+    """
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="swealog-storage")
+
+
+async def get_async_storage(
+    request: Request,
+    storage: Annotated[StorageRepository, Depends(get_storage)],
+) -> AsyncStorageRepository:
+    """Get the async storage facade used by routes.
+
+    Returns the shared facade on app.state when it wraps the resolved
+    repository, so concurrent requests coalesce their reads. When
+    get_storage is overridden (e.g. in tests) the override is wrapped on
+    the shared storage thread pool instead.
+
+    Args:
+        request: The incoming request.
+        storage: Storage repository to wrap.
+
+    Returns:
+        AsyncStorageRepository over the storage repository.
+    """
+    state = request.app.state
+    async_storage: AsyncStorageRepository | None = getattr(state, "async_storage", None)
+    if async_storage is not None and async_storage.storage is storage:
+        return async_storage
+    async_storage = AsyncStorageRepository(storage, executor=get_storage_executor())
+    if storage is getattr(state, "storage", None):
+        state.async_storage = async_storage
+    return async_storage
+
+
+async def get_parse_queue(request: Request) -> ParseQueue:
+    """Get the process-wide parse queue.
+
+    The queue and its workers are created by the app lifespan. If the
+    lifespan did not run the queue is opened on first use; entries queued
+    then are parsed once an app with workers starts.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The shared ParseQueue.
+    """
+    state = request.app.state
+    parse_queue: ParseQueue | None = getattr(state, "parse_queue", None)
+    if parse_queue is None:
+        parse_queue = state.parse_queue = create_parse_queue()
+    return parse_queue
+
+
+async def get_metrics(request: Request) -> ApiMetrics:
+    """Get the app's metrics collector.
+
+    Args:
+        request: The incoming request.
+
+    Returns:
+        The ApiMetrics kept on app.state, created on first use if missing.
+    """
+    state = request.app.state
+    metrics: ApiMetrics | None = getattr(state, "metrics", None)
+    if metrics is None:
+        metrics = state.metrics = ApiMetrics()
+    return metrics
+
+
 def get_domains() -> list[DomainModule]:
     """Get all available domain modules.
 
@@ -0,0 +1,371 @@
+"""Prometheus metrics for the Swealog API.
+
+Metrics are rendered in the Prometheus text exposition format (0.0.4)
+by GET /metrics, so a stock Prometheus can scrape the API directly.
+
+Sources:
+- HTTP requests, recorded by the app's middleware per route template.
+- LLM requests and cascades, recorded from the quilto tracing spans
+  (ApiMetrics is a span exporter registered by the app lifespan).
+- Gauges read at scrape time: parse queue jobs, storage read cache,
+  LLM response cache and circuit breaker state.
+"""
+
+import math
+import threading
+from bisect import bisect_left
+from collections import Counter
+from collections.abc import Mapping, Sequence
+from typing import get_args
+
+from quilto import AsyncStorageRepository, LLMClient
+from quilto.llm import CircuitState
+from quilto.tracing import Span
+
+from swealog.api.parse_queue import JobStatus
+
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+# Seconds; HTTP requests include whole query pipelines, LLM calls can take a minute
+DEFAULT_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0)
+
+_LLM_REQUEST_SPANS = ("LLMClient.complete", "LLMClient.stream")
+_LLM_CASCADE_SPANS = ("LLMClient.complete_with_cascade", "LLMClient.complete_structured_with_cascade")
+
+Labels = tuple[str, ...]
+
+
+class _Histogram:
+    """Bucket counts, sum and count of observed values."""
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        """Initialize an empty histogram.
+
+        Args:
+            buckets: Bucket upper bounds, ascending.
+        """
+        self.buckets = buckets
+        # Last slot counts values above every bucket (+Inf)
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float) -> None:
+        """Count a value in the first bucket whose bound is >= value.
+
+        Args:
+            value: Observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+
+def _escape(value: str) -> str:
+    """Escape a label value for the text format."""
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_value(value: float) -> str:
+    """Format a sample value for the text format."""
+    if math.isinf(value):
+        return "+Inf" if value > 0 else "-Inf"
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Writer:
+    """Builds a text format exposition one metric family at a time."""
+
+    def __init__(self) -> None:
+        self.lines: list[str] = []
+
+    def family(self, name: str, kind: str, help_text: str) -> None:
+        """Write the HELP and TYPE lines that start a metric family.
+
+        Args:
+            name: Metric family name.
+            kind: Metric type (e.g. "counter", "gauge", "histogram").
+            help_text: Description for the HELP line.
+        """
+        self.lines.append(f"# HELP {name} {help_text}")
+        self.lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, labels: Mapping[str, str], value: float) -> None:
+        """Write one sample line.
+
+        Args:
+            name: Sample name (the family name, or e.g. its _bucket series).
+            labels: Label names to values; escaped when written.
+            value: Sample value.
+        """
+        if labels:
+            rendered = ",".join(f'{key}="{_escape(val)}"' for key, val in labels.items())
+            self.lines.append(f"{name}{{{rendered}}} {_format_value(value)}")
+        else:
+            self.lines.append(f"{name} {_format_value(value)}")
+
+    def counter(self, name: str, help_text: str, names: Labels, values: Mapping[Labels, float]) -> None:
+        """Write a counter family with one sample per label set.
+
+        Args:
+            name: Metric family name.
+            help_text: Description for the HELP line.
+            names: Label names, in the order of each label tuple.
+            values: Counter value per label tuple; written sorted.
+        """
+        self.family(name, "counter", help_text)
+        for labels, value in sorted(values.items()):
+            self.sample(name, dict(zip(names, labels, strict=True)), value)
+
+    def histogram(self, name: str, help_text: str, names: Labels, values: Mapping[Labels, _Histogram]) -> None:
+        """Write a histogram family with cumulative buckets, sum and count.
+
+        Args:
+            name: Metric family name.
+            help_text: Description for the HELP line.
+            names: Label names, in the order of each label tuple.
+            values: Histogram per label tuple; written sorted.
+        """
+        self.family(name, "histogram", help_text)
+        for labels, histogram in sorted(values.items()):
+            base = dict(zip(names, labels, strict=True))
+            cumulative = 0
+            for bound, count in zip([*histogram.buckets, math.inf], histogram.counts, strict=True):
+                cumulative += count
+                self.sample(f"{name}_bucket", {**base, "le": _format_value(bound)}, cumulative)
+            self.sample(f"{name}_sum", base, histogram.sum)
+            self.sample(f"{name}_count", base, histogram.count)
+
+    def render(self) -> str:
+        """Join the written lines.
+
+        Returns:
+            The exposition text, ending with a newline.
+        """
+        return "\n".join(self.lines) + "\n"
+
+
+class ApiMetrics:
+    """Collects API and LLM metrics and renders them for Prometheus.
+
+    Counters are process-local and reset on restart, as Prometheus
+    expects. Recording is thread-safe: spans can finish on storage
+    worker threads as well as on the event loop.
+
+    Attributes:
+        buckets: Histogram bucket upper bounds in seconds.
+
+    Example:
+        >>> metrics = ApiMetrics()
+        >>> get_tracer().exporters.append(metrics)
+        >>> metrics.observe_request("POST", "/input", 200, 0.42)
+        >>> text = metrics.render()
+    """
+
+    def __init__(self, buckets: Sequence[float] = DEFAULT_BUCKETS) -> None:
+        """Initialize empty metrics.
+
+        Args:
+            buckets: Histogram bucket upper bounds in seconds, ascending.
+
+        Raises:
+            ValueError: If buckets are empty or not strictly ascending.
+        """
+        if not buckets or any(a >= b for a, b in zip(buckets, buckets[1:], strict=False)):
+            raise ValueError("buckets must be non-empty and strictly ascending")
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self._http_requests: Counter[Labels] = Counter()
+        self._http_latency: dict[Labels, _Histogram] = {}
+        self._llm_requests: Counter[Labels] = Counter()
+        self._llm_latency: dict[Labels, _Histogram] = {}
+        self._llm_tokens: Counter[Labels] = Counter()
+        self._llm_retries: Counter[Labels] = Counter()
+        self._llm_fallbacks: Counter[Labels] = Counter()
+        self._llm_degraded: Counter[Labels] = Counter()
+
+    def _observe(self, histograms: dict[Labels, _Histogram], labels: Labels, seconds: float) -> None:
+        """Record a latency, creating the label set's histogram on first use.
+
+        Callers hold the lock.
+
+        Args:
+            histograms: Histograms of one metric, by label tuple.
+            labels: Label tuple of the observation.
+            seconds: Observed latency.
+        """
+        histogram = histograms.get(labels)
+        if histogram is None:
+            histogram = histograms[labels] = _Histogram(self.buckets)
+        histogram.observe(seconds)
+
+    def observe_request(self, method: str, route: str, status: int, seconds: float) -> None:
+        """Record a handled HTTP request.
+
+        Args:
+            method: HTTP method.
+            route: Route template (e.g. "/input"), not the raw path, to
+                keep label cardinality bounded.
+            status: Response status code.
+            seconds: Time until the response started.
+        """
+        with self._lock:
+            self._http_requests[(method, route, str(status))] += 1
+            self._observe(self._http_latency, (method, route), seconds)
+
+    def export(self, span: Span) -> None:
+        """Record a finished LLM request or cascade span.
+
+        Other spans are ignored. Responses served from the cache count as
+        requests but are left out of the latency histogram.
+
+        Args:
+            span: The finished span.
+        """
+        attributes = span.attributes
+        agent = str(attributes.get("agent", "unknown"))
+        if span.name in _LLM_REQUEST_SPANS:
+            provider = str(attributes.get("provider", "unknown"))
+            if span.status == "error":
+                outcome = "error"
+            elif attributes.get("cache_hit"):
+                outcome = "cache_hit"
+            else:
+                outcome = "ok"
+            with self._lock:
+                self._llm_requests[(agent, provider, outcome)] += 1
+                if outcome != "cache_hit" and span.duration_ms is not None:
+                    self._observe(self._llm_latency, (agent, provider), span.duration_ms / 1000)
+                for token_type in ("prompt", "completion"):
+                    tokens = attributes.get(f"{token_type}_tokens")
+                    if isinstance(tokens, int):
+                        self._llm_tokens[(agent, provider, token_type)] += tokens
+        elif span.name in _LLM_CASCADE_SPANS:
+            with self._lock:
+                self._llm_retries[(agent,)] += int(attributes.get("retries", 0))
+                self._llm_fallbacks[(agent,)] += int(bool(attributes.get("fallback_used")))
+                self._llm_degraded[(agent,)] += int(bool(attributes.get("degraded")))
+
+    def render(
+        self,
+        llm_client: LLMClient | None = None,
+        storage: AsyncStorageRepository | None = None,
+        parse_jobs: dict[JobStatus, int] | None = None,
+    ) -> str:
+        """Render all metrics in the Prometheus text format.
+
+        Args:
+            llm_client: Client to read response cache and circuit breaker
+                state from, if one exists.
+            storage: Storage to read read-cache counters from, if one exists.
+            parse_jobs: Parse job counts per status (see ParseQueue.counts),
+                if a parse queue exists.
+
+        Returns:
+            The exposition text.
+        """
+        writer = _Writer()
+        with self._lock:
+            writer.counter(
+                "swealog_http_requests_total",
+                "HTTP requests handled, by route and status.",
+                ("method", "route", "status"),
+                self._http_requests,
+            )
+            writer.histogram(
+                "swealog_http_request_duration_seconds",
+                "Time until the HTTP response started.",
+                ("method", "route"),
+                self._http_latency,
+            )
+            writer.counter(
+                "swealog_llm_requests_total",
+                "LLM requests by agent, provider and outcome (ok, error, cache_hit).",
+                ("agent", "provider", "outcome"),
+                self._llm_requests,
+            )
+            writer.histogram(
+                "swealog_llm_request_duration_seconds",
+                "Latency of LLM requests that reached a provider.",
+                ("agent", "provider"),
+                self._llm_latency,
+            )
+            writer.counter(
+                "swealog_llm_tokens_total",
+                "Tokens reported by providers, by agent, provider and type.",
+                ("agent", "provider", "type"),
+                self._llm_tokens,
+            )
+            writer.counter(
+                "swealog_llm_retries_total",
+                "Retries made by LLM cascades.",
+                ("agent",),
+                self._llm_retries,
+            )
+            writer.counter(
+                "swealog_llm_fallbacks_total",
+                "LLM cascades that used the fallback provider.",
+                ("agent",),
+                self._llm_fallbacks,
+            )
+            writer.counter(
+                "swealog_llm_degraded_total",
+                "LLM cascades that gave up with a PartialResult.",
+                ("agent",),
+                self._llm_degraded,
+            )
+
+        if parse_jobs is not None:
+            _render_parse_queue(writer, parse_jobs)
+        if storage is not None:
+            _render_storage_cache(writer, storage)
+        if llm_client is not None:
+            _render_llm_client(writer, llm_client)
+        return writer.render()
+
+
+def _render_parse_queue(writer: _Writer, counts: dict[JobStatus, int]) -> None:
+    """Add the parse queue depth and job counts."""
+    writer.family("swealog_parse_queue_depth", "gauge", "Log entries waiting for or being parsed.")
+    writer.sample("swealog_parse_queue_depth", {}, counts["queued"] + counts["running"])
+    writer.family("swealog_parse_jobs", "gauge", "Parse jobs by status; dead jobs gave up after retries.")
+    for status, count in counts.items():
+        writer.sample("swealog_parse_jobs", {"status": status}, count)
+
+
+def _render_storage_cache(writer: _Writer, storage: AsyncStorageRepository) -> None:
+    """Add the storage read cache counters."""
+    stats = storage.cache_stats()
+    writer.family("swealog_storage_cache_hits_total", "counter", "Storage reads answered from the cache.")
+    writer.sample("swealog_storage_cache_hits_total", {}, stats.hits)
+    writer.family("swealog_storage_cache_misses_total", "counter", "Storage reads that missed the cache.")
+    writer.sample("swealog_storage_cache_misses_total", {}, stats.misses)
+    writer.family("swealog_storage_cache_hit_ratio", "gauge", "Fraction of storage reads answered from the cache.")
+    writer.sample("swealog_storage_cache_hit_ratio", {}, stats.hit_ratio)
+    writer.family("swealog_storage_cache_bytes", "gauge", "Size of the files held in the storage cache.")
+    writer.sample("swealog_storage_cache_bytes", {}, stats.bytes)
+
+
+def _render_llm_client(writer: _Writer, llm_client: LLMClient) -> None:
+    """Add the LLM response cache and circuit breaker state."""
+    cache = llm_client.cache_stats()
+    if cache is not None:
+        hits: dict[Labels, float] = {(agent,): count for agent, count in cache.agent_hits.items()}
+        misses: dict[Labels, float] = {(agent,): count for agent, count in cache.agent_misses.items()}
+        writer.counter("swealog_llm_cache_hits_total", "LLM responses served from the cache.", ("agent",), hits)
+        writer.counter("swealog_llm_cache_misses_total", "LLM cache lookups that missed.", ("agent",), misses)
+        writer.family("swealog_llm_cache_hit_ratio", "gauge", "Fraction of LLM cache lookups that hit.")
+        writer.sample("swealog_llm_cache_hit_ratio", {}, cache.hit_ratio)
+
+    breakers = llm_client.circuit_breaker_stats()
+    if breakers:
+        writer.family(
+            "swealog_llm_circuit_state", "gauge", "1 for the current state of each provider's circuit breaker."
+        )
+        for provider, stats in sorted(breakers.items()):
+            for state in get_args(CircuitState):
+                writer.sample(
+                    "swealog_llm_circuit_state", {"provider": provider, "state": state}, int(stats.state == state)
+                )
@@ -1,5 +1,7 @@
 """Pydantic request and response models for API endpoints."""
 
+from datetime import datetime
+
 from pydantic import BaseModel, Field
 
 
@@ -18,6 +20,45 @@ class InputResponse(BaseModel):
     message: str | None = Field(None, description="Additional message")
 
 
+class BatchInputItem(BaseModel):
+    """One input of a /input/batch request."""
+
+    text: str = Field(..., min_length=1, description="Raw input text")
+    timestamp: datetime | None = Field(None, description="When the input was logged on the client; defaults to now")
+
+
+class BatchInputRequest(BaseModel):
+    """Request body for /input/batch endpoint."""
+
+    items: list[BatchInputItem] = Field(..., min_length=1, max_length=500, description="Inputs to process, in order")
+
+
+class BatchInputItemResponse(BaseModel):
+    """Result for one input of a /input/batch request."""
+
+    status: str = Field(..., description="Processing status: accepted, error")
+    input_type: str | None = Field(default=None, description="Classified input type: LOG, QUERY, BOTH, CORRECTION")
+    entry_id: str | None = Field(default=None, description="Entry ID for queued inputs")
+    message: str | None = Field(default=None, description="Additional message or error")
+
+
+class BatchInputResponse(BaseModel):
+    """Response for /input/batch endpoint."""
+
+    batch_id: str = Field(..., description="ID shared by the entries queued from this batch")
+    items: list[BatchInputItemResponse] = Field(..., description="One result per request item, in request order")
+
+
+class InputStatusResponse(BaseModel):
+    """Response for /input/{entry_id}/status endpoint."""
+
+    entry_id: str = Field(..., description="Entry ID returned by /input")
+    status: str = Field(..., description="Parsing status: queued, running, done, dead")
+    attempts: int = Field(..., description="Parse attempts started so far")
+    error: str | None = Field(None, description="Error of the last failed attempt")
+    updated_at: datetime = Field(..., description="Time of the last status change")
+
+
 class QueryRequest(BaseModel):
     """Request body for /query endpoint."""
 
@@ -0,0 +1,669 @@
+"""Durable queue of log entries waiting to be parsed.
+
+/input classifies an entry and enqueues it here; a bounded pool of
+asyncio workers drains the queue by running the Parser agent and saving
+the result. Jobs live in SQLite (under logs/ in the app), so entries
+accepted before a restart or crash are parsed after it. Failed jobs are
+retried with exponential backoff; after max_attempts they are kept as
+"dead" jobs with their last error instead of being dropped. Done jobs are
+purged once they are older than done_retention, at startup and then
+periodically by the workers.
+
+Several processes (e.g. uvicorn workers) can share one database. Jobs are
+claimed in a write transaction, and a claim is a lease: the owning queue
+renews it while the job is parsed, and a running job whose lease expired
+(its process died) is queued again by whichever queue claims next.
+
+Jobs enqueued together by /input/batch share a batch_id. A worker claims
+up to group_size due jobs of the same batch at once, so the handler can
+save the whole group with one storage write per day.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Awaitable, Callable, Sequence
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+
+from pydantic import BaseModel, Field
+
+logger = logging.getLogger(__name__)
+
+JobStatus = Literal["queued", "running", "done", "dead"]
+
+# How often idle workers purge expired done jobs, in seconds
+_PURGE_INTERVAL = 3600.0
+
+# Leases are renewed this many times per lease period while a job is parsed
+_RENEWALS_PER_LEASE = 3
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS parse_jobs (
+    entry_id TEXT PRIMARY KEY,
+    raw_input TEXT NOT NULL,
+    timestamp TEXT NOT NULL,
+    selected_domains TEXT NOT NULL,
+    is_correction INTEGER NOT NULL,
+    correction_target TEXT,
+    status TEXT NOT NULL,
+    attempts INTEGER NOT NULL DEFAULT 0,
+    last_error TEXT,
+    created_at REAL NOT NULL,
+    updated_at REAL NOT NULL,
+    available_at REAL NOT NULL,
+    batch_id TEXT,
+    owner TEXT
+);
+CREATE INDEX IF NOT EXISTS parse_jobs_pending ON parse_jobs (status, available_at);
+CREATE INDEX IF NOT EXISTS parse_jobs_by_status ON parse_jobs (status, updated_at);
+"""
+
+_COLUMNS = (
+    "entry_id, raw_input, timestamp, selected_domains, is_correction, correction_target, "
+    "status, attempts, last_error, created_at, updated_at, batch_id"
+)
+
+
+class ParseJob(BaseModel):
+    """One log entry to parse.
+
+    Attributes:
+        entry_id: ID of the entry, unique within the queue.
+        raw_input: The raw user input text.
+        timestamp: When the entry was logged.
+        selected_domains: Domains selected by the Router.
+        is_correction: Whether the input corrects an earlier entry.
+        correction_target: What is being corrected (if correction).
+        status: queued (waiting, possibly for a retry), running, done, or
+            dead (gave up after max_attempts).
+        attempts: Parse attempts started so far.
+        last_error: Error of the most recent failed attempt.
+        created_at: Unix time the job was enqueued.
+        updated_at: Unix time of the last status change.
+        batch_id: ID shared by jobs enqueued together, if any.
+    """
+
+    entry_id: str
+    raw_input: str
+    timestamp: datetime
+    selected_domains: list[str]
+    is_correction: bool = False
+    correction_target: str | None = None
+    status: JobStatus = "queued"
+    attempts: int = 0
+    last_error: str | None = None
+    created_at: float = Field(default_factory=time.time)
+    updated_at: float = Field(default_factory=time.time)
+    batch_id: str | None = None
+
+
+# Parses and saves a group of jobs; returns each job's error, or None if it succeeded
+ParseHandler = Callable[[list[ParseJob]], Awaitable[Sequence[Exception | None]]]
+
+
+class ParseQueue:
+    """SQLite-backed job queue drained by a bounded asyncio worker pool.
+
+    Database access runs in worker threads so it never blocks the event
+    loop. At most `workers` groups are parsed at once, however many
+    entries arrive, which keeps bursts of input from flooding the LLM.
+
+    Attributes:
+        db_path: Path to the SQLite database file, or None for memory only.
+        workers: Number of job groups parsed concurrently.
+        group_size: Most jobs of one batch handed to the handler at once.
+        max_attempts: Attempts per job before it is dead-lettered.
+        retry_delay: Delay before the first retry in seconds; doubles
+            with every further attempt.
+        done_retention: Seconds a done job is kept before it is purged,
+            or None to keep done jobs forever.
+        lease: Seconds a claimed job stays owned by this queue without a
+            renewal before another queue may claim it again.
+
+    Example:
+        >>> queue = ParseQueue(Path("logs/parse-queue.sqlite"), workers=2)
+        >>> queue.start(parse_jobs)
+        >>> job = await queue.enqueue("2026-01-05_08-30-00", "Ran 5k", datetime.now(), ["Running"])
+        >>> (await queue.get(job.entry_id)).status
+        'queued'
+        >>> await queue.stop()
+    """
+
+    def __init__(
+        self,
+        db_path: Path | None = None,
+        workers: int = 2,
+        max_attempts: int = 3,
+        retry_delay: float = 5.0,
+        poll_interval: float = 1.0,
+        group_size: int = 10,
+        done_retention: float | None = 7 * 24 * 3600.0,
+        lease: float = 300.0,
+    ) -> None:
+        """Open the queue, creating the database if needed.
+
+        Jobs left running by a process that died are queued again once
+        their lease expires.
+
+        Args:
+            db_path: Path to the SQLite database file, or None for memory only.
+            workers: Number of job groups parsed concurrently.
+            max_attempts: Attempts per job before it is dead-lettered.
+            retry_delay: Delay before the first retry in seconds.
+            poll_interval: Longest time an idle worker sleeps before
+                checking for jobs again.
+            group_size: Most jobs of one batch handed to the handler at once.
+            done_retention: Seconds a done job is kept before it is purged,
+                or None to keep done jobs forever.
+            lease: Seconds a claimed job stays owned by this queue without
+                a renewal before another queue may claim it again.
+
+        Raises:
+            ValueError: If workers, max_attempts or group_size is less
+                than 1, a delay or the retention is negative, or the lease
+                is not positive.
+        """
+        if workers < 1 or max_attempts < 1 or group_size < 1:
+            raise ValueError("workers, max_attempts and group_size must be >= 1")
+        if retry_delay < 0 or poll_interval <= 0:
+            raise ValueError("retry_delay must be >= 0 and poll_interval > 0")
+        if done_retention is not None and done_retention < 0:
+            raise ValueError("done_retention must be >= 0")
+        if lease <= 0:
+            raise ValueError("lease must be > 0")
+        self.db_path = db_path
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        self.poll_interval = poll_interval
+        self.group_size = group_size
+        self.done_retention = done_retention
+        self.lease = lease
+        # Identifies this queue's claims among processes sharing the database
+        self._owner = uuid.uuid4().hex
+        self._lock = threading.Lock()
+        self._tasks: list[asyncio.Task[None]] = []
+        self._recovery: asyncio.Task[None] | None = None
+        self._purged_at = 0.0
+        self._wakeup = asyncio.Event()
+        if db_path is not None:
+            db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(db_path or ":memory:", timeout=30.0, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.executescript(_SCHEMA)
+        columns = {row[1] for row in self._conn.execute("PRAGMA table_info(parse_jobs)")}
+        if "batch_id" not in columns:
+            # Databases created before batches were added
+            self._conn.execute("ALTER TABLE parse_jobs ADD COLUMN batch_id TEXT")
+        if "owner" not in columns:
+            # Databases created before claims were leased
+            self._conn.execute("ALTER TABLE parse_jobs ADD COLUMN owner TEXT")
+        self._conn.commit()
+
+    def start(self, handler: ParseHandler) -> None:
+        """Start the worker pool.
+
+        Jobs whose lease expired are queued again and expired done jobs
+        purged (in a thread) before workers claim jobs.
+
+        Args:
+            handler: Parses and saves a group of jobs and returns each
+                job's error or None; raising marks every attempt failed.
+
+        Raises:
+            RuntimeError: If the pool is already running.
+        """
+        if self._tasks:
+            raise RuntimeError("parse queue already started")
+        self._wakeup = asyncio.Event()
+        self._recovery = asyncio.create_task(asyncio.to_thread(self._recover), name="parse-queue-recovery")
+        self._tasks = [
+            asyncio.create_task(self._worker(handler, self._recovery), name=f"parse-worker-{i}")
+            for i in range(self.workers)
+        ]
+
+    async def stop(self) -> None:
+        """Stop the worker pool.
+
+        Jobs being parsed are cancelled and queued again, so the next
+        start picks them up.
+        """
+        tasks, self._tasks = self._tasks, []
+        for task in tasks:
+            task.cancel()
+        recovery, self._recovery = self._recovery, None
+        # The recovery thread cannot be interrupted; wait for it before the connection closes
+        await asyncio.gather(*tasks, *([recovery] if recovery else []), return_exceptions=True)
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            self._conn.close()
+
+    async def enqueue(
+        self,
+        entry_id: str,
+        raw_input: str,
+        timestamp: datetime,
+        selected_domains: list[str],
+        is_correction: bool = False,
+        correction_target: str | None = None,
+    ) -> ParseJob:
+        """Add an entry to the queue.
+
+        The job is committed before this returns, so an accepted entry
+        survives a crash. If the ID is already taken (two entries in the
+        same second), a numeric suffix keeps it unique.
+
+        Args:
+            entry_id: Preferred ID of the entry.
+            raw_input: The raw user input text.
+            timestamp: When the entry was logged.
+            selected_domains: Domains selected by the Router.
+            is_correction: Whether the input corrects an earlier entry.
+            correction_target: What is being corrected (if correction).
+
+        Returns:
+            The queued job, with the entry ID actually used.
+        """
+        job = ParseJob(
+            entry_id=entry_id,
+            raw_input=raw_input,
+            timestamp=timestamp,
+            selected_domains=selected_domains,
+            is_correction=is_correction,
+            correction_target=correction_target,
+        )
+        return (await self.enqueue_many([job]))[0]
+
+    async def enqueue_many(self, jobs: Sequence[ParseJob]) -> list[ParseJob]:
+        """Add several entries to the queue in one transaction.
+
+        Either all jobs are committed or none are. Jobs that share a
+        batch_id are claimed together by the workers. Taken IDs are
+        suffixed as in enqueue.
+
+        Args:
+            jobs: The jobs to queue, in order.
+
+        Returns:
+            The queued jobs, with the entry IDs actually used.
+        """
+        now = time.time()
+        queued = [job.model_copy(update={"status": "queued", "created_at": now, "updated_at": now}) for job in jobs]
+        entry_ids = await asyncio.to_thread(self._insert, queued)
+        for job, entry_id in zip(queued, entry_ids, strict=True):
+            job.entry_id = entry_id
+        self._wakeup.set()
+        return queued
+
+    async def get(self, entry_id: str) -> ParseJob | None:
+        """Look up a job by entry ID.
+
+        Args:
+            entry_id: ID returned by enqueue.
+
+        Returns:
+            The job, or None if there is none with this ID.
+        """
+        return await asyncio.to_thread(self._get, entry_id)
+
+    async def counts(self) -> dict[JobStatus, int]:
+        """Count jobs per status.
+
+        Returns:
+            Number of jobs for every status, including zeros.
+        """
+        return await asyncio.to_thread(self._counts)
+
+    async def depth(self) -> int:
+        """Number of jobs waiting for or being parsed."""
+        counts = await self.counts()
+        return counts["queued"] + counts["running"]
+
+    async def _worker(self, handler: ParseHandler, recovery: asyncio.Task[None]) -> None:
+        """Claim and parse job groups until cancelled.
+
+        Args:
+            handler: Parses and saves a group of jobs.
+            recovery: Startup recovery that must finish before jobs are claimed.
+        """
+        await asyncio.shield(recovery)
+        while True:
+            # Cleared before claiming so an enqueue after the claim still wakes us
+            self._wakeup.clear()
+            jobs = await asyncio.to_thread(self._claim)
+            if not jobs:
+                if time.monotonic() - self._purged_at >= _PURGE_INTERVAL:
+                    self._purged_at = time.monotonic()
+                    await asyncio.to_thread(self._purge)
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(self.poll_interval):
+                        await self._wakeup.wait()
+                continue
+
+            entry_ids = [job.entry_id for job in jobs]
+            renewal = asyncio.create_task(self._keep_leases(entry_ids), name="parse-lease-renewal")
+            try:
+                results = await handler(jobs)
+            except asyncio.CancelledError:
+                await asyncio.to_thread(self._requeue, entry_ids)
+                raise
+            except Exception as e:
+                errors: list[str | None] = [f"{type(e).__name__}: {e}"] * len(jobs)
+            else:
+                errors = [None if error is None else f"{type(error).__name__}: {error}" for error in results]
+            finally:
+                renewal.cancel()
+            await asyncio.to_thread(self._finish, jobs, errors)
+
+    async def _keep_leases(self, entry_ids: Sequence[str]) -> None:
+        """Renew the lease of claimed jobs until cancelled.
+
+        Args:
+            entry_ids: IDs of the jobs being parsed.
+        """
+        while True:
+            await asyncio.sleep(self.lease / _RENEWALS_PER_LEASE)
+            await asyncio.to_thread(self._renew, entry_ids)
+
+    def _counts(self) -> dict[JobStatus, int]:
+        """Count jobs per status.
+
+        Returns:
+            Number of jobs for every status, including zeros.
+        """
+        with self._lock:
+            rows = self._conn.execute("SELECT status, COUNT(*) FROM parse_jobs GROUP BY status").fetchall()
+        counts: dict[JobStatus, int] = {"queued": 0, "running": 0, "done": 0, "dead": 0}
+        for status, count in rows:
+            counts[status] = count
+        return counts
+
+    def _recover(self) -> None:
+        """Queue jobs whose lease expired again and purge expired jobs."""
+        with self._lock:
+            self._expire_leases(time.time())
+            self._conn.commit()
+        self._purged_at = time.monotonic()
+        self._purge()
+
+    def _expire_leases(self, now: float) -> None:
+        """Queue running jobs whose lease expired again, without committing.
+
+        The owner's process died or stalled, so the attempt is counted as
+        interrupted. The caller holds the lock. Jobs other live queues are
+        parsing keep their lease.
+
+        Args:
+            now: Current Unix time.
+        """
+        expired = self._conn.execute(
+            "UPDATE parse_jobs SET status = 'queued', owner = NULL, updated_at = ? "
+            "WHERE status = 'running' AND available_at <= ?",
+            (now, now),
+        ).rowcount
+        if expired:
+            logger.warning("Re-queued %d parse jobs whose worker stopped renewing them", expired)
+
+    def _purge(self) -> int:
+        """Delete done jobs older than done_retention.
+
+        Returns:
+            Number of jobs deleted.
+        """
+        if self.done_retention is None:
+            return 0
+        with self._lock:
+            purged = self._conn.execute(
+                "DELETE FROM parse_jobs WHERE status = 'done' AND updated_at < ?",
+                (time.time() - self.done_retention,),
+            ).rowcount
+            self._conn.commit()
+        if purged:
+            logger.info("Purged %d parsed jobs older than %.0fs", purged, self.done_retention)
+        return purged
+
+    def _insert(self, jobs: Sequence[ParseJob]) -> list[str]:
+        """Insert jobs in one transaction, suffixing IDs until they are unique.
+
+        Args:
+            jobs: The jobs to insert.
+
+        Returns:
+            The entry IDs the jobs were stored under, in order.
+        """
+        entry_ids: list[str] = []
+        with self._lock:
+            try:
+                for job in jobs:
+                    entry_ids.append(self._insert_one(job))
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+        return entry_ids
+
+    def _insert_one(self, job: ParseJob) -> str:
+        """Insert a job without committing; the caller holds the lock.
+
+        Args:
+            job: The job to insert.
+
+        Returns:
+            The entry ID the job was stored under.
+        """
+        base, suffix = job.entry_id, 1
+        entry_id = base
+        while True:
+            try:
+                self._conn.execute(
+                    f"INSERT INTO parse_jobs ({_COLUMNS}, available_at) VALUES ({', '.join('?' * 13)})",
+                    (
+                        entry_id,
+                        job.raw_input,
+                        job.timestamp.isoformat(),
+                        json.dumps(job.selected_domains),
+                        int(job.is_correction),
+                        job.correction_target,
+                        job.status,
+                        job.attempts,
+                        job.last_error,
+                        job.created_at,
+                        job.updated_at,
+                        job.batch_id,
+                        job.created_at,
+                    ),
+                )
+            except sqlite3.IntegrityError:
+                suffix += 1
+                entry_id = f"{base}_{suffix}"
+                continue
+            return entry_id
+
+    def _get(self, entry_id: str) -> ParseJob | None:
+        """Read a job.
+
+        Args:
+            entry_id: ID of the job.
+
+        Returns:
+            The job, or None if missing.
+        """
+        with self._lock:
+            row = self._conn.execute(f"SELECT {_COLUMNS} FROM parse_jobs WHERE entry_id = ?", (entry_id,)).fetchone()
+        return _row_to_job(row) if row is not None else None
+
+    def _claim(self) -> list[ParseJob]:
+        """Mark the oldest due job and its due batch mates as running.
+
+        The jobs are read and leased in one write transaction, so queues in
+        other processes sharing the database never claim the same job. Each
+        claimed job's attempt is counted.
+
+        Returns:
+            The claimed jobs (at most group_size), empty if no job is due.
+        """
+        now = time.time()
+        with self._lock:
+            # Take the write lock before reading so no other process claims in between
+            self._conn.execute("BEGIN IMMEDIATE")
+            try:
+                jobs = self._claim_due(now)
+            except BaseException:
+                self._conn.rollback()
+                raise
+            self._conn.commit()
+        return jobs
+
+    def _claim_due(self, now: float) -> list[ParseJob]:
+        """Lease due jobs inside the caller's transaction; the caller holds the lock.
+
+        Args:
+            now: Current Unix time.
+
+        Returns:
+            The claimed jobs, empty if no job is due.
+        """
+        self._expire_leases(now)
+        row = self._conn.execute(
+            f"SELECT {_COLUMNS} FROM parse_jobs WHERE status = 'queued' AND available_at <= ? "
+            "ORDER BY available_at, created_at LIMIT 1",
+            (now,),
+        ).fetchone()
+        if row is None:
+            return []
+        jobs = [_row_to_job(row)]
+        if jobs[0].batch_id is not None and self.group_size > 1:
+            rows = self._conn.execute(
+                f"SELECT {_COLUMNS} FROM parse_jobs WHERE status = 'queued' AND available_at <= ? "
+                "AND batch_id = ? AND entry_id != ? ORDER BY created_at, rowid LIMIT ?",
+                (now, jobs[0].batch_id, jobs[0].entry_id, self.group_size - 1),
+            ).fetchall()
+            jobs.extend(_row_to_job(r) for r in rows)
+        for job in jobs:
+            job.status = "running"
+            job.attempts += 1
+            job.updated_at = now
+        # A running job's available_at is when its lease expires
+        self._conn.executemany(
+            "UPDATE parse_jobs SET status = 'running', attempts = ?, updated_at = ?, available_at = ?, owner = ? "
+            "WHERE entry_id = ? AND status = 'queued'",
+            [(job.attempts, now, now + self.lease, self._owner, job.entry_id) for job in jobs],
+        )
+        return jobs
+
+    def _renew(self, entry_ids: Sequence[str]) -> None:
+        """Extend the lease of jobs this queue is parsing.
+
+        Args:
+            entry_ids: IDs of the jobs.
+        """
+        expires = time.time() + self.lease
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE parse_jobs SET available_at = ? WHERE entry_id = ? AND status = 'running' AND owner = ?",
+                [(expires, entry_id, self._owner) for entry_id in entry_ids],
+            )
+            self._conn.commit()
+
+    def _finish(self, jobs: Sequence[ParseJob], errors: Sequence[str | None]) -> None:
+        """Mark attempted jobs done, or schedule a retry or dead-letter them.
+
+        Jobs whose lease was lost to another queue are left to that queue.
+
+        Args:
+            jobs: The jobs whose attempt ended.
+            errors: Description of each job's failure, or None if it succeeded.
+        """
+        now = time.time()
+        updates: list[tuple[str, str | None, float, float, str, str]] = []
+        for job, error in zip(jobs, errors, strict=True):
+            if error is None:
+                logger.info("Parsed and saved entry %s", job.entry_id)
+                updates.append(("done", job.last_error, now, now, job.entry_id, self._owner))
+            elif job.attempts >= self.max_attempts:
+                logger.error("Parsing entry %s failed %d times, giving up: %s", job.entry_id, job.attempts, error)
+                updates.append(("dead", error, now, now, job.entry_id, self._owner))
+            else:
+                delay = self.retry_delay * (2 ** (job.attempts - 1))
+                logger.warning(
+                    "Parsing entry %s failed (attempt %d), retrying in %.1fs: %s",
+                    job.entry_id,
+                    job.attempts,
+                    delay,
+                    error,
+                )
+                updates.append(("queued", error, now, now + delay, job.entry_id, self._owner))
+        with self._lock:
+            updated = self._conn.executemany(
+                "UPDATE parse_jobs SET status = ?, last_error = ?, updated_at = ?, available_at = ?, owner = NULL "
+                "WHERE entry_id = ? AND status = 'running' AND owner = ?",
+                updates,
+            ).rowcount
+            self._conn.commit()
+        if updated < len(updates):
+            logger.warning("Lost the lease of %d parse jobs before they finished", len(updates) - updated)
+
+    def _requeue(self, entry_ids: Sequence[str]) -> None:
+        """Queue interrupted jobs again without counting their attempt.
+
+        Args:
+            entry_ids: IDs of the jobs.
+        """
+        now = time.time()
+        with self._lock:
+            self._conn.executemany(
+                "UPDATE parse_jobs SET status = 'queued', attempts = attempts - 1, updated_at = ?, available_at = ?, "
+                "owner = NULL WHERE entry_id = ? AND status = 'running' AND owner = ?",
+                [(now, now, entry_id, self._owner) for entry_id in entry_ids],
+            )
+            self._conn.commit()
+
+
+def _row_to_job(row: tuple[object, ...]) -> ParseJob:
+    """Build a job from a row of _COLUMNS.
+
+    Args:
+        row: The database row.
+
+    Returns:
+        The job.
+    """
+    (
+        entry_id,
+        raw_input,
+        timestamp,
+        selected_domains,
+        is_correction,
+        correction_target,
+        status,
+        attempts,
+        last_error,
+        created_at,
+        updated_at,
+        batch_id,
+    ) = row
+    return ParseJob.model_validate(
+        {
+            "entry_id": entry_id,
+            "raw_input": raw_input,
+            "timestamp": timestamp,
+            "selected_domains": json.loads(str(selected_domains)),
+            "is_correction": bool(is_correction),
+            "correction_target": correction_target,
+            "status": status,
+            "attempts": attempts,
+            "last_error": last_error,
+            "created_at": created_at,
+            "updated_at": updated_at,
+            "batch_id": batch_id,
+        }
+    )
@@ -1,55 +1,79 @@
 """POST /input endpoint for processing user input."""
 
+import asyncio
 import logging
+import uuid
 from datetime import datetime
 from typing import Annotated
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from quilto import (
+    AsyncStorageRepository,
     DomainModule,
     Entry,
     LLMClient,
     ParserAgent,
     ParserInput,
+    ParserOutput,
     RouterAgent,
     RouterInput,
-    StorageRepository,
+    RouterOutput,
 )
 from quilto.agents import DomainInfo
 
-from swealog.api.dependencies import get_domains, get_llm_client, get_storage
-from swealog.api.models import InputRequest, InputResponse
+from swealog.api.dependencies import get_domains, get_llm_client, get_parse_queue
+from swealog.api.models import (
+    BatchInputItemResponse,
+    BatchInputRequest,
+    BatchInputResponse,
+    InputRequest,
+    InputResponse,
+    InputStatusResponse,
+)
+from swealog.api.parse_queue import ParseJob, ParseQueue
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+# Router calls in flight at once for one /input/batch request
+BATCH_ROUTING_CONCURRENCY = 8
 
-async def parse_log_background(
-    raw_input: str,
-    entry_id: str,
+_PARSED_INPUT_TYPES = ("LOG", "BOTH", "CORRECTION")
+
+
+async def parse_log_entries(
+    jobs: list[ParseJob],
     llm_client: LLMClient,
-    storage: StorageRepository,
+    storage: AsyncStorageRepository,
     domains: list[DomainModule],
-    selected_domain_names: list[str],
-    is_correction: bool = False,
-    correction_target: str | None = None,
-) -> None:
-    """Background task to parse and store log entry.
+) -> list[Exception | None]:
+    """Parse a group of queued log entries and store them together.
+
+    Entries are parsed one after another, so LLM load stays bounded by
+    the queue's worker count, then saved with one storage write per day.
+    A Parser failure only fails its own job; a failed save fails every
+    parsed job so the queue retries them.
 
     Args:
-        raw_input: The raw user input text.
-        entry_id: The generated entry ID (timestamp-based).
+        jobs: The queued entries with the Router's classification, in order.
         llm_client: LLM client for Parser agent.
         storage: Storage repository for saving entries.
         domains: Available domain modules.
-        selected_domain_names: Domains selected by Router.
-        is_correction: Whether this is a correction input.
-        correction_target: What is being corrected (if correction).
+
+    Returns:
+        Each job's error, or None if it was parsed and saved.
     """
-    try:
+    parser = ParserAgent(llm_client)
+    errors: list[Exception | None] = [None] * len(jobs)
+    parsed: list[int] = []
+    entries: list[Entry] = []
+    corrections: list[ParserOutput | None] = []
+    stored_entries: list[Entry] | None = None
+
+    for i, job in enumerate(jobs):
         # Filter domains to those selected by Router
-        selected_domains = [d for d in domains if d.name in selected_domain_names]
+        selected_domains = [d for d in domains if d.name in job.selected_domains]
         if not selected_domains:
             selected_domains = domains  # Fall back to all domains
 
@@ -59,66 +83,106 @@ async def parse_log_background(
         for d in selected_domains:
             vocabulary.update(d.vocabulary)
 
-        # Get recent entries for correction context
-        recent_entries: list[Entry] = []
-        if is_correction:
-            recent_entries = storage.get_entries_by_pattern("**/*.md")[-10:]
-
-        # Parse the input - entry_id format is "YYYY-MM-DD_HH-MM-SS"
-        timestamp = datetime.strptime(entry_id, "%Y-%m-%d_%H-%M-%S")
-        parser = ParserAgent(llm_client)
-        parser_input = ParserInput(
-            raw_input=raw_input,
-            timestamp=timestamp,
-            domain_schemas=domain_schemas,
-            vocabulary=vocabulary,
-            correction_mode=is_correction,
-            correction_target=correction_target,
-            recent_entries=recent_entries,
-        )
+        try:
+            # Get recent entries for correction context, including unsaved ones of this group
+            recent_entries: list[Entry] = []
+            if job.is_correction:
+                if stored_entries is None:
+                    stored_entries = await storage.get_entries_by_pattern("**/*.md")
+                recent_entries = [*stored_entries, *entries][-10:]
 
-        parser_output = await parser.parse(parser_input)
+            parser_input = ParserInput(
+                raw_input=job.raw_input,
+                timestamp=job.timestamp,
+                domain_schemas=domain_schemas,
+                vocabulary=vocabulary,
+                correction_mode=job.is_correction,
+                correction_target=job.correction_target,
+                recent_entries=recent_entries,
+            )
+            parser_output = await parser.parse(parser_input)
+        except Exception as e:
+            errors[i] = e
+            continue
 
-        # Create entry for storage
-        entry = Entry(
-            id=entry_id,
-            date=parser_output.date,
-            timestamp=parser_output.timestamp,
-            raw_content=raw_input,
-            parsed_data=parser_output.domain_data,
+        parsed.append(i)
+        entries.append(
+            Entry(
+                id=job.entry_id,
+                date=parser_output.date,
+                timestamp=parser_output.timestamp,
+                raw_content=job.raw_input,
+                parsed_data=parser_output.domain_data,
+            )
         )
+        corrections.append(parser_output if job.is_correction and parser_output.is_correction else None)
 
-        # Save to storage
-        if is_correction and parser_output.is_correction:
-            storage.save_entry(entry, correction=parser_output)
-        else:
-            storage.save_entry(entry)
+    if entries:
+        try:
+            await storage.save_entries(entries, corrections)
+        except Exception as e:
+            for i in parsed:
+                errors[i] = e
+    return errors
 
-        logger.info("Parsed and saved entry %s", entry_id)
 
-    except Exception as e:
-        logger.exception("Background parsing failed for entry %s: %s", entry_id, e)
+async def classify_input(text: str, llm_client: LLMClient, domains: list[DomainModule]) -> RouterOutput:
+    """Classify an input with the Router agent.
+
+    Args:
+        text: The raw input text.
+        llm_client: LLM client for the Router agent.
+        domains: Available domain modules.
+
+    Returns:
+        The Router's classification.
+    """
+    router_agent = RouterAgent(llm_client)
+    domain_infos = [DomainInfo(name=d.name, description=d.description) for d in domains]
+    return await router_agent.classify(RouterInput(raw_input=text, available_domains=domain_infos))
+
+
+def _queued_job(text: str, timestamp: datetime, router_output: RouterOutput, batch_id: str | None = None) -> ParseJob:
+    """Build the parse job for a classified LOG, BOTH or CORRECTION input.
+
+    Args:
+        text: The raw input text.
+        timestamp: When the input was logged.
+        router_output: The Router's classification.
+        batch_id: ID shared with the other jobs of a batch, if any.
+
+    Returns:
+        The job to enqueue.
+    """
+    return ParseJob(
+        entry_id=timestamp.strftime("%Y-%m-%d_%H-%M-%S"),
+        raw_input=text,
+        timestamp=timestamp,
+        selected_domains=list(router_output.selected_domains),
+        is_correction=router_output.input_type.value == "CORRECTION",
+        correction_target=router_output.correction_target,
+        batch_id=batch_id,
+    )
 
 
 @router.post("/input", response_model=InputResponse)
 async def process_input(
     request: InputRequest,
-    background_tasks: BackgroundTasks,
     llm_client: Annotated[LLMClient, Depends(get_llm_client)],
-    storage: Annotated[StorageRepository, Depends(get_storage)],
     domains: Annotated[list[DomainModule], Depends(get_domains)],
+    parse_queue: Annotated[ParseQueue, Depends(get_parse_queue)],
 ) -> InputResponse:
     """Process user input (log, query, both, or correction).
 
-    Routes input through Router agent and schedules background parsing
-    for LOG/BOTH/CORRECTION inputs.
+    Routes input through Router agent and queues LOG/BOTH/CORRECTION
+    inputs for parsing. The entry is stored in the queue before the
+    response is sent; poll /input/{entry_id}/status for the outcome.
 
     Args:
         request: The input request with text field.
-        background_tasks: FastAPI background tasks manager.
         llm_client: LLM client for agents.
-        storage: Storage repository for entries.
         domains: Available domain modules.
+        parse_queue: Queue of entries waiting to be parsed.
 
     Returns:
         InputResponse with status, input_type, and entry_id.
@@ -128,33 +192,19 @@ async def process_input(
     """
     try:
         # Route input through Router agent
-        router_agent = RouterAgent(llm_client)
-        domain_infos = [DomainInfo(name=d.name, description=d.description) for d in domains]
-        router_input = RouterInput(raw_input=request.text, available_domains=domain_infos)
-
-        router_output = await router_agent.classify(router_input)
-        entry_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-
-        # Handle LOG, BOTH, CORRECTION - schedule background parsing
-        if router_output.input_type.value in ("LOG", "BOTH", "CORRECTION"):
-            is_correction = router_output.input_type.value == "CORRECTION"
-            background_tasks.add_task(
-                parse_log_background,
-                request.text,
-                entry_id,
-                llm_client,
-                storage,
-                domains,
-                router_output.selected_domains,
-                is_correction,
-                router_output.correction_target,
-            )
+        router_output = await classify_input(request.text, llm_client, domains)
+        entry_id: str | None = None
+
+        # Handle LOG, BOTH, CORRECTION - queue for parsing
+        if router_output.input_type.value in _PARSED_INPUT_TYPES:
+            [job] = await parse_queue.enqueue_many([_queued_job(request.text, datetime.now(), router_output)])
+            entry_id = job.entry_id
 
         # Build response
         return InputResponse(
             status="accepted",
             input_type=router_output.input_type.value,
-            entry_id=(entry_id if router_output.input_type.value in ("LOG", "BOTH", "CORRECTION") else None),
+            entry_id=entry_id,
             message=(
                 f"Query detected: {router_output.query_portion}" if router_output.input_type.value == "BOTH" else None
             ),
@@ -165,3 +215,106 @@ async def process_input(
     except Exception as e:
         logger.exception("Input processing failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {type(e).__name__}") from e
+
+
+@router.post("/input/batch", response_model=BatchInputResponse)
+async def process_input_batch(
+    request: BatchInputRequest,
+    llm_client: Annotated[LLMClient, Depends(get_llm_client)],
+    domains: Annotated[list[DomainModule], Depends(get_domains)],
+    parse_queue: Annotated[ParseQueue, Depends(get_parse_queue)],
+) -> BatchInputResponse:
+    """Process many inputs with client timestamps in one request.
+
+    Inputs are classified concurrently, at most BATCH_ROUTING_CONCURRENCY
+    at a time. LOG/BOTH/CORRECTION inputs are queued for parsing in one
+    transaction under a shared batch ID, so the parse workers save them
+    in groups. An input whose classification fails gets an error result
+    without failing the rest of the batch.
+
+    Args:
+        request: The inputs, each with text and optional timestamp.
+        llm_client: LLM client for agents.
+        domains: Available domain modules.
+        parse_queue: Queue of entries waiting to be parsed.
+
+    Returns:
+        BatchInputResponse with one result per input, in request order.
+
+    Raises:
+        HTTPException: If the entries cannot be queued.
+    """
+    semaphore = asyncio.Semaphore(BATCH_ROUTING_CONCURRENCY)
+
+    async def classify(text: str) -> RouterOutput | Exception:
+        async with semaphore:
+            try:
+                return await classify_input(text, llm_client, domains)
+            except Exception as e:
+                logger.warning("Batch input classification failed: %s", e)
+                return e
+
+    outputs = await asyncio.gather(*(classify(item.text) for item in request.items))
+
+    batch_id = uuid.uuid4().hex
+    now = datetime.now()
+    results: list[BatchInputItemResponse] = []
+    jobs: list[ParseJob] = []
+    queued: list[int] = []
+    for item, output in zip(request.items, outputs, strict=True):
+        if isinstance(output, Exception):
+            results.append(BatchInputItemResponse(status="error", message=f"Classification failed: {output}"))
+            continue
+        input_type = output.input_type.value
+        results.append(
+            BatchInputItemResponse(
+                status="accepted",
+                input_type=input_type,
+                message=f"Query detected: {output.query_portion}" if input_type == "BOTH" else None,
+            )
+        )
+        if input_type in _PARSED_INPUT_TYPES:
+            timestamp = item.timestamp or now
+            if timestamp.tzinfo is not None:
+                timestamp = timestamp.astimezone().replace(tzinfo=None)  # Entries use local time
+            queued.append(len(results) - 1)
+            jobs.append(_queued_job(item.text, timestamp, output, batch_id))
+
+    try:
+        enqueued = await parse_queue.enqueue_many(jobs)
+    except Exception as e:
+        logger.exception("Queueing batch failed: %s", e)
+        raise HTTPException(status_code=500, detail=f"Internal error: {type(e).__name__}") from e
+    for i, job in zip(queued, enqueued, strict=True):
+        results[i].entry_id = job.entry_id
+
+    return BatchInputResponse(batch_id=batch_id, items=results)
+
+
+@router.get("/input/{entry_id}/status", response_model=InputStatusResponse)
+async def input_status(
+    entry_id: str,
+    parse_queue: Annotated[ParseQueue, Depends(get_parse_queue)],
+) -> InputStatusResponse:
+    """Get the parsing status of an entry accepted by /input.
+
+    Args:
+        entry_id: Entry ID returned by /input or /input/batch.
+        parse_queue: Queue of entries waiting to be parsed.
+
+    Returns:
+        InputStatusResponse with the job's status, attempts and last error.
+
+    Raises:
+        HTTPException: 404 if no entry with this ID was queued.
+    """
+    job = await parse_queue.get(entry_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Unknown entry: {entry_id}")
+    return InputStatusResponse(
+        entry_id=job.entry_id,
+        status=job.status,
+        attempts=job.attempts,
+        error=job.last_error,
+        updated_at=datetime.fromtimestamp(job.updated_at),
+    )
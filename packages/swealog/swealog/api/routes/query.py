@@ -1,10 +1,15 @@
-"""POST /query endpoint for processing user queries."""
+"""POST /query and /query/stream endpoints for processing user queries."""
 
+import json
 import logging
+from collections.abc import AsyncIterator
+from time import perf_counter
 from typing import Annotated, Any
 
 from fastapi import APIRouter, Depends, HTTPException
+from fastapi.responses import StreamingResponse
 from quilto import (
+    AsyncStorageRepository,
     DomainModule,
     DomainSelector,
     LLMClient,
@@ -28,7 +33,7 @@ from quilto.agents import (
     Verdict,
 )
 
-from swealog.api.dependencies import get_domains, get_llm_client, get_storage
+from swealog.api.dependencies import get_async_storage, get_domains, get_llm_client
 from swealog.api.models import QueryRequest, QueryResponse
 
 logger = logging.getLogger(__name__)
@@ -43,11 +48,14 @@ _CONFIDENCE_PARTIAL = 0.6
 _CONFIDENCE_INSUFFICIENT = 0.4
 _CONFIDENCE_ADJUSTMENT = 0.1
 
+# A pipeline progress event: (event name, JSON-serializable data)
+QueryEvent = tuple[str, dict[str, Any]]
+
 
 async def execute_query_pipeline(
     query: str,
     llm_client: LLMClient,
-    storage: StorageRepository,
+    storage: StorageRepository | AsyncStorageRepository,
     domains: list[DomainModule],
 ) -> dict[str, Any]:
     """Execute the full query pipeline.
@@ -64,24 +72,129 @@ async def execute_query_pipeline(
     Returns:
         Dict with response, sources, confidence, and is_partial.
     """
+    result: dict[str, Any] = {}
+    async for event, data in _run_query_pipeline(query, llm_client, storage, domains, stream_draft=False):
+        if event == "final":
+            result = data
+    return result
+
+
+async def stream_query_pipeline(
+    query: str,
+    llm_client: LLMClient,
+    storage: StorageRepository | AsyncStorageRepository,
+    domains: list[DomainModule],
+) -> AsyncIterator[QueryEvent]:
+    """Execute the query pipeline, yielding progress events as it runs.
+
+    Runs the same stages as execute_query_pipeline, but the Synthesizer
+    streams its answer as plain text. Events, as (name, data) pairs:
+
+    - stage_start: {"stage", "attempt"} when a stage begins.
+    - stage_end: {"stage", "attempt", "duration_ms"} when it finishes.
+    - sources: {"attempt", "sources"} entry IDs, as soon as the Retriever finishes.
+    - draft: {"attempt", "text"} a piece of the answer. A new attempt
+      (after a failed evaluation) starts a new draft.
+    - final: QueryResponse fields (response, sources, confidence, partial).
+
+    Args:
+        query: The user's query text.
+        llm_client: LLM client for agents.
+        storage: Storage repository for entries.
+        domains: Available domain modules.
+
+    Yields:
+        (event name, event data) pairs in pipeline order.
+    """
+    async for event, data in _run_query_pipeline(query, llm_client, storage, domains, stream_draft=True):
+        if event == "final":
+            data = QueryResponse(
+                response=data["response"],
+                sources=data["sources"],
+                confidence=data["confidence"],
+                partial=data["is_partial"],
+            ).model_dump()
+        yield event, data
+
+
+def _stage_start(stage: str, attempt: int) -> QueryEvent:
+    """Build a stage_start event.
+
+    Args:
+        stage: Pipeline stage name.
+        attempt: 1-based pipeline attempt.
+
+    Returns:
+        The event.
+    """
+    return "stage_start", {"stage": stage, "attempt": attempt}
+
+
+def _stage_end(stage: str, attempt: int, started: float) -> QueryEvent:
+    """Build a stage_end event with the stage duration.
+
+    Args:
+        stage: Pipeline stage name.
+        attempt: 1-based pipeline attempt.
+        started: perf_counter() value when the stage started.
+
+    Returns:
+        The event.
+    """
+    return "stage_end", {"stage": stage, "attempt": attempt, "duration_ms": round((perf_counter() - started) * 1000, 1)}
+
+
+async def _run_query_pipeline(
+    query: str,
+    llm_client: LLMClient,
+    storage: StorageRepository | AsyncStorageRepository,
+    domains: list[DomainModule],
+    stream_draft: bool,
+) -> AsyncIterator[QueryEvent]:
+    """Run the query pipeline, yielding events (see stream_query_pipeline).
+
+    The final event's data is the execute_query_pipeline result dict.
+
+    Args:
+        query: The user's query text.
+        llm_client: LLM client for agents.
+        storage: Storage repository for entries.
+        domains: Available domain modules.
+        stream_draft: If True, stream the Synthesizer's answer as draft
+            events instead of requesting structured output. If the stream
+            fails before any text, the structured answer is sent as one
+            draft event instead.
+
+    Yields:
+        (event name, event data) pairs in pipeline order.
+    """
     # Initialize domain selector
     selector = DomainSelector(domains)
     domain_infos = selector.get_domain_infos()
+    attempt = 1
 
     # Step 1: Route query
+    yield _stage_start("router", attempt)
+    started = perf_counter()
     router_agent = RouterAgent(llm_client)
     router_input = RouterInput(raw_input=query, available_domains=domain_infos)
     router_output = await router_agent.classify(router_input)
+    yield _stage_end("router", attempt, started)
 
     # Build active domain context from selected domains
     active_context = selector.build_active_context(router_output.selected_domains)
 
     # Step 2: Plan retrieval
+    yield _stage_start("planner", attempt)
+    started = perf_counter()
     planner = PlannerAgent(llm_client)
     planner_input = PlannerInput(query=query, domain_context=active_context)
     planner_output = await planner.plan(planner_input)
+    yield _stage_end("planner", attempt, started)
 
     # Step 3: Retrieve entries
+    yield _stage_start("retriever", attempt)
+    started = perf_counter()
     retriever = RetrieverAgent(storage)
     retriever_input = RetrieverInput(
         instructions=planner_output.retrieval_instructions,
@@ -89,9 +202,11 @@ async def execute_query_pipeline(
         max_entries=100,
     )
     retriever_output = await retriever.retrieve(retriever_input)
+    yield _stage_end("retriever", attempt, started)
 
     # Collect source entry IDs
     sources: list[str] = [entry.id for entry in retriever_output.entries]
+    yield "sources", {"attempt": attempt, "sources": sources}
 
     # Step 4-6: Analyze -> Synthesize -> Evaluate with retry loop
     retry_count = 0
@@ -101,6 +216,8 @@ async def execute_query_pipeline(
 
     while retry_count <= MAX_RETRIES:
         # Step 4: Analyze retrieved entries
+        yield _stage_start("analyzer", attempt)
+        started = perf_counter()
         analyzer = AnalyzerAgent(llm_client)
         analyzer_input = AnalyzerInput(
             query=query,
@@ -110,12 +227,15 @@ async def execute_query_pipeline(
             domain_context=active_context,
         )
         analysis = await analyzer.analyze(analyzer_input)
+        yield _stage_end("analyzer", attempt, started)
 
         # Check if we need to generate partial response
         if analysis.verdict == Verdict.INSUFFICIENT and retry_count == MAX_RETRIES:
             is_partial = True
 
         # Step 5: Synthesize response
+        yield _stage_start("synthesizer", attempt)
+        started = perf_counter()
         synthesizer = SynthesizerAgent(llm_client)
         synthesizer_input = SynthesizerInput(
             query=query,
@@ -125,24 +245,44 @@ async def execute_query_pipeline(
             response_style="concise",
             is_partial=is_partial,
         )
-        synthesizer_output = await synthesizer.synthesize(synthesizer_input)
+        if stream_draft:
+            draft: list[str] = []
+            try:
+                async for text in synthesizer.synthesize_stream(synthesizer_input):
+                    draft.append(text)
+                    yield "draft", {"attempt": attempt, "text": text}
+            except Exception:
+                # Text already sent cannot be taken back
+                if draft:
+                    raise
+                logger.warning("Streamed synthesis failed before any text, using structured synthesis", exc_info=True)
+                response = (await synthesizer.synthesize(synthesizer_input)).response
+                yield "draft", {"attempt": attempt, "text": response}
+            else:
+                response = "".join(draft).strip()
+        else:
+            response = (await synthesizer.synthesize(synthesizer_input)).response
+        yield _stage_end("synthesizer", attempt, started)
 
         # Step 6: Evaluate response
+        yield _stage_start("evaluator", attempt)
+        started = perf_counter()
         evaluator = EvaluatorAgent(llm_client)
         entries_summary = _format_entries_summary(retriever_output.entries)
         evaluator_input = EvaluatorInput(
             query=query,
-            response=synthesizer_output.response,
+            response=response,
             analysis=analysis,
             entries_summary=entries_summary,
             evaluation_rules=active_context.evaluation_rules,
             attempt_number=retry_count + 1,
         )
         evaluation = await evaluator.evaluate(evaluator_input)
+        yield _stage_end("evaluator", attempt, started)
 
         # Check if passed
         if evaluator.is_passed(evaluation):
-            final_response = synthesizer_output.response
+            final_response = response
             confidence = _calculate_confidence(analysis, evaluation)
             break
 
@@ -153,11 +293,15 @@ async def execute_query_pipeline(
         # If max retries reached, return partial/best-effort
         if retry_count > MAX_RETRIES:
             is_partial = True
-            final_response = synthesizer_output.response
+            final_response = response
             confidence = _calculate_confidence(analysis, evaluation)
             break
 
+        attempt += 1
+
         # Re-plan with feedback for next iteration
+        yield _stage_start("planner", attempt)
+        started = perf_counter()
         planner_input = PlannerInput(
             query=query,
             domain_context=active_context,
@@ -165,21 +309,29 @@ async def execute_query_pipeline(
             retrieval_history=[a.model_dump() for a in retriever_output.retrieval_summary],
         )
         planner_output = await planner.plan(planner_input)
+        yield _stage_end("planner", attempt, started)
 
         # Re-retrieve with updated instructions
+        yield _stage_start("retriever", attempt)
+        started = perf_counter()
         retriever_input = RetrieverInput(
             instructions=planner_output.retrieval_instructions,
             vocabulary=active_context.vocabulary,
             max_entries=100,
         )
         retriever_output = await retriever.retrieve(retriever_input)
-
-    return {
-        "response": final_response,
-        "sources": sources,
-        "confidence": confidence,
-        "is_partial": is_partial,
-    }
+        yield _stage_end("retriever", attempt, started)
+        yield "sources", {"attempt": attempt, "sources": [entry.id for entry in retriever_output.entries]}
+
+    yield (
+        "final",
+        {
+            "response": final_response,
+            "sources": sources,
+            "confidence": confidence,
+            "is_partial": is_partial,
+        },
+    )
 
 
 def _format_entries_summary(entries: list[Any]) -> str:
@@ -237,7 +389,7 @@ def _calculate_confidence(analysis: AnalyzerOutput, evaluation: EvaluatorOutput)
 async def process_query(
     request: QueryRequest,
     llm_client: Annotated[LLMClient, Depends(get_llm_client)],
-    storage: Annotated[StorageRepository, Depends(get_storage)],
+    storage: Annotated[AsyncStorageRepository, Depends(get_async_storage)],
     domains: Annotated[list[DomainModule], Depends(get_domains)],
 ) -> QueryResponse:
     """Process a user query through the full agent pipeline.
@@ -277,3 +429,62 @@ async def process_query(
     except Exception as e:
         logger.exception("Query processing failed: %s", e)
         raise HTTPException(status_code=500, detail=f"Internal error: {type(e).__name__}") from e
+
+
+def _format_sse(event: str, data: dict[str, Any]) -> str:
+    """Format one Server-Sent Events message.
+
+    Args:
+        event: Event name.
+        data: JSON-serializable event data.
+
+    Returns:
+        The SSE message, terminated by a blank line.
+    """
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n"
+
+
+@router.post("/query/stream")
+async def stream_query(
+    request: QueryRequest,
+    llm_client: Annotated[LLMClient, Depends(get_llm_client)],
+    storage: Annotated[AsyncStorageRepository, Depends(get_async_storage)],
+    domains: Annotated[list[DomainModule], Depends(get_domains)],
+) -> StreamingResponse:
+    """Process a user query, streaming progress as Server-Sent Events.
+
+    Emits the events of stream_query_pipeline (stage_start, stage_end,
+    sources, draft, final) as they happen. Once the stream has started,
+    failures are reported as an error event with status_code and detail
+    instead of an HTTP error status.
+
+    Args:
+        request: Query request with text field.
+        llm_client: LLM client for agents.
+        storage: Storage repository for entries.
+        domains: Available domain modules.
+
+    Returns:
+        A text/event-stream response.
+    """
+
+    async def events() -> AsyncIterator[str]:
+        try:
+            async for event, data in stream_query_pipeline(
+                query=request.text,
+                llm_client=llm_client,
+                storage=storage,
+                domains=domains,
+            ):
+                yield _format_sse(event, data)
+        except ValueError as e:
+            yield _format_sse("error", {"status_code": 400, "detail": str(e)})
+        except Exception as e:
+            logger.exception("Streamed query processing failed: %s", e)
+            yield _format_sse("error", {"status_code": 500, "detail": f"Internal error: {type(e).__name__}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
@@ -1,6 +1,7 @@
 """CLI framework for Swealog application."""
 
 from swealog.cli.app import app
+from swealog.cli.checkpoint import CheckpointRecord, ImportCheckpoint, entry_key
 from swealog.cli.import_cmd import (
     BatchImporter,
     BatchImportError,
@@ -8,6 +9,8 @@ from swealog.cli.import_cmd import (
     RawEntry,
     collect_import_files,
     import_file,
+    iter_import_file,
+    iter_import_files,
     parse_import_file,
 )
 from swealog.cli.output import (
@@ -32,14 +35,19 @@ __all__ = [
     "BatchImporter",
     "BatchImportError",
     "BatchResult",
+    "CheckpointRecord",
     "EXIT_ERROR",
     "EXIT_SUCCESS",
     "EXIT_USAGE_ERROR",
+    "ImportCheckpoint",
     "RawEntry",
     "app",
     "collect_import_files",
     "console",
+    "entry_key",
     "import_file",
+    "iter_import_file",
+    "iter_import_files",
     "load_cli_config",
     "parse_import_file",
     "print_error",
@@ -1,10 +1,16 @@
 """Base Typer application for Swealog CLI."""
 
 from importlib.metadata import version
+from pathlib import Path
+from typing import Annotated
 
 import typer
+from quilto import StorageRepository
+from quilto.storage import ParsedFormat
 
 from swealog.cli.import_cmd import import_file
+from swealog.cli.output import print_success
+from swealog.cli.utils import resolve_storage_path
 
 
 def _get_version() -> str:
@@ -76,5 +82,49 @@ def serve(
     )
 
 
+@app.command()
+def reindex(
+    storage_path: Annotated[Path | None, typer.Option("--storage", help="Storage directory (default: ./logs)")] = None,
+) -> None:
+    """Rebuild the SQLite entry index from the raw markdown logs.
+
+    Creates logs/index.sqlite for an existing storage tree, or rebuilds it
+    from scratch if it was deleted or is out of date.
+
+    Args:
+        storage_path: Storage directory to index.
+    """
+    storage = StorageRepository(resolve_storage_path(storage_path), use_index=True)
+    try:
+        count = storage.rebuild_index()
+    finally:
+        storage.close()
+    print_success(f"Indexed {count} entries")
+
+
+@app.command(name="migrate-parsed")
+def migrate_parsed(
+    parsed_format: Annotated[
+        ParsedFormat, typer.Option("--format", help="Target format: jsonl (append-only) or json")
+    ] = "jsonl",
+    storage_path: Annotated[Path | None, typer.Option("--storage", help="Storage directory (default: ./logs)")] = None,
+) -> None:
+    """Convert parsed day files between the json and jsonl formats.
+
+    Later commands and the API server pick up the new format automatically.
+    Stop the API server and other writers before migrating.
+
+    Args:
+        parsed_format: Target parsed format.
+        storage_path: Storage directory to migrate.
+    """
+    storage = StorageRepository(resolve_storage_path(storage_path))
+    try:
+        count = storage.migrate_parsed_format(parsed_format)
+    finally:
+        storage.close()
+    print_success(f"Converted {count} day files to {parsed_format}")
+
+
 # Register import command (name="import" since "import" is reserved keyword)
 app.command(name="import")(import_file)
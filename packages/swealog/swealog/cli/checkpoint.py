@@ -0,0 +1,175 @@
+"""Checkpoint file for resumable imports.
+
+`swealog import` records every entry it finishes in a JSON Lines file, so
+`swealog import --resume` can skip them after a crash instead of paying
+for their LLM calls again and saving them twice.
+
+Entries are identified by the SHA-256 of their content and their source
+position (file path relative to the import root, and entry number), so
+identical entries (e.g. two "Rest day" lines) are tracked separately,
+same-named files in different directories (2024/log.md and 2025/log.md)
+do not collide, an export directory that was moved still resumes, and
+keys can be computed while streaming without remembering earlier entries.
+
+Saves are written ahead: a "saving" record (with the entry's date) is
+appended before the storage write and a "done" record after it. An entry
+left "saving" by a crash is looked up in that day's stored entries on
+resume, so it is neither lost nor imported twice.
+"""
+
+import hashlib
+import json
+import logging
+from collections.abc import Sequence
+from dataclasses import dataclass
+from datetime import date
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+CHECKPOINT_FILENAME = "import-checkpoint.jsonl"
+
+
+@dataclass
+class CheckpointRecord:
+    """Progress of one imported entry.
+
+    Attributes:
+        key: Content hash and source position, from entry_key.
+        source_file: File the entry was read from.
+        entry_number: Entry number within the file.
+        line_start: Line the entry starts on.
+        entry_date: Date the entry is saved under ("saving" records only).
+    """
+
+    key: str
+    source_file: Path
+    entry_number: int
+    line_start: int
+    entry_date: date | None = None
+
+
+def entry_key(content: str, source_file: Path, entry_number: int, root: Path | None = None) -> str:
+    """Build the checkpoint key of an entry.
+
+    Args:
+        content: The entry's content.
+        source_file: File the entry was read from.
+        entry_number: Entry number within the file.
+        root: Directory the import was started from. Files are keyed by
+            their path relative to it; without a root, or for a file
+            outside it, by their resolved absolute path.
+
+    Returns:
+        A "<sha256>:<file path>:<entry number>" key.
+    """
+    digest = hashlib.sha256(content.encode("utf-8")).hexdigest()
+    source = source_file.resolve()
+    if root is not None and source.is_relative_to(root.resolve()):
+        source = source.relative_to(root.resolve())
+    return f"{digest}:{source.as_posix()}:{entry_number}"
+
+
+class ImportCheckpoint:
+    """Append-only record of the entries an import has finished.
+
+    Records are flushed on every write, so they survive the import
+    process dying; a torn last line from a crash is ignored on load.
+
+    Attributes:
+        path: Path to the checkpoint file.
+        done: Keys of entries earlier runs finished (saved, or needing no
+            save). Entries finished by this process are only written to
+            the file, so memory does not grow with the import.
+        saving: Keys of entries whose save started but was not confirmed,
+            mapped to the date they are saved under.
+
+    Example:
+        >>> checkpoint = ImportCheckpoint(Path("logs/import-checkpoint.jsonl"))
+        >>> todo = [
+        ...     e for e in entries if entry_key(e.content, e.source_file, e.entry_number) not in checkpoint.done
+        ... ]
+    """
+
+    def __init__(self, path: Path) -> None:
+        """Load the checkpoint file if it exists.
+
+        Args:
+            path: Path to the checkpoint file.
+        """
+        self.path = path
+        self.done: set[str] = set()
+        self.saving: dict[str, date] = {}
+        if path.exists():
+            self._load()
+
+    def _load(self) -> None:
+        """Read the records in the checkpoint file."""
+        with self.path.open(encoding="utf-8") as f:
+            for line_number, line in enumerate(f, 1):
+                try:
+                    record = json.loads(line)
+                    key = str(record["key"])
+                    if record["op"] == "done":
+                        self.done.add(key)
+                        self.saving.pop(key, None)
+                    elif key not in self.done:
+                        self.saving[key] = date.fromisoformat(record["date"])
+                except (ValueError, KeyError, TypeError):
+                    logger.warning("Ignoring malformed checkpoint line %d in %s", line_number, self.path)
+
+    def reset(self) -> None:
+        """Forget all progress and delete the file."""
+        self.done.clear()
+        self.saving.clear()
+        self.path.unlink(missing_ok=True)
+
+    def mark_saving(self, records: Sequence[CheckpointRecord]) -> None:
+        """Record that the entries are about to be saved.
+
+        Args:
+            records: The entries, each with its entry_date.
+
+        Raises:
+            ValueError: If a record has no entry_date.
+        """
+        lines: list[dict[str, object]] = []
+        for record in records:
+            if record.entry_date is None:
+                raise ValueError("saving records need an entry_date")
+            self.saving[record.key] = record.entry_date
+            lines.append({"op": "saving", **_position(record), "date": record.entry_date.isoformat()})
+        self._append(lines)
+
+    def mark_done(self, records: Sequence[CheckpointRecord]) -> None:
+        """Record that the entries are finished.
+
+        Args:
+            records: The finished entries.
+        """
+        for record in records:
+            self.saving.pop(record.key, None)
+        self._append([{"op": "done", **_position(record)} for record in records])
+
+    def _append(self, lines: list[dict[str, object]]) -> None:
+        """Append records to the file and flush them.
+
+        Args:
+            lines: JSON objects to write, one per line.
+        """
+        if not lines:
+            return
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self.path.open("a", encoding="utf-8") as f:
+            f.write("".join(json.dumps(line) + "\n" for line in lines))
+            f.flush()
+
+
+def _position(record: CheckpointRecord) -> dict[str, object]:
+    """Get the key and source position fields of a record."""
+    return {
+        "key": record.key,
+        "source": str(record.source_file),
+        "entry": record.entry_number,
+        "line": record.line_start,
+    }
@@ -1,8 +1,13 @@
 """CLI import command for batch log operations."""
 
+import asyncio
+import itertools
 import logging
+import time
+from collections import Counter
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass, field
-from datetime import datetime
+from datetime import date, datetime
 from pathlib import Path
 from typing import Annotated
 
@@ -13,13 +18,16 @@ from quilto import (
     LLMClient,
     ParserAgent,
     ParserInput,
+    ParserOutput,
     RouterAgent,
     RouterInput,
+    RouterOutput,
     StorageRepository,
 )
 from quilto.agents import DomainInfo
 from rich.progress import (
     BarColumn,
+    MofNCompleteColumn,
     Progress,
     SpinnerColumn,
     TaskID,
@@ -30,12 +38,28 @@ from rich.progress import (
 )
 from rich.table import Table
 
-from swealog.cli.output import console, print_error, print_info, print_panel, print_success
+from swealog.cli.checkpoint import CHECKPOINT_FILENAME, CheckpointRecord, ImportCheckpoint, entry_key
+from swealog.cli.output import console, print_error, print_info, print_panel, print_success, print_warning
 from swealog.cli.utils import load_cli_config, resolve_storage_path, run_async
 from swealog.domains import general_fitness, nutrition, running, strength, swimming
 
 logger = logging.getLogger(__name__)
 
+# Parsed entries buffered by BatchImporter.import_entries between saves
+SAVE_BATCH_SIZE = 200
+
+# Longest time in seconds a parsed entry waits in the buffer before it is saved
+SAVE_INTERVAL = 2.0
+
+# Entries read ahead of the save stage, per concurrent slot
+PIPELINE_DEPTH = 4
+
+# Characters read at a time when splitting import files
+READ_CHUNK_SIZE = 1 << 20
+
+# Characters of a file searched for delimiters before the first one found decides
+DETECT_PREFIX_SIZE = 1 << 20
+
 
 @dataclass
 class RawEntry:
@@ -66,6 +90,39 @@ class BatchResult:
     failed: int
     errors: list["BatchImportError"] = field(default_factory=lambda: [])
     dry_run: bool = False
+    skipped: int = 0  # Already imported by an earlier run (--resume)
+
+
+@dataclass
+class _Prepared:
+    """Outcome of routing and (except for corrections) parsing one entry."""
+
+    raw: RawEntry
+    entry_id: str
+    key: str
+    router_output: RouterOutput | None = None
+    parsed: tuple[Entry, ParserOutput | None] | None = None
+    error: Exception | None = None
+
+    @property
+    def is_query(self) -> bool:
+        """Whether the Router classified the entry as a query."""
+        return self.router_output is not None and self.router_output.input_type.value == "QUERY"
+
+    @property
+    def needs_parse(self) -> bool:
+        """Whether the entry is a correction still waiting to be parsed."""
+        return self.error is None and self.parsed is None and not self.is_query
+
+
+@dataclass
+class _PendingSave:
+    """A parsed entry waiting to be saved by BatchImporter."""
+
+    raw: RawEntry
+    key: str
+    entry: Entry
+    correction: ParserOutput | None
 
 
 def parse_import_file(file_path: Path, delimiter: str | None = None) -> list[RawEntry]:
@@ -78,44 +135,130 @@ def parse_import_file(file_path: Path, delimiter: str | None = None) -> list[Raw
     Returns:
         List of RawEntry objects.
     """
-    content = file_path.read_text(encoding="utf-8")
+    return list(iter_import_file(file_path, delimiter))
 
+
+def iter_import_file(
+    file_path: Path,
+    delimiter: str | None = None,
+    chunk_size: int = READ_CHUNK_SIZE,
+) -> Iterator[RawEntry]:
+    """Split a file into entries while reading it in chunks.
+
+    Only the current chunk and the entry being split are held in memory,
+    so multi-GB exports can be imported without loading them. Entries,
+    numbers and line starts are the same as splitting the whole content.
+    The file is read once, including when its delimiter is auto-detected.
+
+    Args:
+        file_path: Path to the file to parse.
+        delimiter: Entry delimiter (None for auto-detect, see
+            _detect_delimiter; a file without delimiters is one entry).
+        chunk_size: Characters read at a time.
+
+    Yields:
+        RawEntry objects in file order.
+
+    Raises:
+        ValueError: If the delimiter is empty.
+    """
+    chunks = _read_chunks(file_path, chunk_size)
+    head = ""
     # Auto-detect delimiter if not specified
     if delimiter is None:
-        if "\n---\n" in content:
-            delimiter = "---"
-        elif "\n\n" in content:
-            delimiter = "\n\n"
-        else:
-            # Single entry file (no delimiters found)
-            stripped = content.strip()
+        delimiter, head = _detect_delimiter(chunks)
+        if delimiter is None:
+            # Single entry file (no delimiters found); detection read all of it
+            stripped = head.strip()
             if stripped:
-                return [RawEntry(content=stripped, source_file=file_path, entry_number=1, line_start=1)]
-            return []
+                yield RawEntry(content=stripped, source_file=file_path, entry_number=1, line_start=1)
+            return
 
-    # Split by delimiter
-    entries: list[RawEntry] = []
-    parts = content.split("\n---\n") if delimiter == "---" else content.split(delimiter)
+    separator = "\n---\n" if delimiter == "---" else delimiter
+    if not separator:
+        raise ValueError("empty separator")
+    separator_lines = separator.count("\n")
 
+    entry_number = 0
     line_num = 1
-    for i, part in enumerate(parts, 1):
+    buffer = ""
+
+    def finish(part: str) -> RawEntry | None:
+        nonlocal entry_number, line_num
+        entry_number += 1
         stripped = part.strip()
-        if stripped:
-            entries.append(
-                RawEntry(
-                    content=stripped,
-                    source_file=file_path,
-                    entry_number=i,
-                    line_start=line_num,
-                )
-            )
+        entry = RawEntry(stripped, file_path, entry_number, line_num) if stripped else None
         # Track line numbers for next entry
-        if delimiter == "---":
-            line_num += part.count("\n") + 2  # +2 for \n---\n
-        else:
-            line_num += part.count("\n") + delimiter.count("\n")
+        line_num += part.count("\n") + separator_lines
+        return entry
 
-    return entries
+    for chunk in itertools.chain([head], chunks):
+        buffer += chunk
+        start = 0
+        while (end := buffer.find(separator, start)) != -1:
+            if (entry := finish(buffer[start:end])) is not None:
+                yield entry
+            start = end + len(separator)
+        buffer = buffer[start:]
+    if (entry := finish(buffer)) is not None:
+        yield entry
+
+
+def iter_import_files(files: Iterable[Path], delimiter: str | None = None) -> Iterator[RawEntry]:
+    """Split files into entries one after another.
+
+    Args:
+        files: Files in import order.
+        delimiter: Entry delimiter (None for auto-detect per file).
+
+    Yields:
+        RawEntry objects in import order.
+    """
+    for file_path in files:
+        yield from iter_import_file(file_path, delimiter)
+
+
+def _read_chunks(file_path: Path, chunk_size: int) -> Iterator[str]:
+    """Read a text file in chunks with universal newlines.
+
+    Args:
+        file_path: Path to the file.
+        chunk_size: Characters per chunk.
+
+    Yields:
+        Successive chunks of the file.
+    """
+    with file_path.open(encoding="utf-8") as f:
+        while chunk := f.read(chunk_size):
+            yield chunk
+
+
+def _detect_delimiter(chunks: Iterator[str]) -> tuple[str | None, str]:
+    """Pick the delimiter of a file from the start of its chunks.
+
+    A "---" line in the first DETECT_PREFIX_SIZE characters wins, then a
+    blank line there. If the prefix has neither, reading continues until
+    the first delimiter of either kind decides.
+
+    Args:
+        chunks: Chunks of the file; only those needed to decide are read.
+
+    Returns:
+        Tuple of ("---", the blank line delimiter, or None if the file has
+        neither) and the text read, which the caller splits first.
+    """
+    head = ""
+    has_blank_line = False
+    for chunk in chunks:
+        # Search from just before the new chunk to match across the boundary
+        scan_from = max(len(head) - 4, 0)
+        head += chunk
+        if "\n---\n" in head[scan_from:]:
+            return "---", head
+        has_blank_line = has_blank_line or "\n\n" in head[scan_from:]
+        if has_blank_line and len(head) >= DETECT_PREFIX_SIZE:
+            return "\n\n", head
+    return ("\n\n" if has_blank_line else None), head
 
 
 def collect_import_files(path: Path) -> list[Path]:
@@ -148,6 +291,9 @@ class BatchImporter:
         storage: StorageRepository,
         domains: list[DomainModule],
         dry_run: bool = False,
+        concurrency: int = 1,
+        checkpoint: ImportCheckpoint | None = None,
+        import_root: Path | None = None,
     ) -> None:
         """Initialize batch importer.
 
@@ -156,11 +302,24 @@ class BatchImporter:
             storage: Storage repository for saving entries.
             domains: Available domain modules for parsing.
             dry_run: If True, validate but don't save entries.
+            concurrency: Entries routed and parsed at once by import_entries.
+            checkpoint: Records finished entries; import_entries skips the
+                ones it already holds. Not written in dry runs.
+            import_root: Directory the imported files are keyed relative to
+                in the checkpoint (see entry_key).
+
+        Raises:
+            ValueError: If concurrency is less than 1.
         """
+        if concurrency < 1:
+            raise ValueError("concurrency must be >= 1")
         self.llm_client = llm_client
         self.storage = storage
         self.domains = domains
         self.dry_run = dry_run
+        self.concurrency = concurrency
+        self.checkpoint = checkpoint
+        self.import_root = import_root
 
     async def import_entry(self, entry: RawEntry, entry_id: str) -> BatchImportError | None:
         """Import a single entry.
@@ -173,115 +332,396 @@ class BatchImporter:
             BatchImportError if failed, None if successful.
         """
         try:
-            # Route the entry
-            router = RouterAgent(self.llm_client)
-            domain_infos = [DomainInfo(name=d.name, description=d.description) for d in self.domains]
-            router_input = RouterInput(raw_input=entry.content, available_domains=domain_infos)
-            router_output = await router.classify(router_input)
+            router_output = await self._route(entry)
 
             # Skip QUERY-only entries (not loggable)
             # Handle LOG, BOTH, and CORRECTION types (same as /input API)
             if router_output.input_type.value == "QUERY":
                 return None  # Skip silently - queries don't create log entries, not an error
 
-            # Filter domains to those selected by Router
-            selected_domains = [d for d in self.domains if d.name in router_output.selected_domains]
-            if not selected_domains:
-                selected_domains = self.domains
-
-            # Build domain schemas and vocabulary
-            domain_schemas = {d.name: d.log_schema for d in selected_domains}
-            vocabulary: dict[str, str] = {}
-            for d in selected_domains:
-                vocabulary.update(d.vocabulary)
-
-            # Parse using entry_id timestamp (strip counter suffix if present)
-            base_timestamp = entry_id.split("-", 3)[:3]  # Get YYYY-MM-DD part
-            time_part = entry_id.split("_")[1].split("-")[0:3]  # Get HH-MM-SS part
-            timestamp_str = "-".join(base_timestamp) + "_" + "-".join(time_part)
-            timestamp = datetime.strptime(timestamp_str, "%Y-%m-%d_%H-%M-%S")
-
-            # Handle CORRECTION type (same as /input API)
-            is_correction = router_output.input_type.value == "CORRECTION"
-            recent_entries: list[Entry] = []
-            if is_correction:
-                recent_entries = self.storage.get_entries_by_pattern("**/*.md")[-10:]
-
-            parser = ParserAgent(self.llm_client)
-            parser_input = ParserInput(
-                raw_input=entry.content,
-                timestamp=timestamp,
-                domain_schemas=domain_schemas,
-                vocabulary=vocabulary,
-                correction_mode=is_correction,
-                correction_target=router_output.correction_target,
-                recent_entries=recent_entries,
-            )
-
-            parser_output = await parser.parse(parser_input)
+            storage_entry, correction = await self._parse(entry, entry_id, router_output)
 
             if not self.dry_run:
-                # Create and save entry
-                storage_entry = Entry(
-                    id=entry_id,
-                    date=parser_output.date,
-                    timestamp=parser_output.timestamp,
-                    raw_content=entry.content,
-                    parsed_data=parser_output.domain_data,
-                )
                 # Handle correction save (same as /input API)
-                if is_correction and parser_output.is_correction:
-                    self.storage.save_entry(storage_entry, correction=parser_output)
+                if correction is not None:
+                    self.storage.save_entry(storage_entry, correction=correction)
                 else:
                     self.storage.save_entry(storage_entry)
 
             return None
 
         except Exception as e:
-            content_preview = entry.content[:100] + "..." if len(entry.content) > 100 else entry.content
-            return BatchImportError(
-                file_path=entry.source_file,
-                entry_number=entry.entry_number,
-                error_message=str(e),
-                content_preview=content_preview,
+            return _import_error(entry, e)
+
+    async def _route(self, entry: RawEntry) -> RouterOutput:
+        """Classify an entry with the Router agent.
+
+        Args:
+            entry: Raw entry to classify.
+
+        Returns:
+            RouterOutput for the entry.
+        """
+        router = RouterAgent(self.llm_client)
+        domain_infos = [DomainInfo(name=d.name, description=d.description) for d in self.domains]
+        router_input = RouterInput(raw_input=entry.content, available_domains=domain_infos)
+        return await router.classify(router_input)
+
+    async def _parse(
+        self,
+        entry: RawEntry,
+        entry_id: str,
+        router_output: RouterOutput,
+    ) -> tuple[Entry, ParserOutput | None]:
+        """Parse a routed entry into a storage entry.
+
+        Corrections are parsed against the most recent stored entries, so
+        earlier entries of the batch must already be saved.
+
+        Args:
+            entry: Raw entry to parse.
+            entry_id: Unique ID for this entry.
+            router_output: Router classification of the entry.
+
+        Returns:
+            Tuple of the storage entry and, for corrections, the ParserOutput
+            to save it with.
+        """
+        # Filter domains to those selected by Router
+        selected_domains = [d for d in self.domains if d.name in router_output.selected_domains]
+        if not selected_domains:
+            selected_domains = self.domains
+
+        # Build domain schemas and vocabulary
+        domain_schemas = {d.name: d.log_schema for d in selected_domains}
+        vocabulary: dict[str, str] = {}
+        for d in selected_domains:
+            vocabulary.update(d.vocabulary)
+
+        # Parse using entry_id timestamp (strip counter suffix if present)
+        timestamp = datetime.strptime(entry_id[: len("YYYY-MM-DD_HH-MM-SS")], "%Y-%m-%d_%H-%M-%S")
+
+        # Handle CORRECTION type (same as /input API)
+        is_correction = router_output.input_type.value == "CORRECTION"
+        recent_entries: list[Entry] = []
+        if is_correction:
+            recent_entries = self.storage.get_entries_by_pattern("**/*.md")[-10:]
+
+        parser = ParserAgent(self.llm_client)
+        parser_input = ParserInput(
+            raw_input=entry.content,
+            timestamp=timestamp,
+            domain_schemas=domain_schemas,
+            vocabulary=vocabulary,
+            correction_mode=is_correction,
+            correction_target=router_output.correction_target,
+            recent_entries=recent_entries,
+        )
+
+        parser_output = await parser.parse(parser_input)
+
+        storage_entry = Entry(
+            id=entry_id,
+            date=parser_output.date,
+            timestamp=parser_output.timestamp,
+            raw_content=entry.content,
+            parsed_data=parser_output.domain_data,
+        )
+        correction = parser_output if is_correction and parser_output.is_correction else None
+        return storage_entry, correction
+
+    async def _flush(self, pending: list[_PendingSave], result: BatchResult) -> None:
+        """Save buffered entries with one write per day file.
+
+        The checkpoint and storage writes run in a worker thread, so routing
+        and parsing continue while the buffer is saved. If the write fails,
+        the buffered entries are reported as failed.
+
+        Args:
+            pending: Buffered saves; cleared on return.
+            result: Batch result to update on failure.
+        """
+        if not pending:
+            return
+        if self.checkpoint is not None:
+            await asyncio.to_thread(
+                self.checkpoint.mark_saving, [_checkpoint_record(p.raw, p.key, p.entry.date) for p in pending]
+            )
+        try:
+            await asyncio.to_thread(
+                self.storage.save_entries, [p.entry for p in pending], [p.correction for p in pending]
             )
+        except Exception as e:
+            logger.exception("Failed to save %d imported entries", len(pending))
+            result.successful -= len(pending)
+            result.failed += len(pending)
+            result.errors.extend(_import_error(p.raw, e) for p in pending)
+        else:
+            if self.checkpoint is not None:
+                await asyncio.to_thread(self.checkpoint.mark_done, [_checkpoint_record(p.raw, p.key) for p in pending])
+        pending.clear()
+
+    def _stored_contents(self) -> dict[date, Counter[str]]:
+        """Count the stored contents of days with unconfirmed saves.
+
+        Must be read before this import saves anything, so only saves made
+        by earlier runs are counted.
+
+        Returns:
+            Stored raw contents per day the checkpoint has "saving" entries on.
+        """
+        if self.checkpoint is None:
+            return {}
+        return {
+            day: Counter(e.raw_content.strip() for e in self.storage.get_entries_by_date_range(day, day))
+            for day in set(self.checkpoint.saving.values())
+        }
+
+    def _already_imported(self, entry: RawEntry, key: str, saved_by_day: dict[date, Counter[str]]) -> bool:
+        """Check whether the checkpoint says an earlier run finished an entry.
+
+        Entries whose save was started but not confirmed are looked up in
+        storage, so a crash between the save and its checkpoint record
+        neither loses nor duplicates them.
+
+        Args:
+            entry: Entry to import.
+            key: Its checkpoint key.
+            saved_by_day: Stored contents from _stored_contents; each
+                confirmed entry uses up one stored copy.
+
+        Returns:
+            Whether the entry can be skipped.
+        """
+        checkpoint = self.checkpoint
+        if checkpoint is None:
+            return False
+        if key in checkpoint.done:
+            return True
+        entry_date = checkpoint.saving.get(key)
+        if entry_date is None:
+            return False
+        saved = saved_by_day[entry_date]
+        if saved[entry.content] <= 0:
+            return False
+        # Each stored copy confirms one entry with this content
+        saved[entry.content] -= 1
+        if not self.dry_run:
+            checkpoint.mark_done([_checkpoint_record(entry, key)])
+        return True
+
+    async def _prepare(
+        self,
+        entry: RawEntry,
+        entry_id: str,
+        key: str,
+        semaphore: asyncio.Semaphore,
+        progress: Progress,
+        task_id: TaskID,
+    ) -> _Prepared:
+        """Route an entry and parse it unless it is a query or a correction.
+
+        Corrections are only routed: they are parsed by import_entries once
+        the entries before them are saved.
+
+        Args:
+            entry: Raw entry to import.
+            entry_id: Unique ID for this entry.
+            key: Checkpoint key of this entry.
+            semaphore: Bounds the entries being routed and parsed at once.
+            progress: Rich Progress instance, advanced when the entry is done.
+            task_id: Task ID for progress updates.
+
+        Returns:
+            The routing and parsing outcome.
+        """
+        prepared = _Prepared(entry, entry_id, key)
+        async with semaphore:
+            try:
+                prepared.router_output = await self._route(entry)
+                if prepared.router_output.input_type.value not in ("QUERY", "CORRECTION"):
+                    prepared.parsed = await self._parse(entry, entry_id, prepared.router_output)
+            except Exception as e:
+                prepared.error = e
+        if not prepared.needs_parse:
+            progress.advance(task_id)
+        return prepared
+
+    async def _read(
+        self,
+        entries: Iterable[RawEntry],
+        queue: asyncio.Queue[asyncio.Task[_Prepared] | None],
+        started: set[asyncio.Task[_Prepared]],
+        semaphore: asyncio.Semaphore,
+        progress: Progress,
+        task_id: TaskID,
+        result: BatchResult,
+    ) -> None:
+        """Read entries and start routing and parsing them, in order.
+
+        Entries are pulled in a worker thread, so splitting a large file
+        never blocks the event loop. The queue is bounded: reading pauses
+        while it is full, so only a window of entries is held in memory.
+        A None is queued after the last entry, or when reading fails.
+
+        Args:
+            entries: Entries to import.
+            queue: Receives one _prepare task per entry to import.
+            started: Collects the tasks, so they can be cancelled.
+            semaphore: Bounds the entries being routed and parsed at once.
+            progress: Rich Progress instance for updates.
+            task_id: Task ID for progress updates.
+            result: Batch result; counts read and skipped entries.
+        """
+        saved_by_day = self._stored_contents()
+        # Generate unique entry_ids with counter suffix to avoid collisions in batch
+        base_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
+        iterator = iter(entries)
+        try:
+            while (entry := await asyncio.to_thread(next, iterator, None)) is not None:
+                index = result.total_entries
+                result.total_entries += 1
+                key = entry_key(entry.content, entry.source_file, entry.entry_number, self.import_root)
+                if self._already_imported(entry, key, saved_by_day):
+                    result.skipped += 1
+                    progress.advance(task_id)
+                    continue
+                task = asyncio.create_task(
+                    self._prepare(entry, f"{base_id}-{index:04d}", key, semaphore, progress, task_id)
+                )
+                started.add(task)
+                task.add_done_callback(started.discard)
+                await queue.put(task)
+        except Exception:
+            await queue.put(None)
+            raise
+        progress.update(task_id, total=result.total_entries)
+        await queue.put(None)
 
     async def import_entries(
         self,
-        entries: list[RawEntry],
+        entries: Iterable[RawEntry],
         progress: Progress,
         task_id: TaskID,
     ) -> BatchResult:
-        """Import a list of raw entries.
+        """Import raw entries as they are read.
+
+        Entries flow through a pipeline: they are read (see _read), routed
+        and parsed with up to `concurrency` entries at once, and saved in
+        input order, so saves happen in the same order as a sequential
+        import. The stages are connected by a queue bounded to a few entries
+        per concurrent slot, so a generator such as iter_import_files is
+        consumed only as fast as entries are imported and memory does not
+        grow with the size of the export. If reading fails, the entries read
+        before the error are saved and the error is re-raised.
+
+        Parsed entries are buffered and saved with
+        StorageRepository.save_entries, so each day file is written once per
+        flush rather than once per entry. The buffer is flushed before a
+        correction is parsed (it needs the preceding entries in storage),
+        every SAVE_BATCH_SIZE entries, once an entry has waited
+        SAVE_INTERVAL seconds, and at the end.
+
+        With a checkpoint, entries it already holds are skipped without
+        LLM calls, and saved and query entries are recorded as done.
+        Failed entries are not recorded, so a resumed import retries them.
 
         Args:
-            entries: List of RawEntry objects to import.
+            entries: RawEntry objects to import, e.g. from iter_import_files.
             progress: Rich Progress instance for updates.
             task_id: Task ID for progress updates.
 
         Returns:
             BatchResult with statistics and errors.
         """
-        result = BatchResult(total_entries=len(entries), successful=0, failed=0, dry_run=self.dry_run)
+        result = BatchResult(total_entries=0, successful=0, failed=0, dry_run=self.dry_run)
+        pending: list[_PendingSave] = []
+        semaphore = asyncio.Semaphore(self.concurrency)
+        queue: asyncio.Queue[asyncio.Task[_Prepared] | None] = asyncio.Queue(self.concurrency * PIPELINE_DEPTH)
+        started: set[asyncio.Task[_Prepared]] = set()
+        reader = asyncio.create_task(self._read(entries, queue, started, semaphore, progress, task_id, result))
+        last_flush = time.monotonic()
 
-        for i, entry in enumerate(entries):
-            progress.update(task_id, completed=i, description=f"[cyan]{entry.source_file.name}[/cyan]")
-
-            # Generate unique entry_id with counter suffix to avoid collisions in batch
-            base_id = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
-            entry_id = f"{base_id}-{i:04d}"
+        try:
+            while (task := await queue.get()) is not None:
+                prepared = await task
+                entry = prepared.raw
+                progress.update(task_id, description=f"[cyan]{entry.source_file.name}[/cyan]")
+
+                if prepared.is_query:
+                    result.successful += 1
+                    if self.checkpoint is not None and not self.dry_run:
+                        self.checkpoint.mark_done([_checkpoint_record(entry, prepared.key)])
+                    continue
+                if prepared.needs_parse and prepared.router_output is not None:
+                    # Correction: parse against storage holding every earlier entry
+                    await self._flush(pending, result)
+                    last_flush = time.monotonic()
+                    async with semaphore:
+                        try:
+                            prepared.parsed = await self._parse(entry, prepared.entry_id, prepared.router_output)
+                        except Exception as e:
+                            prepared.error = e
+                    progress.advance(task_id)
+
+                if prepared.parsed is None:
+                    result.failed += 1
+                    result.errors.append(_import_error(entry, prepared.error or RuntimeError("entry not parsed")))
+                    continue
 
-            error = await self.import_entry(entry, entry_id)
-            if error:
-                result.failed += 1
-                result.errors.append(error)
-            else:
                 result.successful += 1
-
-        progress.update(task_id, completed=len(entries))
+                if not self.dry_run:
+                    storage_entry, correction = prepared.parsed
+                    pending.append(_PendingSave(entry, prepared.key, storage_entry, correction))
+                    if len(pending) >= SAVE_BATCH_SIZE or time.monotonic() - last_flush >= SAVE_INTERVAL:
+                        await self._flush(pending, result)
+                        last_flush = time.monotonic()
+            await self._flush(pending, result)
+            # Re-raise a read error, now that the entries read before it are saved
+            await reader
+        finally:
+            reader.cancel()
+            for task in started:
+                task.cancel()
+            await asyncio.gather(reader, *started, return_exceptions=True)
+
+        progress.update(task_id, total=result.total_entries, completed=result.total_entries)
         return result
 
 
+def _checkpoint_record(entry: RawEntry, key: str, entry_date: date | None = None) -> CheckpointRecord:
+    """Build the checkpoint record for an entry.
+
+    Args:
+        entry: The imported entry.
+        key: Its checkpoint key.
+        entry_date: Date it is saved under, for "saving" records.
+
+    Returns:
+        The checkpoint record.
+    """
+    return CheckpointRecord(key, entry.source_file, entry.entry_number, entry.line_start, entry_date)
+
+
+def _import_error(entry: RawEntry, error: Exception) -> BatchImportError:
+    """Build the error record for a failed entry.
+
+    Args:
+        entry: Entry that failed.
+        error: The exception raised.
+
+    Returns:
+        BatchImportError with a content preview.
+    """
+    content_preview = entry.content[:100] + "..." if len(entry.content) > 100 else entry.content
+    return BatchImportError(
+        file_path=entry.source_file,
+        entry_number=entry.entry_number,
+        error_message=str(error),
+        content_preview=content_preview,
+    )
+
+
 def display_errors(errors: list[BatchImportError], error_log: Path | None) -> None:
     """Display import errors in table format.
 
@@ -327,16 +767,32 @@ async def import_file(
     ] = None,
     error_log: Annotated[Path | None, typer.Option("--error-log", help="Path to write error details")] = None,
     verbose: Annotated[bool, typer.Option("--verbose", "-v", help="Show detailed progress per entry")] = False,
+    concurrency: Annotated[
+        int, typer.Option("--concurrency", "-j", min=1, help="Entries routed and parsed at once")
+    ] = 1,
+    resume: Annotated[
+        bool, typer.Option("--resume", help="Skip entries finished by an earlier, interrupted import")
+    ] = False,
+    checkpoint_path: Annotated[
+        Path | None,
+        typer.Option("--checkpoint", help=f"Checkpoint file (default: <storage>/{CHECKPOINT_FILENAME})"),
+    ] = None,
 ) -> None:
     """Import log entries from file or directory.
 
     Processes fitness log entries through the Router → Parser pipeline and
     saves them to storage. Supports batch import from multiple files.
+    Files are read as the import goes, so large exports start saving
+    entries right away.
+    Finished entries are recorded in a checkpoint file; rerun with
+    --resume after an interruption to import only the rest.
 
     Examples:
         swealog import logs.txt
         swealog import ./historical/ --dry-run
         swealog import workout.md --delimiter "---"
+        swealog import export.txt --concurrency 8
+        swealog import export.txt --resume
     """
     # Validate path exists
     if not path.exists():
@@ -349,22 +805,10 @@ async def import_file(
         print_error("No .txt or .md files found to import")
         raise typer.Exit(1)
 
+    print_info(f"Importing entries from {len(files)} file(s)")
     if verbose:
-        print_info(f"Found {len(files)} file(s) to process")
-
-    # Parse all entries from all files
-    entries: list[RawEntry] = []
-    for file_path in files:
-        file_entries = parse_import_file(file_path, delimiter)
-        entries.extend(file_entries)
-        if verbose:
-            print_info(f"  {file_path.name}: {len(file_entries)} entries")
-
-    if not entries:
-        print_error("No entries found to import")
-        raise typer.Exit(1)
-
-    print_info(f"Found {len(entries)} entries to import from {len(files)} file(s)")
+        for file_path in files:
+            print_info(f"  {file_path.name}")
 
     if dry_run:
         print_info("[yellow]DRY RUN MODE - no entries will be saved[/yellow]")
@@ -372,25 +816,55 @@ async def import_file(
     # Initialize importer
     config = load_cli_config()
     llm_client = LLMClient(config)
-    storage = StorageRepository(resolve_storage_path())
+    storage_path = resolve_storage_path()
+    storage = StorageRepository(storage_path)
     domains: list[DomainModule] = [general_fitness, strength, nutrition, running, swimming]
 
-    importer = BatchImporter(llm_client, storage, domains, dry_run)
-
-    # Run import with progress bar
-    with Progress(
-        SpinnerColumn(),
-        TextColumn("[progress.description]{task.description}"),
-        BarColumn(),
-        TaskProgressColumn(),
-        TimeElapsedColumn(),
-        TimeRemainingColumn(),
-        console=console,
-    ) as progress:
-        task = progress.add_task("Starting...", total=len(entries))
-        result = await importer.import_entries(entries, progress, task)
+    try:
+        checkpoint = ImportCheckpoint(checkpoint_path or storage_path / CHECKPOINT_FILENAME)
+        if not resume and not dry_run and (checkpoint.done or checkpoint.saving):
+            print_warning(
+                f"Starting over: discarding checkpoint of {len(checkpoint.done)} entries from an earlier import "
+                "(use --resume to skip them)"
+            )
+            checkpoint.reset()
+
+        # Dry runs only read the checkpoint, and only when resuming
+        importer = BatchImporter(
+            llm_client,
+            storage,
+            domains,
+            dry_run,
+            concurrency,
+            checkpoint if resume or not dry_run else None,
+            import_root=path if path.is_dir() else path.parent,
+        )
+
+        # Run import with progress bar
+        with Progress(
+            SpinnerColumn(),
+            TextColumn("[progress.description]{task.description}"),
+            BarColumn(),
+            MofNCompleteColumn(),
+            TaskProgressColumn(),
+            TimeElapsedColumn(),
+            TimeRemainingColumn(),
+            console=console,
+        ) as progress:
+            # Entries are read while importing, so the total is known once the last file is read
+            task = progress.add_task("Starting...", total=None)
+            result = await importer.import_entries(iter_import_files(files, delimiter), progress, task)
+    finally:
+        # Waits for background journal compactions, logging any that fail
+        storage.close()
+
+    if result.total_entries == 0:
+        print_error("No entries found to import")
+        raise typer.Exit(1)
 
     # Display results
+    if result.skipped:
+        print_info(f"Skipped {result.skipped} entries finished by an earlier import")
     if result.dry_run:
         print_panel(
             f"[bold]Dry Run Complete[/bold]\n\n"
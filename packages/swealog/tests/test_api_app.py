@@ -1,8 +1,14 @@
 """Tests for swealog.api.app module - app creation and health endpoint."""
 
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
 import pytest
 from httpx import ASGITransport, AsyncClient
+from quilto import StorageRepository
 from swealog.api import app
+from swealog.api.app import lifespan
+from swealog.api.dependencies import get_llm_config
 
 
 @pytest.mark.asyncio
@@ -59,3 +65,37 @@ async def test_docs_available() -> None:
         response = await client.get("/docs")
 
     assert response.status_code == 200
+
+
+@pytest.mark.asyncio
+async def test_lifespan_creates_and_closes_singletons(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that the lifespan keeps one storage and LLM client per process."""
+    monkeypatch.chdir(tmp_path)
+    llm_client = MagicMock()
+    llm_client.aclose = AsyncMock()
+
+    with patch("swealog.api.app.create_llm_client", return_value=llm_client):
+        async with lifespan(app):
+            storage = app.state.storage
+            assert isinstance(storage, StorageRepository)
+            assert storage.base_path == Path("logs")
+            assert app.state.async_storage.storage is storage
+            assert app.state.llm_client is llm_client
+
+    llm_client.aclose.assert_awaited_once()
+    assert app.state.storage is None
+    assert app.state.async_storage is None
+    assert app.state.llm_client is None
+
+
+@pytest.mark.asyncio
+async def test_lifespan_starts_without_llm_config(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test that a missing LLM config does not block startup."""
+    monkeypatch.chdir(tmp_path)
+    get_llm_config.cache_clear()
+
+    async with lifespan(app):
+        assert app.state.llm_client is None
+        assert app.state.storage is not None
+
+    get_llm_config.cache_clear()
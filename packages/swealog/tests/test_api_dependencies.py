@@ -2,15 +2,21 @@
 
 from pathlib import Path
 from tempfile import TemporaryDirectory
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import pytest
+from fastapi import FastAPI, Request
+from quilto import AsyncStorageRepository, StorageRepository
 from swealog.api.dependencies import (
     ConfigNotFoundError,
+    create_llm_client,
+    create_storage,
+    get_async_storage,
     get_domains,
     get_llm_client,
     get_llm_config,
     get_storage,
+    get_storage_executor,
 )
 
 
@@ -42,11 +48,16 @@ class TestGetDomains:
             assert len(domain.description) > 0
 
 
-class TestGetStorage:
-    """Tests for get_storage dependency."""
+def make_request(app: FastAPI | None = None) -> Request:
+    """Build a bare request bound to an app."""
+    return Request({"type": "http", "app": app or FastAPI()})
+
+
+class TestCreateStorage:
+    """Tests for create_storage factory."""
 
     def test_returns_storage_repository(self) -> None:
-        """Test that get_storage returns StorageRepository instance."""
+        """Test that create_storage returns StorageRepository instance."""
         with (
             TemporaryDirectory() as tmpdir,
             patch("swealog.api.dependencies.Path") as mock_path,
@@ -54,22 +65,75 @@ class TestGetStorage:
             mock_path.return_value = Path(tmpdir) / "logs"
             mock_path.return_value.mkdir(parents=True, exist_ok=True)
 
-            storage = get_storage()
+            storage = create_storage()
 
             # Should be a StorageRepository
-            from quilto import StorageRepository
-
             assert isinstance(storage, StorageRepository)
 
     def test_creates_logs_directory(self) -> None:
-        """Test that get_storage creates logs directory if not exists."""
+        """Test that create_storage creates logs directory if not exists."""
         # This tests the actual behavior - creates ./logs in current dir
-        storage = get_storage()
+        storage = create_storage()
 
         # Verify we got a repository
         assert storage is not None
 
 
+class TestGetStorage:
+    """Tests for get_storage dependency."""
+
+    @pytest.mark.asyncio
+    async def test_returns_app_state_storage(self, tmp_path: Path) -> None:
+        """Test that get_storage returns the repository created at startup."""
+        app = FastAPI()
+        app.state.storage = StorageRepository(tmp_path)
+
+        assert await get_storage(make_request(app)) is app.state.storage
+
+    @pytest.mark.asyncio
+    async def test_creates_once_without_lifespan(self, tmp_path: Path) -> None:
+        """Test that the repository is created on first use and then reused."""
+        app = FastAPI()
+        with patch("swealog.api.dependencies.create_storage", return_value=StorageRepository(tmp_path)) as create:
+            first = await get_storage(make_request(app))
+            second = await get_storage(make_request(app))
+
+        assert first is second is app.state.storage
+        create.assert_called_once()
+
+
+class TestGetAsyncStorage:
+    """Tests for get_async_storage dependency."""
+
+    @pytest.mark.asyncio
+    async def test_reuses_app_state_facade(self, tmp_path: Path) -> None:
+        """Test that requests share the facade wrapping the app's repository."""
+        app = FastAPI()
+        storage = StorageRepository(tmp_path)
+        app.state.storage = storage
+
+        first = await get_async_storage(make_request(app), storage)
+        second = await get_async_storage(make_request(app), storage)
+
+        assert first is second is app.state.async_storage
+        assert first.storage is storage
+
+    @pytest.mark.asyncio
+    async def test_wraps_overridden_storage_on_shared_executor(self, tmp_path: Path) -> None:
+        """Test that an overridden repository is wrapped on the shared thread pool."""
+        app = FastAPI()
+        app.state.storage = StorageRepository(tmp_path / "app")
+        override = StorageRepository(tmp_path / "override")
+
+        first = await get_async_storage(make_request(app), override)
+        second = await get_async_storage(make_request(app), override)
+
+        assert isinstance(first, AsyncStorageRepository)
+        assert first.storage is override
+        assert first._executor is second._executor is get_storage_executor()  # pyright: ignore[reportPrivateUsage]
+        assert getattr(app.state, "async_storage", None) is None
+
+
 class TestGetLLMConfig:
     """Tests for get_llm_config dependency."""
 
@@ -98,10 +162,10 @@ class TestGetLLMConfig:
 
 
 class TestGetLLMClient:
-    """Tests for get_llm_client dependency."""
+    """Tests for create_llm_client and get_llm_client."""
 
     def test_raises_when_config_missing(self) -> None:
-        """Test that get_llm_client raises ConfigNotFoundError when config missing."""
+        """Test that create_llm_client raises ConfigNotFoundError when config missing."""
         # Clear cache first
         get_llm_config.cache_clear()
 
@@ -109,11 +173,34 @@ class TestGetLLMClient:
             mock_path.return_value.exists.return_value = False
 
             with pytest.raises(ConfigNotFoundError):
-                get_llm_client()
+                create_llm_client()
 
         # Clear cache after test
         get_llm_config.cache_clear()
 
+    @pytest.mark.asyncio
+    async def test_returns_app_state_client(self) -> None:
+        """Test that get_llm_client returns the client created at startup."""
+        app = FastAPI()
+        app.state.llm_client = MagicMock()
+
+        with patch("swealog.api.dependencies.create_llm_client") as create:
+            assert await get_llm_client(make_request(app)) is app.state.llm_client
+        create.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_created_on_first_use(self) -> None:
+        """Test that a missing client is created once and kept on app.state."""
+        app = FastAPI()
+        app.state.llm_client = None
+
+        with patch("swealog.api.dependencies.create_llm_client", return_value=MagicMock()) as create:
+            first = await get_llm_client(make_request(app))
+            second = await get_llm_client(make_request(app))
+
+        assert first is second is app.state.llm_client
+        create.assert_called_once()
+
 
 class TestConfigNotFoundError:
     """Tests for ConfigNotFoundError exception."""
@@ -0,0 +1,196 @@
+"""Tests for swealog.api.metrics and the /metrics endpoint."""
+
+from datetime import datetime
+from pathlib import Path
+from typing import Literal
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from httpx import ASGITransport, AsyncClient
+from quilto import AsyncStorageRepository, StorageRepository
+from quilto.tracing import Span, Tracer, get_tracer
+from swealog.api import app
+from swealog.api.app import lifespan
+from swealog.api.metrics import ApiMetrics
+from swealog.api.parse_queue import ParseQueue
+
+
+def make_span(
+    name: str, duration_ms: float = 250.0, status: Literal["ok", "error"] = "ok", **attributes: object
+) -> Span:
+    """Build a finished span with the given name and attributes."""
+    span = Tracer().start_span(name, "llm", **attributes)
+    span.duration_ms = duration_ms
+    span.status = status
+    return span
+
+
+def sample_lines(text: str) -> list[str]:
+    """Get the non-comment lines of an exposition."""
+    return [line for line in text.splitlines() if line and not line.startswith("#")]
+
+
+class TestApiMetrics:
+    """Tests for ApiMetrics recording and rendering."""
+
+    def test_http_requests_counted_per_route_and_status(self) -> None:
+        """Requests are counted per method, route and status."""
+        metrics = ApiMetrics()
+        metrics.observe_request("POST", "/input", 200, 0.2)
+        metrics.observe_request("POST", "/input", 200, 0.3)
+        metrics.observe_request("POST", "/input", 500, 0.1)
+
+        lines = sample_lines(metrics.render())
+        assert 'swealog_http_requests_total{method="POST",route="/input",status="200"} 2' in lines
+        assert 'swealog_http_requests_total{method="POST",route="/input",status="500"} 1' in lines
+
+    def test_histogram_buckets_are_cumulative(self) -> None:
+        """Histogram buckets count every value at or below their bound."""
+        metrics = ApiMetrics(buckets=(0.1, 1.0))
+        for seconds in (0.05, 0.1, 0.5, 3.0):
+            metrics.observe_request("GET", "/health", 200, seconds)
+
+        text = metrics.render()
+        assert "# TYPE swealog_http_request_duration_seconds histogram" in text
+        lines = sample_lines(text)
+        prefix = 'swealog_http_request_duration_seconds_bucket{method="GET",route="/health"'
+        assert f'{prefix},le="0.1"}} 2' in lines
+        assert f'{prefix},le="1"}} 3' in lines
+        assert f'{prefix},le="+Inf"}} 4' in lines
+        assert 'swealog_http_request_duration_seconds_sum{method="GET",route="/health"} 3.65' in lines
+        assert 'swealog_http_request_duration_seconds_count{method="GET",route="/health"} 4' in lines
+
+    def test_label_values_escaped(self) -> None:
+        """Quotes, backslashes and newlines in label values are escaped."""
+        metrics = ApiMetrics()
+        metrics.observe_request("GET", 'a"b\\c\nd', 200, 0.1)
+
+        assert 'route="a\\"b\\\\c\\nd"' in metrics.render()
+
+    def test_rejects_unsorted_buckets(self) -> None:
+        """Buckets must be strictly ascending."""
+        with pytest.raises(ValueError, match="strictly ascending"):
+            ApiMetrics(buckets=(1.0, 0.5))
+        with pytest.raises(ValueError, match="strictly ascending"):
+            ApiMetrics(buckets=())
+
+    def test_llm_request_spans(self) -> None:
+        """LLM request spans feed request, latency and token metrics."""
+        metrics = ApiMetrics()
+        metrics.export(
+            make_span(
+                "LLMClient.complete",
+                agent="parser",
+                provider="ollama",
+                cache_hit=False,
+                prompt_tokens=100,
+                completion_tokens=40,
+            )
+        )
+        metrics.export(make_span("LLMClient.complete", agent="parser", provider="ollama", cache_hit=True))
+        metrics.export(make_span("LLMClient.complete", status="error", agent="parser", provider="ollama"))
+        metrics.export(make_span("RouterAgent.classify"))
+
+        lines = sample_lines(metrics.render())
+        labels = 'agent="parser",provider="ollama"'
+        assert f'swealog_llm_requests_total{{{labels},outcome="ok"}} 1' in lines
+        assert f'swealog_llm_requests_total{{{labels},outcome="cache_hit"}} 1' in lines
+        assert f'swealog_llm_requests_total{{{labels},outcome="error"}} 1' in lines
+        assert f'swealog_llm_tokens_total{{{labels},type="prompt"}} 100' in lines
+        assert f'swealog_llm_tokens_total{{{labels},type="completion"}} 40' in lines
+        # Cache hits are left out of the latency histogram
+        assert f"swealog_llm_request_duration_seconds_count{{{labels}}} 2" in lines
+        assert f"swealog_llm_request_duration_seconds_sum{{{labels}}} 0.5" in lines
+
+    def test_cascade_spans(self) -> None:
+        """Cascade spans feed retry, fallback and degradation counters."""
+        metrics = ApiMetrics()
+        metrics.export(
+            make_span("LLMClient.complete_with_cascade", agent="router", retries=2, fallback_used=True, degraded=True)
+        )
+        metrics.export(
+            make_span(
+                "LLMClient.complete_structured_with_cascade",
+                agent="router",
+                retries=1,
+                fallback_used=False,
+                degraded=False,
+            )
+        )
+
+        lines = sample_lines(metrics.render())
+        assert 'swealog_llm_retries_total{agent="router"} 3' in lines
+        assert 'swealog_llm_fallbacks_total{agent="router"} 1' in lines
+        assert 'swealog_llm_degraded_total{agent="router"} 1' in lines
+
+    @pytest.mark.asyncio
+    async def test_parse_queue_gauges(self) -> None:
+        """The parse queue depth and job counts are exposed as gauges."""
+        queue = ParseQueue()
+        try:
+            for i in range(3):
+                await queue.enqueue(f"e{i}", "Ran 5k", datetime(2026, 1, 5), [])
+            text = ApiMetrics().render(parse_jobs=await queue.counts())
+        finally:
+            queue.close()
+
+        assert "# TYPE swealog_parse_queue_depth gauge" in text
+        lines = sample_lines(text)
+        assert "swealog_parse_queue_depth 3" in lines
+        assert 'swealog_parse_jobs{status="queued"} 3' in lines
+        assert 'swealog_parse_jobs{status="dead"} 0' in lines
+
+    @pytest.mark.asyncio
+    async def test_storage_cache_ratio(self, tmp_path: Path) -> None:
+        """Storage read cache counters are read at render time."""
+        storage = AsyncStorageRepository(StorageRepository(base_path=tmp_path))
+        try:
+            await storage.get_entries_by_pattern("**/*.md")
+            lines = sample_lines(ApiMetrics().render(storage=storage))
+        finally:
+            await storage.aclose()
+
+        stats = storage.cache_stats()
+        assert f"swealog_storage_cache_hits_total {stats.hits}" in lines
+        assert any(line.startswith("swealog_storage_cache_hit_ratio ") for line in lines)
+
+
+class TestMetricsEndpoint:
+    """Tests for GET /metrics."""
+
+    @pytest.mark.asyncio
+    async def test_metrics_scrapeable(self) -> None:
+        """The endpoint serves the text format with recorded requests."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            await client.get("/health")
+            await client.get("/no-such-route")
+            response = await client.get("/metrics")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain; version=0.0.4")
+        text = response.text
+        assert "# TYPE swealog_http_requests_total counter" in text
+        assert 'swealog_http_requests_total{method="GET",route="/health",status="200"}' in text
+        assert 'swealog_http_requests_total{method="GET",route="unmatched",status="404"}' in text
+
+    @pytest.mark.asyncio
+    async def test_metrics_not_in_openapi_schema(self) -> None:
+        """The metrics endpoint is hidden from the API schema."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/openapi.json")
+
+        assert "/metrics" not in response.json()["paths"]
+
+    @pytest.mark.asyncio
+    async def test_lifespan_registers_span_exporter(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """LLM spans reach the app's metrics while the app is running."""
+        monkeypatch.chdir(tmp_path)
+        llm_client = MagicMock()
+        llm_client.aclose = AsyncMock()
+        metrics: ApiMetrics = app.state.metrics
+
+        with patch("swealog.api.app.create_llm_client", return_value=llm_client):
+            async with lifespan(app):
+                assert metrics in get_tracer().exporters
+
+        assert metrics not in get_tracer().exporters
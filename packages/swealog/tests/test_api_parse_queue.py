@@ -0,0 +1,556 @@
+"""Tests for swealog.api.parse_queue - durable parse job queue."""
+
+import asyncio
+import sqlite3
+import time
+from collections.abc import AsyncIterator
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from quilto import AsyncStorageRepository, StorageRepository
+from swealog.api.dependencies import get_domains
+from swealog.api.parse_queue import JobStatus, ParseJob, ParseQueue
+from swealog.api.routes.input import parse_log_entries
+
+TIMESTAMP = datetime(2026, 1, 5, 8, 30)
+
+
+@pytest.fixture
+async def queue() -> AsyncIterator[ParseQueue]:
+    """Create an in-memory queue with fast retries, stopped after the test."""
+    parse_queue = ParseQueue(workers=2, max_attempts=2, retry_delay=0.0, poll_interval=0.01)
+    yield parse_queue
+    await parse_queue.stop()
+    parse_queue.close()
+
+
+def succeeding_handler() -> AsyncMock:
+    """Create a handler mock that parses every job successfully."""
+
+    def succeed(jobs: list[ParseJob]) -> list[Exception | None]:
+        return [None] * len(jobs)
+
+    return AsyncMock(side_effect=succeed)
+
+
+def make_job(entry_id: str, raw_input: str = "x", batch_id: str | None = None) -> ParseJob:
+    """Build an unqueued job."""
+    return ParseJob(entry_id=entry_id, raw_input=raw_input, timestamp=TIMESTAMP, selected_domains=[], batch_id=batch_id)
+
+
+async def wait_for_status(queue: ParseQueue, entry_id: str, status: JobStatus, timeout: float = 2.0) -> ParseJob:
+    """Poll until a job reaches the given status."""
+    async with asyncio.timeout(timeout):
+        while True:
+            job = await queue.get(entry_id)
+            if job is not None and job.status == status:
+                return job
+            await asyncio.sleep(0.01)
+
+
+class TestParseQueue:
+    """Tests for ParseQueue storage and workers."""
+
+    @pytest.mark.asyncio
+    async def test_enqueue_and_get(self, queue: ParseQueue) -> None:
+        """Enqueued jobs keep their fields and start as queued."""
+        job = await queue.enqueue(
+            "2026-01-05_08-30-00",
+            "Bench 185x5",
+            TIMESTAMP,
+            ["Strength"],
+            is_correction=True,
+            correction_target="weight",
+        )
+
+        stored = await queue.get(job.entry_id)
+        assert stored is not None
+        assert stored.raw_input == "Bench 185x5"
+        assert stored.timestamp == TIMESTAMP
+        assert stored.selected_domains == ["Strength"]
+        assert stored.is_correction is True
+        assert stored.correction_target == "weight"
+        assert stored.status == "queued"
+        assert stored.attempts == 0
+        assert await queue.get("missing") is None
+        assert await queue.depth() == 1
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_suffixed(self, queue: ParseQueue) -> None:
+        """Entries in the same second get distinct IDs instead of being dropped."""
+        first = await queue.enqueue("2026-01-05_08-30-00", "a", TIMESTAMP, [])
+        second = await queue.enqueue("2026-01-05_08-30-00", "b", TIMESTAMP, [])
+        third = await queue.enqueue("2026-01-05_08-30-00", "c", TIMESTAMP, [])
+
+        assert [first.entry_id, second.entry_id, third.entry_id] == [
+            "2026-01-05_08-30-00",
+            "2026-01-05_08-30-00_2",
+            "2026-01-05_08-30-00_3",
+        ]
+        assert await queue.depth() == 3
+
+    @pytest.mark.asyncio
+    async def test_worker_parses_job(self, queue: ParseQueue) -> None:
+        """A started worker hands queued jobs to the handler and marks them done."""
+        handler = succeeding_handler()
+        queue.start(handler)
+        job = await queue.enqueue("e1", "Ran 5k", TIMESTAMP, ["Running"])
+
+        done = await wait_for_status(queue, job.entry_id, "done")
+
+        assert done.attempts == 1
+        assert handler.await_args is not None
+        [handled] = handler.await_args.args[0]
+        assert handled.entry_id == "e1"
+        assert handled.raw_input == "Ran 5k"
+        assert await queue.counts() == {"queued": 0, "running": 0, "done": 1, "dead": 0}
+
+    @pytest.mark.asyncio
+    async def test_failed_job_retried(self, queue: ParseQueue) -> None:
+        """A failed attempt is retried and can then succeed."""
+        handler = AsyncMock(side_effect=[RuntimeError("LLM down"), [None]])
+        queue.start(handler)
+        job = await queue.enqueue("e1", "Ran 5k", TIMESTAMP, [])
+
+        done = await wait_for_status(queue, job.entry_id, "done")
+
+        assert done.attempts == 2
+        assert done.last_error == "RuntimeError: LLM down"
+
+    @pytest.mark.asyncio
+    async def test_job_dead_lettered_after_max_attempts(self, queue: ParseQueue) -> None:
+        """A job failing every attempt is kept as dead with its error."""
+        handler = AsyncMock(side_effect=ValueError("bad output"))
+        queue.start(handler)
+        job = await queue.enqueue("e1", "Ran 5k", TIMESTAMP, [])
+
+        dead = await wait_for_status(queue, job.entry_id, "dead")
+
+        assert dead.attempts == 2
+        assert dead.last_error == "ValueError: bad output"
+        assert handler.await_count == 2
+        assert await queue.depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_retry_waits_for_backoff(self) -> None:
+        """A failed job is not claimed again before its retry delay."""
+        queue = ParseQueue(workers=1, max_attempts=3, retry_delay=60.0, poll_interval=0.01)
+        handler = AsyncMock(side_effect=RuntimeError("LLM down"))
+        queue.start(handler)
+        try:
+            await queue.enqueue("e1", "Ran 5k", TIMESTAMP, [])
+            await asyncio.sleep(0.2)
+            job = await queue.get("e1")
+        finally:
+            await queue.stop()
+            queue.close()
+
+        assert job is not None
+        assert job.status == "queued"
+        assert job.attempts == 1
+        assert handler.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_bounded_by_workers(self, queue: ParseQueue) -> None:
+        """No more jobs run at once than there are workers."""
+        running = 0
+        peak = 0
+
+        async def handler(jobs: list[ParseJob]) -> list[Exception | None]:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return [None] * len(jobs)
+
+        queue.start(handler)
+        jobs = [await queue.enqueue(f"e{i}", "x", TIMESTAMP, []) for i in range(6)]
+        for job in jobs:
+            await wait_for_status(queue, job.entry_id, "done")
+
+        assert peak == 2
+
+    @pytest.mark.asyncio
+    async def test_stop_requeues_running_job(self, queue: ParseQueue) -> None:
+        """Stopping the pool puts interrupted jobs back without counting the attempt."""
+        started = asyncio.Event()
+
+        async def handler(jobs: list[ParseJob]) -> list[Exception | None]:
+            started.set()
+            await asyncio.sleep(60)
+            return []
+
+        queue.start(handler)
+        await queue.enqueue("e1", "x", TIMESTAMP, [])
+        await started.wait()
+        await queue.stop()
+
+        job = await queue.get("e1")
+        assert job is not None
+        assert job.status == "queued"
+        assert job.attempts == 0
+
+    @pytest.mark.asyncio
+    async def test_jobs_survive_restart(self, tmp_path: Path) -> None:
+        """Queued and interrupted jobs are still queued after reopening the file."""
+        path = tmp_path / "logs" / "parse-queue.sqlite"
+        first = ParseQueue(path)
+        await first.enqueue("e1", "queued", TIMESTAMP, [])
+        await first.enqueue("e2", "running", TIMESTAMP, [])
+        # Simulate a crash while e2 was being parsed
+        first._conn.execute("UPDATE parse_jobs SET status = 'running' WHERE entry_id = 'e2'")  # pyright: ignore[reportPrivateUsage]
+        first._conn.commit()  # pyright: ignore[reportPrivateUsage]
+        first.close()
+
+        second = ParseQueue(path, poll_interval=0.01)
+        handler = succeeding_handler()
+        second.start(handler)
+        try:
+            await wait_for_status(second, "e1", "done")
+            await wait_for_status(second, "e2", "done")
+        finally:
+            await second.stop()
+            second.close()
+
+        assert handler.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_start_keeps_jobs_leased_by_live_queue(self, tmp_path: Path) -> None:
+        """A queue starting on a shared database leaves another queue's running jobs alone."""
+        path = tmp_path / "parse-queue.sqlite"
+        first = ParseQueue(path)
+        await first.enqueue("e1", "x", TIMESTAMP, [])
+        claimed = first._claim()  # pyright: ignore[reportPrivateUsage]
+
+        second = ParseQueue(path, poll_interval=0.01)
+        handler = succeeding_handler()
+        second.start(handler)
+        try:
+            await asyncio.sleep(0.1)
+            job = await second.get("e1")
+        finally:
+            await second.stop()
+            second.close()
+            first.close()
+
+        assert [j.entry_id for j in claimed] == ["e1"]
+        assert job is not None
+        assert job.status == "running"
+        handler.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_expired_lease_claimed_again(self, tmp_path: Path) -> None:
+        """A job whose owner stopped renewing its lease is parsed by another queue."""
+        path = tmp_path / "parse-queue.sqlite"
+        first = ParseQueue(path, lease=0.05)
+        await first.enqueue("e1", "x", TIMESTAMP, [])
+        first._claim()  # pyright: ignore[reportPrivateUsage]
+        await asyncio.sleep(0.1)
+
+        second = ParseQueue(path, poll_interval=0.01)
+        handler = succeeding_handler()
+        second.start(handler)
+        try:
+            await wait_for_status(second, "e1", "done")
+            # The first owner's late result does not overwrite the new owner's
+            first._finish([make_job("e1")], ["TimeoutError: stalled"])  # pyright: ignore[reportPrivateUsage]
+            job = await second.get("e1")
+        finally:
+            await second.stop()
+            second.close()
+            first.close()
+
+        assert job is not None
+        assert job.status == "done"
+        assert job.attempts == 2
+        assert job.last_error is None
+
+    @pytest.mark.asyncio
+    async def test_claim_waits_for_concurrent_claim(self, tmp_path: Path) -> None:
+        """A claim does not return a job another process claimed in an open transaction."""
+        path = tmp_path / "parse-queue.sqlite"
+        queue = ParseQueue(path)
+        await queue.enqueue("e1", "x", TIMESTAMP, [])
+        other = sqlite3.connect(path, isolation_level=None)
+        try:
+            other.execute("BEGIN IMMEDIATE")
+            other.execute("UPDATE parse_jobs SET status = 'running', available_at = ? WHERE entry_id = 'e1'", (1e12,))
+            claim = asyncio.create_task(asyncio.to_thread(queue._claim))  # pyright: ignore[reportPrivateUsage]
+            await asyncio.sleep(0.1)
+            assert not claim.done()
+            other.execute("COMMIT")
+            claimed = await claim
+        finally:
+            other.close()
+            queue.close()
+
+        assert claimed == []
+
+    @pytest.mark.asyncio
+    async def test_lease_renewed_while_parsing(self, tmp_path: Path) -> None:
+        """A job parsed for longer than the lease is not claimed by another queue."""
+        path = tmp_path / "parse-queue.sqlite"
+        first = ParseQueue(path, poll_interval=0.01, lease=0.06)
+        second = ParseQueue(path, poll_interval=0.01)
+
+        async def slow(jobs: list[ParseJob]) -> list[Exception | None]:
+            await asyncio.sleep(0.3)
+            return [None] * len(jobs)
+
+        other = succeeding_handler()
+        first.start(slow)
+        await first.enqueue("e1", "x", TIMESTAMP, [])
+        await wait_for_status(first, "e1", "running")
+        second.start(other)
+        try:
+            job = await wait_for_status(first, "e1", "done")
+        finally:
+            await first.stop()
+            await second.stop()
+            first.close()
+            second.close()
+
+        assert job.attempts == 1
+        other.assert_not_awaited()
+
+    def test_rejects_invalid_settings(self) -> None:
+        """Worker counts and delays are validated."""
+        with pytest.raises(ValueError, match="workers, max_attempts and group_size must be >= 1"):
+            ParseQueue(workers=0)
+        with pytest.raises(ValueError, match="workers, max_attempts and group_size must be >= 1"):
+            ParseQueue(max_attempts=0)
+        with pytest.raises(ValueError, match="workers, max_attempts and group_size must be >= 1"):
+            ParseQueue(group_size=0)
+        with pytest.raises(ValueError, match="retry_delay must be >= 0"):
+            ParseQueue(retry_delay=-1.0)
+        with pytest.raises(ValueError, match="done_retention must be >= 0"):
+            ParseQueue(done_retention=-1.0)
+        with pytest.raises(ValueError, match="lease must be > 0"):
+            ParseQueue(lease=0.0)
+
+    @pytest.mark.asyncio
+    async def test_expired_done_jobs_purged_at_start(self) -> None:
+        """Done jobs older than the retention are deleted; recent and dead jobs are kept."""
+        queue = ParseQueue(poll_interval=0.01, done_retention=60.0)
+        for entry_id in ("old", "recent", "dead"):
+            await queue.enqueue(entry_id, "x", TIMESTAMP, [])
+        old = time.time() - 120
+        queue._conn.executemany(  # pyright: ignore[reportPrivateUsage]
+            "UPDATE parse_jobs SET status = ?, updated_at = ? WHERE entry_id = ?",
+            [("done", old, "old"), ("done", time.time(), "recent"), ("dead", old, "dead")],
+        )
+        queue._conn.commit()  # pyright: ignore[reportPrivateUsage]
+
+        queue.start(succeeding_handler())
+        try:
+            async with asyncio.timeout(2.0):
+                while await queue.get("old") is not None:
+                    await asyncio.sleep(0.01)
+            assert await queue.counts() == {"queued": 0, "running": 0, "done": 1, "dead": 1}
+        finally:
+            await queue.stop()
+            queue.close()
+
+    @pytest.mark.asyncio
+    async def test_idle_workers_purge_periodically(self, queue: ParseQueue) -> None:
+        """Idle workers purge again once the purge interval has passed."""
+        queue.done_retention = 0.0
+        handler = succeeding_handler()
+        queue.start(handler)
+        await queue.enqueue("e1", "x", TIMESTAMP, [])
+        await wait_for_status(queue, "e1", "done")
+
+        queue._purged_at = 0.0  # pyright: ignore[reportPrivateUsage]
+        async with asyncio.timeout(2.0):
+            while await queue.get("e1") is not None:
+                await asyncio.sleep(0.01)
+        assert handler.await_count == 1
+
+    def test_retention_can_be_disabled(self) -> None:
+        """With done_retention=None done jobs are never purged."""
+        queue = ParseQueue(done_retention=None)
+        try:
+            queue._conn.execute(  # pyright: ignore[reportPrivateUsage]
+                "INSERT INTO parse_jobs (entry_id, raw_input, timestamp, selected_domains, is_correction, "
+                "status, created_at, updated_at, available_at) VALUES ('e1', 'x', ?, '[]', 0, 'done', 0, 0, 0)",
+                (TIMESTAMP.isoformat(),),
+            )
+            assert queue._purge() == 0  # pyright: ignore[reportPrivateUsage]
+        finally:
+            queue.close()
+
+    @pytest.mark.asyncio
+    async def test_start_twice_raises(self, queue: ParseQueue) -> None:
+        """The worker pool can only be started once."""
+        queue.start(AsyncMock())
+        with pytest.raises(RuntimeError, match="already started"):
+            queue.start(AsyncMock())
+
+    @pytest.mark.asyncio
+    async def test_enqueue_many_suffixes_ids_within_batch(self, queue: ParseQueue) -> None:
+        """Jobs of one batch keep their order and get distinct IDs."""
+        await queue.enqueue("e1", "earlier", TIMESTAMP, [])
+
+        jobs = await queue.enqueue_many(
+            [make_job("e1", "a", "b1"), make_job("e1", "b", "b1"), make_job("e2", "c", "b1")]
+        )
+
+        assert [job.entry_id for job in jobs] == ["e1_2", "e1_3", "e2"]
+        assert all(job.batch_id == "b1" and job.status == "queued" for job in jobs)
+        stored = await queue.get("e1_3")
+        assert stored is not None
+        assert stored.raw_input == "b"
+        assert stored.batch_id == "b1"
+
+    @pytest.mark.asyncio
+    async def test_batch_claimed_as_groups(self) -> None:
+        """Due jobs of one batch reach the handler together, group_size at a time."""
+        queue = ParseQueue(workers=1, group_size=2, poll_interval=0.01)
+        handler = succeeding_handler()
+        try:
+            jobs = await queue.enqueue_many([make_job(f"e{i}", batch_id="b1") for i in range(3)])
+            await queue.enqueue("single", "x", TIMESTAMP, [])
+            queue.start(handler)
+            for job in [*jobs, make_job("single")]:
+                await wait_for_status(queue, job.entry_id, "done")
+        finally:
+            await queue.stop()
+            queue.close()
+
+        groups = [[job.entry_id for job in call.args[0]] for call in handler.await_args_list]
+        assert groups == [["e0", "e1"], ["e2"], ["single"]]
+
+    @pytest.mark.asyncio
+    async def test_group_results_applied_per_job(self, queue: ParseQueue) -> None:
+        """One failed job of a group is retried while the others are done."""
+        handler = AsyncMock(side_effect=[[None, ValueError("bad output")], [None]])
+        queue.start(handler)
+        await queue.enqueue_many([make_job("e1", batch_id="b1"), make_job("e2", batch_id="b1")])
+
+        ok = await wait_for_status(queue, "e1", "done")
+        retried = await wait_for_status(queue, "e2", "done")
+
+        assert ok.attempts == 1
+        assert retried.attempts == 2
+        assert retried.last_error == "ValueError: bad output"
+
+    def test_adds_batch_column_to_old_database(self, tmp_path: Path) -> None:
+        """Databases created before batches get the batch_id column."""
+        path = tmp_path / "parse-queue.sqlite"
+        conn = sqlite3.connect(path)
+        conn.execute(
+            "CREATE TABLE parse_jobs (entry_id TEXT PRIMARY KEY, raw_input TEXT NOT NULL, timestamp TEXT NOT NULL, "
+            "selected_domains TEXT NOT NULL, is_correction INTEGER NOT NULL, correction_target TEXT, "
+            "status TEXT NOT NULL, attempts INTEGER NOT NULL DEFAULT 0, last_error TEXT, created_at REAL NOT NULL, "
+            "updated_at REAL NOT NULL, available_at REAL NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO parse_jobs VALUES ('e1', 'x', ?, '[]', 0, NULL, 'queued', 0, NULL, 0, 0, 0)",
+            (TIMESTAMP.isoformat(),),
+        )
+        conn.commit()
+        conn.close()
+
+        queue = ParseQueue(path)
+        try:
+            assert queue._counts()["queued"] == 1  # pyright: ignore[reportPrivateUsage]
+            job = queue._get("e1")  # pyright: ignore[reportPrivateUsage]
+        finally:
+            queue.close()
+
+        assert job is not None
+        assert job.batch_id is None
+
+
+class TestParseLogEntries:
+    """Tests for the parse job handler."""
+
+    @pytest.mark.asyncio
+    async def test_parses_and_saves_entry(self, tmp_path: Path) -> None:
+        """The handler runs the Parser with the selected domains and saves the entry."""
+        job = ParseJob(
+            entry_id="2026-01-05_08-30-00",
+            raw_input="Bench 185x5",
+            timestamp=TIMESTAMP,
+            selected_domains=["Strength"],
+        )
+        parser_output = MagicMock(
+            date=TIMESTAMP.date(),
+            timestamp=TIMESTAMP,
+            domain_data={"strength": {"exercises": []}},
+            is_correction=False,
+        )
+        storage = AsyncStorageRepository(StorageRepository(base_path=tmp_path))
+
+        try:
+            with patch("swealog.api.routes.input.ParserAgent") as mock_parser_cls:
+                mock_parser_cls.return_value.parse = AsyncMock(return_value=parser_output)
+                errors = await parse_log_entries([job], MagicMock(), storage, get_domains())
+            entries = await storage.get_entries_by_pattern("**/*.md")
+        finally:
+            await storage.aclose()
+
+        assert errors == [None]
+        await_args = mock_parser_cls.return_value.parse.await_args
+        assert await_args is not None
+        parser_input = await_args.args[0]
+        assert list(parser_input.domain_schemas) == ["Strength"]
+        assert parser_input.timestamp == TIMESTAMP
+        assert [entry.raw_content for entry in entries] == ["Bench 185x5"]
+
+    @pytest.mark.asyncio
+    async def test_group_saved_with_one_write(self) -> None:
+        """Parsed entries of a group are saved in order with a single save_entries call."""
+        jobs = [make_job("e1", "Ran 5k"), make_job("e2", "Bench 185x5")]
+        storage = MagicMock()
+        storage.save_entries = AsyncMock()
+
+        with patch("swealog.api.routes.input.ParserAgent") as mock_parser_cls:
+            mock_parser_cls.return_value.parse = AsyncMock(
+                return_value=MagicMock(date=TIMESTAMP.date(), timestamp=TIMESTAMP, domain_data={}, is_correction=False)
+            )
+            errors = await parse_log_entries(jobs, MagicMock(), storage, get_domains())
+
+        assert errors == [None, None]
+        storage.save_entries.assert_awaited_once()
+        await_args = storage.save_entries.await_args
+        assert await_args is not None
+        entries, corrections = await_args.args
+        assert [entry.id for entry in entries] == ["e1", "e2"]
+        assert corrections == [None, None]
+
+    @pytest.mark.asyncio
+    async def test_parser_errors_reported_per_job(self) -> None:
+        """A Parser failure is returned for its job so only that job is retried."""
+        jobs = [make_job("e1"), make_job("e2")]
+        storage = MagicMock()
+        storage.save_entries = AsyncMock()
+        parser_output = MagicMock(date=TIMESTAMP.date(), timestamp=TIMESTAMP, domain_data={}, is_correction=False)
+        failure = RuntimeError("LLM down")
+
+        with patch("swealog.api.routes.input.ParserAgent") as mock_parser_cls:
+            mock_parser_cls.return_value.parse = AsyncMock(side_effect=[failure, parser_output])
+            errors = await parse_log_entries(jobs, MagicMock(), storage, get_domains())
+
+        assert errors == [failure, None]
+        await_args = storage.save_entries.await_args
+        assert await_args is not None
+        assert [entry.id for entry in await_args.args[0]] == ["e2"]
+
+    @pytest.mark.asyncio
+    async def test_save_error_fails_parsed_jobs(self) -> None:
+        """A failed group save is reported for every parsed job."""
+        storage = MagicMock()
+        failure = OSError("disk full")
+        storage.save_entries = AsyncMock(side_effect=failure)
+
+        with patch("swealog.api.routes.input.ParserAgent") as mock_parser_cls:
+            mock_parser_cls.return_value.parse = AsyncMock(
+                return_value=MagicMock(date=TIMESTAMP.date(), timestamp=TIMESTAMP, domain_data={}, is_correction=False)
+            )
+            errors = await parse_log_entries([make_job("e1"), make_job("e2")], MagicMock(), storage, get_domains())
+
+        assert errors == [failure, failure]
@@ -3,17 +3,26 @@
 Tests use mocked dependencies to avoid actual LLM calls.
 """
 
-from collections.abc import Generator
+import asyncio
+import json
+import math
+from collections.abc import AsyncIterator, Generator
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 from httpx import ASGITransport, AsyncClient
+from quilto.agents import Verdict
 from swealog.api import app
 from swealog.api.dependencies import (
     ConfigNotFoundError,
     get_llm_client,
+    get_parse_queue,
     get_storage,
 )
+from swealog.api.parse_queue import ParseQueue
+from swealog.api.routes.query import execute_query_pipeline
 
 
 def mock_llm_client() -> MagicMock:
@@ -27,10 +36,19 @@ def mock_storage() -> MagicMock:
 
 
 @pytest.fixture
-def override_dependencies() -> Generator[None]:
+def parse_queue() -> Generator[ParseQueue]:
+    """Create an in-memory parse queue without workers."""
+    queue = ParseQueue()
+    yield queue
+    queue.close()
+
+
+@pytest.fixture
+def override_dependencies(parse_queue: ParseQueue) -> Generator[None]:
     """Override app dependencies with mocks."""
     app.dependency_overrides[get_llm_client] = mock_llm_client
     app.dependency_overrides[get_storage] = mock_storage
+    app.dependency_overrides[get_parse_queue] = lambda: parse_queue
     yield
     app.dependency_overrides.clear()
 
@@ -117,7 +135,55 @@ class TestInputEndpoint:
         assert "How does this compare?" in data["message"]
 
     @pytest.mark.asyncio
-    async def test_input_rejects_empty_text(self) -> None:
+    async def test_input_queues_log_for_parsing(self, override_dependencies: None, parse_queue: ParseQueue) -> None:
+        """Test /input stores LOG entries in the parse queue before responding."""
+        mock_router_output = MagicMock()
+        mock_router_output.input_type.value = "CORRECTION"
+        mock_router_output.selected_domains = ["Strength"]
+        mock_router_output.correction_target = "bench weight"
+
+        with patch("swealog.api.routes.input.RouterAgent") as mock_router_cls:
+            mock_router_cls.return_value.classify = AsyncMock(return_value=mock_router_output)
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/input", json={"text": "Actually it was 195"})
+                entry_id = response.json()["entry_id"]
+                status = await client.get(f"/input/{entry_id}/status")
+
+        job = await parse_queue.get(entry_id)
+        assert job is not None
+        assert job.raw_input == "Actually it was 195"
+        assert job.selected_domains == ["Strength"]
+        assert job.is_correction is True
+        assert job.correction_target == "bench weight"
+        assert status.status_code == 200
+        assert status.json()["status"] == "queued"
+        assert status.json()["attempts"] == 0
+
+    @pytest.mark.asyncio
+    async def test_input_does_not_queue_query(self, override_dependencies: None, parse_queue: ParseQueue) -> None:
+        """Test /input does not queue pure queries."""
+        mock_router_output = MagicMock()
+        mock_router_output.input_type.value = "QUERY"
+
+        with patch("swealog.api.routes.input.RouterAgent") as mock_router_cls:
+            mock_router_cls.return_value.classify = AsyncMock(return_value=mock_router_output)
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                await client.post("/input", json={"text": "How much did I bench?"})
+
+        assert await parse_queue.depth() == 0
+
+    @pytest.mark.asyncio
+    async def test_status_unknown_entry(self, override_dependencies: None) -> None:
+        """Test /input/{entry_id}/status returns 404 for unknown entries."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.get("/input/2026-01-01_00-00-00/status")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_input_rejects_empty_text(self, override_dependencies: None) -> None:
         """Test /input rejects empty text."""
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
             response = await client.post(
@@ -128,7 +194,7 @@ class TestInputEndpoint:
         assert response.status_code == 422  # Pydantic validation error
 
     @pytest.mark.asyncio
-    async def test_input_rejects_missing_text(self) -> None:
+    async def test_input_rejects_missing_text(self, override_dependencies: None) -> None:
         """Test /input rejects missing text field."""
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
             response = await client.post(
@@ -139,6 +205,116 @@ class TestInputEndpoint:
         assert response.status_code == 422
 
 
+def router_output(input_type: str, selected_domains: list[str] | None = None) -> MagicMock:
+    """Create a mock Router classification."""
+    output = MagicMock()
+    output.input_type.value = input_type
+    output.selected_domains = selected_domains or []
+    output.correction_target = None
+    output.query_portion = "how did it go?"
+    return output
+
+
+class TestInputBatchEndpoint:
+    """Tests for POST /input/batch endpoint."""
+
+    @pytest.mark.asyncio
+    async def test_batch_queues_logs_in_order(self, override_dependencies: None, parse_queue: ParseQueue) -> None:
+        """Test logs are queued under one batch with client timestamps and per-item results."""
+        outputs = {
+            "Ran 5k": router_output("LOG", ["Running"]),
+            "What is my PR?": router_output("QUERY"),
+            "Bench 185x5": router_output("LOG", ["Strength"]),
+        }
+
+        async def classify(router_input: Any) -> MagicMock:
+            return outputs[router_input.raw_input]
+
+        with patch("swealog.api.routes.input.RouterAgent") as mock_router_cls:
+            mock_router_cls.return_value.classify = classify
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post(
+                    "/input/batch",
+                    json={
+                        "items": [
+                            {"text": "Ran 5k", "timestamp": "2026-01-05T07:00:00"},
+                            {"text": "What is my PR?"},
+                            {"text": "Bench 185x5", "timestamp": "2026-01-05T07:00:00"},
+                        ]
+                    },
+                )
+
+        assert response.status_code == 200
+        data = response.json()
+        items = data["items"]
+        assert [item["status"] for item in items] == ["accepted", "accepted", "accepted"]
+        assert [item["input_type"] for item in items] == ["LOG", "QUERY", "LOG"]
+        assert [item["entry_id"] for item in items] == ["2026-01-05_07-00-00", None, "2026-01-05_07-00-00_2"]
+        job = await parse_queue.get("2026-01-05_07-00-00_2")
+        assert job is not None
+        assert job.raw_input == "Bench 185x5"
+        assert job.selected_domains == ["Strength"]
+        assert job.batch_id == data["batch_id"]
+        assert await parse_queue.depth() == 2
+
+    @pytest.mark.asyncio
+    async def test_batch_item_error_does_not_fail_batch(
+        self, override_dependencies: None, parse_queue: ParseQueue
+    ) -> None:
+        """Test a failed classification is reported for its item only."""
+        with patch("swealog.api.routes.input.RouterAgent") as mock_router_cls:
+            mock_router_cls.return_value.classify = AsyncMock(
+                side_effect=[RuntimeError("LLM down"), router_output("LOG")]
+            )
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/input/batch", json={"items": [{"text": "a"}, {"text": "b"}]})
+
+        assert response.status_code == 200
+        items = response.json()["items"]
+        assert items[0]["status"] == "error"
+        assert items[0]["entry_id"] is None
+        assert "LLM down" in items[0]["message"]
+        assert items[1]["status"] == "accepted"
+        assert items[1]["entry_id"] is not None
+        assert await parse_queue.depth() == 1
+
+    @pytest.mark.asyncio
+    async def test_batch_routing_concurrency_bounded(self, override_dependencies: None) -> None:
+        """Test Router calls run concurrently but no more than the limit at once."""
+        running = 0
+        peak = 0
+
+        async def classify(router_input: Any) -> MagicMock:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.01)
+            running -= 1
+            return router_output("QUERY")
+
+        with (
+            patch("swealog.api.routes.input.RouterAgent") as mock_router_cls,
+            patch("swealog.api.routes.input.BATCH_ROUTING_CONCURRENCY", 3),
+        ):
+            mock_router_cls.return_value.classify = classify
+
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/input/batch", json={"items": [{"text": str(i)} for i in range(10)]})
+
+        assert response.status_code == 200
+        assert peak == 3
+
+    @pytest.mark.asyncio
+    async def test_batch_rejects_empty_items(self, override_dependencies: None) -> None:
+        """Test /input/batch rejects an empty item list."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/input/batch", json={"items": []})
+
+        assert response.status_code == 422
+
+
 class TestQueryEndpoint:
     """Tests for POST /query endpoint."""
 
@@ -183,6 +359,171 @@ class TestQueryEndpoint:
         assert response.status_code == 422
 
 
+def parse_sse(body: str) -> list[tuple[str, dict[str, Any]]]:
+    """Split a text/event-stream body into (event, data) pairs."""
+    events: list[tuple[str, dict[str, Any]]] = []
+    for message in body.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in message.splitlines())
+        events.append((fields["event"], json.loads(fields["data"])))
+    return events
+
+
+@pytest.fixture
+def mock_pipeline_agents() -> Generator[None]:
+    """Replace the pipeline's agents with mocks that pass on the first attempt."""
+    entry = SimpleNamespace(id="2026-01-10_09-00-00", date="2026-01-10", raw_content="bench 185x5")
+    entry.model_dump = lambda: {"id": entry.id}  # type: ignore[attr-defined]
+
+    async def synthesize_stream(synthesizer_input: Any) -> AsyncIterator[str]:
+        for text in ("Your bench ", "went up."):
+            yield text
+
+    agents = {
+        "RouterAgent": MagicMock(return_value=MagicMock(classify=AsyncMock(return_value=MagicMock()))),
+        "PlannerAgent": MagicMock(return_value=MagicMock(plan=AsyncMock(return_value=MagicMock()))),
+        "RetrieverAgent": MagicMock(
+            return_value=MagicMock(retrieve=AsyncMock(return_value=MagicMock(entries=[entry], retrieval_summary=[])))
+        ),
+        "AnalyzerAgent": MagicMock(
+            return_value=MagicMock(analyze=AsyncMock(return_value=MagicMock(verdict=Verdict.SUFFICIENT)))
+        ),
+        "SynthesizerAgent": MagicMock(
+            return_value=MagicMock(
+                synthesize=AsyncMock(return_value=MagicMock(response="Structured answer.")),
+                synthesize_stream=synthesize_stream,
+            )
+        ),
+        "EvaluatorAgent": MagicMock(
+            return_value=MagicMock(
+                evaluate=AsyncMock(return_value=MagicMock(overall_verdict=Verdict.SUFFICIENT)),
+                is_passed=MagicMock(return_value=True),
+            )
+        ),
+    }
+    inputs = {
+        name: MagicMock()
+        for name in (
+            "DomainSelector",
+            "RouterInput",
+            "PlannerInput",
+            "RetrieverInput",
+            "AnalyzerInput",
+            "SynthesizerInput",
+            "EvaluatorInput",
+        )
+    }
+    with patch.multiple("swealog.api.routes.query", **agents, **inputs):
+        yield
+
+
+class TestQueryStreamEndpoint:
+    """Tests for POST /query/stream."""
+
+    @pytest.mark.asyncio
+    async def test_streams_pipeline_events(self, override_dependencies: None, mock_pipeline_agents: None) -> None:
+        """Stages, sources, draft text and the final result arrive as SSE events."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/query/stream", json={"text": "How has my bench press progressed?"})
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = parse_sse(response.text)
+        names = [name for name, _ in events]
+
+        stages = [data["stage"] for name, data in events if name == "stage_start"]
+        assert stages == ["router", "planner", "retriever", "analyzer", "synthesizer", "evaluator"]
+        assert all(data["duration_ms"] >= 0 for name, data in events if name == "stage_end")
+        # Sources are sent right after the Retriever, before analysis starts
+        sources_at = names.index("sources")
+        assert events[sources_at - 1][0] == "stage_end"
+        assert events[sources_at - 1][1]["stage"] == "retriever"
+        assert events[sources_at][1] == {"attempt": 1, "sources": ["2026-01-10_09-00-00"]}
+        assert [data["text"] for name, data in events if name == "draft"] == ["Your bench ", "went up."]
+        name, final = events[-1]
+        assert name == "final"
+        assert math.isclose(final.pop("confidence"), 0.9)
+        assert final == {"response": "Your bench went up.", "sources": ["2026-01-10_09-00-00"], "partial": False}
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_before_text_falls_back(
+        self, override_dependencies: None, mock_pipeline_agents: None
+    ) -> None:
+        """If streaming fails before any text, the structured answer is sent instead of an error."""
+
+        async def failing_stream(synthesizer_input: Any) -> AsyncIterator[str]:
+            raise RuntimeError("provider unavailable")
+            yield ""
+
+        synthesizer = MagicMock(
+            synthesize=AsyncMock(return_value=MagicMock(response="Structured answer.")),
+            synthesize_stream=failing_stream,
+        )
+        with patch("swealog.api.routes.query.SynthesizerAgent", MagicMock(return_value=synthesizer)):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/query/stream", json={"text": "How has my bench press progressed?"})
+
+        events = parse_sse(response.text)
+        assert "error" not in [name for name, _ in events]
+        assert [data["text"] for name, data in events if name == "draft"] == ["Structured answer."]
+        assert events[-1][0] == "final"
+        assert events[-1][1]["response"] == "Structured answer."
+        synthesizer.synthesize.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stream_failure_after_text_is_reported(
+        self, override_dependencies: None, mock_pipeline_agents: None
+    ) -> None:
+        """A stream that fails after sending text ends with an error event."""
+
+        async def broken_stream(synthesizer_input: Any) -> AsyncIterator[str]:
+            yield "Your bench "
+            raise RuntimeError("connection reset")
+
+        synthesizer = MagicMock(synthesize=AsyncMock(), synthesize_stream=broken_stream)
+        with patch("swealog.api.routes.query.SynthesizerAgent", MagicMock(return_value=synthesizer)):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/query/stream", json={"text": "How has my bench press progressed?"})
+
+        events = parse_sse(response.text)
+        assert [data["text"] for name, data in events if name == "draft"] == ["Your bench "]
+        assert events[-1][0] == "error"
+        synthesizer.synthesize.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_blocking_pipeline_uses_structured_synthesis(self, mock_pipeline_agents: None) -> None:
+        """execute_query_pipeline keeps its result shape and structured Synthesizer output."""
+        result = await execute_query_pipeline("How has my bench press progressed?", MagicMock(), MagicMock(), [])
+
+        assert math.isclose(result.pop("confidence"), 0.9)
+        assert result == {"response": "Structured answer.", "sources": ["2026-01-10_09-00-00"], "is_partial": False}
+
+    @pytest.mark.asyncio
+    async def test_failure_becomes_error_event(self, override_dependencies: None) -> None:
+        """Errors after the stream started are reported as an error event."""
+
+        async def failing_pipeline(**kwargs: Any) -> AsyncIterator[tuple[str, dict[str, Any]]]:
+            yield "stage_start", {"stage": "router", "attempt": 1}
+            raise RuntimeError("boom")
+
+        with patch("swealog.api.routes.query.stream_query_pipeline", failing_pipeline):
+            async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+                response = await client.post("/query/stream", json={"text": "How has my bench press progressed?"})
+
+        assert response.status_code == 200
+        assert parse_sse(response.text) == [
+            ("stage_start", {"stage": "router", "attempt": 1}),
+            ("error", {"status_code": 500, "detail": "Internal error: RuntimeError"}),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_rejects_empty_text(self) -> None:
+        """Empty queries are rejected before streaming starts."""
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            response = await client.post("/query/stream", json={"text": ""})
+
+        assert response.status_code == 422
+
+
 class TestErrorHandling:
     """Tests for error handling in API routes."""
 
@@ -1,5 +1,7 @@
 """Tests for swealog.cli.app module."""
 
+from pathlib import Path
+
 from swealog import __version__
 from swealog.cli import app
 from typer.testing import CliRunner
@@ -89,3 +91,30 @@ def test_app_command_decorator() -> None:
     result = test_runner.invoke(test_app)
     assert result.exit_code == 0
     assert "decorated output" in result.stdout
+
+
+def test_reindex_builds_index(tmp_path: Path) -> None:
+    """Test reindex indexes an existing storage tree."""
+    raw_dir = tmp_path / "logs" / "raw" / "2026" / "01"
+    raw_dir.mkdir(parents=True)
+    (raw_dir / "2026-01-01.md").write_text("## 10:30\nBench 185x5\n\n## 18:00\nRun 5k\n")
+
+    result = runner.invoke(app, ["reindex", "--storage", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "Indexed 2 entries" in result.stdout
+    assert (tmp_path / "logs" / "index.sqlite").exists()
+
+
+def test_migrate_parsed_to_jsonl(tmp_path: Path) -> None:
+    """Test migrate-parsed converts parsed JSON day files to JSONL."""
+    parsed_dir = tmp_path / "logs" / "parsed" / "2026" / "01"
+    parsed_dir.mkdir(parents=True)
+    (parsed_dir / "2026-01-01.json").write_text('{"2026-01-01_10-30-00": {"weight": 185}}')
+
+    result = runner.invoke(app, ["migrate-parsed", "--format", "jsonl", "--storage", str(tmp_path)])
+
+    assert result.exit_code == 0
+    assert "Converted 1 day files to jsonl" in result.stdout
+    assert (parsed_dir / "2026-01-01.jsonl").exists()
+    assert not (parsed_dir / "2026-01-01.json").exists()
@@ -0,0 +1,110 @@
+"""Tests for swealog.cli.checkpoint module."""
+
+from datetime import date
+from pathlib import Path
+
+import pytest
+from swealog.cli import CheckpointRecord, ImportCheckpoint, entry_key
+
+
+def record(key: str, entry_date: date | None = None) -> CheckpointRecord:
+    """Build a checkpoint record for an entry of log.txt."""
+    return CheckpointRecord(key, Path("log.txt"), 1, 1, entry_date)
+
+
+class TestEntryKey:
+    """Tests for entry_key."""
+
+    def test_duplicates_get_distinct_keys(self) -> None:
+        """Identical contents at different positions are tracked separately."""
+        first = entry_key("Rest day", Path("log.txt"), 1)
+        second = entry_key("Rest day", Path("log.txt"), 3)
+
+        assert first != second
+        assert first.split(":")[0] == second.split(":")[0]
+
+    def test_keys_relative_to_import_root(self) -> None:
+        """A moved export directory keeps its keys."""
+        assert entry_key("a", Path("old/2024/log.txt"), 1, Path("old")) == entry_key(
+            "a", Path("new/2024/log.txt"), 1, Path("new")
+        )
+
+    def test_same_named_files_get_distinct_keys(self) -> None:
+        """Files with the same name in different directories do not collide."""
+        root = Path("export")
+        first = entry_key("Rest day", root / "2024" / "log.md", 1, root)
+        second = entry_key("Rest day", root / "2025" / "log.md", 1, root)
+
+        assert first != second
+        assert first.split(":")[1] == "2024/log.md"
+
+    def test_keys_without_root_use_absolute_path(self, tmp_path: Path) -> None:
+        """Without an import root, files are keyed by their resolved path."""
+        assert entry_key("a", tmp_path / "2024" / "log.md", 1) != entry_key("a", tmp_path / "2025" / "log.md", 1)
+        assert entry_key("a", tmp_path / "x" / ".." / "log.md", 1) == entry_key("a", tmp_path / "log.md", 1)
+
+    def test_keys_depend_on_content(self) -> None:
+        """An edited entry is imported again."""
+        assert entry_key("a", Path("log.txt"), 1) != entry_key("b", Path("log.txt"), 1)
+
+
+class TestImportCheckpoint:
+    """Tests for ImportCheckpoint."""
+
+    def test_missing_file_is_empty(self, tmp_path: Path) -> None:
+        """A checkpoint that was never written has no progress."""
+        checkpoint = ImportCheckpoint(tmp_path / "checkpoint.jsonl")
+
+        assert checkpoint.done == set()
+        assert checkpoint.saving == {}
+        assert not checkpoint.path.exists()
+
+    def test_records_survive_reload(self, tmp_path: Path) -> None:
+        """Done and unconfirmed saving records are read back."""
+        path = tmp_path / "nested" / "checkpoint.jsonl"
+        checkpoint = ImportCheckpoint(path)
+        checkpoint.mark_saving([record("a:0", date(2024, 1, 15)), record("b:0", date(2024, 1, 16))])
+        checkpoint.mark_done([record("a:0"), record("q:0")])
+
+        reloaded = ImportCheckpoint(path)
+
+        assert reloaded.done == {"a:0", "q:0"}
+        assert reloaded.saving == {"b:0": date(2024, 1, 16)}
+
+    def test_torn_line_ignored(self, tmp_path: Path) -> None:
+        """A partial last line from a crash does not stop the load."""
+        path = tmp_path / "checkpoint.jsonl"
+        checkpoint = ImportCheckpoint(path)
+        checkpoint.mark_done([record("a:0")])
+        with path.open("a", encoding="utf-8") as f:
+            f.write('{"op": "done", "ke')
+
+        assert ImportCheckpoint(path).done == {"a:0"}
+
+    def test_reset_deletes_file(self, tmp_path: Path) -> None:
+        """Reset forgets progress and removes the file."""
+        checkpoint = ImportCheckpoint(tmp_path / "checkpoint.jsonl")
+        checkpoint.mark_done([record("a:0")])
+
+        checkpoint.reset()
+
+        assert ImportCheckpoint(checkpoint.path).done == set()
+        assert not checkpoint.path.exists()
+
+    def test_done_not_kept_in_memory(self, tmp_path: Path) -> None:
+        """Entries finished by this process are only written to the file."""
+        path = tmp_path / "checkpoint.jsonl"
+        checkpoint = ImportCheckpoint(path)
+        checkpoint.mark_saving([record("a:0", date(2024, 1, 15))])
+        checkpoint.mark_done([record("a:0")])
+
+        assert checkpoint.done == set()
+        assert checkpoint.saving == {}
+        assert ImportCheckpoint(path).done == {"a:0"}
+
+    def test_saving_requires_date(self, tmp_path: Path) -> None:
+        """Saving records must say which day to check on resume."""
+        checkpoint = ImportCheckpoint(tmp_path / "checkpoint.jsonl")
+
+        with pytest.raises(ValueError, match="entry_date"):
+            checkpoint.mark_saving([record("a:0")])
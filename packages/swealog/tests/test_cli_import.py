@@ -1,18 +1,34 @@
 """Tests for swealog.cli.import_cmd module."""
 
+import asyncio
+import threading
+from collections.abc import Iterator
+from datetime import date, datetime, time
 from pathlib import Path
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+from pydantic import BaseModel
+from quilto import StorageRepository
+from quilto.agents.models import InputType, ParserInput, ParserOutput, RouterOutput
 from swealog.cli import (
     BatchImporter,
     BatchImportError,
     BatchResult,
+    CheckpointRecord,
+    ImportCheckpoint,
     RawEntry,
     app,
     collect_import_files,
+    entry_key,
+    iter_import_file,
+    iter_import_files,
     parse_import_file,
 )
+from swealog.cli.import_cmd import (
+    PIPELINE_DEPTH,
+    _detect_delimiter,  # pyright: ignore[reportPrivateUsage]
+)
 from typer.testing import CliRunner
 
 runner = CliRunner()
@@ -196,6 +212,100 @@ class TestParseImportFile:
         assert entries[1].content == "Entry 2"
 
 
+class TestIterImportFile:
+    """Tests for iter_import_file and iter_import_files."""
+
+    @pytest.mark.parametrize(
+        "text",
+        [
+            "Entry 1\n---\nEntry 2\n---\nEntry 3",
+            "Line 1\nLine 2\n---\n\n---\nEntry 2\n",
+            "Entry 1\n\nEntry 2\n\n\nEntry 3",
+            "Entry 1\r\n---\r\nEntry 2",
+            "Just one entry\nover two lines",
+            "\n---\n",
+            "",
+        ],
+    )
+    @pytest.mark.parametrize("chunk_size", [1, 2, 5])
+    def test_chunked_matches_whole_file(self, tmp_path: Path, text: str, chunk_size: int) -> None:
+        """Test splitting in small chunks gives the same entries as reading the whole file."""
+        file = tmp_path / "log.txt"
+        file.write_bytes(text.encode("utf-8"))
+
+        chunked = list(iter_import_file(file, chunk_size=chunk_size))
+
+        assert chunked == parse_import_file(file)
+
+    def test_line_starts_across_chunks(self, tmp_path: Path) -> None:
+        """Test line starts count the lines of earlier chunks."""
+        file = tmp_path / "log.txt"
+        file.write_text("A\nB\n---\nC\n---\nD")
+
+        entries = list(iter_import_file(file, chunk_size=3))
+
+        assert [(e.content, e.line_start) for e in entries] == [("A\nB", 1), ("C", 4), ("D", 6)]
+
+    def test_single_entry_file_read_once(self, tmp_path: Path) -> None:
+        """Test a file without delimiters is not read again after detection."""
+        file = tmp_path / "log.txt"
+        file.write_text("Just one entry\nover two lines")
+
+        with patch.object(Path, "read_text", side_effect=AssertionError("read twice")):
+            entries = list(iter_import_file(file, chunk_size=4))
+
+        assert [e.content for e in entries] == ["Just one entry\nover two lines"]
+
+    def test_detection_stops_at_dash_line(self) -> None:
+        """Test detection reads only up to the first "---" line."""
+        chunks = iter(["A\n-", "--\nB", "\n\nC"])
+
+        assert _detect_delimiter(chunks) == ("---", "A\n---\nB")
+        assert next(chunks) == "\n\nC"
+
+    def test_blank_lines_decide_after_prefix(self) -> None:
+        """Test blank lines in the detection prefix win over a later "---" line."""
+        chunks = iter(["A\n\nB", "C\n---\nD"])
+
+        with patch("swealog.cli.import_cmd.DETECT_PREFIX_SIZE", 4):
+            assert _detect_delimiter(chunks) == ("\n\n", "A\n\nB")
+
+    def test_empty_delimiter_rejected(self, tmp_path: Path) -> None:
+        """Test an empty delimiter is an error rather than an endless split."""
+        file = tmp_path / "log.txt"
+        file.write_text("Entry")
+
+        with pytest.raises(ValueError, match="empty separator"):
+            list(iter_import_file(file, delimiter=""))
+
+    def test_files_chained_in_order(self, tmp_path: Path) -> None:
+        """Test entries of several files are yielded file by file."""
+        first = tmp_path / "a.txt"
+        first.write_text("A1\n---\nA2")
+        second = tmp_path / "b.txt"
+        second.write_text("B1")
+
+        entries = list(iter_import_files([first, second]))
+
+        assert [(e.source_file, e.entry_number, e.content) for e in entries] == [
+            (first, 1, "A1"),
+            (first, 2, "A2"),
+            (second, 1, "B1"),
+        ]
+
+    def test_files_read_lazily(self, tmp_path: Path) -> None:
+        """Test a file is not opened until the entries before it are consumed."""
+        first = tmp_path / "a.txt"
+        first.write_text("A1")
+        missing = tmp_path / "missing.txt"
+
+        entries = iter_import_files([first, missing])
+
+        assert next(entries).content == "A1"
+        with pytest.raises(FileNotFoundError):
+            next(entries)
+
+
 class TestCollectImportFiles:
     """Tests for collect_import_files function."""
 
@@ -299,6 +409,12 @@ class TestBatchImporter:
         assert importer.storage == storage
         assert importer.domains == domains
         assert importer.dry_run is True
+        assert importer.concurrency == 1
+
+    def test_init_rejects_zero_concurrency(self) -> None:
+        """Test BatchImporter requires at least one concurrent entry."""
+        with pytest.raises(ValueError, match="concurrency must be >= 1"):
+            BatchImporter(MagicMock(), MagicMock(), [], concurrency=0)
 
     @pytest.mark.asyncio
     async def test_import_entry_success(self, tmp_path: Path) -> None:
@@ -389,6 +505,402 @@ class TestBatchImporter:
             # Storage should NOT be called for QUERY
             storage.save_entry.assert_not_called()
 
+    @staticmethod
+    def _router_output(input_type: str) -> RouterOutput:
+        """Build a router classification for import_entries tests."""
+        return RouterOutput(
+            input_type=InputType(input_type),
+            confidence=0.9,
+            selected_domains=["test_domain"],
+            domain_selection_reasoning="Fitness log",
+            correction_target="bench weight" if input_type == "CORRECTION" else None,
+            reasoning="Test classification",
+        )
+
+    @staticmethod
+    def _parser_output(parser_input: ParserInput) -> ParserOutput:
+        """Parse "YYYY-MM-DD text" inputs onto their date."""
+        day = date.fromisoformat(parser_input.raw_input[:10])
+        if parser_input.correction_mode:
+            target = parser_input.recent_entries[-1].id
+            return ParserOutput(
+                date=day,
+                timestamp=datetime.combine(day, time(12, 0)),
+                domain_data={},
+                raw_content=parser_input.raw_input,
+                confidence=0.9,
+                is_correction=True,
+                target_entry_id=target,
+                correction_delta={"weight": 185},
+            )
+        return ParserOutput(
+            date=day,
+            timestamp=datetime.combine(day, time(8, len(parser_input.recent_entries))),
+            domain_data={"weight": 135},
+            raw_content=parser_input.raw_input,
+            confidence=0.9,
+        )
+
+    def _importer(
+        self, storage: object, concurrency: int = 1, checkpoint: ImportCheckpoint | None = None
+    ) -> BatchImporter:
+        """Build an importer over a mock domain."""
+        mock_domain = MagicMock()
+        mock_domain.name = "test_domain"
+        mock_domain.description = "Test domain"
+        mock_domain.log_schema = BaseModel
+        mock_domain.vocabulary = {}
+        return BatchImporter(MagicMock(), storage, [mock_domain], concurrency=concurrency, checkpoint=checkpoint)  # type: ignore[arg-type]
+
+    @staticmethod
+    def _raw(tmp_path: Path, texts: list[str]) -> list[RawEntry]:
+        """Build raw entries from texts."""
+        return [
+            RawEntry(content=text, source_file=tmp_path / "log.txt", entry_number=i, line_start=i)
+            for i, text in enumerate(texts, 1)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_import_entries_saves_in_one_batch(self, tmp_path: Path) -> None:
+        """Test that import_entries saves all entries with one save_entries call."""
+        storage = MagicMock()
+        importer = self._importer(storage)
+        entries = self._raw(tmp_path, ["2024-01-15 bench", "2024-01-16 squat", "2024-01-15 row"])
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(return_value=self._router_output("LOG"))
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, MagicMock(), MagicMock())
+
+        assert result.successful == 3
+        storage.save_entry.assert_not_called()
+        storage.save_entries.assert_called_once()
+        saved, corrections = storage.save_entries.call_args.args
+        assert [e.raw_content for e in saved] == [e.content for e in entries]
+        assert corrections == [None, None, None]
+
+    @pytest.mark.asyncio
+    async def test_import_entries_saves_off_event_loop(self, tmp_path: Path) -> None:
+        """Test that the batch save runs in a worker thread, not on the event loop."""
+        storage = MagicMock()
+        importer = self._importer(storage)
+        entries = self._raw(tmp_path, ["2024-01-15 bench"])
+        loop_thread = threading.get_ident()
+        save_threads: list[int] = []
+
+        def record_thread(*_: object) -> None:
+            save_threads.append(threading.get_ident())
+
+        storage.save_entries.side_effect = record_thread
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(return_value=self._router_output("LOG"))
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, MagicMock(), MagicMock())
+
+        assert result.successful == 1
+        assert len(save_threads) == 1
+        assert save_threads[0] != loop_thread
+
+    @pytest.mark.asyncio
+    async def test_import_entries_correction_sees_earlier_entries(self, tmp_path: Path) -> None:
+        """Test that a correction is parsed after earlier batch entries are saved."""
+        storage = StorageRepository(tmp_path / "store")
+        importer = self._importer(storage)
+        entries = self._raw(tmp_path, ["2024-01-15 bench 135", "2024-01-15 actually 185"])
+        outputs = [self._router_output("LOG"), self._router_output("CORRECTION")]
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(side_effect=outputs)
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, MagicMock(), MagicMock())
+
+        assert result.successful == 2
+        saved = storage.get_entries_by_date_range(date(2024, 1, 15), date(2024, 1, 15))
+        assert len(saved) == 2
+        assert saved[0].parsed_data == {"weight": 185}
+
+    @pytest.mark.asyncio
+    async def test_import_entries_save_failure_marks_entries_failed(self, tmp_path: Path) -> None:
+        """Test that a failed batch save reports its entries as failed."""
+        storage = MagicMock()
+        storage.save_entries.side_effect = OSError("disk full")
+        importer = self._importer(storage)
+        entries = self._raw(tmp_path, ["2024-01-15 bench", "2024-01-16 squat"])
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(return_value=self._router_output("LOG"))
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, MagicMock(), MagicMock())
+
+        assert result.successful == 0
+        assert result.failed == 2
+        assert [e.error_message for e in result.errors] == ["disk full", "disk full"]
+
+    @pytest.mark.asyncio
+    async def test_import_entries_concurrent_keeps_order(self, tmp_path: Path) -> None:
+        """Test that concurrent imports stay bounded and save in input order."""
+        storage = MagicMock()
+        importer = self._importer(storage, concurrency=3)
+        entries = self._raw(tmp_path, [f"2024-01-{day:02d} bench" for day in range(10, 20)])
+        running = 0
+        peak = 0
+
+        async def classify(router_input: object) -> RouterOutput:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            # Later entries finish first
+            await asyncio.sleep(0.001 * (30 - int(str(getattr(router_input, "raw_input", ""))[8:10])))
+            running -= 1
+            return self._router_output("LOG")
+
+        progress = MagicMock()
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = classify
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, progress, MagicMock())
+
+        assert result.successful == 10
+        assert peak == 3
+        saved, _ = storage.save_entries.call_args.args
+        assert [e.raw_content for e in saved] == [e.content for e in entries]
+        assert progress.advance.call_count == 10
+
+    @pytest.mark.asyncio
+    async def test_import_entries_concurrent_correction_sees_earlier_entries(self, tmp_path: Path) -> None:
+        """Test that a correction waits for every earlier entry when importing concurrently."""
+        storage = StorageRepository(tmp_path / "store")
+        importer = self._importer(storage, concurrency=4)
+        entries = self._raw(
+            tmp_path, ["2024-01-15 bench 135", "2024-01-15 squat 225", "2024-01-15 actually 185", "2024-01-16 row"]
+        )
+        outputs = {
+            entry.content: self._router_output("CORRECTION" if "actually" in entry.content else "LOG")
+            for entry in entries
+        }
+
+        async def classify(router_input: object) -> RouterOutput:
+            return outputs[str(getattr(router_input, "raw_input", ""))]
+
+        progress = MagicMock()
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = classify
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, progress, MagicMock())
+
+        assert result.successful == 4
+        assert progress.advance.call_count == 4
+        correction_input = next(
+            call.args[0]
+            for call in mock_parser_class.return_value.parse.await_args_list
+            if call.args[0].correction_mode
+        )
+        assert [e.raw_content for e in correction_input.recent_entries] == [
+            "2024-01-15 bench 135",
+            "2024-01-15 squat 225",
+        ]
+        saved = storage.get_entries_by_date_range(date(2024, 1, 15), date(2024, 1, 16))
+        assert [e.raw_content for e in saved] == [e.content for e in entries]
+        assert saved[1].parsed_data == {"weight": 185}
+
+    @pytest.mark.asyncio
+    async def test_import_entries_concurrent_errors_reported_in_order(self, tmp_path: Path) -> None:
+        """Test that failed entries are reported in input order under concurrency."""
+        storage = MagicMock()
+        importer = self._importer(storage, concurrency=4)
+        entries = self._raw(tmp_path, ["2024-01-15 a", "bad b", "2024-01-15 c", "bad d"])
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(return_value=self._router_output("LOG"))
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(entries, MagicMock(), MagicMock())
+
+        assert result.successful == 2
+        assert result.failed == 2
+        assert [e.entry_number for e in result.errors] == [2, 4]
+        saved, _ = storage.save_entries.call_args.args
+        assert [e.raw_content for e in saved] == ["2024-01-15 a", "2024-01-15 c"]
+
+    @pytest.mark.asyncio
+    async def test_import_entries_streams_from_generator(self, tmp_path: Path) -> None:
+        """Test entries are saved while the generator is still being read, with bounded read-ahead."""
+        storage = MagicMock()
+        importer = self._importer(storage, concurrency=2)
+        count = 200
+        read = 0
+        read_at_first_save: list[int] = []
+
+        def generate() -> Iterator[RawEntry]:
+            nonlocal read
+            for i in range(1, count + 1):
+                read += 1
+                yield RawEntry(f"2024-01-15 set {i}", tmp_path / "log.txt", i, i)
+
+        def save(entries: list[object], corrections: list[object]) -> None:
+            read_at_first_save.append(read)
+
+        storage.save_entries.side_effect = save
+        with (
+            patch("swealog.cli.import_cmd.SAVE_INTERVAL", 0),
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(return_value=self._router_output("LOG"))
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            result = await importer.import_entries(generate(), MagicMock(), MagicMock())
+
+        assert (result.total_entries, result.successful) == (count, count)
+        # The first save happened with only the queue's worth of entries read
+        assert read_at_first_save[0] < 2 * PIPELINE_DEPTH + 4
+        saved = [e.raw_content for call in storage.save_entries.call_args_list for e in call.args[0]]
+        assert saved == [f"2024-01-15 set {i}" for i in range(1, count + 1)]
+
+    @pytest.mark.asyncio
+    async def test_import_entries_read_error_saves_earlier_entries(self, tmp_path: Path) -> None:
+        """Test a failure while reading is raised after the entries read before it are saved."""
+        storage = MagicMock()
+        importer = self._importer(storage)
+
+        def generate() -> Iterator[RawEntry]:
+            yield RawEntry("2024-01-15 bench", tmp_path / "log.txt", 1, 1)
+            raise UnicodeDecodeError("utf-8", b"\xff", 0, 1, "invalid start byte")
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = AsyncMock(return_value=self._router_output("LOG"))
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=self._parser_output)
+            with pytest.raises(UnicodeDecodeError):
+                await importer.import_entries(generate(), MagicMock(), MagicMock())
+
+        saved, _ = storage.save_entries.call_args.args
+        assert [e.raw_content for e in saved] == ["2024-01-15 bench"]
+
+    async def _import(
+        self,
+        storage: StorageRepository,
+        checkpoint: ImportCheckpoint,
+        entries: list[RawEntry],
+        input_types: dict[str, str] | None = None,
+        fail: set[str] | None = None,
+    ) -> tuple[BatchResult, MagicMock]:
+        """Import entries through mocked agents and return the result and parser mock."""
+        importer = self._importer(storage, checkpoint=checkpoint)
+
+        async def classify(router_input: object) -> RouterOutput:
+            text = str(getattr(router_input, "raw_input", ""))
+            return self._router_output((input_types or {}).get(text, "LOG"))
+
+        def parse(parser_input: ParserInput) -> ParserOutput:
+            if parser_input.raw_input in (fail or set()):
+                raise ValueError("bad output")
+            return self._parser_output(parser_input)
+
+        with (
+            patch("swealog.cli.import_cmd.RouterAgent") as mock_router_class,
+            patch("swealog.cli.import_cmd.ParserAgent") as mock_parser_class,
+        ):
+            mock_router_class.return_value.classify = classify
+            mock_parser_class.return_value.parse = AsyncMock(side_effect=parse)
+            result = await importer.import_entries(entries, MagicMock(), MagicMock())
+        return result, mock_parser_class.return_value.parse
+
+    @pytest.mark.asyncio
+    async def test_resume_imports_only_remaining_entries(self, tmp_path: Path) -> None:
+        """Entries that failed are retried on resume; finished ones are skipped."""
+        storage = StorageRepository(tmp_path / "store")
+        path = tmp_path / "checkpoint.jsonl"
+        entries = self._raw(tmp_path, ["2024-01-15 bench", "2024-01-15 squat", "2024-01-16 row"])
+
+        first, _ = await self._import(storage, ImportCheckpoint(path), entries, fail={"2024-01-15 squat"})
+        second, parse = await self._import(storage, ImportCheckpoint(path), entries)
+
+        assert (first.successful, first.failed) == (2, 1)
+        assert (second.skipped, second.successful, second.failed) == (2, 1, 0)
+        assert [call.args[0].raw_input for call in parse.await_args_list] == ["2024-01-15 squat"]
+        saved = storage.get_entries_by_date_range(date(2024, 1, 15), date(2024, 1, 16))
+        assert sorted(e.raw_content for e in saved) == sorted(e.content for e in entries)
+
+    @pytest.mark.asyncio
+    async def test_same_named_files_resume_separately(self, tmp_path: Path) -> None:
+        """An entry of 2025/log.md is not skipped because 2024/log.md had the same entry."""
+        storage = StorageRepository(tmp_path / "store")
+        path = tmp_path / "checkpoint.jsonl"
+        entries = [
+            RawEntry(content="2024-01-15 rest", source_file=tmp_path / year / "log.md", entry_number=1, line_start=1)
+            for year in ("2024", "2025")
+        ]
+
+        await self._import(storage, ImportCheckpoint(path), entries[:1])
+        result, parse = await self._import(storage, ImportCheckpoint(path), entries)
+
+        assert (result.skipped, result.successful) == (1, 1)
+        assert parse.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_rerun_of_finished_import_does_nothing(self, tmp_path: Path) -> None:
+        """Importing the same export twice does not duplicate entries or call the LLM."""
+        storage = StorageRepository(tmp_path / "store")
+        path = tmp_path / "checkpoint.jsonl"
+        entries = self._raw(tmp_path, ["2024-01-15 rest", "2024-01-15 rest", "2024-01-15 what was my PR?"])
+        input_types = {"2024-01-15 what was my PR?": "QUERY"}
+
+        first, _ = await self._import(storage, ImportCheckpoint(path), entries, input_types)
+        second, parse = await self._import(storage, ImportCheckpoint(path), entries, input_types)
+
+        assert first.successful == 3
+        assert second.skipped == 3
+        parse.assert_not_awaited()
+        # Both identical entries are kept, neither is duplicated
+        saved = storage.get_entries_by_date_range(date(2024, 1, 15), date(2024, 1, 15))
+        assert [e.raw_content for e in saved] == ["2024-01-15 rest", "2024-01-15 rest"]
+
+    @pytest.mark.asyncio
+    async def test_unconfirmed_save_checked_in_storage(self, tmp_path: Path) -> None:
+        """Entries saved just before a crash are not imported again; unsaved ones are."""
+        storage = StorageRepository(tmp_path / "store")
+        path = tmp_path / "checkpoint.jsonl"
+        entries = self._raw(tmp_path, ["2024-01-15 bench", "2024-01-15 squat"])
+        keys = [entry_key(e.content, e.source_file, e.entry_number) for e in entries]
+        # Crash after "saving" was recorded and only the first entry reached storage
+        await self._import(storage, ImportCheckpoint(tmp_path / "other.jsonl"), entries[:1])
+        ImportCheckpoint(path).mark_saving(
+            [
+                CheckpointRecord(key, e.source_file, 0, 0, date(2024, 1, 15))
+                for key, e in zip(keys, entries, strict=True)
+            ]
+        )
+
+        checkpoint = ImportCheckpoint(path)
+        result, parse = await self._import(storage, checkpoint, entries)
+
+        assert (result.skipped, result.successful) == (1, 1)
+        assert [call.args[0].raw_input for call in parse.await_args_list] == ["2024-01-15 squat"]
+        assert set(keys) <= ImportCheckpoint(path).done
+
 
 class TestImportCommand:
     """Tests for import CLI command."""
@@ -403,6 +915,8 @@ class TestImportCommand:
         assert "--delimiter" in result.stdout
         assert "--error-log" in result.stdout
         assert "--verbose" in result.stdout
+        assert "--concurrency" in result.stdout
+        assert "--resume" in result.stdout
 
     def test_import_nonexistent_path(self) -> None:
         """Test import with nonexistent path."""
@@ -443,6 +957,28 @@ class TestImportCommand:
         # Should succeed (imports were mocked)
         assert "2" in result.stdout or result.exit_code == 0
 
+    @patch("swealog.cli.import_cmd.load_cli_config")
+    @patch("swealog.cli.import_cmd.LLMClient")
+    @patch("swealog.cli.import_cmd.StorageRepository")
+    @patch("swealog.cli.import_cmd.BatchImporter")
+    def test_import_closes_storage_on_failure(
+        self,
+        mock_importer_class: MagicMock,
+        mock_storage_class: MagicMock,
+        mock_llm_class: MagicMock,
+        mock_config: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test the storage is closed even when the import raises."""
+        file = tmp_path / "logs.txt"
+        file.write_text("Bench 185x5")
+        mock_importer_class.return_value.import_entries = AsyncMock(side_effect=OSError("disk full"))
+
+        result = runner.invoke(app, ["import", str(file)])
+
+        assert result.exit_code != 0
+        mock_storage_class.return_value.close.assert_called_once()
+
     @patch("swealog.cli.import_cmd.load_cli_config")
     @patch("swealog.cli.import_cmd.LLMClient")
     @patch("swealog.cli.import_cmd.StorageRepository")
@@ -564,6 +1100,94 @@ class TestImportCommand:
         content = error_log_path.read_text()
         assert "Test error" in content
 
+    @patch("swealog.cli.import_cmd.load_cli_config")
+    @patch("swealog.cli.import_cmd.LLMClient")
+    @patch("swealog.cli.import_cmd.StorageRepository")
+    @patch("swealog.cli.import_cmd.BatchImporter")
+    def test_import_concurrency_option(
+        self,
+        mock_importer_class: MagicMock,
+        mock_storage_class: MagicMock,
+        mock_llm_class: MagicMock,
+        mock_config: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test --concurrency is passed to the importer."""
+        file = tmp_path / "logs.txt"
+        file.write_text("Test entry")
+        mock_importer = mock_importer_class.return_value
+        mock_importer.import_entries = AsyncMock(return_value=BatchResult(total_entries=1, successful=1, failed=0))
+
+        result = runner.invoke(app, ["import", "--concurrency", "4", str(file)])
+
+        assert result.exit_code == 0
+        assert mock_importer_class.call_args.args[4] == 4
+
+    def test_import_rejects_zero_concurrency(self, tmp_path: Path) -> None:
+        """Test --concurrency must be at least 1."""
+        file = tmp_path / "logs.txt"
+        file.write_text("Test entry")
+
+        result = runner.invoke(app, ["import", "--concurrency", "0", str(file)])
+
+        assert result.exit_code == 2
+
+    @patch("swealog.cli.import_cmd.load_cli_config")
+    @patch("swealog.cli.import_cmd.LLMClient")
+    @patch("swealog.cli.import_cmd.StorageRepository")
+    @patch("swealog.cli.import_cmd.BatchImporter")
+    def test_import_resume_keeps_checkpoint(
+        self,
+        mock_importer_class: MagicMock,
+        mock_storage_class: MagicMock,
+        mock_llm_class: MagicMock,
+        mock_config: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test --resume hands the earlier progress to the importer and reports skips."""
+        file = tmp_path / "logs.txt"
+        file.write_text("Test entry")
+        checkpoint_path = tmp_path / "checkpoint.jsonl"
+        ImportCheckpoint(checkpoint_path).mark_done([CheckpointRecord("a:0", file, 1, 1)])
+        mock_importer = mock_importer_class.return_value
+        mock_importer.import_entries = AsyncMock(
+            return_value=BatchResult(total_entries=1, successful=0, failed=0, skipped=1)
+        )
+
+        result = runner.invoke(app, ["import", "--resume", "--checkpoint", str(checkpoint_path), str(file)])
+
+        assert result.exit_code == 0
+        checkpoint = mock_importer_class.call_args.args[5]
+        assert checkpoint.done == {"a:0"}
+        assert "Skipped 1" in result.stdout
+
+    @patch("swealog.cli.import_cmd.load_cli_config")
+    @patch("swealog.cli.import_cmd.LLMClient")
+    @patch("swealog.cli.import_cmd.StorageRepository")
+    @patch("swealog.cli.import_cmd.BatchImporter")
+    def test_import_without_resume_starts_over(
+        self,
+        mock_importer_class: MagicMock,
+        mock_storage_class: MagicMock,
+        mock_llm_class: MagicMock,
+        mock_config: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Test a plain import discards an earlier checkpoint with a warning."""
+        file = tmp_path / "logs.txt"
+        file.write_text("Test entry")
+        checkpoint_path = tmp_path / "checkpoint.jsonl"
+        ImportCheckpoint(checkpoint_path).mark_done([CheckpointRecord("a:0", file, 1, 1)])
+        mock_importer = mock_importer_class.return_value
+        mock_importer.import_entries = AsyncMock(return_value=BatchResult(total_entries=1, successful=1, failed=0))
+
+        result = runner.invoke(app, ["import", "--checkpoint", str(checkpoint_path), str(file)])
+
+        assert result.exit_code == 0
+        assert "--resume" in result.stdout
+        assert mock_importer_class.call_args.args[5].done == set()
+        assert not checkpoint_path.exists()
+
 
 class TestImportCommandExports:
     """Tests for import_cmd module exports."""
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""Benchmark BatchImporter concurrency against a fake LLM with injected latency.
+
+Imports N synthetic entries into a temporary storage for each concurrency
+level. Router and Parser calls go to a local fake LLM client that sleeps
+for the configured latency (with jitter) before answering, so the run
+measures how well the importer overlaps LLM round trips. Each run checks
+that every entry was saved in input order.
+
+Usage:
+    uv run scripts/bench_import_concurrency.py
+    uv run scripts/bench_import_concurrency.py --entries 500 --latency 0.2 --concurrency 1 8 32
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+
+from pydantic import BaseModel
+from quilto import ParserOutput, RouterOutput, StorageRepository
+from quilto.agents.models import InputType
+from rich.progress import Progress
+from swealog.cli.import_cmd import BatchImporter, RawEntry
+from swealog.domains import general_fitness, strength
+
+START_DATE = date(2026, 1, 1)
+
+
+class FakeLLMClient:
+    """Answers Router and Parser requests after a simulated network delay.
+
+    Attributes:
+        latency: Mean delay per call in seconds.
+        jitter: Fraction of the latency added or removed at random.
+        calls: Completed calls.
+        peak_in_flight: Most calls waiting at once.
+    """
+
+    def __init__(self, latency: float, jitter: float, seed: int = 0) -> None:
+        """Initialize the fake client.
+
+        Args:
+            latency: Mean delay per call in seconds.
+            jitter: Fraction of the latency added or removed at random.
+            seed: Seed for the jitter.
+        """
+        self.latency = latency
+        self.jitter = jitter
+        self.calls = 0
+        self.peak_in_flight = 0
+        self._in_flight = 0
+        self._random = random.Random(seed)
+
+    async def complete_structured(
+        self, agent: str, messages: list[dict[str, Any]], response_model: type[BaseModel], **kwargs: Any
+    ) -> BaseModel:
+        """Sleep for the injected latency, then build a valid response."""
+        self._in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self._in_flight)
+        try:
+            await asyncio.sleep(self.latency * (1 + self._random.uniform(-self.jitter, self.jitter)))
+        finally:
+            self._in_flight -= 1
+        self.calls += 1
+
+        text = str(messages[-1]["content"])
+        if response_model is RouterOutput:
+            return RouterOutput(
+                input_type=InputType.LOG,
+                confidence=0.9,
+                selected_domains=["Strength"],
+                domain_selection_reasoning="Strength log",
+                reasoning="Benchmark entry",
+            )
+        day = date.fromisoformat(text[:10])
+        return ParserOutput(
+            date=day,
+            timestamp=datetime.combine(day, datetime.min.time()),
+            domain_data={"strength": {"raw": text}},
+            raw_content=text,
+            confidence=0.9,
+        )
+
+
+def make_entries(count: int, source: Path) -> list[RawEntry]:
+    """Build `count` entries spread over ten entries per day.
+
+    Args:
+        count: Number of entries.
+        source: Source file recorded on the entries.
+
+    Returns:
+        The raw entries, in order.
+    """
+    return [
+        RawEntry(
+            content=f"{START_DATE + timedelta(days=i // 10)} set {i}: bench 185x5",
+            source_file=source,
+            entry_number=i + 1,
+            line_start=i + 1,
+        )
+        for i in range(count)
+    ]
+
+
+async def bench_import(count: int, concurrency: int, latency: float, jitter: float) -> tuple[float, int, int, bool]:
+    """Import `count` entries with the given concurrency.
+
+    Args:
+        count: Number of entries.
+        concurrency: Entries routed and parsed at once.
+        latency: Mean fake LLM latency in seconds.
+        jitter: Fraction of latency varied at random.
+
+    Returns:
+        Tuple of (elapsed seconds, entries saved, peak LLM calls in flight,
+        whether the saved order matches the input).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = StorageRepository(Path(tmp))
+        try:
+            llm = FakeLLMClient(latency, jitter)
+            importer = BatchImporter(llm, storage, [general_fitness, strength], concurrency=concurrency)  # type: ignore[arg-type]
+            entries = make_entries(count, Path(tmp) / "export.txt")
+
+            with Progress(disable=True) as progress:
+                task = progress.add_task("import", total=len(entries))
+                t0 = time.perf_counter()
+                result = await importer.import_entries(entries, progress, task)
+                elapsed = time.perf_counter() - t0
+
+            if result.failed:
+                raise SystemExit(f"{result.failed} entries failed: {result.errors[0].error_message}")
+            last_day = START_DATE + timedelta(days=(count - 1) // 10)
+            saved = storage.get_entries_by_date_range(START_DATE, last_day)
+        finally:
+            # Wait for background compactions before the directory is removed
+            storage.close()
+        in_order = [e.raw_content for e in saved] == [e.content for e in entries]
+        return elapsed, len(saved), llm.peak_in_flight, in_order
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent BatchImporter against a fake LLM")
+    parser.add_argument("--entries", type=int, default=200)
+    parser.add_argument("--latency", type=float, default=0.05, help="mean fake LLM latency in seconds")
+    parser.add_argument("--jitter", type=float, default=0.5, help="fraction of latency varied at random")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    args = parser.parse_args()
+
+    print(f"{'conc':>5} {'entries':>8} {'seconds':>9} {'entries/s':>10} {'speedup':>8} {'peak':>5} {'ordered':>8}")
+    baseline: float | None = None
+    for concurrency in args.concurrency:
+        elapsed, saved, peak, in_order = asyncio.run(bench_import(args.entries, concurrency, args.latency, args.jitter))
+        baseline = baseline or elapsed
+        print(
+            f"{concurrency:>5} {saved:>8} {elapsed:>9.2f} {saved / elapsed:>10.1f} "
+            f"{baseline / elapsed:>7.1f}x {peak:>5} {'yes' if in_order else 'NO':>8}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+#!/usr/bin/env python3
+"""Benchmark streaming import of a large export against loading it whole.
+
+Writes a synthetic export of the given size, then measures:
+
+- splitting it with parse_import_file (whole list) and iter_import_file
+  (streamed), reporting time and peak traced memory of each;
+- importing it through BatchImporter with a fake LLM, reporting the time
+  until the first entry reaches storage and peak traced memory. The import
+  is stopped after --import-entries entries, so large exports stay quick.
+
+Usage:
+    uv run scripts/bench_import_streaming.py
+    uv run scripts/bench_import_streaming.py --size-mb 500 --latency 0.2 --concurrency 8
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import itertools
+import tempfile
+import time
+import tracemalloc
+from collections.abc import Callable
+from datetime import date, timedelta
+from pathlib import Path
+from typing import Any
+
+from bench_import_concurrency import FakeLLMClient
+from quilto import StorageRepository
+from rich.progress import Progress
+from swealog.cli.import_cmd import BatchImporter, iter_import_file, parse_import_file
+from swealog.domains import general_fitness, strength
+
+START_DATE = date(2026, 1, 1)
+
+
+def write_export(path: Path, size_mb: int) -> int:
+    """Write a "---" delimited export of about `size_mb` megabytes.
+
+    Args:
+        path: File to write.
+        size_mb: Target size in megabytes.
+
+    Returns:
+        Number of entries written.
+    """
+    target = size_mb * 1024 * 1024
+    written = 0
+    count = 0
+    with path.open("w", encoding="utf-8") as f:
+        while written < target:
+            day = START_DATE + timedelta(days=count // 10)
+            text = f"{day} set {count}: bench 185x5, squat 225x5, felt strong today\n---\n"
+            f.write(text)
+            written += len(text)
+            count += 1
+    return count
+
+
+def measure(fn: Callable[[], Any]) -> tuple[float, float, Any]:
+    """Run `fn` under tracemalloc.
+
+    Args:
+        fn: Function to run.
+
+    Returns:
+        Tuple of (elapsed seconds, peak traced MiB, return value).
+    """
+    tracemalloc.start()
+    t0 = time.perf_counter()
+    value = fn()
+    elapsed = time.perf_counter() - t0
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak / (1024 * 1024), value
+
+
+async def bench_first_save(export: Path, entries: int, concurrency: int, latency: float) -> float:
+    """Import the first `entries` entries of an export and time the first save.
+
+    Args:
+        export: Export file.
+        entries: Entries to import before stopping.
+        concurrency: Entries routed and parsed at once.
+        latency: Mean fake LLM latency in seconds.
+
+    Returns:
+        Seconds from the start of the import until the first save.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        storage = StorageRepository(Path(tmp))
+        first_save: list[float] = []
+        save_entries = storage.save_entries
+
+        def timed_save(*args: Any, **kwargs: Any) -> None:
+            first_save.append(time.perf_counter())
+            save_entries(*args, **kwargs)
+
+        storage.save_entries = timed_save  # type: ignore[method-assign]
+        llm = FakeLLMClient(latency, jitter=0.5)
+        importer = BatchImporter(llm, storage, [general_fitness, strength], concurrency=concurrency)  # type: ignore[arg-type]
+        try:
+            with Progress(disable=True) as progress:
+                task = progress.add_task("import", total=None)
+                t0 = time.perf_counter()
+                result = await importer.import_entries(
+                    itertools.islice(iter_import_file(export), entries), progress, task
+                )
+        finally:
+            # Wait for background compactions before the directory is removed
+            storage.close()
+        if result.failed:
+            raise SystemExit(f"{result.failed} entries failed: {result.errors[0].error_message}")
+        return first_save[0] - t0
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    parser = argparse.ArgumentParser(description="Benchmark streaming import of a large export")
+    parser.add_argument("--size-mb", type=int, default=100)
+    parser.add_argument("--latency", type=float, default=0.05, help="mean fake LLM latency in seconds")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--import-entries", type=int, default=200, help="entries imported in the import run")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        export = Path(tmp) / "export.txt"
+        count = write_export(export, args.size_mb)
+        print(f"export: {args.size_mb} MiB, {count} entries")
+
+        print(f"{'split':>10} {'seconds':>9} {'peak MiB':>9} {'entries':>9}")
+        for name, fn in [
+            ("list", lambda: len(parse_import_file(export))),
+            ("streamed", lambda: sum(1 for _ in iter_import_file(export))),
+        ]:
+            elapsed, peak, split = measure(fn)
+            print(f"{name:>10} {elapsed:>9.2f} {peak:>9.1f} {split:>9}")
+
+        elapsed, peak, first_save = measure(
+            lambda: asyncio.run(bench_first_save(export, args.import_entries, args.concurrency, args.latency))
+        )
+        print(
+            f"import of {args.import_entries} entries: first save after {first_save:.2f}s, "
+            f"done in {elapsed:.2f}s, peak {peak:.1f} MiB"
+        )
+
+
+if __name__ == "__main__":
+    main()
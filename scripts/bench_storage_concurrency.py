@@ -0,0 +1,115 @@
+#!/usr/bin/env python3
+"""Stress benchmark for concurrent StorageRepository writers.
+
+Starts W writer processes that each save N entries (with parsed data) to
+the same day, then checks that every entry survived in both the raw
+markdown and the parsed JSON file and reports write throughput. Writers
+serialize only on short appends; the parsed JSON rewrite is shared through
+the journal compaction, so throughput should hold up as W grows.
+
+Usage:
+    uv run scripts/bench_storage_concurrency.py
+    uv run scripts/bench_storage_concurrency.py --writers 1 4 16 --entries 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import multiprocessing
+import tempfile
+import time
+from datetime import date, datetime
+from pathlib import Path
+
+from quilto.storage import Entry, ParsedJournal, StorageRepository
+
+BENCH_DATE = date(2026, 1, 1)
+
+
+def write_entries(base_path: Path, worker: int, count: int) -> None:
+    """Save `count` entries for one writer, each with its own minute.
+
+    Args:
+        base_path: Storage root shared by all writers.
+        worker: Writer number.
+        count: Number of entries to save.
+    """
+    repo = StorageRepository(base_path)
+    try:
+        for i in range(count):
+            minute = worker * count + i
+            timestamp = datetime(BENCH_DATE.year, BENCH_DATE.month, BENCH_DATE.day, minute // 60, minute % 60)
+            repo.save_entry(
+                Entry(
+                    id=timestamp.strftime("%Y-%m-%d_%H-%M-%S"),
+                    date=BENCH_DATE,
+                    timestamp=timestamp,
+                    raw_content=f"Writer {worker} set {i}: 185x5",
+                    parsed_data={"worker": worker, "set": i, "weight": 185, "reps": 5},
+                )
+            )
+    finally:
+        # Forked writers exit without joining threads; finish background compaction first
+        repo.close()
+
+
+def bench_writers(writers: int, count: int) -> tuple[float, int, int]:
+    """Run `writers` concurrent processes and verify the result.
+
+    Args:
+        writers: Number of writer processes.
+        count: Entries per writer.
+
+    Returns:
+        Tuple of (elapsed seconds, raw entries found, parsed entries found).
+    """
+    ctx = multiprocessing.get_context("fork")
+    with tempfile.TemporaryDirectory() as tmp:
+        base_path = Path(tmp)
+        StorageRepository(base_path).close()
+        processes = [ctx.Process(target=write_entries, args=(base_path, w, count)) for w in range(writers)]
+
+        t0 = time.perf_counter()
+        for process in processes:
+            process.start()
+        for process in processes:
+            process.join()
+        elapsed = time.perf_counter() - t0
+
+        repo = StorageRepository(base_path)
+        try:
+            raw_found = len(repo.get_entries_by_date_range(BENCH_DATE, BENCH_DATE))
+        finally:
+            repo.close()
+        parsed_path = base_path / "logs" / "parsed" / "2026" / "01" / "2026-01-01.json"
+        parsed_found = len(ParsedJournal(parsed_path).read())
+        on_disk = len(json.loads(parsed_path.read_text(encoding="utf-8")))
+        if on_disk != parsed_found:
+            raise SystemExit(f"journal not fully compacted: {on_disk} on disk vs {parsed_found} folded")
+        return elapsed, raw_found, parsed_found
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description="Benchmark concurrent StorageRepository writers")
+    parser.add_argument("--writers", type=int, nargs="+", default=[1, 2, 4, 8, 16])
+    parser.add_argument("--entries", type=int, default=40, help="entries per writer")
+    args = parser.parse_args()
+
+    if max(args.writers) * args.entries > 24 * 60:
+        parser.error("writers * entries must fit in one day of distinct minutes (1440)")
+
+    print(f"{'writers':>8} {'writes':>8} {'seconds':>9} {'writes/s':>10} {'raw':>6} {'parsed':>7} {'lost':>5}")
+    for writers in args.writers:
+        expected = writers * args.entries
+        elapsed, raw_found, parsed_found = bench_writers(writers, args.entries)
+        lost = expected - min(raw_found, parsed_found)
+        print(
+            f"{writers:>8} {expected:>8} {elapsed:>9.2f} {expected / elapsed:>10.0f} "
+            f"{raw_found:>6} {parsed_found:>7} {lost:>5}"
+        )
+
+
+if __name__ == "__main__":
+    main()
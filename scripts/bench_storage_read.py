@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for StorageRepository reads over heavy-logging days.
+
+Writes one day with N entries (each with parsed data) into a temporary
+storage tree and times get_entries_by_date_range for increasing N. It also
+counts json.load calls, which should be one per day file regardless of N:
+read cost per entry stays flat (O(N) per day) instead of growing with the
+size of the day's parsed JSON (O(N^2)).
+
+Usage:
+    uv run scripts/bench_storage_read.py
+    uv run scripts/bench_storage_read.py --sizes 50 200 800 --repeat 20
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Any
+from unittest import mock
+
+from quilto.storage import Entry, StorageRepository
+
+BENCH_DATE = date(2026, 1, 1)
+
+
+def populate_day(repo: StorageRepository, count: int) -> None:
+    """Write a day with `count` entries, each with parsed data.
+
+    Args:
+        repo: Repository to write into.
+        count: Number of entries for the day.
+    """
+    start = datetime(BENCH_DATE.year, BENCH_DATE.month, BENCH_DATE.day)
+    for i in range(count):
+        # Spread entries over the day so every section gets a distinct HH:MM
+        timestamp = start + timedelta(minutes=i * (24 * 60 // max(count, 1)))
+        repo.save_entry(
+            Entry(
+                id=timestamp.strftime("%Y-%m-%d_%H-%M-%S"),
+                date=BENCH_DATE,
+                timestamp=timestamp,
+                raw_content=f"Bench press set {i}: 185x5 @ RPE 8",
+                parsed_data={"exercise": "bench press", "weight": 185, "reps": 5, "set": i},
+            )
+        )
+
+
+def bench_size(count: int, repeat: int) -> tuple[float, int]:
+    """Time a single-day read for a day with `count` entries.
+
+    Args:
+        count: Number of entries in the day.
+        repeat: Number of timed reads.
+
+    Returns:
+        Tuple of (best read time in seconds, json.load calls per read).
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        writer = StorageRepository(Path(tmp))
+        try:
+            populate_day(writer, count)
+        finally:
+            # Wait for background journal compaction, which also calls json.load
+            writer.close()
+
+        repo = StorageRepository(Path(tmp))
+        try:
+            loads = 0
+            real_load = json.load
+
+            def counting_load(*args: Any, **kwargs: Any) -> Any:
+                nonlocal loads
+                loads += 1
+                return real_load(*args, **kwargs)
+
+            with mock.patch("quilto.storage.repository.json.load", counting_load):
+                repo.get_entries_by_date_range(BENCH_DATE, BENCH_DATE)
+            loads_per_read = loads
+
+            best = float("inf")
+            for _ in range(repeat):
+                t0 = time.perf_counter()
+                entries = repo.get_entries_by_date_range(BENCH_DATE, BENCH_DATE)
+                best = min(best, time.perf_counter() - t0)
+                assert len(entries) == count
+        finally:
+            repo.close()
+
+        return best, loads_per_read
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description="Benchmark StorageRepository day reads")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 50, 100, 200, 400])
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'entries/day':>12} {'read ms':>10} {'us/entry':>10} {'json.load':>10}")
+    for count in args.sizes:
+        best, loads = bench_size(count, args.repeat)
+        print(f"{count:>12} {best * 1000:>10.2f} {best * 1e6 / count:>10.1f} {loads:>10}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""Micro-benchmark for StorageRepository writes on heavy-logging days.
+
+Saves N entries (with parsed data) to one day in each parsed format and
+reports the average cost of the last 10% of writes. With the ``json``
+format every write rewrites the whole day's parsed file, so the per-write
+cost grows with N; with ``jsonl`` a write appends one record and stays
+flat.
+
+Usage:
+    uv run scripts/bench_storage_write.py
+    uv run scripts/bench_storage_write.py --sizes 100 400 1000
+"""
+
+from __future__ import annotations
+
+import argparse
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+from pathlib import Path
+
+from quilto.storage import Entry, ParsedFormat, StorageRepository
+
+BENCH_DATE = date(2026, 1, 1)
+
+
+def bench_format(parsed_format: ParsedFormat, count: int) -> float:
+    """Time writes of a day with `count` entries.
+
+    Args:
+        parsed_format: Parsed format to write.
+        count: Number of entries for the day.
+
+    Returns:
+        Average seconds per write over the last 10% of writes.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        repo = StorageRepository(Path(tmp), parsed_format=parsed_format)
+        start = datetime(BENCH_DATE.year, BENCH_DATE.month, BENCH_DATE.day)
+        tail = max(count // 10, 1)
+        tail_time = 0.0
+        for i in range(count):
+            timestamp = start + timedelta(minutes=i * (24 * 60 // max(count, 1)))
+            entry = Entry(
+                id=timestamp.strftime("%Y-%m-%d_%H-%M-%S"),
+                date=BENCH_DATE,
+                timestamp=timestamp,
+                raw_content=f"Bench press set {i}: 185x5 @ RPE 8",
+                parsed_data={"exercise": "bench press", "weight": 185, "reps": 5, "set": i},
+            )
+            t0 = time.perf_counter()
+            repo.save_entry(entry)
+            if i >= count - tail:
+                tail_time += time.perf_counter() - t0
+        repo.close()
+        return tail_time / tail
+
+
+def main() -> None:
+    """Run the benchmark and print a table of results."""
+    parser = argparse.ArgumentParser(description="Benchmark StorageRepository writes per parsed format")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[50, 200, 800, 1400])
+    args = parser.parse_args()
+
+    print(f"{'entries/day':>12} {'json ms/write':>14} {'jsonl ms/write':>15}")
+    for count in args.sizes:
+        json_cost = bench_format("json", count)
+        jsonl_cost = bench_format("jsonl", count)
+        print(f"{count:>12} {json_cost * 1000:>14.3f} {jsonl_cost * 1000:>15.3f}")
+
+
+if __name__ == "__main__":
+    main()